@@ -33,6 +33,7 @@ from api.agentspec_models import (
     create_tool_policy,
     generate_uuid,
 )
+from api.artifact_storage import read_blob, write_object
 
 
 def _utc_now() -> datetime:
@@ -440,13 +441,6 @@ def _compute_hash(content: bytes | str) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
-def _get_artifact_storage_path(project_dir: Path, run_id: str, content_hash: str) -> Path:
-    """Get the storage path for an artifact blob."""
-    artifacts_dir = project_dir / ".autobuildr" / "artifacts" / run_id
-    artifacts_dir.mkdir(parents=True, exist_ok=True)
-    return artifacts_dir / f"{content_hash}.blob"
-
-
 def create_artifact(
     session: Session,
     run_id: str,
@@ -461,7 +455,8 @@ def create_artifact(
     Create an artifact with content storage.
 
     Small content (<=4KB) is stored inline.
-    Large content is stored in files at .autobuildr/artifacts/{run_id}/{hash}.blob
+    Large content is stored in the project object store
+    (.autobuildr/artifacts/objects/{hash[:2]}/{hash[2:]}), shared across runs.
 
     Args:
         session: SQLAlchemy session
@@ -507,13 +502,7 @@ def create_artifact(
         if project_dir is None:
             raise ValueError("project_dir required for large artifacts")
 
-        storage_path = _get_artifact_storage_path(project_dir, run_id, content_hash)
-
-        # Check if already exists (content-addressable dedup)
-        if not storage_path.exists():
-            storage_path.write_bytes(content_bytes)
-
-        artifact.content_ref = str(storage_path.relative_to(project_dir))
+        artifact.content_ref = write_object(project_dir, content_bytes, content_hash)
 
     session.add(artifact)
     session.flush()
@@ -545,7 +534,7 @@ def get_artifact_content(
     if artifact.content_ref and project_dir:
         storage_path = project_dir / artifact.content_ref
         if storage_path.exists():
-            return storage_path.read_bytes()
+            return read_blob(storage_path)
 
     return None
 
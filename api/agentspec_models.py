@@ -587,6 +587,46 @@ class AgentRun(Base):
         return self.transition_to("timeout", error_message=error_message)
 
 
+# =============================================================================
+# AgentRunQueueEntry - Durable Execution Queue
+# =============================================================================
+
+class AgentRunQueueEntry(Base):
+    """
+    A run waiting for (or holding) a slot in the server's spec executor.
+
+    Rows are inserted in the same transaction as the pending AgentRun, so a
+    run accepted by POST /agent-specs/{id}/execute survives a server restart.
+    claimed_at is set when a worker picks the run up; the row is deleted
+    when the run finishes or is cancelled while still queued.
+    """
+    __tablename__ = "agent_run_queue"
+
+    __table_args__ = (
+        Index('ix_run_queue_enqueued', 'enqueued_at'),
+    )
+
+    run_id = Column(
+        String(36),
+        ForeignKey("agent_runs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    agent_spec_id = Column(String(36), nullable=False)
+    project_name = Column(String(100), nullable=False)
+    enqueued_at = Column(DateTime, nullable=False, default=_utc_now)
+    claimed_at = Column(DateTime, nullable=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "run_id": self.run_id,
+            "agent_spec_id": self.agent_spec_id,
+            "project_name": self.project_name,
+            "enqueued_at": self.enqueued_at.isoformat() if self.enqueued_at else None,
+            "claimed_at": self.claimed_at.isoformat() if self.claimed_at else None,
+        }
+
+
 # =============================================================================
 # Artifact - Persisted Output
 # =============================================================================
@@ -624,7 +664,7 @@ class Artifact(Base):
     path = Column(String(500), nullable=True)  # for file artifacts, the source path
 
     # Content storage (file-based for large, inline for small)
-    content_ref = Column(String(255), nullable=True)  # path to content file: .autobuildr/artifacts/{run_id}/{sha256}.blob
+    content_ref = Column(String(255), nullable=True)  # path to content file: .autobuildr/artifacts/objects/{sha256[:2]}/{sha256[2:]}[.zst|.zz]
     content_inline = Column(Text, nullable=True)  # small content stored inline (<=4KB)
     content_hash = Column(String(64), nullable=False)  # SHA256 for dedup and integrity (Feature #147: NOT NULL)
     size_bytes = Column(Integer, nullable=False)  # Feature #147: NOT NULL - always set by CRUD layer
@@ -6,9 +6,14 @@ Content-addressable artifact storage with SHA256 hashing.
 
 This service handles:
 - Small content (<=4KB) stored inline in the database
-- Large content stored as files in .autobuildr/artifacts/{run_id}/{hash}.blob
-- Content deduplication via SHA256 hashing
-- Automatic directory creation
+- Large content stored once per project in a content-addressed object store:
+  .autobuildr/artifacts/objects/{hash[:2]}/{hash[2:]}
+- Transparent compression of stored objects (zstd when the ``zstandard``
+  package is installed, zlib otherwise); the codec is recorded as a file
+  suffix (``.zst`` / ``.zz``) and incompressible content is stored raw
+- Reference counting from Artifact rows and garbage collection of objects
+  no Artifact references any more
+- Migration of the legacy per-run layout (.autobuildr/artifacts/{run_id}/{hash}.blob)
 
 Usage:
     from api.artifact_storage import ArtifactStorage
@@ -20,15 +25,22 @@ Usage:
         artifact_type="log",
         content="Some log content..."
     )
+
+    # Reclaim objects no longer referenced by any Artifact
+    storage.collect_garbage(db_session)
 """
 from __future__ import annotations
 
 import hashlib
 import logging
 import os
+import tempfile
+import time
+import zlib
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from api.agentspec_models import (
@@ -38,9 +50,170 @@ from api.agentspec_models import (
     generate_uuid,
 )
 
+# zstd is optional; zlib is always available
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
 # Configure logging
 _logger = logging.getLogger(__name__)
 
+# Directory (under .autobuildr/artifacts) holding content-addressed objects
+OBJECTS_DIRNAME = "objects"
+
+# File suffixes recording how an object is encoded ("" = stored raw)
+ZSTD_SUFFIX = ".zst"
+ZLIB_SUFFIX = ".zz"
+
+# Keep the compressed form only if it saves at least this fraction of the size
+MIN_COMPRESSION_SAVINGS = 0.1
+
+# Objects younger than this are never garbage collected. Writers create the
+# object before the referencing Artifact row is committed (EventRecorder in
+# buffered mode queues the row), so a fresh object may legitimately have no
+# references yet.
+GC_GRACE_PERIOD_SECONDS = 3600
+
+# Chunk size for streaming (decompressed) object content
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def artifacts_dir(project_dir: str | Path) -> Path:
+    """Return the artifact storage root for a project."""
+    return Path(project_dir) / ".autobuildr" / "artifacts"
+
+
+def is_object_ref(content_ref: str | None) -> bool:
+    """True if content_ref points into the object store (not a legacy per-run blob)."""
+    if not content_ref:
+        return False
+    parts = Path(content_ref).parts
+    return len(parts) >= 5 and parts[-3] == OBJECTS_DIRNAME
+
+
+def _compress(data: bytes) -> tuple[bytes, str]:
+    """Compress data with the best available codec.
+
+    Returns:
+        Tuple of (encoded bytes, codec suffix). The suffix is "" when
+        compression does not pay off and the data is returned unchanged.
+    """
+    if HAS_ZSTD:
+        encoded, suffix = zstandard.ZstdCompressor(level=3).compress(data), ZSTD_SUFFIX
+    else:
+        encoded, suffix = zlib.compress(data, 6), ZLIB_SUFFIX
+    if len(encoded) > len(data) * (1 - MIN_COMPRESSION_SAVINGS):
+        return data, ""
+    return encoded, suffix
+
+
+def read_blob(path: Path) -> bytes:
+    """Read a stored blob, decompressing it according to its suffix.
+
+    Raises:
+        OSError: If the file cannot be read
+        RuntimeError: If the blob is zstd-compressed and zstandard is not installed
+    """
+    data = path.read_bytes()
+    if path.suffix == ZLIB_SUFFIX:
+        return zlib.decompress(data)
+    if path.suffix == ZSTD_SUFFIX:
+        if not HAS_ZSTD:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        # compress() writes the content size into the frame header
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def iter_blob_chunks(path: Path, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield the decompressed content of a stored blob in chunks.
+
+    Compressed objects are decoded incrementally, so memory use stays bounded
+    by the chunk size regardless of the object size.
+    """
+    with open(path, "rb") as f:
+        if path.suffix == ZSTD_SUFFIX:
+            if not HAS_ZSTD:
+                raise RuntimeError(f"zstandard is required to read {path}")
+            yield from zstandard.ZstdDecompressor().read_to_iter(f, read_size=chunk_size)
+        elif path.suffix == ZLIB_SUFFIX:
+            decompressor = zlib.decompressobj()
+            while raw := f.read(chunk_size):
+                chunk = decompressor.decompress(raw)
+                if chunk:
+                    yield chunk
+            tail = decompressor.flush()
+            if tail:
+                yield tail
+        else:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+
+def write_object(project_dir: str | Path, content: bytes, content_hash: str | None = None) -> str:
+    """Store content in the project object store (once per distinct content).
+
+    Args:
+        project_dir: Project root directory
+        content: Raw (uncompressed) content
+        content_hash: SHA256 of content, if already computed
+
+    Returns:
+        content_ref for the object, relative to project_dir
+    """
+    project_dir = Path(project_dir)
+    if content_hash is None:
+        content_hash = hashlib.sha256(content).hexdigest()
+
+    existing = find_object(project_dir, content_hash)
+    if existing is not None:
+        # Touch so a concurrent GC pass sees a fresh object until our row commits
+        try:
+            os.utime(existing)
+        except OSError:
+            pass
+        _logger.debug("Object already stored (content-addressable dedup): %s", existing)
+        return str(existing.relative_to(project_dir))
+
+    encoded, suffix = _compress(content)
+    path = _object_base(project_dir, content_hash).with_name(content_hash[2:] + suffix)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temp file and rename so readers never see a partial object
+    fd, tmp_name = tempfile.mkstemp(prefix=".tmp-", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+    _logger.debug(
+        "Object written: %s (%d -> %d bytes)", path, len(content), len(encoded)
+    )
+    return str(path.relative_to(project_dir))
+
+
+def find_object(project_dir: str | Path, content_hash: str) -> Path | None:
+    """Return the path of the stored object for content_hash, whatever its codec."""
+    base = _object_base(Path(project_dir), content_hash)
+    for suffix in ("", ZSTD_SUFFIX, ZLIB_SUFFIX):
+        candidate = base.with_name(base.name + suffix)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def _object_base(project_dir: Path, content_hash: str) -> Path:
+    """objects/ab/cdef... path (without codec suffix) for a hash."""
+    return artifacts_dir(project_dir) / OBJECTS_DIRNAME / content_hash[:2] / content_hash[2:]
+
 
 class ArtifactStorage:
     """
@@ -48,11 +221,13 @@ class ArtifactStorage:
 
     Stores artifacts with automatic size-based routing:
     - Small artifacts (<=4KB) are stored inline in the database
-    - Large artifacts are stored as files with content-addressable paths
+    - Large artifacts are stored in the project-wide object store, shared by
+      every run that produces the same content
 
     Attributes:
         project_dir: Base directory for file storage
         artifacts_base: Path to .autobuildr/artifacts directory
+        objects_base: Path to the content-addressed objects directory
     """
 
     def __init__(self, project_dir: str | Path):
@@ -63,7 +238,8 @@ class ArtifactStorage:
             project_dir: Project root directory where .autobuildr/artifacts will be created
         """
         self.project_dir = Path(project_dir).resolve()
-        self.artifacts_base = self.project_dir / ".autobuildr" / "artifacts"
+        self.artifacts_base = artifacts_dir(self.project_dir)
+        self.objects_base = self.artifacts_base / OBJECTS_DIRNAME
 
         _logger.debug(
             "ArtifactStorage initialized: project_dir=%s, artifacts_base=%s",
@@ -83,32 +259,6 @@ class ArtifactStorage:
         """
         return hashlib.sha256(content).hexdigest()
 
-    def _get_storage_path(self, run_id: str, content_hash: str) -> Path:
-        """
-        Get the file path for storing artifact content.
-
-        Creates the directory structure if needed:
-        .autobuildr/artifacts/{run_id}/{content_hash}.blob
-
-        Args:
-            run_id: AgentRun ID (used as directory name)
-            content_hash: SHA256 hash of content (used as filename)
-
-        Returns:
-            Absolute path to the storage file
-        """
-        run_dir = self.artifacts_base / run_id
-        return run_dir / f"{content_hash}.blob"
-
-    def _ensure_directory(self, path: Path) -> None:
-        """
-        Ensure the parent directory exists.
-
-        Args:
-            path: Path whose parent directory should exist
-        """
-        path.parent.mkdir(parents=True, exist_ok=True)
-
     def _normalize_content(self, content: bytes | str) -> tuple[bytes, str | None]:
         """
         Normalize content to bytes and optionally get string representation.
@@ -132,7 +282,8 @@ class ArtifactStorage:
         """
         Find an existing artifact with the same hash in the same run.
 
-        This enables content deduplication within a run.
+        This deduplicates Artifact rows within a run. File content is
+        deduplicated project-wide by the object store regardless.
 
         Args:
             session: SQLAlchemy session
@@ -167,7 +318,8 @@ class ArtifactStorage:
 
         Routes content based on size:
         - Content <= 4096 bytes: stored in content_inline field
-        - Content > 4096 bytes: stored in file at .autobuildr/artifacts/{run_id}/{hash}.blob
+        - Content > 4096 bytes: stored (compressed) in the object store at
+          .autobuildr/artifacts/objects/{hash[:2]}/{hash[2:]}
 
         Args:
             session: SQLAlchemy database session
@@ -245,25 +397,8 @@ class ArtifactStorage:
 
             _logger.debug("Artifact stored inline: %s (%d bytes)", artifact.id, size_bytes)
         else:
-            # Large content: store in file
-            storage_path = self._get_storage_path(run_id, content_hash)
-
-            # Check if file already exists (content-addressable deduplication)
-            if not storage_path.exists():
-                self._ensure_directory(storage_path)
-                storage_path.write_bytes(content_bytes)
-                _logger.debug(
-                    "Artifact content written to file: %s",
-                    storage_path
-                )
-            else:
-                _logger.debug(
-                    "Artifact file already exists (content-addressable dedup): %s",
-                    storage_path
-                )
-
-            # Store relative path from project root
-            artifact.content_ref = str(storage_path.relative_to(self.project_dir))
+            # Large content: store in the shared object store
+            artifact.content_ref = write_object(self.project_dir, content_bytes, content_hash)
 
             _logger.debug(
                 "Artifact stored in file: %s (%d bytes), ref=%s",
@@ -297,7 +432,7 @@ class ArtifactStorage:
         if artifact.content_ref:
             storage_path = self.project_dir / artifact.content_ref
             if storage_path.exists():
-                return storage_path.read_bytes()
+                return read_blob(storage_path)
             else:
                 _logger.warning(
                     "Artifact file not found: %s (artifact_id=%s)",
@@ -328,49 +463,274 @@ class ArtifactStorage:
             return content.decode(encoding, errors=errors)
         return None
 
-    def delete_content(self, artifact: Artifact) -> bool:
+    def iter_content(
+        self,
+        artifact: Artifact,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes] | None:
+        """
+        Stream artifact content in decompressed chunks.
+
+        Args:
+            artifact: Artifact record to stream content from
+            chunk_size: Read size for file-based content
+
+        Returns:
+            Iterator of byte chunks, or None if content not available
+        """
+        if artifact.content_inline is not None:
+            return iter((artifact.content_inline.encode("utf-8"),))
+        if artifact.content_ref:
+            storage_path = self.project_dir / artifact.content_ref
+            if storage_path.exists():
+                return iter_blob_chunks(storage_path, chunk_size)
+        return None
+
+    def delete_content(self, artifact: Artifact, session: Session | None = None) -> bool:
         """
         Delete the file content for a file-based artifact.
 
         Note: This does NOT delete the artifact record from the database.
+        Objects in the shared store are only deleted when no other artifact
+        references them, which requires a session; without one they are left
+        for collect_garbage().
 
         Args:
             artifact: Artifact record
+            session: Optional session used to check other references
 
         Returns:
-            True if file was deleted, False if no file or already deleted
+            True if file was deleted, False if no file, already deleted or still shared
         """
-        if artifact.content_ref:
-            storage_path = self.project_dir / artifact.content_ref
-            if storage_path.exists():
-                storage_path.unlink()
-                _logger.info("Deleted artifact file: %s", storage_path)
-                return True
+        if not artifact.content_ref:
+            return False
+        if is_object_ref(artifact.content_ref):
+            if session is None:
+                return False
+            others = (
+                session.query(func.count(Artifact.id))
+                .filter(
+                    Artifact.content_ref == artifact.content_ref,
+                    Artifact.id != artifact.id,
+                )
+                .scalar()
+            )
+            if others:
+                _logger.debug(
+                    "Object %s still referenced by %d artifact(s)", artifact.content_ref, others
+                )
+                return False
+        storage_path = self.project_dir / artifact.content_ref
+        if storage_path.exists():
+            storage_path.unlink()
+            _logger.info("Deleted artifact file: %s", storage_path)
+            return True
         return False
 
+    # ------------------------------------------------------------------
+    # Reference counting and garbage collection
+    # ------------------------------------------------------------------
+
+    def reference_counts(self, session: Session) -> dict[str, int]:
+        """
+        Count Artifact rows per stored file.
+
+        Args:
+            session: SQLAlchemy session
+
+        Returns:
+            Mapping of content_ref -> number of Artifact rows referencing it
+        """
+        rows = (
+            session.query(Artifact.content_ref, func.count(Artifact.id))
+            .filter(Artifact.content_ref.isnot(None))
+            .group_by(Artifact.content_ref)
+            .all()
+        )
+        return {ref: count for ref, count in rows}
+
+    def _iter_stored_files(self) -> Iterator[Path]:
+        """Yield every stored file: objects, legacy per-run blobs and stale temp files."""
+        if not self.artifacts_base.exists():
+            return
+        for entry in self.artifacts_base.iterdir():
+            if not entry.is_dir():
+                continue
+            if entry.name == OBJECTS_DIRNAME:
+                for fanout in entry.iterdir():
+                    if fanout.is_dir():
+                        yield from (p for p in fanout.iterdir() if p.is_file())
+            else:
+                yield from entry.glob("*.blob")
+
+    def collect_garbage(
+        self,
+        session: Session,
+        *,
+        grace_seconds: float = GC_GRACE_PERIOD_SECONDS,
+        dry_run: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Delete stored files that no Artifact row references.
+
+        Covers objects in the shared store, orphaned legacy per-run blobs and
+        temp files left behind by interrupted writes. Files modified within
+        grace_seconds are kept, since their Artifact rows may not be committed yet.
+
+        Args:
+            session: SQLAlchemy session
+            grace_seconds: Minimum age of a file before it can be collected
+            dry_run: If True, only report what would be deleted
+
+        Returns:
+            Dictionary with scanned, referenced, deleted and bytes_freed counts
+        """
+        refs = self.reference_counts(session)
+        cutoff = time.time() - grace_seconds
+        scanned = referenced = deleted = bytes_freed = 0
+
+        for path in self._iter_stored_files():
+            scanned += 1
+            ref = str(path.relative_to(self.project_dir))
+            if refs.get(ref):
+                referenced += 1
+                continue
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime > cutoff:
+                continue
+            deleted += 1
+            bytes_freed += stat.st_size
+            if not dry_run:
+                path.unlink(missing_ok=True)
+                _logger.debug("Collected unreferenced artifact file: %s", path)
+
+        if not dry_run:
+            self._remove_empty_dirs()
+
+        _logger.info(
+            "Artifact GC: scanned=%d, referenced=%d, %s=%d, bytes=%d",
+            scanned, referenced, "would_delete" if dry_run else "deleted", deleted, bytes_freed
+        )
+        return {
+            "scanned": scanned,
+            "referenced": referenced,
+            "deleted": deleted,
+            "bytes_freed": bytes_freed,
+            "dry_run": dry_run,
+        }
+
+    def migrate_legacy_blobs(self, session: Session, *, dry_run: bool = False) -> dict[str, Any]:
+        """
+        Move artifacts from per-run .blob files into the object store.
+
+        Each legacy file is read, verified against the artifact's content_hash,
+        written once to the object store and every row pointing at it is
+        repointed. Legacy files are removed after the session commits.
+
+        Args:
+            session: SQLAlchemy session (committed by this method unless dry_run)
+            dry_run: If True, only report what would be migrated
+
+        Returns:
+            Dictionary with migrated, missing, mismatched and removed_files counts
+        """
+        legacy = [
+            a for a in session.query(Artifact).filter(Artifact.content_ref.isnot(None)).all()
+            if not is_object_ref(a.content_ref)
+        ]
+        migrated = missing = mismatched = 0
+        legacy_files: set[Path] = set()
+
+        for artifact in legacy:
+            legacy_path = self.project_dir / artifact.content_ref
+            if not legacy_path.exists():
+                missing += 1
+                _logger.warning(
+                    "Legacy artifact file missing: %s (artifact_id=%s)", legacy_path, artifact.id
+                )
+                continue
+            content = legacy_path.read_bytes()
+            if self._compute_hash(content) != artifact.content_hash:
+                mismatched += 1
+                _logger.warning(
+                    "Legacy artifact hash mismatch, left in place: %s (artifact_id=%s)",
+                    legacy_path, artifact.id
+                )
+                continue
+            migrated += 1
+            legacy_files.add(legacy_path)
+            if not dry_run:
+                artifact.content_ref = write_object(self.project_dir, content, artifact.content_hash)
+
+        removed = 0
+        if not dry_run:
+            session.commit()
+            # Only delete files nothing points at any more (mismatched rows keep theirs)
+            refs = self.reference_counts(session)
+            for path in legacy_files:
+                if not refs.get(str(path.relative_to(self.project_dir))):
+                    path.unlink(missing_ok=True)
+                    removed += 1
+            self._remove_empty_dirs()
+
+        _logger.info(
+            "Artifact migration: migrated=%d, missing=%d, mismatched=%d, removed_files=%d",
+            migrated, missing, mismatched, removed
+        )
+        return {
+            "migrated": migrated,
+            "missing": missing,
+            "mismatched": mismatched,
+            "removed_files": removed,
+            "dry_run": dry_run,
+        }
+
+    def _remove_empty_dirs(self) -> None:
+        """Remove empty run and fan-out directories left after deletions."""
+        if not self.artifacts_base.exists():
+            return
+        for entry in self.artifacts_base.iterdir():
+            if not entry.is_dir():
+                continue
+            dirs = [d for d in entry.iterdir() if d.is_dir()] if entry.name == OBJECTS_DIRNAME else []
+            for d in dirs + [entry]:
+                try:
+                    d.rmdir()
+                except OSError:
+                    pass  # Not empty
+
     def get_storage_stats(self) -> dict[str, Any]:
         """
         Get statistics about artifact storage.
 
         Returns:
-            Dictionary with storage statistics
+            Dictionary with storage statistics. total_bytes is the on-disk
+            (compressed) size of objects plus legacy per-run blobs.
         """
         total_files = 0
         total_bytes = 0
+        object_count = 0
         run_dirs: set[str] = set()
 
-        if self.artifacts_base.exists():
-            for run_dir in self.artifacts_base.iterdir():
-                if run_dir.is_dir():
-                    run_dirs.add(run_dir.name)
-                    for blob_file in run_dir.glob("*.blob"):
-                        total_files += 1
-                        total_bytes += blob_file.stat().st_size
+        for path in self._iter_stored_files():
+            if path.name.startswith(".tmp-"):
+                continue
+            total_files += 1
+            total_bytes += path.stat().st_size
+            if path.parent.parent == self.objects_base:
+                object_count += 1
+            else:
+                run_dirs.add(path.parent.name)
 
         return {
             "artifacts_base": str(self.artifacts_base),
             "run_count": len(run_dirs),
             "file_count": total_files,
+            "object_count": object_count,
+            "legacy_file_count": total_files - object_count,
             "total_bytes": total_bytes,
             "total_mb": round(total_bytes / (1024 * 1024), 2),
         }
@@ -92,6 +92,8 @@ STANDARD_TOOLS: frozenset[str] = frozenset({
     "feature_get_summary",
     "feature_get_stats",
     "feature_claim_and_get",
+    "feature_claim_next",
+    "feature_renew_lease",
     "feature_mark_in_progress",
     "feature_mark_passing",
     "feature_mark_failing",
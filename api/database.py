@@ -6,10 +6,13 @@ SQLite database schema for feature storage using SQLAlchemy.
 """
 from __future__ import annotations
 
+import sqlite3
 import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
 
 def _utc_now() -> datetime:
@@ -29,6 +32,8 @@ from sqlalchemy import (
     create_engine,
     text,
 )
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session, relationship, sessionmaker
 from sqlalchemy.types import JSON
@@ -58,6 +63,11 @@ class Feature(Base):
     # Dependencies: list of feature IDs that must be completed before this feature
     # NULL/empty = no dependencies (backwards compatible)
     dependencies = Column(JSON, nullable=True, default=None)
+    # Optional worker lease (see api.feature_claims): while in_progress, a
+    # claim whose lease has expired can be taken over by another worker.
+    # NULL lease_expires_at = claim never expires.
+    claimed_by = Column(String(100), nullable=True, default=None)
+    lease_expires_at = Column(DateTime, nullable=True, default=None)
 
     def to_dict(self) -> dict:
         """Convert feature to dictionary for JSON serialization."""
@@ -84,6 +94,28 @@ class Feature(Base):
         return []
 
 
+class FeatureDependency(Base):
+    """Edge table mirroring Feature.dependencies (feature_id depends on depends_on_id).
+
+    Maintained by SQLite triggers on the features table (see
+    _migrate_add_feature_dependencies_table), so it always matches the JSON
+    column no matter which code path wrote it. Never written directly.
+
+    The primary key indexes "what does X depend on"; the reverse index
+    answers "who depends on X" for ready/blocked queries (api.dependency_queries).
+    depends_on_id may reference a missing feature, which counts as unmet.
+    """
+
+    __tablename__ = "feature_dependencies"
+
+    __table_args__ = (
+        Index('ix_feature_dependencies_depends_on', 'depends_on_id', 'feature_id'),
+    )
+
+    feature_id = Column(Integer, ForeignKey("features.id", ondelete="CASCADE"), primary_key=True)
+    depends_on_id = Column(Integer, primary_key=True)
+
+
 class Schedule(Base):
     """Time-based schedule for automated agent start/stop."""
 
@@ -179,6 +211,16 @@ class ScheduleOverride(Base):
         }
 
 
+class SchemaVersion(Base):
+    """One row per applied schema migration (see MIGRATIONS)."""
+
+    __tablename__ = "schema_version"
+
+    version = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    applied_at = Column(DateTime, nullable=False, default=_utc_now)
+
+
 def get_database_path(project_dir: Path) -> Path:
     """Return the path to the SQLite database for a project."""
     return project_dir / "features.db"
@@ -193,9 +235,25 @@ def get_database_url(project_dir: Path) -> str:
     return f"sqlite:///{db_path.as_posix()}"
 
 
-def _migrate_add_in_progress_column(engine) -> None:
+@contextmanager
+def _migration_connection(bind: Engine | Connection) -> Iterator[Connection]:
+    """Yield a connection for a single migration step.
+
+    The migration runner passes the Connection that holds its schema
+    transaction; the step then runs inside that transaction and must not
+    commit. Callers that pass an Engine (older scripts and tests) get a
+    short-lived connection that is committed when the step succeeds.
+    """
+    if isinstance(bind, Connection):
+        yield bind
+    else:
+        with bind.begin() as conn:
+            yield conn
+
+
+def _migrate_add_in_progress_column(bind) -> None:
     """Add in_progress column to existing databases that don't have it."""
-    with engine.connect() as conn:
+    with _migration_connection(bind) as conn:
         # Check if column exists
         result = conn.execute(text("PRAGMA table_info(features)"))
         columns = [row[1] for row in result.fetchall()]
@@ -203,26 +261,24 @@ def _migrate_add_in_progress_column(engine) -> None:
         if "in_progress" not in columns:
             # Add the column with default value
             conn.execute(text("ALTER TABLE features ADD COLUMN in_progress BOOLEAN DEFAULT 0"))
-            conn.commit()
 
 
-def _migrate_fix_null_boolean_fields(engine) -> None:
+def _migrate_fix_null_boolean_fields(bind) -> None:
     """Fix NULL values in passes and in_progress columns."""
-    with engine.connect() as conn:
+    with _migration_connection(bind) as conn:
         # Fix NULL passes values
         conn.execute(text("UPDATE features SET passes = 0 WHERE passes IS NULL"))
         # Fix NULL in_progress values
         conn.execute(text("UPDATE features SET in_progress = 0 WHERE in_progress IS NULL"))
-        conn.commit()
 
 
-def _migrate_add_dependencies_column(engine) -> None:
+def _migrate_add_dependencies_column(bind) -> None:
     """Add dependencies column to existing databases that don't have it.
 
     Uses NULL default for backwards compatibility - existing features
     without dependencies will have NULL which is treated as empty list.
     """
-    with engine.connect() as conn:
+    with _migration_connection(bind) as conn:
         # Check if column exists
         result = conn.execute(text("PRAGMA table_info(features)"))
         columns = [row[1] for row in result.fetchall()]
@@ -230,10 +286,9 @@ def _migrate_add_dependencies_column(engine) -> None:
         if "dependencies" not in columns:
             # Use TEXT for SQLite JSON storage, NULL default for backwards compat
             conn.execute(text("ALTER TABLE features ADD COLUMN dependencies TEXT DEFAULT NULL"))
-            conn.commit()
 
 
-def _migrate_add_testing_columns(engine) -> None:
+def _migrate_add_testing_columns(bind) -> None:
     """Legacy migration - no longer adds testing columns.
 
     The testing_in_progress and last_tested_at columns were removed from the
@@ -299,41 +354,40 @@ def _is_network_path(path: Path) -> bool:
     return False
 
 
-def _migrate_add_schedules_tables(engine) -> None:
+
+
+def _migrate_add_schedules_tables(bind) -> None:
     """Create schedules and schedule_overrides tables if they don't exist."""
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        inspector = inspect(conn)
+        existing_tables = inspector.get_table_names()
 
-    # Create schedules table if missing
-    if "schedules" not in existing_tables:
-        Schedule.__table__.create(bind=engine)
+        # Create schedules table if missing
+        if "schedules" not in existing_tables:
+            Schedule.__table__.create(bind=conn)
 
-    # Create schedule_overrides table if missing
-    if "schedule_overrides" not in existing_tables:
-        ScheduleOverride.__table__.create(bind=engine)
+        # Create schedule_overrides table if missing
+        if "schedule_overrides" not in existing_tables:
+            ScheduleOverride.__table__.create(bind=conn)
 
-    # Add crash_count column if missing (for upgrades)
-    if "schedules" in existing_tables:
-        columns = [c["name"] for c in inspector.get_columns("schedules")]
-        if "crash_count" not in columns:
-            with engine.connect() as conn:
+        # Add crash_count column if missing (for upgrades)
+        if "schedules" in existing_tables:
+            columns = [c["name"] for c in inspector.get_columns("schedules")]
+            if "crash_count" not in columns:
                 conn.execute(
                     text("ALTER TABLE schedules ADD COLUMN crash_count INTEGER DEFAULT 0")
                 )
-                conn.commit()
 
-        # Add max_concurrency column if missing (for upgrades)
-        if "max_concurrency" not in columns:
-            with engine.connect() as conn:
+            # Add max_concurrency column if missing (for upgrades)
+            if "max_concurrency" not in columns:
                 conn.execute(
                     text("ALTER TABLE schedules ADD COLUMN max_concurrency INTEGER DEFAULT 3")
                 )
-                conn.commit()
 
 
-def _migrate_add_agentspec_tables(engine) -> None:
+def _migrate_add_agentspec_tables(bind) -> None:
     """Create AgentSpec-related tables if they don't exist.
 
     This migration is additive and non-destructive:
@@ -364,31 +418,31 @@ def _migrate_add_agentspec_tables(engine) -> None:
         # agentspec_models not yet available (shouldn't happen in normal use)
         return
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
-
-    # Create tables in dependency order (foreign key constraints)
-    tables_to_create = [
-        ("agent_specs", AgentSpec),
-        ("acceptance_specs", AcceptanceSpec),
-        ("agent_runs", AgentRun),
-        ("artifacts", Artifact),
-        ("agent_events", AgentEvent),
-    ]
-
-    for table_name, model_class in tables_to_create:
-        if table_name not in existing_tables:
-            try:
-                model_class.__table__.create(bind=engine)
-            except Exception as e:
-                # Log but don't fail - table might have partial state
-                import logging
-                logging.getLogger(__name__).warning(
-                    f"Could not create table {table_name}: {e}"
-                )
-
-
-def _migrate_add_agentspec_name_unique(engine) -> None:
+    with _migration_connection(bind) as conn:
+        existing_tables = inspect(conn).get_table_names()
+
+        # Create tables in dependency order (foreign key constraints)
+        tables_to_create = [
+            ("agent_specs", AgentSpec),
+            ("acceptance_specs", AcceptanceSpec),
+            ("agent_runs", AgentRun),
+            ("artifacts", Artifact),
+            ("agent_events", AgentEvent),
+        ]
+
+        for table_name, model_class in tables_to_create:
+            if table_name not in existing_tables:
+                try:
+                    model_class.__table__.create(bind=conn)
+                except Exception as e:
+                    # Log but don't fail - table might have partial state
+                    import logging
+                    logging.getLogger(__name__).warning(
+                        f"Could not create table {table_name}: {e}"
+                    )
+
+
+def _migrate_add_agentspec_name_unique(bind) -> None:
     """Add UNIQUE constraint on agent_specs.name column.
 
     Feature #138: The spec requires agent_specs.name to be unique.
@@ -397,37 +451,36 @@ def _migrate_add_agentspec_name_unique(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        inspector = inspect(conn)
+        existing_tables = inspector.get_table_names()
 
-    if "agent_specs" not in existing_tables:
-        return  # Table doesn't exist yet, will be created with constraint
+        if "agent_specs" not in existing_tables:
+            return  # Table doesn't exist yet, will be created with constraint
 
-    # Check if unique index already exists
-    indexes = inspector.get_indexes("agent_specs")
-    for idx in indexes:
-        if idx.get("unique") and idx.get("column_names") == ["name"]:
-            return  # Already has unique index
+        # Check if unique index already exists
+        indexes = inspector.get_indexes("agent_specs")
+        for idx in indexes:
+            if idx.get("unique") and idx.get("column_names") == ["name"]:
+                return  # Already has unique index
 
-    # Also check unique constraints
-    unique_constraints = inspector.get_unique_constraints("agent_specs")
-    for uc in unique_constraints:
-        if uc.get("column_names") == ["name"]:
-            return  # Already has unique constraint
+        # Also check unique constraints
+        unique_constraints = inspector.get_unique_constraints("agent_specs")
+        for uc in unique_constraints:
+            if uc.get("column_names") == ["name"]:
+                return  # Already has unique constraint
 
-    # Add unique index
-    try:
-        with engine.connect() as conn:
+        # Add unique index
+        try:
             conn.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uq_agent_specs_name ON agent_specs (name)"))
-            conn.commit()
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not add unique constraint on agent_specs.name: {e}"
-        )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not add unique constraint on agent_specs.name: {e}"
+            )
 
 
-def _migrate_add_agentspec_spec_path(engine) -> None:
+def _migrate_add_agentspec_spec_path(bind) -> None:
     """Add spec_path column to agent_specs table.
 
     Feature #137: The spec requires a spec_path (VARCHAR, nullable) column
@@ -436,32 +489,31 @@ def _migrate_add_agentspec_spec_path(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        inspector = inspect(conn)
+        existing_tables = inspector.get_table_names()
 
-    if "agent_specs" not in existing_tables:
-        return  # Table doesn't exist yet, will be created with column
+        if "agent_specs" not in existing_tables:
+            return  # Table doesn't exist yet, will be created with column
 
-    # Check if column already exists
-    columns = inspector.get_columns("agent_specs")
-    column_names = [col["name"] for col in columns]
+        # Check if column already exists
+        columns = inspector.get_columns("agent_specs")
+        column_names = [col["name"] for col in columns]
 
-    if "spec_path" in column_names:
-        return  # Column already exists
+        if "spec_path" in column_names:
+            return  # Column already exists
 
-    # Add the column
-    try:
-        with engine.connect() as conn:
+        # Add the column
+        try:
             conn.execute(text("ALTER TABLE agent_specs ADD COLUMN spec_path VARCHAR(500)"))
-            conn.commit()
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not add spec_path column to agent_specs: {e}"
-        )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not add spec_path column to agent_specs: {e}"
+            )
 
 
-def _migrate_add_agentrun_spec_status_index(engine) -> None:
+def _migrate_add_agentrun_spec_status_index(bind) -> None:
     """Add composite index on agent_runs(agent_spec_id, status).
 
     Feature #142: The spec requires a composite index on agent_runs(agent_spec_id, status)
@@ -471,34 +523,33 @@ def _migrate_add_agentrun_spec_status_index(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        inspector = inspect(conn)
+        existing_tables = inspector.get_table_names()
 
-    if "agent_runs" not in existing_tables:
-        return  # Table doesn't exist yet, will be created with index
+        if "agent_runs" not in existing_tables:
+            return  # Table doesn't exist yet, will be created with index
 
-    # Check if composite index already exists
-    indexes = inspector.get_indexes("agent_runs")
-    for idx in indexes:
-        if idx.get("column_names") == ["agent_spec_id", "status"]:
-            return  # Composite index already exists
+        # Check if composite index already exists
+        indexes = inspector.get_indexes("agent_runs")
+        for idx in indexes:
+            if idx.get("column_names") == ["agent_spec_id", "status"]:
+                return  # Composite index already exists
 
-    # Create the composite index
-    try:
-        with engine.connect() as conn:
+        # Create the composite index
+        try:
             conn.execute(text(
                 "CREATE INDEX IF NOT EXISTS ix_agentrun_spec_status "
                 "ON agent_runs (agent_spec_id, status)"
             ))
-            conn.commit()
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not add composite index on agent_runs(agent_spec_id, status): {e}"
-        )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not add composite index on agent_runs(agent_spec_id, status): {e}"
+            )
 
 
-def _migrate_add_agent_event_run_event_type_index(engine) -> None:
+def _migrate_add_agent_event_run_event_type_index(bind) -> None:
     """Add composite index on agent_events(run_id, event_type).
 
     Feature #143: The spec requires a composite index on agent_events(run_id, event_type)
@@ -508,34 +559,33 @@ def _migrate_add_agent_event_run_event_type_index(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        inspector = inspect(conn)
+        existing_tables = inspector.get_table_names()
 
-    if "agent_events" not in existing_tables:
-        return  # Table doesn't exist yet, will be created with index
+        if "agent_events" not in existing_tables:
+            return  # Table doesn't exist yet, will be created with index
 
-    # Check if composite index already exists
-    indexes = inspector.get_indexes("agent_events")
-    for idx in indexes:
-        if idx.get("column_names") == ["run_id", "event_type"]:
-            return  # Composite index already exists
+        # Check if composite index already exists
+        indexes = inspector.get_indexes("agent_events")
+        for idx in indexes:
+            if idx.get("column_names") == ["run_id", "event_type"]:
+                return  # Composite index already exists
 
-    # Create the composite index
-    try:
-        with engine.connect() as conn:
+        # Create the composite index
+        try:
             conn.execute(text(
                 "CREATE INDEX IF NOT EXISTS ix_event_run_event_type "
                 "ON agent_events (run_id, event_type)"
             ))
-            conn.commit()
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not add composite index on agent_events(run_id, event_type): {e}"
-        )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not add composite index on agent_events(run_id, event_type): {e}"
+            )
 
 
-def _migrate_add_agent_event_artifact_fk(engine) -> None:
+def _migrate_add_agent_event_artifact_fk(bind) -> None:
     """Ensure agent_events.artifact_ref FK to artifacts.id is recognized.
 
     Feature #144: The model now declares artifact_ref as ForeignKey('artifacts.id').
@@ -546,16 +596,16 @@ def _migrate_add_agent_event_artifact_fk(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        existing_tables = inspect(conn).get_table_names()
 
-    if "agent_events" not in existing_tables or "artifacts" not in existing_tables:
-        return  # Tables don't exist yet, will be created with FK
+        if "agent_events" not in existing_tables or "artifacts" not in existing_tables:
+            return  # Tables don't exist yet, will be created with FK
 
-    # Enable FK enforcement for this connection
-    # (also done globally, but ensure it's on for cleanup)
-    try:
-        with engine.connect() as conn:
+        # Enable FK enforcement for this connection
+        # (also done globally, but ensure it's on for cleanup; this is a
+        # no-op when the runner already holds an open transaction)
+        try:
             conn.execute(text("PRAGMA foreign_keys=ON"))
             # Clean up orphaned artifact_ref values that would violate the FK
             conn.execute(text(
@@ -563,15 +613,14 @@ def _migrate_add_agent_event_artifact_fk(engine) -> None:
                 "WHERE artifact_ref IS NOT NULL "
                 "AND artifact_ref NOT IN (SELECT id FROM artifacts)"
             ))
-            conn.commit()
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not clean up orphaned artifact_ref values: {e}"
-        )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not clean up orphaned artifact_ref values: {e}"
+            )
 
 
-def _migrate_artifact_not_null_content_hash_size(engine) -> None:
+def _migrate_artifact_not_null_content_hash_size(bind) -> None:
     """Fix NULL values in artifacts.content_hash and artifacts.size_bytes.
 
     Feature #147: The spec implies content_hash and size_bytes are required fields
@@ -584,14 +633,13 @@ def _migrate_artifact_not_null_content_hash_size(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        existing_tables = inspect(conn).get_table_names()
 
-    if "artifacts" not in existing_tables:
-        return  # Table doesn't exist yet, will be created with NOT NULL
+        if "artifacts" not in existing_tables:
+            return  # Table doesn't exist yet, will be created with NOT NULL
 
-    try:
-        with engine.connect() as conn:
+        try:
             # Fix NULL content_hash values with a placeholder hash
             # (empty string SHA256 hash as default for legacy data)
             conn.execute(text(
@@ -603,15 +651,14 @@ def _migrate_artifact_not_null_content_hash_size(engine) -> None:
             conn.execute(text(
                 "UPDATE artifacts SET size_bytes = 0 WHERE size_bytes IS NULL"
             ))
-            conn.commit()
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not fix NULL content_hash/size_bytes in artifacts: {e}"
-        )
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not fix NULL content_hash/size_bytes in artifacts: {e}"
+            )
 
 
-def _migrate_add_agent_planning_decisions_table(engine) -> None:
+def _migrate_add_agent_planning_decisions_table(bind) -> None:
     """Create agent_planning_decisions table if it doesn't exist.
 
     Feature #179: Maestro persists agent-planning decisions to database.
@@ -625,30 +672,30 @@ def _migrate_add_agent_planning_decisions_table(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        existing_tables = inspect(conn).get_table_names()
 
-    if "agent_planning_decisions" in existing_tables:
-        return  # Table already exists
+        if "agent_planning_decisions" in existing_tables:
+            return  # Table already exists
 
-    # Import model here to avoid circular imports
-    try:
-        from api.agentspec_models import AgentPlanningDecisionRecord
-    except ImportError:
-        # Model not yet available (shouldn't happen in normal use)
-        return
+        # Import model here to avoid circular imports
+        try:
+            from api.agentspec_models import AgentPlanningDecisionRecord
+        except ImportError:
+            # Model not yet available (shouldn't happen in normal use)
+            return
 
-    # Create the table
-    try:
-        AgentPlanningDecisionRecord.__table__.create(bind=engine)
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not create agent_planning_decisions table: {e}"
-        )
+        # Create the table
+        try:
+            AgentPlanningDecisionRecord.__table__.create(bind=conn)
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not create agent_planning_decisions table: {e}"
+            )
 
 
-def _migrate_add_agent_icons_table(engine) -> None:
+def _migrate_add_agent_icons_table(bind) -> None:
     """Create agent_icons table if it doesn't exist.
 
     Feature #219: Generated icons stored and retrievable.
@@ -661,33 +708,208 @@ def _migrate_add_agent_icons_table(engine) -> None:
     """
     from sqlalchemy import inspect
 
-    inspector = inspect(engine)
-    existing_tables = inspector.get_table_names()
+    with _migration_connection(bind) as conn:
+        existing_tables = inspect(conn).get_table_names()
 
-    if "agent_icons" in existing_tables:
-        return  # Table already exists
+        if "agent_icons" in existing_tables:
+            return  # Table already exists
 
-    # Import model here to avoid circular imports
-    try:
-        from api.icon_storage import AgentIcon
-    except ImportError:
-        # Model not yet available (shouldn't happen in normal use)
-        return
+        # Import model here to avoid circular imports
+        try:
+            from api.icon_storage import AgentIcon
+        except ImportError:
+            # Model not yet available (shouldn't happen in normal use)
+            return
+
+        # Create the table
+        try:
+            AgentIcon.__table__.create(bind=conn)
+        except Exception as e:
+            import logging
+            logging.getLogger(__name__).warning(
+                f"Could not create agent_icons table: {e}"
+            )
 
-    # Create the table
-    try:
-        AgentIcon.__table__.create(bind=engine)
-    except Exception as e:
-        import logging
-        logging.getLogger(__name__).warning(
-            f"Could not create agent_icons table: {e}"
-        )
+
+def _migrate_add_agent_run_queue_table(bind) -> None:
+    """Create agent_run_queue table if it doesn't exist.
+
+    Durable queue of runs accepted by the execute endpoint and not yet
+    finished by the server's spec executor.
+    """
+    from sqlalchemy import inspect
+
+    with _migration_connection(bind) as conn:
+        existing_tables = inspect(conn).get_table_names()
+
+        if "agent_run_queue" in existing_tables:
+            return  # Table already exists
+
+        from api.agentspec_models import AgentRunQueueEntry
+
+        AgentRunQueueEntry.__table__.create(bind=conn)
+
+
+def _migrate_add_feature_lease_columns(bind) -> None:
+    """Add claimed_by / lease_expires_at columns for feature claim leases."""
+    with _migration_connection(bind) as conn:
+        result = conn.execute(text("PRAGMA table_info(features)"))
+        columns = [row[1] for row in result.fetchall()]
+
+        if "claimed_by" not in columns:
+            conn.execute(text("ALTER TABLE features ADD COLUMN claimed_by VARCHAR(100) DEFAULT NULL"))
+        if "lease_expires_at" not in columns:
+            conn.execute(text("ALTER TABLE features ADD COLUMN lease_expires_at DATETIME DEFAULT NULL"))
+
+
+def _dependency_json_each_sql(column: str) -> str:
+    """SQL table-valued source over a dependencies JSON column (alias dep).
+
+    NULL, non-array or malformed JSON yields no rows. Callers filter on
+    dep.type = 'integer' so non-integer entries are skipped - the same rules
+    as Feature.get_dependencies_safe().
+    """
+    return (
+        f"json_each(CASE WHEN json_valid({column}) "
+        f"THEN CASE WHEN json_type({column}) = 'array' THEN {column} ELSE '[]' END "
+        "ELSE '[]' END) AS dep"
+    )
+
+
+# Keep feature_dependencies in step with features.dependencies
+_FEATURE_DEPENDENCY_TRIGGERS = (
+    f"""CREATE TRIGGER IF NOT EXISTS trg_features_insert_dependencies
+    AFTER INSERT ON features
+    BEGIN
+        INSERT OR IGNORE INTO feature_dependencies (feature_id, depends_on_id)
+        SELECT NEW.id, dep.value FROM {_dependency_json_each_sql('NEW.dependencies')}
+        WHERE dep.type = 'integer';
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_features_update_dependencies
+    AFTER UPDATE OF id, dependencies ON features
+    BEGIN
+        DELETE FROM feature_dependencies WHERE feature_id = OLD.id;
+        INSERT OR IGNORE INTO feature_dependencies (feature_id, depends_on_id)
+        SELECT NEW.id, dep.value FROM {_dependency_json_each_sql('NEW.dependencies')}
+        WHERE dep.type = 'integer';
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_features_delete_dependencies
+    AFTER DELETE ON features
+    BEGIN
+        DELETE FROM feature_dependencies WHERE feature_id = OLD.id;
+    END""",
+)
+
+
+def _migrate_add_feature_dependencies_table(bind) -> None:
+    """Create the feature_dependencies edge table and its sync triggers.
+
+    Existing JSON dependencies are copied into the table once; from then on
+    the triggers maintain it on every insert, update and delete of features.
+    """
+    with _migration_connection(bind) as conn:
+        FeatureDependency.__table__.create(bind=conn, checkfirst=True)
+        for ddl in _FEATURE_DEPENDENCY_TRIGGERS:
+            conn.execute(text(ddl))
+        conn.execute(text(
+            "INSERT OR IGNORE INTO feature_dependencies (feature_id, depends_on_id) "
+            f"SELECT f.id, dep.value FROM features AS f, {_dependency_json_each_sql('f.dependencies')} "
+            "WHERE dep.type = 'integer'"
+        ))
+
+
+# =============================================================================
+# Versioned Migration Runner
+# =============================================================================
+
+# Ordered migration registry: (version, name, migration function).
+# Every function is idempotent, so a legacy database without a schema_version
+# table simply replays all of them once. To change the schema, append a new
+# entry with the next version number - never renumber or remove entries.
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "add_in_progress_column", _migrate_add_in_progress_column),
+    (2, "fix_null_boolean_fields", _migrate_fix_null_boolean_fields),
+    (3, "add_dependencies_column", _migrate_add_dependencies_column),
+    (4, "add_testing_columns", _migrate_add_testing_columns),
+    (5, "add_schedules_tables", _migrate_add_schedules_tables),
+    (6, "add_agentspec_tables", _migrate_add_agentspec_tables),
+    (7, "add_agentspec_spec_path", _migrate_add_agentspec_spec_path),  # Feature #137
+    (8, "add_agentspec_name_unique", _migrate_add_agentspec_name_unique),  # Feature #138
+    (9, "add_agentrun_spec_status_index", _migrate_add_agentrun_spec_status_index),  # Feature #142
+    (10, "add_agent_event_run_event_type_index", _migrate_add_agent_event_run_event_type_index),  # Feature #143
+    (11, "add_agent_event_artifact_fk", _migrate_add_agent_event_artifact_fk),  # Feature #144
+    (12, "artifact_not_null_content_hash_size", _migrate_artifact_not_null_content_hash_size),  # Feature #147
+    (13, "add_agent_planning_decisions_table", _migrate_add_agent_planning_decisions_table),  # Feature #179
+    (14, "add_agent_icons_table", _migrate_add_agent_icons_table),  # Feature #219
+    (15, "add_agent_run_queue_table", _migrate_add_agent_run_queue_table),
+    (16, "add_feature_lease_columns", _migrate_add_feature_lease_columns),
+    (17, "add_feature_dependencies_table", _migrate_add_feature_dependencies_table),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(bind: Engine | Connection) -> int:
+    """Return the highest applied migration version, or 0 if none are recorded.
+
+    This is the single query an up-to-date database costs on startup.
+    """
+    with _migration_connection(bind) as conn:
+        try:
+            version = conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar()
+        except OperationalError:
+            # No schema_version table: brand-new or pre-versioning database
+            return 0
+    return version or 0
+
+
+def run_migrations(engine: Engine) -> list[int]:
+    """Apply all pending migrations inside a single transaction.
+
+    The transaction is opened with BEGIN IMMEDIATE so concurrent processes
+    (MCP server, orchestrator, agent subprocesses) starting against the same
+    file serialize here; the version is re-read under the write lock so only
+    the first of them does any work.
+
+    Args:
+        engine: Engine for the project database
+
+    Returns:
+        List of migration versions that were applied (empty if up to date)
+    """
+    applied: list[int] = []
+    with engine.connect() as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            current = get_schema_version(conn)
+            if current < SCHEMA_VERSION:
+                Base.metadata.create_all(bind=conn)
+                for version, name, migrate in MIGRATIONS:
+                    if version <= current:
+                        continue
+                    migrate(conn)
+                    conn.execute(
+                        text(
+                            "INSERT INTO schema_version (version, name, applied_at) "
+                            "VALUES (:version, :name, :applied_at)"
+                        ),
+                        {"version": version, "name": name, "applied_at": _utc_now()},
+                    )
+                    applied.append(version)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return applied
 
 
 def create_database(project_dir: Path) -> tuple:
     """
     Create database and return engine + session maker.
 
+    A database already at SCHEMA_VERSION costs a single SELECT; otherwise
+    the journal mode is configured and pending migrations are applied.
+
     Args:
         project_dir: Directory containing the project
 
@@ -697,58 +919,151 @@ def create_database(project_dir: Path) -> tuple:
     db_url = get_database_url(project_dir)
     engine = create_engine(db_url, connect_args={
         "check_same_thread": False,
-        "timeout": 30  # Wait up to 30s for locks
+        "timeout": 30  # Wait up to 30s for locks (sets busy_timeout per connection)
     })
-    Base.metadata.create_all(bind=engine)
 
-    # Choose journal mode based on filesystem type
-    # WAL mode doesn't work reliably on network filesystems and can cause corruption
-    is_network = _is_network_path(project_dir)
-    journal_mode = "DELETE" if is_network else "WAL"
+    if get_schema_version(engine) < SCHEMA_VERSION:
+        # Choose journal mode based on filesystem type
+        # WAL mode doesn't work reliably on network filesystems and can cause corruption
+        # (journal mode is persistent in the database file, so this only runs on upgrade)
+        is_network = _is_network_path(project_dir)
+        journal_mode = "DELETE" if is_network else "WAL"
 
-    with engine.connect() as conn:
-        conn.execute(text(f"PRAGMA journal_mode={journal_mode}"))
-        conn.execute(text("PRAGMA busy_timeout=30000"))
-        conn.commit()
+        with engine.connect() as conn:
+            conn.execute(text(f"PRAGMA journal_mode={journal_mode}"))
+            conn.execute(text("PRAGMA busy_timeout=30000"))
+            conn.commit()
 
-    # Migrate existing databases
-    _migrate_add_in_progress_column(engine)
-    _migrate_fix_null_boolean_fields(engine)
-    _migrate_add_dependencies_column(engine)
-    _migrate_add_testing_columns(engine)
+        run_migrations(engine)
 
-    # Migrate to add schedules tables
-    _migrate_add_schedules_tables(engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return engine, SessionLocal
 
-    # Migrate to add AgentSpec tables (AutoBuildr extension)
-    _migrate_add_agentspec_tables(engine)
 
-    # Feature #137: Add spec_path column to agent_specs
-    _migrate_add_agentspec_spec_path(engine)
+# Process-wide engine registry keyed by database file path.
+# create_database() builds a new engine and runs every migration, which is far
+# too expensive to repeat on each HTTP request. Long-lived processes (the FastAPI
+# server in particular) should go through get_cached_database() instead.
+_engine_cache: dict[str, tuple] = {}
+_engine_cache_lock = threading.Lock()
 
-    # Feature #138: Add unique constraint on agent_specs.name
-    _migrate_add_agentspec_name_unique(engine)
 
-    # Feature #142: Add composite index on agent_runs(agent_spec_id, status)
-    _migrate_add_agentrun_spec_status_index(engine)
+def _engine_cache_key(project_dir: Path) -> str:
+    """Return the registry key for a project's database file."""
+    return str(get_database_path(Path(project_dir)).resolve())
 
-    # Feature #143: Add composite index on agent_events(run_id, event_type)
-    _migrate_add_agent_event_run_event_type_index(engine)
 
-    # Feature #144: Ensure agent_events.artifact_ref FK to artifacts.id
-    _migrate_add_agent_event_artifact_fk(engine)
+def get_cached_database(project_dir: Path) -> tuple:
+    """
+    Return a process-wide (engine, SessionLocal) pair for a project.
 
-    # Feature #147: Fix NULL content_hash/size_bytes in artifacts
-    _migrate_artifact_not_null_content_hash_size(engine)
+    The first call for a database file creates the engine and runs the
+    migrations via create_database(); later calls reuse the pooled engine.
+    If the database file has disappeared since it was cached (e.g. the
+    project files were deleted), the stale engine is disposed and rebuilt.
 
-    # Feature #179: Add agent_planning_decisions table
-    _migrate_add_agent_planning_decisions_table(engine)
+    Args:
+        project_dir: Directory containing the project
 
-    # Feature #219: Add agent_icons table
-    _migrate_add_agent_icons_table(engine)
+    Returns:
+        Tuple of (engine, SessionLocal), same as create_database()
+    """
+    key = _engine_cache_key(project_dir)
+    db_exists = Path(key).exists()
 
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return engine, SessionLocal
+    cached = _engine_cache.get(key)
+    if cached is not None and db_exists:
+        return cached
+
+    with _engine_cache_lock:
+        cached = _engine_cache.get(key)
+        if cached is not None:
+            if Path(key).exists():
+                return cached
+            # Database file was removed out from under us
+            del _engine_cache[key]
+            cached[0].dispose()
+
+        cached = create_database(project_dir)
+        _engine_cache[key] = cached
+        return cached
+
+
+def dispose_cached_database(project_dir: Path) -> bool:
+    """
+    Drop a project's engine from the registry and close its pooled connections.
+
+    Call this when a project is deleted so a later project with the same
+    path starts from a fresh engine (and runs its migrations again).
+
+    Args:
+        project_dir: Directory containing the project
+
+    Returns:
+        True if an engine was cached for the project, False otherwise
+    """
+    # Lazy import: dependency_order imports this module
+    from api.dependency_order import discard_project_dependency_order
+
+    discard_project_dependency_order(project_dir)
+
+    key = _engine_cache_key(project_dir)
+    with _engine_cache_lock:
+        cached = _engine_cache.pop(key, None)
+    if cached is None:
+        return False
+    cached[0].dispose()
+    return True
+
+
+def dispose_all_cached_databases() -> int:
+    """
+    Dispose every cached engine. Used on server shutdown.
+
+    Returns:
+        Number of engines disposed
+    """
+    with _engine_cache_lock:
+        cached_items = list(_engine_cache.values())
+        _engine_cache.clear()
+    for engine, _ in cached_items:
+        engine.dispose()
+    return len(cached_items)
+
+
+class DataVersionWatcher:
+    """
+    Detect commits made to a project database by other connections.
+
+    Reads ``PRAGMA data_version`` on a dedicated connection. SQLite changes
+    that value whenever another connection - in this process or another one,
+    e.g. an agent's MCP server - commits to the database. The check touches
+    no tables, so it is cheap enough to poll a few times per second in place
+    of re-querying feature state.
+    """
+
+    def __init__(self, project_dir: Path):
+        self._db_path = get_database_path(project_dir)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def current(self) -> int:
+        """Return the current data version (opens the connection on first use)."""
+        with self._lock:
+            if self._conn is None:
+                self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False, timeout=30)
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changed_since(self, version: Optional[int]) -> bool:
+        """Return True if another connection committed since ``version`` was read."""
+        return version is None or self.current() != version
+
+    def close(self) -> None:
+        """Close the watcher connection. A later current() call reopens it."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
 
 # Global session maker - will be set when server starts
@@ -0,0 +1,457 @@
+"""
+Dependency Order
+================
+
+Incremental topological order of features with exact cycle detection.
+
+Adding a dependency used to run a depth-capped recursive DFS over every
+feature (would_create_circular_dependency), and validating the graph re-walked
+it recursively. DependencyOrder instead keeps a topological order of the
+dependency graph up to date as edges change (Pearce-Kelly):
+
+- A new edge whose dependency already comes first costs O(1)
+- Otherwise only the features whose position lies between the two endpoints
+  are searched and reordered, and reaching the dependent feature during that
+  search is an exact cycle detection - no depth cap, no recursion
+- Removing an edge never invalidates the order
+- Large batches (a fresh project, the initializer's bulk create) are applied
+  by a single Kahn pass, O(features + edges)
+
+Edges that would close a cycle are kept aside ("rejected") so cycles already
+present in a database can be reported by cycles(), and are retried whenever
+an edge is removed.
+
+Edges are (feature_id, depends_on_id) pairs, as in the feature_dependencies
+table. find_dependency_cycle() keeps one order per project database, synced
+from that table only when the database changed (PRAGMA data_version).
+
+Example:
+    >>> order = DependencyOrder.from_edges([(2, 1), (3, 2)])
+    >>> order.find_cycle(1, 3)     # 1 would depend on 3, which depends on 2 -> 1
+    [1, 3, 2]
+    >>> order.add_dependency(3, 1) is None
+    True
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+class DependencyOrder:
+    """Topological order of features, repaired incrementally on edge changes.
+
+    Every accepted edge (f depends on d) satisfies position(d) < position(f).
+    Positions are unique integers but need not be contiguous.
+    """
+
+    def __init__(self) -> None:
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pos: dict[int, int] = {}
+        self._next_pos = 0
+        # Accepted edges, both directions
+        self._deps: dict[int, set[int]] = {}        # feature -> its dependencies
+        self._dependents: dict[int, set[int]] = {}  # feature -> features depending on it
+        # Edges left out because they close a cycle: (feature_id, depends_on_id)
+        self._rejected: set[tuple[int, int]] = set()
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple[int, int]], nodes: Iterable[int] = ()) -> "DependencyOrder":
+        """Build an order from (feature_id, depends_on_id) edges in O(V + E)."""
+        order = cls()
+        order._rebuild(set(nodes), set(edges))
+        return order
+
+    @classmethod
+    def from_features(cls, features: Iterable[dict]) -> "DependencyOrder":
+        """Build an order from feature dicts (id, dependencies)."""
+        nodes: set[int] = set()
+        edges: set[tuple[int, int]] = set()
+        for f in features:
+            nodes.add(f["id"])
+            for dep_id in f.get("dependencies") or []:
+                if isinstance(dep_id, int):
+                    edges.add((f["id"], dep_id))
+        return cls.from_edges(edges, nodes)
+
+    def _rebuild(self, nodes: set[int], edges: set[tuple[int, int]]) -> None:
+        """Replace all state with a Kahn pass over the given graph."""
+        self._reset()
+        edges = {(f, d) for f, d in edges if f != d}
+        for f, d in edges:
+            nodes.add(f)
+            nodes.add(d)
+        in_degree = dict.fromkeys(nodes, 0)
+        dependents: dict[int, list[int]] = {n: [] for n in nodes}
+        for f, d in edges:
+            in_degree[f] += 1
+            dependents[d].append(f)
+
+        # Smallest ID first among available features, for a stable order
+        ordered: list[int] = []
+        heap = [n for n, deg in in_degree.items() if deg == 0]
+        heapq.heapify(heap)
+        while heap:
+            node = heapq.heappop(heap)
+            ordered.append(node)
+            for f in dependents[node]:
+                in_degree[f] -= 1
+                if in_degree[f] == 0:
+                    heapq.heappush(heap, f)
+        # Features left over are on or behind a cycle
+        ordered.extend(sorted(n for n, deg in in_degree.items() if deg > 0))
+
+        pos = self._pos = {n: i for i, n in enumerate(ordered)}
+        self._next_pos = len(ordered)
+        self._deps = {n: set() for n in ordered}
+        self._dependents = {n: set() for n in ordered}
+
+        deferred = []
+        for f, d in edges:
+            if pos[d] < pos[f]:
+                self._deps[f].add(d)
+                self._dependents[d].add(f)
+            else:
+                deferred.append((f, d))
+        # Only edges touching cyclic parts remain; repair or reject them
+        for f, d in sorted(deferred):
+            self.add_dependency(f, d)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __contains__(self, feature_id: int) -> bool:
+        return feature_id in self._pos
+
+    def __len__(self) -> int:
+        return len(self._pos)
+
+    def order(self) -> list[int]:
+        """Feature IDs with every dependency before its dependents."""
+        return sorted(self._pos, key=self._pos.__getitem__)
+
+    def edges(self) -> set[tuple[int, int]]:
+        """All known edges, including rejected ones."""
+        accepted = {(f, d) for f, deps in self._deps.items() for d in deps}
+        return accepted | self._rejected
+
+    def find_cycle(self, feature_id: int, depends_on_id: int) -> list[int] | None:
+        """Cycle that making feature_id depend on depends_on_id would close.
+
+        Returns:
+            The cycle in "depends on" order starting at feature_id
+            (feature_id -> depends_on_id -> ... -> back to feature_id),
+            or None if the edge is safe. A self-reference is [feature_id].
+        """
+        if feature_id == depends_on_id:
+            return [feature_id]
+        if feature_id not in self._pos or depends_on_id not in self._pos:
+            return None
+        # A cycle exists iff depends_on_id already (transitively) depends on feature_id
+        if self._rejected:
+            parents = self._search_all(feature_id, depends_on_id)
+        else:
+            if self._pos[depends_on_id] < self._pos[feature_id]:
+                return None
+            parents = self._search_forward(feature_id, self._pos[depends_on_id])
+        return self._cycle_from(parents, feature_id, depends_on_id)
+
+    def cycles(self) -> list[list[int]]:
+        """One cycle per rejected edge, each rotated to start at its smallest ID.
+
+        Each cycle is the rejected edge closed by a path of accepted edges
+        (which always exists, see _retry_rejected), so every rejected edge
+        yields a distinct cycle.
+        """
+        found: set[tuple[int, ...]] = set()
+        for f, d in self._rejected:
+            parents = self._search_forward(f, self._pos[d])
+            cycle = self._cycle_from(parents, f, d)
+            if not cycle:
+                continue
+            start = cycle.index(min(cycle))
+            found.add(tuple(cycle[start:] + cycle[:start]))
+        return [list(c) for c in sorted(found)]
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add_dependency(self, feature_id: int, depends_on_id: int) -> list[int] | None:
+        """Add an edge, repairing the order.
+
+        Returns:
+            None if the edge was added, or the cycle it would close (the edge
+            is then kept aside as rejected and reported by cycles()).
+        """
+        if feature_id == depends_on_id:
+            return [feature_id]
+        self._add_node(feature_id)
+        self._add_node(depends_on_id)
+        if depends_on_id in self._deps[feature_id] or (feature_id, depends_on_id) in self._rejected:
+            return None
+
+        lower = self._pos[feature_id]
+        upper = self._pos[depends_on_id]
+        if upper < lower:
+            self._link(feature_id, depends_on_id)
+            return None
+
+        forward = self._search_forward(feature_id, upper)
+        if depends_on_id in forward:
+            self._rejected.add((feature_id, depends_on_id))
+            return self._cycle_from(forward, feature_id, depends_on_id)
+
+        backward = self._search_backward(depends_on_id, lower)
+        self._reorder(backward, forward)
+        self._link(feature_id, depends_on_id)
+        return None
+
+    def remove_dependency(self, feature_id: int, depends_on_id: int) -> None:
+        """Remove an edge. The order stays valid; rejected edges are retried."""
+        if (feature_id, depends_on_id) in self._rejected:
+            self._rejected.discard((feature_id, depends_on_id))
+            return
+        if depends_on_id in self._deps.get(feature_id, ()):
+            self._deps[feature_id].discard(depends_on_id)
+            self._dependents[depends_on_id].discard(feature_id)
+            self._retry_rejected()
+
+    def remove_feature(self, feature_id: int) -> None:
+        """Remove a feature and every edge touching it."""
+        if feature_id not in self._pos:
+            return
+        for d in self._deps.pop(feature_id):
+            self._dependents[d].discard(feature_id)
+        for f in self._dependents.pop(feature_id):
+            self._deps[f].discard(feature_id)
+        del self._pos[feature_id]
+        self._rejected = {(f, d) for f, d in self._rejected if feature_id not in (f, d)}
+        self._retry_rejected()
+
+    def sync(self, nodes: Iterable[int], edges: Iterable[tuple[int, int]]) -> None:
+        """Bring the order in line with a full snapshot of features and edges.
+
+        Only the difference is applied. A difference larger than the graph
+        itself (first load, bulk creation) is applied by one Kahn pass.
+        """
+        nodes = set(nodes)
+        edges = {(f, d) for f, d in edges if f != d}
+        for f, d in edges:
+            nodes.add(f)
+            nodes.add(d)
+
+        current = self.edges()
+        added = edges - current
+        if len(added) > len(current) + len(self._pos):
+            self._rebuild(nodes, edges)
+            return
+
+        for f, d in current - edges:
+            self.remove_dependency(f, d)
+        for feature_id in [n for n in self._pos if n not in nodes]:
+            self.remove_feature(feature_id)
+        for node in sorted(nodes - self._pos.keys()):
+            self._add_node(node)
+        for f, d in sorted(added):
+            self.add_dependency(f, d)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _add_node(self, feature_id: int) -> None:
+        if feature_id not in self._pos:
+            self._pos[feature_id] = self._next_pos
+            self._next_pos += 1
+            self._deps[feature_id] = set()
+            self._dependents[feature_id] = set()
+
+    def _link(self, feature_id: int, depends_on_id: int) -> None:
+        self._deps[feature_id].add(depends_on_id)
+        self._dependents[depends_on_id].add(feature_id)
+
+    @staticmethod
+    def _cycle_from(parents: dict[int, int], feature_id: int, depends_on_id: int) -> list[int] | None:
+        """Cycle closed by feature_id -> depends_on_id, from a dependents search tree."""
+        if depends_on_id not in parents:
+            return None
+        # parents walks back from depends_on_id to feature_id along dependents
+        cycle = [feature_id]
+        node = depends_on_id
+        while node != feature_id:
+            cycle.append(node)
+            node = parents[node]
+        return cycle
+
+    def _search_forward(self, start: int, upper: int) -> dict[int, int]:
+        """Dependents reachable from start with position <= upper (node -> parent)."""
+        parents = {start: start}
+        stack = [start]
+        pos = self._pos
+        while stack:
+            node = stack.pop()
+            for f in self._dependents[node]:
+                if f not in parents and pos[f] <= upper:
+                    parents[f] = node
+                    stack.append(f)
+        return parents
+
+    def _search_backward(self, start: int, lower: int) -> set[int]:
+        """Dependencies reachable from start with position > lower."""
+        seen = {start}
+        stack = [start]
+        pos = self._pos
+        while stack:
+            node = stack.pop()
+            for d in self._deps[node]:
+                if d not in seen and pos[d] > lower:
+                    seen.add(d)
+                    stack.append(d)
+        return seen
+
+    def _search_all(self, start: int, goal: int) -> dict[int, int]:
+        """Unbounded search along dependents, including rejected edges.
+
+        Positions only bound searches through accepted edges, so this is
+        used while the graph holds rejected (cyclic) edges.
+        """
+        extra: dict[int, list[int]] = {}
+        for f, d in self._rejected:
+            extra.setdefault(d, []).append(f)
+        parents = {start: start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                break
+            for f in (*self._dependents[node], *extra.get(node, ())):
+                if f not in parents:
+                    parents[f] = node
+                    stack.append(f)
+        return parents
+
+    def _reorder(self, backward: set[int], forward: dict[int, int]) -> None:
+        """Move the backward set ahead of the forward set, reusing their positions."""
+        pos = self._pos
+        moved = sorted(backward, key=pos.__getitem__) + sorted(forward, key=pos.__getitem__)
+        slots = sorted(pos[n] for n in moved)
+        for node, slot in zip(moved, slots):
+            pos[node] = slot
+
+    def _retry_rejected(self) -> None:
+        """Accept rejected edges that no longer close a cycle.
+
+        Keeps the invariant that every rejected edge is closed into a cycle
+        by accepted edges alone.
+        """
+        if not self._rejected:
+            return
+        pending = sorted(self._rejected)
+        self._rejected.clear()
+        for f, d in pending:
+            self.add_dependency(f, d)
+
+
+# =============================================================================
+# Per-project orders
+# =============================================================================
+
+class _ProjectOrder:
+    """A project's DependencyOrder and the database version it reflects."""
+
+    def __init__(self, project_dir: Path):
+        # Lazy import: DependencyOrder itself is used without a database
+        from api.database import DataVersionWatcher
+
+        self.watcher = DataVersionWatcher(project_dir)
+        self.version: int | None = None
+        self.order = DependencyOrder()
+        self.lock = threading.Lock()
+
+    def refresh(self, session: "Session") -> DependencyOrder:
+        """Sync with the database if it changed since the last call (hold lock)."""
+        from sqlalchemy import text
+
+        from api.dependency_queries import get_dependency_edges
+
+        # Read the version first: a commit racing with the reads below makes
+        # the next call sync again rather than being missed
+        version = self.watcher.current()
+        if version != self.version:
+            nodes = [row[0] for row in session.execute(text("SELECT id FROM features"))]
+            self.order.sync(nodes, get_dependency_edges(session))
+            self.version = version
+        return self.order
+
+
+_project_orders: dict[str, _ProjectOrder] = {}
+_project_orders_lock = threading.Lock()
+
+
+def _project_key(project_dir: Path) -> str:
+    from api.database import get_database_path
+
+    return str(get_database_path(Path(project_dir)).resolve())
+
+
+def _project_order(project_dir: Path) -> _ProjectOrder:
+    key = _project_key(project_dir)
+    with _project_orders_lock:
+        entry = _project_orders.get(key)
+        if entry is None:
+            entry = _project_orders[key] = _ProjectOrder(Path(project_dir))
+        return entry
+
+
+def find_dependency_cycle(
+    project_dir: Path,
+    session: "Session",
+    feature_id: int,
+    dependency_ids: Iterable[int],
+) -> list[int] | None:
+    """Check whether giving feature_id these dependencies would create a cycle.
+
+    Uses the project's cached DependencyOrder, re-synced from the
+    feature_dependencies table only when the database changed.
+
+    Args:
+        project_dir: Project directory (one order is kept per database)
+        session: Session on the project database
+        feature_id: Feature gaining the dependencies
+        dependency_ids: Proposed dependency IDs (existing ones may be included)
+
+    Returns:
+        The first cycle found ([feature_id, dependency_id, ..., ] in
+        "depends on" order), or None if all dependencies are safe
+    """
+    entry = _project_order(project_dir)
+    with entry.lock:
+        order = entry.refresh(session)
+        for dep_id in dependency_ids:
+            cycle = order.find_cycle(feature_id, dep_id)
+            if cycle:
+                return cycle
+    return None
+
+
+def discard_project_dependency_order(project_dir: Path) -> None:
+    """Forget a project's cached order (e.g. when the project is deleted)."""
+    key = _project_key(project_dir)
+    with _project_orders_lock:
+        entry = _project_orders.pop(key, None)
+    if entry is not None:
+        entry.watcher.close()
@@ -0,0 +1,151 @@
+"""
+Dependency Queries
+==================
+
+Indexed SQL queries over the feature_dependencies edge table
+(api.database.FeatureDependency).
+
+Ready/blocked status used to require loading every feature and parsing its
+dependencies JSON in Python. These queries let SQLite answer them from the
+edge table's indexes instead, touching only the rows involved:
+
+- DEPENDENCIES_MET_SQL: "every dependency of f passes" as a SQL condition
+- get_ready_feature_ids() / count_ready_features(): features ready to start
+- get_blocking_dependencies_map(): unmet dependency IDs per feature
+- get_dependents(): who depends on a feature
+- get_unblocked_by(): dependents that become ready once a feature passes
+- get_dependency_edges(): (feature_id, depends_on_id) pairs for graphs
+
+A dependency is met when the referenced feature exists and passes, so a
+reference to a missing feature keeps its dependent blocked - the same rule
+as api.dependency_resolver.
+
+Example:
+    >>> blocking = get_blocking_dependencies_map(session, pending_only=True)
+    >>> blocking
+    {7: [3, 5], 9: [7]}
+    >>> get_unblocked_by(session, 3)
+    []
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Iterable
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# Every dependency of the features row aliased "f" exists and passes
+DEPENDENCIES_MET_SQL = """NOT EXISTS (
+    SELECT 1 FROM feature_dependencies AS fd
+    LEFT JOIN features AS d ON d.id = fd.depends_on_id
+    WHERE fd.feature_id = f.id AND d.passes IS NOT 1
+)"""
+
+# Not passing, not in progress, all dependencies met
+_READY_SQL = f"f.passes = 0 AND f.in_progress = 0 AND {DEPENDENCIES_MET_SQL}"
+
+# Edges whose dependency is not (yet) satisfied
+_UNMET_EDGES_SQL = """
+    SELECT fd.feature_id, fd.depends_on_id FROM feature_dependencies AS fd
+    JOIN features AS f ON f.id = fd.feature_id
+    LEFT JOIN features AS d ON d.id = fd.depends_on_id
+    WHERE d.passes IS NOT 1
+"""
+
+
+def get_ready_feature_ids(session: Session, limit: int | None = None) -> list[int]:
+    """IDs of features ready to start, by priority then id.
+
+    Args:
+        session: Database session
+        limit: Maximum number of IDs to return (None = all)
+    """
+    rows = session.execute(
+        text(f"SELECT f.id FROM features AS f WHERE {_READY_SQL} ORDER BY f.priority, f.id LIMIT :limit"),
+        {"limit": -1 if limit is None else limit},
+    )
+    return [row[0] for row in rows]
+
+
+def count_ready_features(session: Session) -> int:
+    """Number of features ready to start."""
+    return session.execute(
+        text(f"SELECT COUNT(*) FROM features AS f WHERE {_READY_SQL}")
+    ).scalar() or 0
+
+
+def get_blocking_dependencies_map(
+    session: Session,
+    feature_ids: Iterable[int] | None = None,
+    pending_only: bool = False,
+) -> dict[int, list[int]]:
+    """Map each blocked feature to its unmet dependency IDs.
+
+    Features without unmet dependencies are absent from the result, so its
+    keys are exactly the blocked features (in id order).
+
+    Args:
+        session: Database session
+        feature_ids: Restrict to these features (None = all)
+        pending_only: Skip passing features, whose dependencies no longer matter
+    """
+    sql = _UNMET_EDGES_SQL
+    params = {}
+    if pending_only:
+        sql += " AND f.passes = 0"
+    if feature_ids is not None:
+        sql += " AND fd.feature_id IN (SELECT value FROM json_each(:feature_ids))"
+        params["feature_ids"] = json.dumps(list(feature_ids))
+    sql += " ORDER BY fd.feature_id, fd.depends_on_id"
+
+    blocking: dict[int, list[int]] = {}
+    for feature_id, depends_on_id in session.execute(text(sql), params):
+        blocking.setdefault(feature_id, []).append(depends_on_id)
+    return blocking
+
+
+def get_dependents(session: Session, feature_id: int) -> list[int]:
+    """IDs of features that depend on feature_id."""
+    rows = session.execute(
+        text(
+            "SELECT feature_id FROM feature_dependencies "
+            "WHERE depends_on_id = :feature_id ORDER BY feature_id"
+        ),
+        {"feature_id": feature_id},
+    )
+    return [row[0] for row in rows]
+
+
+def get_unblocked_by(session: Session, feature_id: int) -> list[int]:
+    """Dependents of feature_id that are ready once it passes.
+
+    These are pending features whose only unmet dependency is feature_id
+    (or that are already ready, if feature_id passes), by priority then id.
+    """
+    rows = session.execute(
+        text("""
+            SELECT f.id FROM feature_dependencies AS r
+            JOIN features AS f ON f.id = r.feature_id
+            WHERE r.depends_on_id = :feature_id
+              AND f.passes = 0 AND f.in_progress = 0
+              AND NOT EXISTS (
+                  SELECT 1 FROM feature_dependencies AS fd
+                  LEFT JOIN features AS d ON d.id = fd.depends_on_id
+                  WHERE fd.feature_id = f.id AND fd.depends_on_id != :feature_id
+                    AND d.passes IS NOT 1
+              )
+            ORDER BY f.priority, f.id
+        """),
+        {"feature_id": feature_id},
+    )
+    return [row[0] for row in rows]
+
+
+def get_dependency_edges(session: Session) -> list[tuple[int, int]]:
+    """All (feature_id, depends_on_id) edges."""
+    rows = session.execute(
+        text("SELECT feature_id, depends_on_id FROM feature_dependencies ORDER BY feature_id, depends_on_id")
+    )
+    return [(row[0], row[1]) for row in rows]
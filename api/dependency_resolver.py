@@ -8,13 +8,18 @@ Includes cycle detection, validation, and helper functions for dependency manage
 
 import heapq
 import logging
-from typing import TypedDict
+from collections import deque
+from typing import TYPE_CHECKING, TypedDict
+
+from api.dependency_order import DependencyOrder
+
+if TYPE_CHECKING:
+    from api.feature_graph import FeatureGraph
 
 _logger = logging.getLogger(__name__)
 
 # Security: Prevent DoS via excessive dependencies
 MAX_DEPENDENCIES_PER_FEATURE = 20
-MAX_DEPENDENCY_DEPTH = 50  # Prevent stack overflow in cycle detection
 
 
 class DependencyResult(TypedDict):
@@ -169,7 +174,11 @@ def would_create_circular_dependency(
 ) -> bool:
     """Check if adding a dependency from target to source would create a cycle.
 
-    Uses DFS with visited set for efficient cycle detection.
+    Exact and iterative (see api.dependency_order): there is no depth cap,
+    so long cycles are always found and long acyclic chains are accepted.
+    Callers that check repeatedly against a project database should use
+    dependency_order.find_dependency_cycle(), which keeps the order between
+    calls instead of rebuilding it from the feature list.
 
     Args:
         features: List of all feature dicts
@@ -182,40 +191,12 @@ def would_create_circular_dependency(
     if source_id == target_id:
         return True  # Self-reference is a cycle
 
-    feature_map = {f["id"]: f for f in features}
-    source = feature_map.get(source_id)
-    if not source:
-        return False
-
-    # Check if target already depends on source (direct or indirect)
-    target = feature_map.get(target_id)
-    if not target:
+    feature_ids = {f["id"] for f in features}
+    if source_id not in feature_ids or target_id not in feature_ids:
         return False
 
-    # DFS from target to see if we can reach source
-    visited: set[int] = set()
-
-    def can_reach(current_id: int, depth: int = 0) -> bool:
-        # Security: Prevent stack overflow with depth limit
-        if depth > MAX_DEPENDENCY_DEPTH:
-            return True  # Assume cycle if too deep (fail-safe)
-        if current_id == source_id:
-            return True
-        if current_id in visited:
-            return False
-        visited.add(current_id)
-
-        current = feature_map.get(current_id)
-        if not current:
-            return False
-
-        deps = current.get("dependencies") or []
-        for dep_id in deps:
-            if can_reach(dep_id, depth + 1):
-                return True
-        return False
-
-    return can_reach(target_id)
+    order = DependencyOrder.from_features(features)
+    return order.find_cycle(source_id, target_id) is not None
 
 
 def validate_dependencies(
@@ -364,82 +345,27 @@ def _detect_cycles_for_validation(
 ) -> list[list[int]]:
     """Detect cycles in the dependency graph for validation purposes.
 
-    Similar to _detect_cycles but returns unique cycles without duplicates.
-    Enforces iteration limit of len(features) * 2 to prevent infinite loops.
+    Builds a DependencyOrder in one O(features + edges) pass; every edge it
+    has to reject closes a cycle, which is reported once, rotated to start
+    at its smallest ID. Iterative, so arbitrarily long cycles are found.
 
     Args:
         features: List of features to check for cycles
-        feature_map: Map of feature_id -> feature dict
+        feature_map: Map of feature_id -> feature dict (dependencies to IDs
+            not in the map are ignored)
 
     Returns:
         List of unique cycles, where each cycle is a list of feature IDs
     """
-    cycles: list[list[int]] = []
-    visited: set[int] = set()
-    rec_stack: set[int] = set()
-    path: list[int] = []
-    found_cycles: set[tuple[int, ...]] = set()  # Track unique cycles
-
-    # Iteration limit to prevent infinite loops
-    max_iterations = len(features) * 2
-    iteration_count = [0]  # Use list to allow mutation in nested function
-    limit_exceeded = [False]
-
-    def dfs(fid: int) -> None:
-        # Check iteration limit
-        iteration_count[0] += 1
-        if iteration_count[0] > max_iterations:
-            if not limit_exceeded[0]:
-                _logger.error(
-                    "_detect_cycles_for_validation: DFS iteration limit exceeded "
-                    f"(limit={max_iterations}, features={len(features)}). "
-                    "Returning partial results."
-                )
-                limit_exceeded[0] = True
-            return
-
-        visited.add(fid)
-        rec_stack.add(fid)
-        path.append(fid)
-
-        feature = feature_map.get(fid)
-        if feature and not limit_exceeded[0]:
-            for dep_id in feature.get("dependencies") or []:
-                if limit_exceeded[0]:
-                    break
-                # Skip self-references (handled separately)
-                if dep_id == fid:
-                    continue
-                # Skip dependencies to non-existent features
-                if dep_id not in feature_map:
-                    continue
-
-                if dep_id not in visited:
-                    dfs(dep_id)
-                elif dep_id in rec_stack:
-                    # Found a cycle - extract the cycle path
-                    try:
-                        cycle_start = path.index(dep_id)
-                        cycle = path[cycle_start:]
-                        # Normalize cycle for deduplication (start from smallest ID)
-                        min_idx = cycle.index(min(cycle))
-                        normalized = tuple(cycle[min_idx:] + cycle[:min_idx])
-                        if normalized not in found_cycles:
-                            found_cycles.add(normalized)
-                            cycles.append(list(normalized))
-                    except ValueError:
-                        pass  # dep_id not in path, shouldn't happen
-
-        path.pop()
-        rec_stack.remove(fid)
-
-    for f in features:
-        if limit_exceeded[0]:
-            break
-        if f["id"] not in visited:
-            dfs(f["id"])
-
-    return cycles
+    edges = [
+        (fid, dep_id)
+        for fid, feature in feature_map.items()
+        for dep_id in feature.get("dependencies") or []
+        # Self-references are reported separately; missing targets cannot cycle
+        if dep_id != fid and dep_id in feature_map
+    ]
+    order = DependencyOrder.from_edges(edges, nodes=(f["id"] for f in features))
+    return order.cycles()
 
 
 def _detect_cycles(features: list[dict], feature_map: dict) -> list[list[int]]:
@@ -517,6 +443,12 @@ def compute_scheduling_scores(features: list[dict]) -> dict[int, float]:
 
     Score formula: (1000 * unblock) + (100 * depth_score) + (10 * priority_factor)
 
+    Runs in one Kahn pass (O(V + E)): depth is the longest path from a root,
+    and downstream work is the exact number of distinct transitive dependents,
+    so shared descendants in diamond-shaped graphs are counted once. Callers
+    that score the same graph repeatedly should go through FeatureGraph,
+    which caches the result per structural version.
+
     Args:
         features: List of feature dicts with id, priority, dependencies fields
 
@@ -526,31 +458,45 @@ def compute_scheduling_scores(features: list[dict]) -> dict[int, float]:
     if not features:
         return {}
 
-    # Build adjacency lists
-    children: dict[int, list[int]] = {f["id"]: [] for f in features}  # who depends on me
-    parents: dict[int, list[int]] = {f["id"]: [] for f in features}   # who I depend on
-
+    # Build adjacency lists over dense indices
+    index: dict[int, int] = {}
+    ids: list[int] = []
     for f in features:
+        if f["id"] not in index:
+            index[f["id"]] = len(ids)
+            ids.append(f["id"])
+    n = len(ids)
+
+    children: list[list[int]] = [[] for _ in range(n)]  # who depends on me
+    in_degree = [0] * n                                 # how many valid deps I have
+    seen_deps: set[int] = set()
+    for f in features:
+        i = index[f["id"]]
+        seen_deps.clear()
         for dep_id in (f.get("dependencies") or []):
-            if dep_id in children:  # Only valid deps
-                children[dep_id].append(f["id"])
-                parents[f["id"]].append(dep_id)
-
-    # Calculate depths via BFS from roots with visited tracking and iteration limit
-    # visited set prevents re-processing nodes in cycles
+            dep = index.get(dep_id)  # Only valid deps
+            if dep is not None and dep_id not in seen_deps:
+                seen_deps.add(dep_id)
+                children[dep].append(i)
+                in_degree[i] += 1
+
+    # Kahn pass from roots: topological order plus longest-path depth.
+    # visited set prevents re-queueing a node; nodes in cycles never reach
+    # in-degree 0 and keep depth 0.
     # iteration limit provides defense-in-depth against unexpected graph issues
     max_iterations = len(features) * 2
     iteration_count = 0
 
-    depths: dict[int, int] = {}
-    visited: set[int] = set()  # Track visited nodes to prevent re-processing
-    roots = [f["id"] for f in features if not parents[f["id"]]]
-    queue = [(root, 0) for root in roots]
-
-    # Mark roots as visited initially
-    for root in roots:
-        visited.add(root)
+    depths = [0] * n
+    remaining = in_degree[:]
+    visited: set[int] = set()
+    queue: deque[int] = deque()
+    for i in range(n):
+        if remaining[i] == 0:
+            visited.add(i)
+            queue.append(i)
 
+    order: list[int] = []
     while queue:
         # Check iteration limit to prevent infinite loops (defense in depth)
         iteration_count += 1
@@ -563,39 +509,33 @@ def compute_scheduling_scores(features: list[dict]) -> dict[int, float]:
             )
             break
 
-        node_id, depth = queue.pop(0)
-        depths[node_id] = depth
-        for child_id in children[node_id]:
-            # Only add unvisited children to queue - prevents infinite loops in cycles
-            if child_id not in visited:
+        node = queue.popleft()
+        order.append(node)
+        child_depth = depths[node] + 1
+        for child_id in children[node]:
+            if depths[child_id] < child_depth:
+                depths[child_id] = child_depth
+            remaining[child_id] -= 1
+            if remaining[child_id] == 0 and child_id not in visited:
                 visited.add(child_id)
-                queue.append((child_id, depth + 1))
+                queue.append(child_id)
 
-    # Handle orphaned nodes (shouldn't happen but be safe)
-    for f in features:
-        if f["id"] not in depths:
-            depths[f["id"]] = 0
-
-    # Calculate transitive downstream counts (reverse topo order)
-    downstream: dict[int, int] = {f["id"]: 0 for f in features}
-    # Process in reverse depth order (leaves first)
-    for fid in sorted(depths.keys(), key=lambda x: -depths[x]):
-        for parent_id in parents[fid]:
-            downstream[parent_id] += 1 + downstream[fid]
+    downstream = _count_descendants(order, children)
 
     # Normalize and compute scores
-    max_depth = max(depths.values()) if depths else 0
-    max_downstream = max(downstream.values()) if downstream else 0
+    max_depth = max(depths)
+    max_downstream = max(downstream)
 
     scores: dict[int, float] = {}
     for f in features:
         fid = f["id"]
+        i = index[fid]
 
         # Unblocking score: 0-1, higher = unblocks more
-        unblock = downstream[fid] / max_downstream if max_downstream > 0 else 0
+        unblock = downstream[i] / max_downstream if max_downstream > 0 else 0
 
         # Depth score: 0-1, higher = closer to root (no deps)
-        depth_score = 1 - (depths[fid] / max_depth) if max_depth > 0 else 1
+        depth_score = 1 - (depths[i] / max_depth) if max_depth > 0 else 1
 
         # Priority factor: 0-1, lower priority number = higher factor
         priority = f.get("priority", 999)
@@ -606,7 +546,47 @@ def compute_scheduling_scores(features: list[dict]) -> dict[int, float]:
     return scores
 
 
-def get_ready_features(features: list[dict], limit: int = 10) -> list[dict]:
+def _count_descendants(order: list[int], children: list[list[int]]) -> list[int]:
+    """Count distinct transitive descendants of each node.
+
+    Walks the topological order backwards, representing each node's
+    descendant set as an int bitset and OR-ing children's sets together.
+    Bits are numbered in that backwards order, so a node's set only spans
+    the nodes processed before it. A node's set is dropped as soon as its
+    last parent has consumed it, so memory tracks the width of the graph
+    rather than V^2. Nodes not in ``order`` (cycle members) report 0.
+    """
+    n = len(children)
+    counts = [0] * n
+    pending_parents = [0] * n
+    for node in order:
+        for child in children[node]:
+            pending_parents[child] += 1
+
+    reach: dict[int, int] = {}
+    position = [0] * n
+    for k, node in enumerate(reversed(order)):
+        position[node] = k
+        bits = 0
+        for child in children[node]:
+            child_bits = reach.get(child)
+            if child_bits is None:
+                continue  # Child is in a cycle and was never ordered
+            bits |= child_bits | (1 << position[child])
+            pending_parents[child] -= 1
+            if pending_parents[child] == 0:
+                del reach[child]
+        counts[node] = bits.bit_count()
+        if pending_parents[node]:
+            reach[node] = bits
+    return counts
+
+
+def get_ready_features(
+    features: list[dict],
+    limit: int = 10,
+    graph: "FeatureGraph | None" = None,
+) -> list[dict]:
     """Get features that are ready to be worked on.
 
     A feature is ready if:
@@ -617,25 +597,23 @@ def get_ready_features(features: list[dict], limit: int = 10) -> list[dict]:
     Args:
         features: List of all feature dicts
         limit: Maximum number of features to return
+        graph: Optional FeatureGraph kept by the caller between calls. It is
+            synced with ``features`` so scores are only recomputed when the
+            dependency structure changed.
 
     Returns:
         List of ready features, sorted by priority
     """
-    passing_ids = {f["id"] for f in features if f.get("passes")}
-
-    ready = []
-    for f in features:
-        if f.get("passes") or f.get("in_progress"):
-            continue
-        deps = f.get("dependencies") or []
-        if all(dep_id in passing_ids for dep_id in deps):
-            ready.append(f)
+    # Lazy import to avoid circular import (feature_graph uses compute_scheduling_scores)
+    from api.feature_graph import FeatureGraph
 
-    # Sort by scheduling score (higher = first), then priority, then id
-    scores = compute_scheduling_scores(features)
-    ready.sort(key=lambda f: (-scores.get(f["id"], 0), f.get("priority", 999), f["id"]))
+    if graph is None:
+        graph = FeatureGraph()
+    graph.sync(features)
 
-    return ready[:limit]
+    # Sorted by scheduling score (higher = first), then priority, then id
+    by_id = {f["id"]: f for f in features}
+    return [by_id[fid] for fid in graph.get_ready(limit=limit)]
 
 
 def get_blocked_features(features: list[dict]) -> list[dict]:
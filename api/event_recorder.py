@@ -7,7 +7,7 @@ Immutable event recording service for agent execution audit trails.
 The EventRecorder creates AgentEvent records with:
 - Sequential ordering within each run (sequence numbers start at 1)
 - Automatic payload size management (4KB limit, larger payloads go to artifacts)
-- Immediate commit for durability
+- Immediate commit for durability (or group commit in buffered mode)
 - Full traceability of all agent actions
 
 This service is the foundation of the immutable audit trail principle.
@@ -22,6 +22,12 @@ Usage:
     # Option 2: Create local instance
     recorder = EventRecorder(session, project_dir)
     event_id = recorder.record(run_id, "started", payload={"message": "Run started"})
+
+    # Option 3: Buffered mode for chatty runs (group commit)
+    with EventRecorder(session, project_dir, buffered=True) as recorder:
+        for call in tool_calls:
+            recorder.record_tool_call(run_id, call.name, call.arguments)
+        recorder.record_completed(run_id)  # run-state transition: flushed now
 """
 
 from __future__ import annotations
@@ -29,6 +35,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -42,6 +49,8 @@ from api.agentspec_models import (
     EVENT_TYPES,
     generate_uuid,
 )
+from api.artifact_storage import write_object
+from api.run_event_index import observe_event
 
 # Configure logging
 _logger = logging.getLogger(__name__)
@@ -49,6 +58,15 @@ _logger = logging.getLogger(__name__)
 # Global instance cache (keyed by session id for proper session handling)
 _recorder_cache: dict[int, "EventRecorder"] = {}
 
+# Buffered mode: flush when this many events are queued...
+DEFAULT_FLUSH_SIZE = 64
+# ...or when the oldest queued event is this many seconds old
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Run-state transitions are always committed before record() returns,
+# so a run's terminal state is never lost with a buffer
+FLUSH_EVENT_TYPES = frozenset({"started", "completed", "failed", "paused", "resumed"})
+
 
 def _utc_now() -> datetime:
     """Return current UTC time."""
@@ -67,16 +85,31 @@ class EventRecorder:
     Creates AgentEvent records with sequential ordering and automatic
     payload size management. Events are committed immediately for durability.
 
+    In buffered mode, sequences are still assigned in memory but events are
+    queued (record() returns None for them, as they have no ID yet) and
+    written in one group commit when the queue reaches
+    ``flush_size`` events, when the oldest queued event is older than
+    ``flush_interval`` seconds (checked on each record), on an explicit
+    flush(), and on every run-state transition (FLUSH_EVENT_TYPES). One
+    commit - one WAL fsync and one write-lock acquisition on features.db -
+    then covers a whole burst of tool events.
+
     Attributes:
         session: SQLAlchemy database session
         project_dir: Project directory for artifact storage
+        buffered: Whether events are queued for group commit
         _sequence_cache: In-memory cache of sequence numbers per run
+        _pending: Events (and artifacts) queued for the next group commit
     """
 
     def __init__(
         self,
         session: Session,
         project_dir: str | Path | None = None,
+        *,
+        buffered: bool = False,
+        flush_size: int = DEFAULT_FLUSH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
     ):
         """
         Initialize the EventRecorder.
@@ -86,14 +119,75 @@ class EventRecorder:
             project_dir: Project root directory for storing large payloads
                         as artifacts. If None, large payloads will be
                         truncated without artifact storage.
+            buffered: Queue events and commit them in groups instead of
+                     committing each event on its own.
+            flush_size: Buffered mode: number of queued events that
+                       triggers a flush.
+            flush_interval: Buffered mode: age in seconds of the oldest
+                           queued event that triggers a flush.
         """
         self.session = session
         self.project_dir = Path(project_dir) if project_dir else None
+        self.buffered = buffered
+        self.flush_size = max(1, flush_size)
+        self.flush_interval = flush_interval
         self._sequence_cache: dict[str, int] = {}
+        self._pending: list[Any] = []
+        self._pending_events = 0
+        self._oldest_pending_at: float | None = None
 
         _logger.debug(
-            "EventRecorder initialized: project_dir=%s",
-            self.project_dir
+            "EventRecorder initialized: project_dir=%s, buffered=%s",
+            self.project_dir,
+            self.buffered
+        )
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of events queued and not yet committed."""
+        return self._pending_events
+
+    def flush(self) -> int:
+        """
+        Commit all queued events in a single transaction.
+
+        On failure the session is rolled back, the events stay queued for
+        the next flush and the error is re-raised.
+
+        Returns:
+            Number of events committed
+        """
+        if not self._pending:
+            return 0
+
+        count = self._pending_events
+        self.session.add_all(self._pending)
+        try:
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+
+        self._pending = []
+        self._pending_events = 0
+        self._oldest_pending_at = None
+        _logger.debug("Group commit: %d events", count)
+        return count
+
+    def _should_flush(self, event_type: str) -> bool:
+        if event_type in FLUSH_EVENT_TYPES:
+            return True
+        if self._pending_events >= self.flush_size:
+            return True
+        return (
+            self._oldest_pending_at is not None
+            and time.monotonic() - self._oldest_pending_at >= self.flush_interval
         )
 
     def _get_next_sequence(self, run_id: str) -> int:
@@ -190,15 +284,8 @@ class EventRecorder:
         content_hash = _compute_hash(content_bytes)
         size_bytes = len(content_bytes)
 
-        # Create storage directory
-        artifacts_dir = self.project_dir / ".autobuildr" / "artifacts" / run_id
-        artifacts_dir.mkdir(parents=True, exist_ok=True)
-        storage_path = artifacts_dir / f"{content_hash}.blob"
-
-        # Write content if not already exists (content-addressable)
-        if not storage_path.exists():
-            storage_path.write_bytes(content_bytes)
-            _logger.debug("Artifact content written to: %s", storage_path)
+        # Write to the shared object store (no-op if the content is already stored)
+        content_ref = write_object(self.project_dir, content_bytes, content_hash)
 
         # Create artifact record
         artifact = Artifact(
@@ -207,7 +294,7 @@ class EventRecorder:
             artifact_type="log",
             content_hash=content_hash,
             size_bytes=size_bytes,
-            content_ref=str(storage_path.relative_to(self.project_dir)),
+            content_ref=content_ref,
             artifact_metadata={
                 "event_sequence": sequence,
                 "event_type": event_type,
@@ -215,8 +302,12 @@ class EventRecorder:
             },
         )
 
-        self.session.add(artifact)
-        self.session.flush()
+        if self.buffered:
+            # ID is generated client-side; insert with the event's group commit
+            self._pending.append(artifact)
+        else:
+            self.session.add(artifact)
+            self.session.flush()
 
         _logger.debug(
             "Artifact created for large payload: id=%s, size=%d",
@@ -233,7 +324,7 @@ class EventRecorder:
         *,
         payload: dict[str, Any] | None = None,
         tool_name: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Record an immutable agent event.
 
@@ -244,7 +335,9 @@ class EventRecorder:
         4. Truncates the payload and sets payload_truncated to original size
         5. Sets timestamp to current UTC time
         6. Creates AgentEvent record with all fields
-        7. Commits immediately for durability
+        7. Commits immediately for durability (buffered mode: queues the
+           event and group-commits on the size/time thresholds or at a
+           run-state transition)
         8. Returns the created event ID
 
         Args:
@@ -259,7 +352,10 @@ class EventRecorder:
                       Stored denormalized for query efficiency.
 
         Returns:
-            The database ID of the created event (integer)
+            The database ID of the created event (integer). In buffered mode
+            an event that is still queued has no ID yet and None is returned;
+            run-state transitions are committed at once and always return
+            their ID.
 
         Raises:
             ValueError: If event_type is not a valid event type
@@ -330,11 +426,30 @@ class EventRecorder:
                 if artifact:
                     event.artifact_ref = artifact.id
 
-        # Add event to session
-        self.session.add(event)
+        # Feed the run's acceptance index (if open) the full payload
+        observe_event(event, payload if event.payload_truncated else None)
+
+        if self.buffered:
+            self._pending.append(event)
+            self._pending_events += 1
+            if self._oldest_pending_at is None:
+                self._oldest_pending_at = time.monotonic()
+            if not self._should_flush(event_type):
+                _logger.debug(
+                    "Event queued: run=%s, type=%s, seq=%d, pending=%d",
+                    run_id,
+                    event_type,
+                    sequence,
+                    self._pending_events
+                )
+                return None
+            self.flush()
+        else:
+            # Add event to session
+            self.session.add(event)
 
-        # Commit immediately for durability
-        self.session.commit()
+            # Commit immediately for durability
+            self.session.commit()
 
         _logger.debug(
             "Event recorded: run=%s, type=%s, seq=%d, id=%d",
@@ -353,7 +468,7 @@ class EventRecorder:
         objective: str | None = None,
         spec_id: str | None = None,
         extra: dict[str, Any] | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'started' event.
 
@@ -381,7 +496,7 @@ class EventRecorder:
         run_id: str,
         tool_name: str,
         arguments: dict[str, Any] | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'tool_call' event.
 
@@ -412,7 +527,7 @@ class EventRecorder:
         *,
         success: bool = True,
         error: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'tool_result' event.
 
@@ -449,7 +564,7 @@ class EventRecorder:
         *,
         tokens_in: int | None = None,
         tokens_out: int | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'turn_complete' event.
 
@@ -477,7 +592,7 @@ class EventRecorder:
         *,
         verdict: str | None = None,
         gate_mode: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record an 'acceptance_check' event.
 
@@ -506,7 +621,7 @@ class EventRecorder:
         turns_used: int | None = None,
         tokens_in: int | None = None,
         tokens_out: int | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'completed' event.
 
@@ -539,7 +654,7 @@ class EventRecorder:
         *,
         error_type: str | None = None,
         traceback: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'failed' event.
 
@@ -566,7 +681,7 @@ class EventRecorder:
         *,
         reason: str | None = None,
         turns_used: int | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'paused' event.
 
@@ -592,7 +707,7 @@ class EventRecorder:
         *,
         previous_status: str | None = None,
         turns_used: int | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'resumed' event.
 
@@ -623,7 +738,7 @@ class EventRecorder:
         rationale: str | None = None,
         project_name: str | None = None,
         feature_id: int | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record an 'agent_planned' event.
 
@@ -671,7 +786,7 @@ class EventRecorder:
         required_capabilities: list[str] | None = None,
         fallback_agents: list[str] | None = None,
         context: dict[str, Any] | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record an 'octo_failure' event.
 
@@ -711,7 +826,7 @@ class EventRecorder:
         spec_id: str | None = None,
         display_name: str | None = None,
         task_type: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record an 'agent_materialized' event.
 
@@ -756,7 +871,7 @@ class EventRecorder:
         test_framework: str | None = None,
         test_directory: str | None = None,
         assertions_count: int | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'tests_written' event.
 
@@ -814,7 +929,7 @@ class EventRecorder:
         test_target: str | None = None,
         failures: list[dict] | None = None,
         error_message: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record a 'tests_executed' event.
 
@@ -880,7 +995,7 @@ class EventRecorder:
         generation_time_ms: int = 0,
         success: bool = True,
         error: str | None = None,
-    ) -> int:
+    ) -> int | None:
         """
         Convenience method to record an 'icon_generated' event.
 
@@ -932,11 +1047,13 @@ class EventRecorder:
         Clear the sequence number cache.
 
         Useful for testing or when the database may have been modified
-        externally.
+        externally. Queued events are flushed first so the next sequence
+        read from the database accounts for them.
 
         Args:
             run_id: Clear cache for specific run only, or all if None
         """
+        self.flush()
         if run_id:
             self._sequence_cache.pop(run_id, None)
         else:
@@ -946,6 +1063,8 @@ class EventRecorder:
 def get_event_recorder(
     session: Session,
     project_dir: str | Path | None = None,
+    *,
+    buffered: bool = False,
 ) -> EventRecorder:
     """
     Get or create an EventRecorder instance.
@@ -956,6 +1075,8 @@ def get_event_recorder(
     Args:
         session: SQLAlchemy session
         project_dir: Project directory for artifact storage
+        buffered: Use group commit. A cached recorder is switched to this
+                 mode; switching off flushes its queued events first.
 
     Returns:
         EventRecorder instance
@@ -963,12 +1084,15 @@ def get_event_recorder(
     session_id = id(session)
 
     if session_id not in _recorder_cache:
-        _recorder_cache[session_id] = EventRecorder(session, project_dir)
+        _recorder_cache[session_id] = EventRecorder(session, project_dir, buffered=buffered)
     else:
         # Update project_dir if different
         recorder = _recorder_cache[session_id]
         if project_dir:
             recorder.project_dir = Path(project_dir)
+        if recorder.buffered and not buffered:
+            recorder.flush()
+        recorder.buffered = buffered
 
     return _recorder_cache[session_id]
 
@@ -51,6 +51,7 @@ from api.agentspec_models import (
     AgentSpec,
     Artifact,
 )
+from api.artifact_storage import read_blob
 
 # Configure logging
 _logger = logging.getLogger(__name__)
@@ -367,7 +368,7 @@ class EventReplayContext:
             content_path = self.project_dir / artifact.content_ref
             if content_path.exists():
                 try:
-                    return json.loads(content_path.read_text())
+                    return json.loads(read_blob(content_path))
                 except json.JSONDecodeError:
                     _logger.warning("Failed to parse file content for artifact %s", artifact_id)
                     return None
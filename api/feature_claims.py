@@ -0,0 +1,234 @@
+"""
+Feature Claims
+==============
+
+Race-free claiming of features by agents and the orchestrator.
+
+A claim is a single conditional UPDATE: the row is only written if it is
+still claimable at the moment SQLite applies the statement, so two workers
+can never both claim the same feature and nobody has to read, check and
+retry.
+
+- claim_feature(): claim a specific feature (the orchestrator's start path,
+  feature_claim_and_get, feature_mark_in_progress)
+- claim_next_ready_feature(): pick and claim the best ready feature in one
+  statement (feature_claim_next)
+- renew_feature_lease() / release_feature(): lease upkeep
+
+A feature is claimable when it is not passing and either not in progress or
+held under a worker lease (lease_expires_at) that has expired - so a claim
+taken by an agent that died is recovered automatically. Claims without a
+lease never expire.
+
+Uses UPDATE ... RETURNING (SQLite 3.35+). On older SQLite the row is read
+back after the guarded UPDATE in the same transaction.
+
+Example:
+    >>> feature = claim_next_ready_feature(session, order=graph.get_ready(),
+    ...                                    worker_id="agent-7", lease_seconds=600)
+    >>> feature["id"] if feature else None
+    12
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import DateTime, bindparam, text
+from sqlalchemy.orm import Session
+
+from api.dependency_queries import DEPENDENCIES_MET_SQL
+
+# UPDATE ... RETURNING needs SQLite 3.35
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Columns returned for a claimed feature (Feature.to_dict() keys)
+_FEATURE_COLUMNS = "id, priority, category, name, description, steps, passes, in_progress, dependencies"
+
+# Not passing, and free or held under an expired lease
+_CLAIMABLE = (
+    "{t}.passes = 0 AND ({t}.in_progress = 0 OR "
+    "({t}.lease_expires_at IS NOT NULL AND {t}.lease_expires_at < :now))"
+)
+
+# Best ready feature: caller's order first (scheduling score), then priority, id
+_NEXT_READY_SUBQUERY = f"""
+    SELECT f.id FROM features AS f
+    LEFT JOIN json_each(:order) AS o ON o.value = f.id
+    WHERE {_CLAIMABLE.format(t='f')}
+      AND {DEPENDENCIES_MET_SQL}
+    ORDER BY o.key IS NULL, o.key, f.priority, f.id
+    LIMIT 1
+"""
+
+_SET_CLAIM = "SET in_progress = 1, claimed_by = :worker_id, lease_expires_at = :lease_expires_at"
+
+
+def _params(worker_id: str | None, lease_seconds: float | None, **extra: Any) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "now": now,
+        "worker_id": worker_id,
+        "lease_expires_at": now + timedelta(seconds=lease_seconds) if lease_seconds else None,
+        **extra,
+    }
+
+
+def _statement(sql: str):
+    """text(sql) with DateTime binds for the timestamp parameters it uses.
+
+    text() rejects bindparams() for names the statement does not contain,
+    and not every statement uses both (renewal has no :now, the pre-3.35
+    target lookup may have neither).
+    """
+    return text(sql).bindparams(*(
+        bindparam(name, type_=DateTime)
+        for name in ("now", "lease_expires_at")
+        if re.search(rf":{name}\b", sql)
+    ))
+
+
+def _row_to_dict(row) -> dict:
+    """Convert a features row to the Feature.to_dict() shape."""
+    steps = row[5]
+    dependencies = row[8]
+    if isinstance(steps, str):
+        steps = json.loads(steps)
+    if isinstance(dependencies, str):
+        try:
+            dependencies = json.loads(dependencies)
+        except ValueError:
+            dependencies = None
+    return {
+        "id": row[0],
+        "priority": row[1],
+        "category": row[2],
+        "name": row[3],
+        "description": row[4],
+        "steps": steps,
+        "passes": bool(row[6]),
+        "in_progress": bool(row[7]),
+        "dependencies": dependencies if isinstance(dependencies, list) else [],
+    }
+
+
+def _claim(session: Session, target_sql: str, params: dict) -> dict | None:
+    """Run the guarded claim UPDATE for the row selected by target_sql."""
+    where = f"id = ({target_sql}) AND {_CLAIMABLE.format(t='features')}"
+    if HAS_RETURNING:
+        row = session.execute(
+            _statement(f"UPDATE features {_SET_CLAIM} WHERE {where} RETURNING {_FEATURE_COLUMNS}"),
+            params,
+        ).first()
+        session.commit()
+        return _row_to_dict(row) if row is not None else None
+
+    # Older SQLite: resolve the target first, then update it only if it is
+    # still claimable. A concurrent claim makes the UPDATE match nothing, in
+    # which case the target is resolved again (targets only select claimable
+    # rows, so this ends once nothing is left to claim).
+    while True:
+        feature_id = session.execute(_statement(target_sql), params).scalar()
+        if feature_id is None:
+            session.commit()
+            return None
+        target_params = {**params, "target_id": feature_id}
+        result = session.execute(
+            _statement(f"UPDATE features {_SET_CLAIM} WHERE id = :target_id AND {_CLAIMABLE.format(t='features')}"),
+            target_params,
+        )
+        if result.rowcount == 1:
+            row = session.execute(
+                text(f"SELECT {_FEATURE_COLUMNS} FROM features WHERE id = :target_id"), target_params
+            ).first()
+            session.commit()
+            return _row_to_dict(row)
+        session.commit()
+
+
+def claim_feature(
+    session: Session,
+    feature_id: int,
+    worker_id: str | None = None,
+    lease_seconds: float | None = None,
+) -> dict | None:
+    """Claim a specific feature (set in_progress) if it is claimable.
+
+    Dependencies are not checked: callers that pick a feature themselves
+    (the orchestrator, agents given a feature ID) have already decided.
+
+    Args:
+        session: Database session (committed by this call)
+        feature_id: Feature to claim
+        worker_id: Optional identifier of the claiming worker
+        lease_seconds: Optional lease; the claim can be taken over once it expires
+
+    Returns:
+        The claimed feature as a dict, or None if it does not exist, is
+        passing, or is held by another claim
+    """
+    target_sql = f"SELECT id FROM features WHERE id = :feature_id AND {_CLAIMABLE.format(t='features')}"
+    return _claim(session, target_sql, _params(worker_id, lease_seconds, feature_id=feature_id))
+
+
+def claim_next_ready_feature(
+    session: Session,
+    order: Iterable[int] = (),
+    worker_id: str | None = None,
+    lease_seconds: float | None = None,
+) -> dict | None:
+    """Claim the best ready feature in a single statement.
+
+    A feature is ready when it is claimable and all of its dependencies
+    exist and pass. Readiness is evaluated by SQLite inside the UPDATE, so a
+    stale order can affect which feature is chosen but never lets an
+    unready or already-claimed feature through.
+
+    Args:
+        session: Database session (committed by this call)
+        order: Feature IDs in preferred order (e.g. FeatureGraph.get_ready());
+            ready features not listed follow, by priority then id
+        worker_id: Optional identifier of the claiming worker
+        lease_seconds: Optional lease; the claim can be taken over once it expires
+
+    Returns:
+        The claimed feature as a dict, or None if no feature is ready
+    """
+    params = _params(worker_id, lease_seconds, order=json.dumps(list(order)))
+    return _claim(session, _NEXT_READY_SUBQUERY, params)
+
+
+def renew_feature_lease(session: Session, feature_id: int, worker_id: str, lease_seconds: float) -> bool:
+    """Extend a worker's lease on a feature it still holds.
+
+    Returns:
+        True if renewed; False if the feature is no longer claimed by worker_id
+        (for example because the lease expired and another worker took it)
+    """
+    result = session.execute(
+        _statement(
+            "UPDATE features SET lease_expires_at = :lease_expires_at "
+            "WHERE id = :feature_id AND in_progress = 1 AND passes = 0 AND claimed_by = :worker_id"
+        ),
+        _params(worker_id, lease_seconds, feature_id=feature_id),
+    )
+    session.commit()
+    return result.rowcount == 1
+
+
+def release_feature(session: Session, feature_id: int, worker_id: str | None = None) -> bool:
+    """Clear in_progress and the lease. With worker_id, only if that worker holds it.
+
+    Returns:
+        True if a claim was released
+    """
+    sql = "UPDATE features SET in_progress = 0, claimed_by = NULL, lease_expires_at = NULL WHERE id = :feature_id"
+    if worker_id is not None:
+        sql += " AND claimed_by = :worker_id"
+    result = session.execute(text(sql), {"feature_id": feature_id, "worker_id": worker_id})
+    session.commit()
+    return result.rowcount == 1
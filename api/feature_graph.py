@@ -0,0 +1,374 @@
+"""
+Feature Graph
+=============
+
+Incremental in-memory dependency graph for the feature scheduler.
+
+The scheduler hot paths (ParallelOrchestrator, the feature_get_ready MCP tool,
+dependency_resolver.get_ready_features) used to rebuild everything from the
+full feature list on every call: dict conversion, passing-id sets and a fresh
+compute_scheduling_scores() pass. FeatureGraph keeps that state between calls:
+
+- Adjacency lists in both directions (dependencies and dependents), which
+  also give downstream counts in O(1)
+- Per-feature count of unsatisfied (non-passing or missing) dependencies
+- The set of ready features and a ready-heap ordered like get_ready_features()
+
+Status changes (passes / in_progress) are applied in O(degree) and never
+invalidate scheduling scores, because scores depend only on graph structure.
+Structural changes (dependencies, priority, added/removed features) bump the
+graph version; scores and the heap are then rebuilt lazily on the next query.
+
+Example:
+    >>> graph = FeatureGraph.from_features(features)
+    >>> graph.get_ready(limit=3)
+    [12, 4, 7]
+    >>> graph.set_passes(4, True)   # O(dependents of #4)
+"""
+
+import heapq
+from typing import Any, Container, Iterable, Union
+
+from api.feature_lite import FeatureLite
+
+
+class FeatureGraph:
+    """Incrementally maintained dependency graph with a ready-feature heap.
+
+    Feature IDs are the graph keys. A feature is ready when it is not passing,
+    not in progress, and every dependency exists and is passing - the same
+    rule as dependency_resolver.get_ready_features().
+    """
+
+    def __init__(self) -> None:
+        # Per-feature scheduling state
+        self._priority: dict[int, int] = {}
+        self._passes: dict[int, bool] = {}
+        self._in_progress: dict[int, bool] = {}
+        self._deps: dict[int, tuple[int, ...]] = {}
+        # Reverse adjacency: dependency id -> features that depend on it.
+        # Keys may refer to IDs that do not exist (missing dependencies).
+        self._dependents: dict[int, set[int]] = {}
+        # Number of dependencies that are missing or not passing
+        self._unsatisfied: dict[int, int] = {}
+
+        self._passing: set[int] = set()
+        self._ready: set[int] = set()
+
+        # Ready-heap of (-score, priority, id) with lazy deletion:
+        # entries for features that are no longer ready are dropped on pop.
+        self._heap: list[tuple[float, int, int]] = []
+        self._heap_members: set[int] = set()
+
+        # Structural version: bumped whenever scores may change
+        self.version = 0
+        self._scores: dict[int, float] | None = None
+        self._scores_version = -1
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_features(cls, features: Iterable[dict]) -> "FeatureGraph":
+        """Build a graph from feature dicts (id, priority, passes, in_progress, dependencies)."""
+        graph = cls()
+        graph.sync(features)
+        return graph
+
+    def sync(self, features: Iterable[Union[dict, FeatureLite]]) -> int:
+        """Bring the graph in line with a full snapshot of features.
+
+        Only features whose scheduling fields differ from the current graph
+        state are touched, so a snapshot with a handful of status flips costs
+        O(n) comparisons plus O(degree) updates - no rescoring.
+
+        Args:
+            features: Feature dicts or FeatureLite records (see
+                load_feature_lites); features absent from the snapshot are removed
+
+        Returns:
+            Number of features added, changed or removed
+        """
+        changed = 0
+        seen: set[int] = set()
+        for feature in features:
+            fid = feature["id"]
+            seen.add(fid)
+            if self._apply(feature):
+                changed += 1
+        for fid in [fid for fid in self._priority if fid not in seen]:
+            self.remove_feature(fid)
+            changed += 1
+        return changed
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+
+    def upsert_feature(self, feature: Union[dict, FeatureLite]) -> None:
+        """Add a feature or update its scheduling fields."""
+        self._apply(feature)
+
+    def remove_feature(self, feature_id: int) -> None:
+        """Remove a feature. Its dependents now see it as a missing dependency."""
+        if feature_id not in self._priority:
+            return
+        self._set_dependencies(feature_id, ())
+        if self._passes[feature_id]:
+            self._passing.discard(feature_id)
+            for child in self._dependents.get(feature_id, ()):
+                self._adjust_unsatisfied(child, 1)
+        del self._priority[feature_id]
+        del self._passes[feature_id]
+        del self._in_progress[feature_id]
+        del self._deps[feature_id]
+        del self._unsatisfied[feature_id]
+        self._ready.discard(feature_id)
+        self._bump_version()
+
+    def set_passes(self, feature_id: int, passes: bool) -> None:
+        """Flip a feature's passes flag, updating its dependents in O(degree)."""
+        passes = bool(passes)
+        if feature_id not in self._priority or self._passes[feature_id] == passes:
+            return
+        self._passes[feature_id] = passes
+        if passes:
+            self._passing.add(feature_id)
+        else:
+            self._passing.discard(feature_id)
+        delta = -1 if passes else 1
+        for child in self._dependents.get(feature_id, ()):
+            self._adjust_unsatisfied(child, delta)
+        self._refresh_ready(feature_id)
+
+    def set_in_progress(self, feature_id: int, in_progress: bool) -> None:
+        """Flip a feature's in_progress flag."""
+        in_progress = bool(in_progress)
+        if feature_id not in self._priority or self._in_progress[feature_id] == in_progress:
+            return
+        self._in_progress[feature_id] = in_progress
+        self._refresh_ready(feature_id)
+
+    def set_dependencies(self, feature_id: int, dependencies: Iterable[int] | None) -> None:
+        """Replace a feature's dependency list."""
+        if feature_id not in self._priority:
+            return
+        if self._set_dependencies(feature_id, _normalize_deps(dependencies)):
+            self._refresh_ready(feature_id)
+            self._bump_version()
+
+    def set_priority(self, feature_id: int, priority: int) -> None:
+        """Change a feature's priority (affects ordering, not readiness)."""
+        if feature_id not in self._priority or self._priority[feature_id] == priority:
+            return
+        self._priority[feature_id] = priority
+        self._bump_version()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._priority)
+
+    def __contains__(self, feature_id: object) -> bool:
+        return feature_id in self._priority
+
+    @property
+    def passing_count(self) -> int:
+        return len(self._passing)
+
+    @property
+    def ready_count(self) -> int:
+        return len(self._ready)
+
+    @property
+    def passing_ids(self) -> set[int]:
+        """IDs of passing features (do not mutate)."""
+        return self._passing
+
+    def in_progress_ids(self) -> list[int]:
+        """IDs of features that are in progress and not passing."""
+        return [
+            fid for fid, in_progress in self._in_progress.items()
+            if in_progress and not self._passes[fid]
+        ]
+
+    def is_ready(self, feature_id: int) -> bool:
+        return feature_id in self._ready
+
+    def is_passing(self, feature_id: int) -> bool:
+        return feature_id in self._passing
+
+    def is_in_progress(self, feature_id: int) -> bool:
+        return self._in_progress.get(feature_id, False)
+
+    def get_dependencies(self, feature_id: int) -> tuple[int, ...]:
+        return self._deps.get(feature_id, ())
+
+    def get_dependents(self, feature_id: int) -> set[int]:
+        """IDs of features that directly depend on feature_id."""
+        return set(self._dependents.get(feature_id, ()))
+
+    def dependent_count(self, feature_id: int) -> int:
+        """Number of features that directly depend on feature_id."""
+        return len(self._dependents.get(feature_id, ()))
+
+    def get_blocking(self, feature_id: int) -> list[int]:
+        """Dependencies of feature_id that are missing or not passing."""
+        return [d for d in self._deps.get(feature_id, ()) if d not in self._passing]
+
+    def scores(self) -> dict[int, float]:
+        """Scheduling scores for all features, recomputed only after structural changes."""
+        if self._scores is None or self._scores_version != self.version:
+            from api.dependency_resolver import compute_scheduling_scores
+
+            self._scores = compute_scheduling_scores([
+                {"id": fid, "priority": self._priority[fid], "dependencies": list(self._deps[fid])}
+                for fid in self._priority
+            ])
+            self._scores_version = self.version
+        return self._scores
+
+    def sort_key(self, feature_id: int) -> tuple[float, int, int]:
+        """Scheduling order key: higher score first, then priority, then id."""
+        return (-self.scores().get(feature_id, 0), self._priority.get(feature_id, 999), feature_id)
+
+    def get_ready(self, limit: int | None = None, exclude: Container[int] = ()) -> list[int]:
+        """Return IDs of the best ready features in scheduling order.
+
+        Args:
+            limit: Maximum number of IDs to return (None = all ready features)
+            exclude: IDs to skip (e.g. features already running or permanently failed)
+
+        Returns:
+            Ready feature IDs ordered by (-score, priority, id)
+        """
+        self._ensure_heap()
+        if limit is None:
+            limit = len(self._ready)
+
+        result: list[int] = []
+        taken: list[tuple[float, int, int]] = []
+        while self._heap and len(result) < limit:
+            entry = heapq.heappop(self._heap)
+            fid = entry[2]
+            if fid not in self._ready:
+                # Stale entry: feature stopped being ready since it was pushed
+                self._heap_members.discard(fid)
+                continue
+            taken.append(entry)
+            if fid not in exclude:
+                result.append(fid)
+
+        for entry in taken:
+            heapq.heappush(self._heap, entry)
+        return result
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _apply(self, feature: Union[dict, FeatureLite]) -> bool:
+        """Add or update one feature. Returns True if anything changed."""
+        if type(feature) is FeatureLite:
+            # Already typed and normalized by load_feature_lites()
+            fid = feature.id
+            priority = feature.priority
+            passes = feature.passes
+            in_progress = feature.in_progress
+            deps = feature.dependencies
+        else:
+            fid = feature["id"]
+            priority = feature.get("priority", 999)
+            passes = bool(feature.get("passes"))
+            in_progress = bool(feature.get("in_progress"))
+            deps = _normalize_deps(feature.get("dependencies"))
+
+        if fid not in self._priority:
+            self._priority[fid] = priority
+            self._passes[fid] = False
+            self._in_progress[fid] = in_progress
+            self._deps[fid] = ()
+            self._unsatisfied[fid] = 0
+            self._set_dependencies(fid, deps)
+            # Dependents that referenced this ID saw it as missing (unsatisfied);
+            # set_passes() settles them if the new feature is already passing.
+            self.set_passes(fid, passes)
+            self._refresh_ready(fid)
+            self._bump_version()
+            return True
+
+        changed = False
+        if self._deps[fid] != deps:
+            self.set_dependencies(fid, deps)
+            changed = True
+        if self._priority[fid] != priority:
+            self.set_priority(fid, priority)
+            changed = True
+        if self._passes[fid] != passes:
+            self.set_passes(fid, passes)
+            changed = True
+        if self._in_progress[fid] != in_progress:
+            self.set_in_progress(fid, in_progress)
+            changed = True
+        return changed
+
+    def _set_dependencies(self, feature_id: int, deps: tuple[int, ...]) -> bool:
+        """Rewire adjacency for feature_id. Returns True if the edge set changed."""
+        old = self._deps[feature_id]
+        if old == deps:
+            return False
+        for dep in old:
+            dependents = self._dependents.get(dep)
+            if dependents is not None:
+                dependents.discard(feature_id)
+                if not dependents:
+                    del self._dependents[dep]
+        for dep in deps:
+            self._dependents.setdefault(dep, set()).add(feature_id)
+        self._deps[feature_id] = deps
+        self._unsatisfied[feature_id] = sum(1 for dep in deps if dep not in self._passing)
+        return True
+
+    def _adjust_unsatisfied(self, feature_id: int, delta: int) -> None:
+        self._unsatisfied[feature_id] += delta
+        self._refresh_ready(feature_id)
+
+    def _refresh_ready(self, feature_id: int) -> None:
+        ready = (
+            not self._passes[feature_id]
+            and not self._in_progress[feature_id]
+            and self._unsatisfied[feature_id] == 0
+        )
+        if not ready:
+            self._ready.discard(feature_id)
+            return
+        self._ready.add(feature_id)
+        if self._scores_version == self.version and feature_id not in self._heap_members:
+            heapq.heappush(self._heap, self._heap_entry(feature_id))
+            self._heap_members.add(feature_id)
+
+    def _heap_entry(self, feature_id: int) -> tuple[float, int, int]:
+        score = self._scores.get(feature_id, 0) if self._scores else 0
+        return (-score, self._priority[feature_id], feature_id)
+
+    def _ensure_heap(self) -> None:
+        """Rebuild the heap from the ready set if scores are out of date."""
+        if self._scores_version == self.version and self._scores is not None:
+            return
+        self.scores()
+        self._heap = [self._heap_entry(fid) for fid in self._ready]
+        heapq.heapify(self._heap)
+        self._heap_members = set(self._ready)
+
+    def _bump_version(self) -> None:
+        self.version += 1
+
+
+def _normalize_deps(dependencies: Any) -> tuple[int, ...]:
+    """Return dependency IDs as a de-duplicated tuple, preserving order."""
+    if not dependencies or not isinstance(dependencies, (list, tuple)):
+        return ()
+    return tuple(dict.fromkeys(d for d in dependencies if isinstance(d, int)))
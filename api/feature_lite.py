@@ -0,0 +1,136 @@
+"""
+Feature Lite
+============
+
+Compact read-only feature records for the scheduling hot paths.
+
+The orchestrator and the feature_get_ready MCP tool re-read every feature
+whenever the database changes, but only need five columns. Going through the
+ORM built a Feature object (or a SQLAlchemy Row plus a dict) per feature and
+ran the JSON type's result processor on every dependencies value.
+
+load_feature_lites() instead runs one raw SELECT of the scheduling columns
+and returns FeatureLite records: __slots__ objects with no per-instance
+dict. Dependency lists are parsed from their stored JSON text through a
+cache keyed by that text, so re-reading an unchanged project parses nothing
+and features with equal dependency lists share one tuple.
+
+FeatureLite supports record["id"] and record.get("dependencies"), so it can
+be passed anywhere a scheduling feature dict is read (FeatureGraph.sync,
+dependency_resolver functions).
+
+Example:
+    >>> features = load_feature_lites(session)
+    >>> features[0]
+    FeatureLite(id=1, priority=1, passes=True, in_progress=False, dependencies=())
+    >>> graph.sync(features)
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Union
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+# The scheduling columns, in FeatureLite field order
+FEATURE_LITE_SQL = "SELECT id, priority, passes, in_progress, dependencies FROM features"
+
+# Distinct dependency JSON strings kept parsed (one per feature at most)
+DEPENDENCY_CACHE_SIZE = 65536
+
+
+class FeatureLite:
+    """Scheduling fields of one feature.
+
+    dependencies is a de-duplicated tuple of integer IDs; malformed stored
+    values (not a JSON list, non-integer entries) are dropped, as in
+    Feature.get_dependencies_safe().
+    """
+
+    __slots__ = ("id", "priority", "passes", "in_progress", "dependencies")
+
+    def __init__(
+        self,
+        id: int,
+        priority: int,
+        passes: bool = False,
+        in_progress: bool = False,
+        dependencies: tuple[int, ...] = (),
+    ):
+        self.id = id
+        self.priority = priority
+        self.passes = passes
+        self.in_progress = in_progress
+        self.dependencies = dependencies
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style access to a field (default if it is not a field)."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict:
+        """Scheduling fields as a dict, dependencies as a list."""
+        return {
+            "id": self.id,
+            "priority": self.priority,
+            "passes": self.passes,
+            "in_progress": self.in_progress,
+            "dependencies": list(self.dependencies),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FeatureLite):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"FeatureLite({fields})"
+
+
+@lru_cache(maxsize=DEPENDENCY_CACHE_SIZE)
+def parse_dependencies(raw: str | None) -> tuple[int, ...]:
+    """Parse a stored dependencies JSON value into a tuple of IDs (cached)."""
+    if not raw:
+        return ()
+    try:
+        value = json.loads(raw)
+    except ValueError:
+        return ()
+    if not isinstance(value, list):
+        return ()
+    # bool is an int subclass but never a feature ID
+    return tuple(dict.fromkeys(d for d in value if type(d) is int))
+
+
+def load_feature_lites(source: Union["Session", sqlite3.Connection]) -> list[FeatureLite]:
+    """Load the scheduling fields of every feature with one raw SELECT.
+
+    Args:
+        source: A SQLAlchemy session or a sqlite3 connection on the project
+            database. Rows are read without ORM type processing either way.
+
+    Returns:
+        One FeatureLite per feature, in id order
+    """
+    if isinstance(source, sqlite3.Connection):
+        rows = source.execute(FEATURE_LITE_SQL + " ORDER BY id")
+    else:
+        rows = source.connection().exec_driver_sql(FEATURE_LITE_SQL + " ORDER BY id")
+    # NULL flags are legacy rows; treat them as False like Feature.to_dict()
+    return [
+        FeatureLite(fid, priority, bool(passes), bool(in_progress), parse_dependencies(deps))
+        for fid, priority, passes, in_progress, deps in rows
+    ]
@@ -22,6 +22,7 @@ This module implements:
 - Feature #25: HarnessKernel.execute() Core Execution Loop
 - Feature #27: Max Turns Budget Enforcement
 - Feature #28: Timeout Seconds Enforcement
+- Cooperative pause/cancel of an executing run (RunControl)
 """
 
 from __future__ import annotations
@@ -29,6 +30,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -54,6 +56,7 @@ from api.tool_policy import (
     record_forbidden_tools_violation,
     PolicyViolation,
 )
+from api.run_event_index import close_run_event_index, observe_event, open_run_event_index
 
 
 # =============================================================================
@@ -414,6 +417,69 @@ class TimeoutSecondsExceeded(BudgetExceeded):
         self.timeout_seconds = timeout_seconds
 
 
+# =============================================================================
+# Run Control (pause / cancel)
+# =============================================================================
+
+# Error recorded on a run stopped through RunControl.cancel(); matches the
+# error the cancel endpoint writes to the AgentRun.
+RUN_CANCELLED_ERROR = "user_cancelled"
+
+
+class RunControl:
+    """
+    Thread-safe pause/cancel signals for one executing run.
+
+    The executor that owns a worker thread passes a RunControl to
+    HarnessKernel.execute(); API handlers flip it from the event loop. The
+    kernel checks it between turns: a paused run blocks there until resumed,
+    a cancelled run is failed with RUN_CANCELLED_ERROR.
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() has been called."""
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        """True between pause() and resume() (or cancel())."""
+        return not self._running.is_set()
+
+    def pause(self) -> None:
+        """Hold the run at its next turn boundary."""
+        self._running.clear()
+
+    def resume(self) -> None:
+        """Let a paused run continue."""
+        self._running.set()
+
+    def cancel(self) -> None:
+        """Stop the run at its next turn boundary (also releases a pause)."""
+        self._cancelled.set()
+        self._running.set()
+
+    def wait_if_paused(self, timeout: float | None = None) -> bool:
+        """
+        Block while the run is paused.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits until resumed/cancelled)
+
+        Returns:
+            True if the run may continue, False if it was cancelled
+            (or is still paused when the timeout expires)
+        """
+        if not self._running.wait(timeout):
+            return False
+        return not self._cancelled.is_set()
+
+
 # =============================================================================
 # Budget Tracker
 # =============================================================================
@@ -1553,8 +1619,10 @@ class HarnessKernel:
         payload_str = json.dumps(payload, default=str)
         payload_truncated = None
         artifact_ref = None
+        full_payload = None
         if len(payload_str) > 4096:
             payload_truncated = len(payload_str)
+            full_payload = dict(payload)
 
             # Feature #150: Create artifact with full payload before truncating
             artifact = self._create_payload_artifact(
@@ -1585,6 +1653,8 @@ class HarnessKernel:
         )
 
         self.db.add(event)
+        # Match forbidden patterns now rather than in a post-run scan
+        observe_event(event, full_payload)
         _logger.debug("Recorded tool_result event: run=%s, tool=%s, seq=%d", run_id, tool_name, self._event_sequence)
         return event
 
@@ -1696,6 +1766,33 @@ class HarnessKernel:
         _logger.error("Recorded failed event: run=%s, error=%s", run_id, error_message)
         return event
 
+    def _stop_if_cancelled(self, run: "AgentRun", control: RunControl | None) -> bool:
+        """
+        Wait out a pause, then fail the run if it was cancelled.
+
+        Args:
+            run: The executing AgentRun
+            control: RunControl passed to execute(), or None
+
+        Returns:
+            True if the run was cancelled and has been marked failed
+        """
+        if control is None or control.wait_if_paused():
+            return False
+
+        _logger.info("Run %s cancelled", run.id)
+        if self._budget_tracker is not None:
+            run.tokens_in = self._budget_tracker.tokens_in
+            run.tokens_out = self._budget_tracker.tokens_out
+        self._record_failed_event(run.id, RUN_CANCELLED_ERROR)
+        run.fail(error_message=RUN_CANCELLED_ERROR)
+        try:
+            commit_with_retry(self.db, "execute_cancelled", run.id)
+        except TransactionError as e:
+            _logger.error("Failed to commit cancellation for %s: %s", run.id, e)
+            rollback_and_record_error(self.db, run.id, e)
+        return True
+
     # =========================================================================
     # Feature #129: Tool Policy Enforcement
     # =========================================================================
@@ -2158,6 +2255,7 @@ class HarnessKernel:
         spec: "AgentSpec",
         turn_executor: Callable[["AgentRun", "AgentSpec"], tuple[bool, dict[str, Any], list[dict], int, int]] | None = None,
         context: dict[str, Any] | None = None,
+        control: RunControl | None = None,
     ) -> "AgentRun":
         """
         Execute an AgentSpec and return the finalized AgentRun.
@@ -2197,6 +2295,10 @@ class HarnessKernel:
                 - feature_id: Linked feature ID (if any)
                 - Additional context from spec.context
 
+            control: Optional RunControl checked before each turn. A paused
+                run waits at the turn boundary; a cancelled run is failed
+                with error RUN_CANCELLED_ERROR.
+
         Returns:
             The finalized AgentRun with:
             - status: completed, failed, or timeout
@@ -2240,6 +2342,10 @@ class HarnessKernel:
         # Compiles forbidden_patterns as regex and caches for performance
         self._initialize_tool_policy_enforcer(spec)
 
+        # Index tool results for the acceptance validators as they are recorded
+        acceptance_spec = spec.acceptance_spec
+        open_run_event_index(run.id, (acceptance_spec.validators or []) if acceptance_spec else [])
+
         try:
             # Step 2: Initialize run (sets status=running, starts budget tracker)
             self.initialize_run(run, spec)
@@ -2247,6 +2353,8 @@ class HarnessKernel:
             # If no turn executor provided, complete immediately
             # This is useful for testing the infrastructure
             if turn_executor is None:
+                if self._stop_if_cancelled(run, control):
+                    return run
                 _logger.info("No turn executor provided, completing immediately")
                 run.complete()
 
@@ -2289,6 +2397,10 @@ class HarnessKernel:
 
             # Step 5-11: Execution loop
             while True:
+                # Honor pause/cancel requests at the turn boundary
+                if self._stop_if_cancelled(run, control):
+                    return run
+
                 # Check budget before turn
                 try:
                     self.check_budget_before_turn(run)
@@ -2414,3 +2526,4 @@ class HarnessKernel:
             self._validator_context = {}
             # Feature #129: Clear tool policy enforcer to prevent memory leaks
             self._tool_policy_enforcer = None
+            close_run_event_index(run.id)
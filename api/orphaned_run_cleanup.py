@@ -30,9 +30,10 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from api.agentspec_models import AgentRun, AgentSpec
+from api.agentspec_models import AgentRun, AgentRunQueueEntry, AgentSpec
 from api.event_recorder import EventRecorder
 
 # Configure logging
@@ -113,7 +114,10 @@ def get_orphaned_runs(session: Session) -> list[AgentRun]:
     """
     Query all runs that are in running or pending status.
 
-    These runs may be orphaned from a previous server instance.
+    These runs may be orphaned from a previous server instance. Pending runs
+    still waiting in the durable execution queue (an unclaimed
+    agent_run_queue row) are not orphaned: the spec run executor re-queues
+    them on startup.
 
     Args:
         session: SQLAlchemy database session
@@ -123,9 +127,13 @@ def get_orphaned_runs(session: Session) -> list[AgentRun]:
     """
     orphaned_statuses = ("running", "pending")
 
+    queued = select(AgentRunQueueEntry.run_id).where(AgentRunQueueEntry.claimed_at.is_(None))
     runs = (
         session.query(AgentRun)
-        .filter(AgentRun.status.in_(orphaned_statuses))
+        .filter(
+            AgentRun.status.in_(orphaned_statuses),
+            ~((AgentRun.status == "pending") & AgentRun.id.in_(queued)),
+        )
         .all()
     )
 
@@ -0,0 +1,258 @@
+"""
+Run Event Index
+===============
+
+Incremental per-run index of the events the acceptance validators inspect.
+
+ForbiddenPatternsValidator used to load every event of a finished run,
+flatten each tool_result payload to text and run every pattern over it, and
+TestEnforcementValidator scanned the same event list for tests_executed
+events. On long runs that was seconds of work between the last turn and the
+verdict.
+
+Instead, HarnessKernel.execute() opens a RunEventIndex for the run with the
+forbidden_patterns configs of its AcceptanceSpec. Every event recorded for
+the run in this process (by the kernel or an EventRecorder) is passed to
+observe_event() as it is created:
+
+- tool_result payloads are matched against each config once, including the
+  full pre-truncation payload of artifact-backed events, and only the
+  matches are kept
+- the latest tests_executed event is remembered
+
+The validators then read precomputed results in O(matches). An index is
+only used when it provably saw every relevant event: its counts must equal
+one COUNT query per run on ix_event_run_event_type. Anything else (runs
+resumed elsewhere, events written by another process, events still queued
+in a buffered recorder, configs not known at run start) falls back to the
+full scan, which checks the same texts.
+
+Usage:
+    from api.run_event_index import open_run_event_index, close_run_event_index
+
+    open_run_event_index(run.id, acceptance_spec.validators)
+    try:
+        ...  # record events, run acceptance validators
+    finally:
+        close_run_event_index(run.id)
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Iterable
+
+from api.validators import _find_forbidden_matches, _payload_search_texts
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from api.agentspec_models import AgentEvent
+
+# Module logger
+_logger = logging.getLogger(__name__)
+
+# Open indexes kept at most; the oldest is dropped (its validators fall back
+# to the full scan) if runs are never closed
+MAX_OPEN_INDEXES = 256
+
+# Event types the index accounts for
+INDEXED_EVENT_TYPES = ("tool_result", "tests_executed")
+
+_indexes: "OrderedDict[str, RunEventIndex]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def forbidden_patterns_key(patterns: list[Any], case_sensitive: Any = True) -> tuple:
+    """Key identifying a forbidden_patterns config (patterns and case mode)."""
+    return tuple(patterns), bool(case_sensitive)
+
+
+class RunEventIndex:
+    """
+    Matches and counts for one run, updated as its events are recorded.
+
+    Attributes:
+        run_id: The AgentRun this index belongs to
+        tool_result_count: tool_result events observed
+        tests_executed_count: tests_executed events observed
+        latest_tests_executed: The tests_executed event with the highest sequence
+    """
+
+    def __init__(self, run_id: str, validators: Iterable[dict[str, Any]] = ()):
+        """
+        Args:
+            run_id: ID of the AgentRun
+            validators: AcceptanceSpec validator definitions; each
+                forbidden_patterns config whose patterns compile is indexed
+        """
+        self.run_id = run_id
+        self.tool_result_count = 0
+        self.tests_executed_count = 0
+        self.latest_tests_executed: AgentEvent | None = None
+        self._compiled: dict[tuple, list[tuple[str, re.Pattern]]] = {}
+        self._matches: dict[tuple, list[tuple[AgentEvent, dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+        for validator_def in validators:
+            if validator_def.get("type") != "forbidden_patterns":
+                continue
+            config = validator_def.get("config") or {}
+            patterns = config.get("patterns")
+            if not isinstance(patterns, list) or not patterns:
+                continue
+            case_sensitive = config.get("case_sensitive", True)
+            flags = 0 if case_sensitive else re.IGNORECASE
+            try:
+                compiled = [(p, re.compile(p, flags)) for p in patterns]
+                key = forbidden_patterns_key(patterns, case_sensitive)
+            except (re.error, TypeError):
+                # The validator reports the bad config itself
+                continue
+            self._compiled[key] = compiled
+            self._matches[key] = []
+
+    def observe(self, event: "AgentEvent", full_payload: Any = None) -> None:
+        """
+        Account for a newly recorded event.
+
+        Args:
+            event: The AgentEvent just created for this run
+            full_payload: The untruncated payload, if event.payload is a
+                truncated summary backed by an artifact
+        """
+        with self._lock:
+            if event.event_type == "tool_result":
+                self.tool_result_count += 1
+                if not self._compiled or event.payload is None:
+                    return
+                texts = _payload_search_texts(event.payload, full_payload)
+                for key, compiled in self._compiled.items():
+                    for match in _find_forbidden_matches(compiled, texts):
+                        self._matches[key].append((event, match))
+            elif event.event_type == "tests_executed":
+                self.tests_executed_count += 1
+                latest = self.latest_tests_executed
+                if latest is None or event.sequence >= latest.sequence:
+                    self.latest_tests_executed = event
+
+    def forbidden_matches(
+        self,
+        patterns: list[Any],
+        case_sensitive: Any = True,
+    ) -> list[dict[str, Any]] | None:
+        """
+        Matches for a forbidden_patterns config, as the validator reports them.
+
+        Returns:
+            Match dicts in event order, or None if the config is not indexed
+        """
+        key = forbidden_patterns_key(patterns, case_sensitive)
+        with self._lock:
+            matches = self._matches.get(key)
+            if matches is None:
+                return None
+            return [
+                {
+                    "event_id": event.id,
+                    "event_sequence": event.sequence,
+                    "tool_name": event.tool_name,
+                    **match,
+                }
+                for event, match in matches
+            ]
+
+    def is_complete(self, session: "Session") -> bool:
+        """
+        True if this index observed every tool_result and tests_executed
+        event stored for the run.
+
+        One grouped COUNT on ix_event_run_event_type; pending events in the
+        session are flushed first by autoflush.
+        """
+        from sqlalchemy import func
+
+        from api.agentspec_models import AgentEvent
+
+        rows = (
+            session.query(AgentEvent.event_type, func.count(AgentEvent.id))
+            .filter(
+                AgentEvent.run_id == self.run_id,
+                AgentEvent.event_type.in_(INDEXED_EVENT_TYPES),
+            )
+            .group_by(AgentEvent.event_type)
+            .all()
+        )
+        stored = dict(rows)
+        with self._lock:
+            return (
+                stored.get("tool_result", 0) == self.tool_result_count
+                and stored.get("tests_executed", 0) == self.tests_executed_count
+            )
+
+
+def open_run_event_index(
+    run_id: str,
+    validators: Iterable[dict[str, Any]] = (),
+) -> RunEventIndex:
+    """
+    Start indexing a run's events (replacing any index already open for it).
+
+    Open the index before the run records its first event; an index that
+    misses events is never used.
+    """
+    index = RunEventIndex(run_id, validators)
+    with _indexes_lock:
+        _indexes.pop(run_id, None)
+        _indexes[run_id] = index
+        while len(_indexes) > MAX_OPEN_INDEXES:
+            dropped, _ = _indexes.popitem(last=False)
+            _logger.debug("Dropped run event index for run %s", dropped)
+    return index
+
+
+def get_run_event_index(run_id: str) -> RunEventIndex | None:
+    """The open index for a run, or None."""
+    return _indexes.get(run_id)
+
+
+def close_run_event_index(run_id: str) -> None:
+    """Stop indexing a run and release its index."""
+    with _indexes_lock:
+        _indexes.pop(run_id, None)
+
+
+def observe_event(event: "AgentEvent", full_payload: Any = None) -> None:
+    """Pass a newly created event to its run's index, if one is open."""
+    index = _indexes.get(event.run_id)
+    if index is not None:
+        index.observe(event, full_payload)
+
+
+def get_complete_run_event_index(run: Any) -> RunEventIndex | None:
+    """
+    The open index for run if it accounts for every stored event, else None.
+
+    Used by validators to decide between precomputed results and a full
+    scan of run.events.
+    """
+    run_id = getattr(run, "id", None)
+    index = _indexes.get(run_id) if isinstance(run_id, str) else None
+    if index is None:
+        return None
+
+    try:
+        from sqlalchemy.orm import object_session
+
+        session = object_session(run)
+        complete = session is not None and index.is_complete(session)
+    except Exception as e:
+        _logger.debug("Run event index check failed for run %s: %s", run_id, e)
+        return None
+    if not complete:
+        _logger.debug("Run event index for run %s is incomplete, scanning events", run_id)
+        return None
+    return index
@@ -720,8 +720,10 @@ class SpecOrchestrator:
         attempt = self._feature_attempts[feat_id]
         _logger.info("Feature #%d attempt %d/%d", feat_id, attempt, self.max_retries_per_feature)
 
-        # Mark in-progress
+        # Mark in-progress (a plain claim: drop any expired worker lease)
         feature.in_progress = True
+        feature.claimed_by = None
+        feature.lease_expires_at = None
         self.session.commit()
 
         try:
@@ -122,8 +122,10 @@ class TaskSyncBack:
                 message=f"Feature {feature_id} not found",
             )
 
-        # Update feature state
+        # Update feature state (a plain claim: drop any expired worker lease)
         feature.in_progress = True
+        feature.claimed_by = None
+        feature.lease_expires_at = None
         self.session.commit()
 
         _logger.info(
@@ -7,6 +7,7 @@ Implements ToolPolicy enforcement for the HarnessKernel.
 This module provides:
 - Extraction of forbidden_patterns from spec.tool_policy
 - Regex compilation at spec load time for efficiency
+- A combined alternation regex so each tool call is scanned once
 - Tool argument validation against forbidden patterns
 - Event recording for blocked tool calls
 
@@ -25,6 +26,8 @@ import json
 import logging
 import os
 import re
+import stat
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
@@ -1045,6 +1048,131 @@ def is_path_under_directories(
     return False
 
 
+# Marks the end of an allowed directory in a DirectorySandbox trie
+_TRIE_END = None
+
+# Path strings remembered as free of traversal patterns, per sandbox
+CLEAN_PATH_CACHE_SIZE = 4096
+
+
+def _resolve_symlink_free(path_str: str, base_dir: str | None) -> Path | None:
+    """
+    Resolve a path that contains no symlinks, without Path.resolve().
+
+    Returns what resolve_target_path(path_str, base_dir) would return as its
+    resolved path, or None whenever that is not certain: any existing
+    component is a symlink, the path contains "..", or the platform resolves
+    paths differently (non-POSIX). Callers then fall back to
+    resolve_target_path().
+
+    Each component is checked with one lstat(); realpath() does the same
+    lstat() calls plus per-component path handling and a final stat().
+    """
+    if os.name != "posix":
+        return None
+    base = Path(base_dir) if base_dir else Path.cwd()
+    target = Path(path_str)
+    if not target.is_absolute():
+        target = base / target
+    if not target.is_absolute() or ".." in target.parts:
+        return None
+    path = str(target)
+    # POSIX keeps a leading "//" that realpath() collapses
+    if path.startswith("//"):
+        return None
+
+    end = path.find("/", 1)
+    while True:
+        prefix = path if end == -1 else path[:end]
+        try:
+            if stat.S_ISLNK(os.lstat(prefix).st_mode):
+                return None
+        except OSError:
+            # Missing or unreadable: realpath() treats it as a non-link too
+            pass
+        except ValueError:
+            # Embedded NUL: let resolve_target_path() raise as it always has
+            return None
+        if end == -1:
+            return target
+        end = path.find("/", end + 1)
+
+
+class DirectorySandbox:
+    """
+    Precomputed directory-sandbox checks for a fixed set of allowed directories.
+
+    Gives the same answers as validate_directory_access() with fewer steps:
+
+    - Containment walks a trie of the allowed directories' path components,
+      O(path depth) instead of one relative_to() per allowed directory
+    - Paths without symlinks are resolved with one lstat() per component
+      (see _resolve_symlink_free); anything else uses resolve_target_path()
+    - Path strings already found free of traversal patterns skip
+      detect_path_traversal_attack() (a pure function of the string)
+
+    Nothing about the filesystem is cached, so symlinks created or changed
+    between calls are seen exactly as before.
+
+    Example:
+        >>> sandbox = DirectorySandbox([Path("/home/user/project")])
+        >>> sandbox.contains(Path("/home/user/project/src/app.py"))
+        True
+        >>> validate_directory_access("Read", "/etc/passwd", sandbox.allowed_directories, sandbox=sandbox)[0]
+        False
+    """
+
+    def __init__(self, allowed_directories: list[Path]):
+        self.allowed_directories = list(allowed_directories)
+        # PurePath comparisons are case-insensitive on Windows
+        self._fold = str.lower if os.name == "nt" else None
+        self._trie: dict[str | None, Any] = {}
+        for directory in self.allowed_directories:
+            node = self._trie
+            for part in self._parts(directory):
+                node = node.setdefault(part, {})
+            node[_TRIE_END] = True
+        self._clean_paths: dict[str, None] = {}
+        self._clean_lock = threading.Lock()
+
+    def _parts(self, path: Path) -> tuple[str, ...]:
+        if self._fold is None:
+            return path.parts
+        return tuple(self._fold(part) for part in path.parts)
+
+    def contains(self, path: Path) -> bool:
+        """Same result as is_path_under_directories(path, allowed_directories)."""
+        if not self.allowed_directories:
+            # Empty list means no restriction
+            return True
+        node = self._trie
+        for part in self._parts(path):
+            if _TRIE_END in node:
+                return True
+            node = node.get(part)
+            if node is None:
+                return False
+        return _TRIE_END in node
+
+    def resolve(self, path_str: str, base_dir: str | None = None) -> tuple[Path, bool, bool]:
+        """Same result as resolve_target_path(path_str, base_dir, follow_symlinks=True)."""
+        resolved = _resolve_symlink_free(path_str, base_dir)
+        if resolved is not None:
+            return resolved, False, False
+        return resolve_target_path(path_str, base_dir=base_dir, follow_symlinks=True)
+
+    def is_known_clean(self, path_str: str) -> bool:
+        """True if path_str already passed detect_path_traversal_attack()."""
+        return path_str in self._clean_paths
+
+    def remember_clean(self, path_str: str) -> None:
+        """Record that path_str passed detect_path_traversal_attack()."""
+        with self._clean_lock:
+            if len(self._clean_paths) >= CLEAN_PATH_CACHE_SIZE:
+                del self._clean_paths[next(iter(self._clean_paths))]
+            self._clean_paths[path_str] = None
+
+
 def validate_directory_access(
     tool_name: str,
     target_path_str: str,
@@ -1052,6 +1180,7 @@ def validate_directory_access(
     base_dir: str | None = None,
     *,
     allow_broken_symlinks: bool = False,
+    sandbox: DirectorySandbox | None = None,
 ) -> tuple[bool, str | None, dict[str, Any]]:
     """
     Validate that a file operation target is within allowed directories.
@@ -1073,6 +1202,8 @@ def validate_directory_access(
         base_dir: Base directory for resolving relative paths
         allow_broken_symlinks: If False (default), broken symlinks are blocked.
             If True, broken symlinks are allowed but logged.
+        sandbox: DirectorySandbox built from allowed_directories, used for
+            faster checks with identical results
 
     Returns:
         Tuple of (allowed: bool, reason: str | None, details: dict)
@@ -1094,8 +1225,11 @@ def validate_directory_access(
 
     # Feature #48: Enhanced path traversal attack detection with security audit logging
     # Step 6: Log detailed violation info for security audit
-    traversal_result = detect_path_traversal_attack(target_path_str)
-    if traversal_result.detected:
+    if sandbox is not None and sandbox.is_known_clean(target_path_str):
+        traversal_result = None
+    else:
+        traversal_result = detect_path_traversal_attack(target_path_str)
+    if traversal_result is not None and traversal_result.detected:
         # Feature #48, Step 6: Include detailed security audit information
         details["traversal_detected"] = True
         details["attack_type"] = traversal_result.attack_type
@@ -1129,16 +1263,21 @@ def validate_directory_access(
             ": ".join(reason_parts),
             details,
         )
+    if traversal_result is not None and sandbox is not None:
+        sandbox.remember_clean(target_path_str)
 
     # Steps 4 & 7: Resolve to absolute and handle symlinks
     # Feature #46: Symlink Target Validation - all 5 steps
     try:
         # Feature #46, Steps 1-2: Check symlink and resolve to final target
-        resolved_path, was_symlink, is_broken = resolve_target_path(
-            target_path_str,
-            base_dir=base_dir,
-            follow_symlinks=True,  # Step 7: resolve symlinks
-        )
+        if sandbox is not None:
+            resolved_path, was_symlink, is_broken = sandbox.resolve(target_path_str, base_dir)
+        else:
+            resolved_path, was_symlink, is_broken = resolve_target_path(
+                target_path_str,
+                base_dir=base_dir,
+                follow_symlinks=True,  # Step 7: resolve symlinks
+            )
         details["resolved_path"] = str(resolved_path)
         details["was_symlink"] = was_symlink
         details["is_broken_symlink"] = is_broken
@@ -1175,7 +1314,11 @@ def validate_directory_access(
         )
 
     # Step 5: Check if under allowed directories
-    if not is_path_under_directories(resolved_path, allowed_directories):
+    if sandbox is not None:
+        contained = sandbox.contains(resolved_path)
+    else:
+        contained = is_path_under_directories(resolved_path, allowed_directories)
+    if not contained:
         details["allowed_directories"] = [str(d) for d in allowed_directories]
         return (
             False,
@@ -1278,6 +1421,306 @@ def check_arguments_against_patterns(
     return None
 
 
+# =============================================================================
+# Combined Pattern Matching
+# =============================================================================
+
+# C-accelerated encoder behind json.dumps(): str -> quoted, escaped JSON literal
+_encode_json_string = json.encoder.encode_basestring_ascii
+
+# Constructs whose meaning depends on group numbering or names, so the pattern
+# cannot be embedded in a larger alternation: numbered backreferences, named
+# backreferences, conditionals and named groups (names must be unique).
+_UNCOMBINABLE_PATTERN = re.compile(r"\\[1-9]|\(\?P[=<]|\(\?\(")
+
+
+def iter_argument_strings(arguments: Any) -> list[str]:
+    """
+    Collect the keys and values of tool arguments for pattern matching.
+
+    Each key and scalar value is rendered exactly as it appears inside
+    serialize_tool_arguments() output - strings as quoted, escaped JSON
+    literals, numbers/booleans/None as JSON - so patterns written against
+    the serialized form (e.g. ``--\\"`` for a trailing SQL comment) keep
+    matching. Only the dict/list punctuation between fields is not rebuilt,
+    so a pattern can no longer match across two separate fields.
+
+    Nesting depth is not limited, so deeply nested arguments cannot hide a
+    value from the scan; containers already visited are skipped.
+
+    Args:
+        arguments: Tool arguments (normally a dict; other values are str()'d)
+
+    Returns:
+        List of strings to scan
+    """
+    if arguments is None:
+        return []
+    if not isinstance(arguments, dict):
+        return [str(arguments)]
+
+    strings: list[str] = []
+    seen: set[int] = set()
+    stack: list[Any] = [arguments]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            strings.append(_encode_json_string(value))
+        elif isinstance(value, (dict, list, tuple)):
+            if id(value) in seen:
+                continue
+            seen.add(id(value))
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    strings.append(_encode_json_string(key if isinstance(key, str) else str(key)))
+                    stack.append(item)
+            else:
+                stack.extend(value)
+        elif value is None or isinstance(value, (bool, int, float)):
+            strings.append(json.dumps(value))
+        else:
+            # json.dumps(default=str) renders unknown objects as strings
+            strings.append(_encode_json_string(str(value)))
+    return strings
+
+
+# Escapes that stand for a literal character (anything else - \s, \d, \b,
+# \x41, \1 ... - is treated as "not a plain literal")
+_BRACE_QUANTIFIER = re.compile(r"\{(\d*)(?:,\d*)?\}")
+_LITERAL_ESCAPES = frozenset("\\.^$*+?{}[]()|/-:;&<>=!\"'#%@~`,")
+# Escapes longer than two characters (\xNN, \uNNNN, \UNNNNNNNN, \N{...},
+# octal, backreferences); their tail must not be read as literal text
+_LONG_ESCAPES = frozenset("xuUN0123456789")
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Return a lowercase substring that every match of pattern must contain.
+
+    A conservative scan of the top level of the pattern: runs of plain (or
+    escaped) characters are collected, and anything whose contribution is
+    uncertain - groups, classes, ".", anchors, character-class escapes and
+    quantified characters - ends the current run. A top-level alternation
+    means no single literal is required.
+
+    Returns:
+        The longest required run, or "" if none could be determined
+    """
+    runs: list[str] = []
+    current: list[str] = []
+    depth = 0
+    in_class = False
+    i = 0
+
+    def end_run() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    while i < len(pattern):
+        ch = pattern[i]
+        if in_class:
+            if ch == "\\":
+                i += 1
+            elif ch == "]":
+                in_class = False
+            i += 1
+            continue
+        if ch == "\\":
+            nxt = pattern[i + 1] if i + 1 < len(pattern) else ""
+            if nxt and nxt in _LONG_ESCAPES:
+                return ""
+            if depth == 0 and nxt in _LITERAL_ESCAPES and nxt:
+                current.append(nxt)
+            elif depth == 0:
+                end_run()
+            i += 2
+            continue
+        if ch == "[":
+            in_class = True
+            end_run()
+        elif ch == "(":
+            depth += 1
+            end_run()
+        elif ch == ")":
+            depth = max(depth - 1, 0)
+        elif depth > 0:
+            pass
+        elif ch == "|":
+            return ""
+        elif ch == "{" and (quantifier := _BRACE_QUANTIFIER.match(pattern, i)):
+            # {m,n}: previous character is required only if m >= 1
+            if current and not int(quantifier.group(1) or 0):
+                current.pop()
+            end_run()
+            i = quantifier.end()
+            continue
+        elif ch in "?*":
+            # Previous character is optional
+            if current:
+                current.pop()
+            end_run()
+        elif ch == "+":
+            end_run()
+        elif ch in ".^$":
+            end_run()
+        else:
+            current.append(ch)
+        i += 1
+    end_run()
+
+    literal = max(runs, key=len, default="")
+    # Non-ASCII literals may match ASCII text under re.IGNORECASE (e.g. U+017F
+    # matches "s"), which a lowercase substring test would miss
+    return literal.lower() if literal.isascii() else ""
+
+
+class ForbiddenPatternMatcher:
+    """
+    Multi-pattern matcher over all forbidden patterns of a spec.
+
+    Built once per pattern list. A clean tool call - the overwhelmingly common
+    case - is rejected without running the individual regexes:
+
+    - Each pattern's required literal (e.g. "sudo" for ``sudo\\s+``) is looked
+      up with a substring search in the lowercased ASCII argument string; only
+      patterns whose literal is present are run.
+    - Patterns without a usable literal are folded into one alternation regex,
+      as are all patterns for non-ASCII strings (where str.lower() and
+      re.IGNORECASE case folding may disagree).
+
+    When something may match, patterns are tried in list order, so the
+    reported pattern is the same one check_arguments_against_patterns()
+    would return. Patterns that cannot be embedded in an alternation
+    (backreferences, named groups, conditionals, inline global flags) are
+    always checked individually.
+
+    Example:
+        >>> matcher = ForbiddenPatternMatcher(compile_forbidden_patterns(["rm -rf", "DROP TABLE"]))
+        >>> matcher.match_arguments({"command": "rm -rf /home"}).original
+        'rm -rf'
+    """
+
+    def __init__(self, patterns: list[CompiledPattern]):
+        self.patterns = list(patterns)
+        # Verbose-mode patterns ignore whitespace, so their text is not literal
+        self.literals = [
+            "" if p.regex.flags & re.VERBOSE else _required_literal(p.original)
+            for p in self.patterns
+        ]
+
+        combinable: list[CompiledPattern] = []
+        standalone: list[CompiledPattern] = []
+        for pattern in self.patterns:
+            if self._can_combine(pattern):
+                combinable.append(pattern)
+            else:
+                standalone.append(pattern)
+        self.standalone = standalone
+
+        # Alternation over every combinable pattern (non-ASCII strings) and
+        # over those without a literal (ASCII strings)
+        self.combined = self._combine(combinable)
+        self.combined_unfiltered = self._combine([
+            p for p, literal in zip(self.patterns, self.literals)
+            if not literal and p in combinable
+        ])
+        if self.combined is None and combinable:
+            self.standalone = list(self.patterns)
+            self.combined_unfiltered = None
+
+        standalone_ids = {id(p) for p in self.standalone}
+        # Per pattern: (pattern, literal, checked individually?)
+        self._entries = [
+            (p, literal, id(p) in standalone_ids)
+            for p, literal in zip(self.patterns, self.literals)
+        ]
+
+    @staticmethod
+    def _can_combine(pattern: CompiledPattern) -> bool:
+        if _UNCOMBINABLE_PATTERN.search(pattern.original):
+            return False
+        try:
+            # Inline global flags such as (?i) are only legal at the very start
+            re.compile(f"(?:{pattern.original})", re.IGNORECASE)
+        except re.error:
+            return False
+        return True
+
+    @staticmethod
+    def _combine(patterns: list[CompiledPattern]) -> re.Pattern | None:
+        if not patterns:
+            return None
+        try:
+            return re.compile("|".join(f"(?:{p.original})" for p in patterns), re.IGNORECASE)
+        except re.error as e:
+            _logger.warning("Could not combine forbidden patterns (%s); matching individually", e)
+            return None
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _may_match(self, value: str) -> bool:
+        """Cheap test: False means no pattern can match value."""
+        if value.isascii():
+            lowered = value.lower()
+            for _, literal, standalone in self._entries:
+                if literal and literal in lowered:
+                    return True
+            if self.combined_unfiltered is not None and self.combined_unfiltered.search(value):
+                return True
+        elif self.combined is not None and self.combined.search(value):
+            return True
+        return any(
+            p.regex.search(value) for p, literal, standalone in self._entries
+            if standalone and not (literal and value.isascii())
+        )
+
+    def match_strings(self, strings: list[str]) -> CompiledPattern | None:
+        """
+        Return the first pattern (in list order) that matches any of strings.
+
+        Args:
+            strings: Strings to scan
+
+        Returns:
+            The first matching pattern, or None if no patterns match
+        """
+        if not strings or not self.patterns:
+            return None
+
+        hits = [s for s in strings if self._may_match(s)]
+        if not hits:
+            return None
+
+        lowered = [s.lower() if s.isascii() else None for s in hits]
+        for pattern, literal, _ in self._entries:
+            for value, low in zip(hits, lowered):
+                if literal and low is not None and literal not in low:
+                    continue
+                if pattern.regex.search(value):
+                    _logger.warning(
+                        "Forbidden pattern '%s' matched in arguments: %s",
+                        pattern.original, value[:200]
+                    )
+                    return pattern
+        return None
+
+    def match_arguments(self, arguments: Any) -> CompiledPattern | None:
+        """
+        Return the first forbidden pattern matching any string in tool arguments.
+
+        Args:
+            arguments: Tool arguments dict (may be None)
+
+        Returns:
+            The first matching pattern, or None if no patterns match
+        """
+        if not self.patterns:
+            return None
+        return self.match_strings(iter_argument_strings(arguments))
+
+
 # =============================================================================
 # Event Recording
 # =============================================================================
@@ -1374,6 +1817,22 @@ class ToolPolicyEnforcer:
     allowed_directories: list[Path] = field(default_factory=list)  # Feature #42: Sandbox
     base_dir: str | None = None  # Base directory for relative path resolution
     strict_mode: bool = False
+    # Combined matcher over forbidden_patterns, rebuilt when the patterns
+    # differ from those it was built for (replaced or edited in place)
+    _pattern_matcher: ForbiddenPatternMatcher | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _pattern_matcher_key: tuple[tuple[str, re.Pattern], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Trie and caches over allowed_directories, rebuilt (dropping the memo)
+    # when the directories differ from those it was built for
+    _directory_sandbox: DirectorySandbox | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _directory_sandbox_key: tuple[Path, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_spec(
@@ -1541,11 +2000,9 @@ class ToolPolicyEnforcer:
                     forbidden_tools=self.forbidden_tools,
                 )
 
-        # Step 3: Before each tool call, serialize arguments to string
-        serialized = serialize_tool_arguments(arguments)
-
-        # Step 4 & 5: Check arguments against all forbidden patterns
-        matched = check_arguments_against_patterns(serialized, self.forbidden_patterns)
+        # Steps 3-4: Scan the argument strings against all forbidden patterns
+        # (one combined regex pass; no per-call JSON serialization)
+        matched = self.pattern_matcher.match_arguments(arguments)
 
         if matched is not None:
             # Step 5: If pattern matches, block tool call
@@ -1599,6 +2056,7 @@ class ToolPolicyEnforcer:
             target_path_str=target_path,
             allowed_directories=self.allowed_directories,
             base_dir=self.base_dir,
+            sandbox=self.directory_sandbox,
         )
 
         if not allowed:
@@ -1675,6 +2133,24 @@ class ToolPolicyEnforcer:
             f"Please modify your request to avoid dangerous operations."
         )
 
+    @property
+    def pattern_matcher(self) -> ForbiddenPatternMatcher:
+        """Combined matcher for forbidden_patterns, rebuilt when the patterns change."""
+        key = tuple((p.original, p.regex) for p in self.forbidden_patterns)
+        if self._pattern_matcher is None or self._pattern_matcher_key != key:
+            self._pattern_matcher = ForbiddenPatternMatcher(self.forbidden_patterns)
+            self._pattern_matcher_key = key
+        return self._pattern_matcher
+
+    @property
+    def directory_sandbox(self) -> DirectorySandbox:
+        """Precomputed checks for allowed_directories, rebuilt when the directories change."""
+        key = tuple(self.allowed_directories)
+        if self._directory_sandbox is None or self._directory_sandbox_key != key:
+            self._directory_sandbox = DirectorySandbox(self.allowed_directories)
+            self._directory_sandbox_key = key
+        return self._directory_sandbox
+
     @property
     def has_forbidden_patterns(self) -> bool:
         """True if any forbidden patterns are configured."""
@@ -137,6 +137,18 @@ AVAILABLE_TOOLS: dict[str, dict[str, Any]] = {
         "privilege_level": "write",
         "requires_sandbox": False,
     },
+    "feature_claim_next": {
+        "category": "feature_management",
+        "description": "Claim the best ready feature",
+        "privilege_level": "write",
+        "requires_sandbox": False,
+    },
+    "feature_renew_lease": {
+        "category": "feature_management",
+        "description": "Renew the lease on a claimed feature",
+        "privilege_level": "write",
+        "requires_sandbox": False,
+    },
     "feature_mark_in_progress": {
         "category": "feature_management",
         "description": "Mark feature as in-progress",
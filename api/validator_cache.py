@@ -0,0 +1,393 @@
+"""
+Validator Result Cache
+======================
+
+Per-project cache of test_pass and lint_clean validator results.
+
+Both validators re-ran their shell command on every evaluation - final
+acceptance, partial acceptance on budget exhaustion, regression re-checks -
+even when nothing in the project had changed. Their result is a function of
+the validator config, the interpolated command, the working directory, the
+environment and the files under the working directory, so that is the
+cache key:
+
+- the files are summarized by tree_fingerprint(): one stat() per file
+  (size, mtime, inode), listed by ``git ls-files`` so .gitignore is honored
+  exactly, or by a directory walk with the project's top-level .gitignore
+  when the directory is not a git work tree
+- files modified within RACY_WINDOW_NS of the fingerprint are hashed by
+  content instead, so a rewrite within the same mtime tick is still seen
+- tool caches and autobuildr's own state (FINGERPRINT_ALWAYS_IGNORED) never
+  count as changes
+
+The fingerprint is taken before the command runs and only passing results
+of commands that ran to completion are cached. Failures, timeouts and
+launch errors are re-run, since a failure may have causes outside the tree
+(a dev server not up yet, the network, a flaky test). A command
+that itself writes files that are not ignored changes the fingerprint and
+so never hits.
+
+Entries live in .autobuildr/validator_cache.json in the project, shared by
+every process working on it.
+
+Usage:
+    from api.validator_cache import command_cache_key, get_validator_cache
+
+    cache = get_validator_cache(project_dir)
+    key = command_cache_key("test_pass", config, command, cwd)
+    result = cache.get(key) if key else None
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Module logger
+_logger = logging.getLogger(__name__)
+
+# Cache file, relative to the project directory
+CACHE_FILE = Path(".autobuildr") / "validator_cache.json"
+
+CACHE_FORMAT_VERSION = 1
+
+# Results kept per project; the least recently stored are dropped first
+MAX_CACHE_ENTRIES = 256
+
+# Trees with more files than this are not fingerprinted (never cached)
+MAX_FINGERPRINT_FILES = 100_000
+
+# Files modified this recently are hashed by content: a rewrite within the
+# same mtime tick would leave size and mtime unchanged
+RACY_WINDOW_NS = 2_000_000_000
+
+# Seconds allowed for ``git ls-files``
+GIT_LIST_TIMEOUT_SECONDS = 30
+
+# Path components that never affect a result: VCS and autobuildr state,
+# bytecode and tool caches the validated commands write themselves
+FINGERPRINT_ALWAYS_IGNORED = frozenset({
+    ".git",
+    ".autobuildr",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".ruff_cache",
+    "features.db",
+    "features.db-wal",
+    "features.db-shm",
+    "features.db-journal",
+})
+
+# Shell bookkeeping variables that differ between otherwise identical shells
+VOLATILE_ENV_VARS = frozenset({"_", "OLDPWD", "SHLVL"})
+
+_WILDCARD_CHARS = frozenset("*?[")
+
+
+def _is_ignored_always(rel_path: str) -> bool:
+    return any(part in FINGERPRINT_ALWAYS_IGNORED for part in rel_path.split("/"))
+
+
+def _git_listing(root: Path) -> list[str] | None:
+    """
+    Tracked and untracked, non-ignored files under root, relative to it.
+
+    None if root is not in a git work tree or git is unavailable. Uses
+    Popen rather than subprocess.run() so callers' patches of run() for the
+    validated command are not consumed here.
+    """
+    try:
+        proc = subprocess.Popen(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return None
+    try:
+        stdout, _ = proc.communicate(timeout=GIT_LIST_TIMEOUT_SECONDS)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        return None
+    if proc.returncode != 0:
+        return None
+    return [p for p in stdout.decode("utf-8", errors="surrogateescape").split("\0") if p]
+
+
+def _gitignore_rules(root: Path) -> tuple[set[str], set[str], list[str]] | None:
+    """
+    The safely supported subset of root/.gitignore.
+
+    Returns (anchored literal paths, anchored literal directories,
+    unanchored basename globs). Patterns that cannot be matched exactly
+    without git (anchored globs, "**") are left out, so at worst more
+    files are fingerprinted than git would track. Negations re-include
+    files, so a .gitignore with any "!" line is not used at all (None).
+    """
+    try:
+        lines = (root / ".gitignore").read_text(encoding="utf-8", errors="replace").splitlines()
+    except OSError:
+        return set(), set(), []
+
+    paths: set[str] = set()
+    dirs: set[str] = set()
+    globs: list[str] = []
+    for line in lines:
+        pattern = line.strip()
+        if not pattern or pattern.startswith("#"):
+            continue
+        if pattern.startswith("!"):
+            return None
+        dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        if "**" in pattern or not pattern:
+            continue
+        if "/" in pattern:
+            # Anchored to root: only literal paths are matched
+            pattern = pattern.lstrip("/")
+            if _WILDCARD_CHARS.isdisjoint(pattern):
+                (dirs if dir_only else paths).add(pattern)
+        elif not dir_only:
+            globs.append(pattern)
+        elif _WILDCARD_CHARS.isdisjoint(pattern):
+            # Unanchored directory name: matches at any depth
+            globs.append(pattern + "/")
+    return paths, dirs, globs
+
+
+def _walk_listing(root: Path) -> list[str] | None:
+    """Files under root honoring the top-level .gitignore (no git needed)."""
+    rules = _gitignore_rules(root)
+    paths, dirs, globs = rules if rules is not None else (set(), set(), [])
+    dir_globs = [g[:-1] for g in globs if g.endswith("/")]
+    file_globs = [g for g in globs if not g.endswith("/")]
+
+    def ignored(rel: str, name: str, is_dir: bool) -> bool:
+        if name in FINGERPRINT_ALWAYS_IGNORED or rel in paths:
+            return True
+        if is_dir and (rel in dirs or any(fnmatch.fnmatchcase(name, g) for g in dir_globs)):
+            return True
+        return any(fnmatch.fnmatchcase(name, g) for g in file_globs)
+
+    listing: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+        dirnames[:] = sorted(d for d in dirnames if not ignored(prefix + d, d, True))
+        for name in filenames:
+            rel = prefix + name
+            if not ignored(rel, name, False):
+                listing.append(rel)
+        if len(listing) > MAX_FINGERPRINT_FILES:
+            return None
+    return listing
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_fingerprint(root: str | Path) -> str | None:
+    """
+    Fingerprint of the files under root that a command could depend on.
+
+    Returns:
+        Hex digest, or None if root cannot be listed or has more than
+        MAX_FINGERPRINT_FILES files
+    """
+    root = Path(root)
+    if not root.is_dir():
+        return None
+    listing = _git_listing(root)
+    if listing is None:
+        listing = _walk_listing(root)
+    if listing is None or len(listing) > MAX_FINGERPRINT_FILES:
+        return None
+
+    racy_after = time.time_ns() - RACY_WINDOW_NS
+    digest = hashlib.sha256()
+    for rel in sorted(listing):
+        if _is_ignored_always(rel):
+            continue
+        path = root / rel
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Deleted but still tracked, or a broken symlink
+            entry = f"{rel}\0missing"
+        else:
+            if st.st_mtime_ns > racy_after:
+                try:
+                    entry = f"{rel}\0{st.st_size}\0sha256:{_file_digest(path)}"
+                except OSError:
+                    entry = f"{rel}\0unreadable\0{st.st_mtime_ns}"
+            else:
+                entry = f"{rel}\0{st.st_size}\0{st.st_mtime_ns}\0{st.st_ino}"
+        digest.update(entry.encode("utf-8", errors="surrogateescape"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def environment_fingerprint(env: dict[str, str] | None = None) -> str:
+    """Fingerprint of the environment a command inherits."""
+    env = os.environ if env is None else env
+    digest = hashlib.sha256()
+    for name in sorted(env):
+        if name not in VOLATILE_ENV_VARS:
+            digest.update(f"{name}={env[name]}\0".encode("utf-8", errors="surrogateescape"))
+    return digest.hexdigest()
+
+
+def command_cache_key(
+    validator_type: str,
+    config: dict[str, Any],
+    command: str,
+    working_directory: str | Path,
+) -> str | None:
+    """
+    Cache key for running command in working_directory with config.
+
+    Returns:
+        Hex digest, or None if the inputs cannot be fingerprinted (then
+        the result must not be cached)
+    """
+    cwd = Path(working_directory).resolve()
+    tree = tree_fingerprint(cwd)
+    if tree is None:
+        return None
+    try:
+        config_json = json.dumps(config, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    material = "\0".join([
+        str(CACHE_FORMAT_VERSION), validator_type, config_json, command, str(cwd),
+        environment_fingerprint(), tree,
+    ])
+    return hashlib.sha256(material.encode("utf-8", errors="surrogateescape")).hexdigest()
+
+
+class ValidatorResultCache:
+    """
+    Validator results for one project, persisted in CACHE_FILE.
+
+    Entries are ValidatorResult.to_dict() values. The file is re-read when
+    another process has changed it and rewritten atomically on every put().
+    """
+
+    def __init__(self, project_dir: str | Path):
+        self.path = Path(project_dir) / CACHE_FILE
+        self._entries: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._signature: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+
+    def _file_signature(self) -> tuple[int, int] | None:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _reload_if_changed(self) -> None:
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        self._signature = signature
+        self._entries = OrderedDict()
+        if signature is None:
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            _logger.warning("Ignoring unreadable validator cache %s: %s", self.path, e)
+            return
+        if isinstance(data, dict) and data.get("version") == CACHE_FORMAT_VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self._entries = OrderedDict(entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """The stored result dict for key, or None."""
+        with self._lock:
+            self._reload_if_changed()
+            entry = self._entries.get(key)
+        return entry.get("result") if isinstance(entry, dict) else None
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        """Store a result dict under key and persist the cache."""
+        with self._lock:
+            self._reload_if_changed()
+            self._entries.pop(key, None)
+            self._entries[key] = {
+                "result": result,
+                "stored_at": datetime.now(timezone.utc).isoformat(),
+            }
+            while len(self._entries) > MAX_CACHE_ENTRIES:
+                self._entries.popitem(last=False)
+            try:
+                self._write()
+            except (OSError, TypeError, ValueError) as e:
+                _logger.warning("Could not write validator cache %s: %s", self.path, e)
+
+    def clear(self) -> None:
+        """Drop all entries and the cache file."""
+        with self._lock:
+            self._entries = OrderedDict()
+            self._signature = None
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"version": CACHE_FORMAT_VERSION, "entries": self._entries})
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".validator_cache.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        self._signature = self._file_signature()
+
+
+_caches: dict[str, ValidatorResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_validator_cache(project_dir: str | Path) -> ValidatorResultCache:
+    """The shared ValidatorResultCache for a project directory."""
+    key = str(Path(project_dir).resolve())
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = ValidatorResultCache(key)
+        return cache
+
+
+def clear_validator_caches() -> None:
+    """Forget all in-memory caches (files are left in place)."""
+    with _caches_lock:
+        _caches.clear()
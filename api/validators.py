@@ -35,21 +35,33 @@ Usage:
 """
 from __future__ import annotations
 
+import json
 import logging
 import re
 import subprocess
 import shlex
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from api.validator_cache import command_cache_key, get_validator_cache
+
 if TYPE_CHECKING:
     from api.agentspec_models import AgentRun
 
 # Module logger
 _logger = logging.getLogger(__name__)
 
+# Relative validator costs: acceptance specs run cheap validators first
+COST_CHEAP = 0  # filesystem metadata or in-memory checks
+COST_EVENTS = 1  # reads the run's events
+COST_COMMAND = 2  # runs an external command
+
+# Worker threads for validators that can run concurrently (command validators)
+DEFAULT_VALIDATOR_WORKERS = 4
+
 
 # =============================================================================
 # ValidatorResult Dataclass
@@ -182,6 +194,13 @@ class Validator(ABC):
     # Validator type identifier (set in subclasses)
     validator_type: str = "base"
 
+    # Relative cost (COST_*), used to order validators cheapest first
+    cost: int = COST_CHEAP
+
+    # True if evaluate() never touches the run or the database session, so
+    # it can run in a worker thread alongside other validators
+    concurrent_safe: bool = False
+
     @abstractmethod
     def evaluate(
         self,
@@ -402,6 +421,7 @@ class ForbiddenPatternsValidator(Validator):
     """
 
     validator_type: str = "forbidden_patterns"
+    cost: int = COST_EVENTS
 
     def evaluate(
         self,
@@ -489,53 +509,52 @@ class ForbiddenPatternsValidator(Validator):
                 validator_type=self.validator_type,
             )
 
-        # Step 4: Query all tool_result events for the run
-        # The run.events relationship is already loaded by SQLAlchemy
-        tool_result_events = [
-            event for event in run.events
-            if event.event_type == "tool_result"
-        ]
+        # Step 4-5: Use matches indexed while the run recorded its events, if
+        # the index saw every tool_result event; otherwise scan run.events
+        from api.run_event_index import get_complete_run_event_index
 
-        _logger.debug(
-            "ForbiddenPatternsValidator: checking %d tool_result events against %d patterns",
-            len(tool_result_events), len(compiled_patterns)
+        index = get_complete_run_event_index(run)
+        matches_found = (
+            index.forbidden_matches(patterns, case_sensitive) if index is not None else None
         )
 
-        # Step 5: Check each payload against all patterns
-        matches_found: list[dict[str, Any]] = []
+        if matches_found is not None:
+            events_checked = index.tool_result_count
+            _logger.debug(
+                "ForbiddenPatternsValidator: %d indexed match(es) in %d tool_result events",
+                len(matches_found), events_checked
+            )
+        else:
+            # Step 4: Query all tool_result events for the run
+            # The run.events relationship is already loaded by SQLAlchemy
+            tool_result_events = [
+                event for event in run.events
+                if event.event_type == "tool_result"
+            ]
+            events_checked = len(tool_result_events)
 
-        for event in tool_result_events:
-            payload = event.payload
+            _logger.debug(
+                "ForbiddenPatternsValidator: checking %d tool_result events against %d patterns",
+                events_checked, len(compiled_patterns)
+            )
 
-            if payload is None:
-                continue
+            # Step 5: Check each payload against all patterns
+            matches_found = []
+            project_dir = context.get("project_dir")
 
-            # Convert payload to searchable string
-            # Handle both string and dict payloads
-            if isinstance(payload, str):
-                payload_text = payload
-            elif isinstance(payload, dict):
-                # Convert dict to string for pattern matching
-                # Include all values in the search
-                payload_text = _dict_to_searchable_text(payload)
-            else:
-                payload_text = str(payload)
+            for event in tool_result_events:
+                if event.payload is None:
+                    continue
+
+                texts = _payload_search_texts(event.payload, _load_full_payload(event, project_dir))
 
-            # Step 5 (cont): Check against all patterns
-            for pattern_str, compiled_pattern in compiled_patterns:
-                match = compiled_pattern.search(payload_text)
-                if match:
-                    # Step 7: Include matched pattern and context in result
+                # Step 7: Include matched pattern and context in result
+                for match in _find_forbidden_matches(compiled_patterns, texts):
                     matches_found.append({
                         "event_id": event.id,
                         "event_sequence": event.sequence,
                         "tool_name": event.tool_name,
-                        "pattern": pattern_str,
-                        "matched_text": match.group(),
-                        "match_start": match.start(),
-                        "match_end": match.end(),
-                        # Include some context around the match
-                        "context": _get_match_context(payload_text, match, context_chars=50),
+                        **match,
                     })
 
         # Step 6 & 8: Return result
@@ -559,13 +578,13 @@ class ForbiddenPatternsValidator(Validator):
                 details={
                     "matches": matches_found,
                     "patterns_checked": patterns,
-                    "events_checked": len(tool_result_events),
+                    "events_checked": events_checked,
                 },
                 validator_type=self.validator_type,
             )
         else:
             # Step 8: Return passed = true if no matches
-            message = f"No forbidden patterns found in {len(tool_result_events)} tool_result event(s)"
+            message = f"No forbidden patterns found in {events_checked} tool_result event(s)"
             if description:
                 message = f"{message} ({description})"
 
@@ -580,12 +599,68 @@ class ForbiddenPatternsValidator(Validator):
                 score=1.0,
                 details={
                     "patterns_checked": patterns,
-                    "events_checked": len(tool_result_events),
+                    "events_checked": events_checked,
                 },
                 validator_type=self.validator_type,
             )
 
 
+# =============================================================================
+# Command Result Cache
+# =============================================================================
+
+def _lookup_command_result(
+    validator_type: str,
+    config: dict[str, Any],
+    command: str,
+    working_directory: str | None,
+    context: dict[str, Any],
+) -> tuple[str | None, ValidatorResult | None]:
+    """
+    Look up a cached result for a command validator (see api/validator_cache.py).
+
+    Only used when the context has a project_dir to store the cache in and
+    the config does not set "cache": false.
+
+    Returns:
+        (cache key or None if the result must not be cached, cached result
+        with details["cache_hit"] = True or None)
+    """
+    project_dir = context.get("project_dir")
+    if not project_dir or not working_directory or config.get("cache", True) is False:
+        return None, None
+    try:
+        key = command_cache_key(validator_type, config, command, working_directory)
+        if key is None:
+            return None, None
+        cached = get_validator_cache(project_dir).get(key)
+    except OSError as e:
+        _logger.debug("%s: validator cache unavailable: %s", validator_type, e)
+        return None, None
+    if not cached:
+        return key, None
+
+    _logger.info("%s: cache hit for command=%s", validator_type, command)
+    return key, ValidatorResult(
+        passed=cached["passed"],
+        message=cached["message"],
+        score=cached.get("score", 1.0 if cached["passed"] else 0.0),
+        details={**cached.get("details", {}), "cache_hit": True},
+        validator_type=validator_type,
+    )
+
+
+def _store_command_result(key: str | None, context: dict[str, Any], result: ValidatorResult) -> ValidatorResult:
+    """Cache a passing result of a command that ran to completion; returns result.
+
+    Failures are not stored: they may come from something outside the tree
+    (a server not up yet, the network, a flaky test), so they are re-run.
+    """
+    if key is not None and result.passed:
+        get_validator_cache(context["project_dir"]).put(key, result.to_dict())
+    return result
+
+
 # =============================================================================
 # TestPassValidator
 # =============================================================================
@@ -606,6 +681,9 @@ class TestPassValidator(Validator):
         working_directory (str, optional): Working directory for command execution.
             Supports variable interpolation.
         description (str, optional): Human-readable description of the check.
+        cache (bool, optional): Reuse the passing result of an identical
+            earlier run on an unchanged working tree, default True. Needs
+            project_dir in the context; see api/validator_cache.py.
 
     Context Variables:
         project_dir: Base project directory
@@ -621,6 +699,8 @@ class TestPassValidator(Validator):
     """
 
     validator_type: str = "test_pass"
+    cost: int = COST_COMMAND
+    concurrent_safe: bool = True
 
     def evaluate(
         self,
@@ -704,6 +784,13 @@ class TestPassValidator(Validator):
             interpolated_command, expected_exit_code, timeout_seconds, working_directory
         )
 
+        # Reuse the result of an identical run on an unchanged tree
+        cache_key, cached = _lookup_command_result(
+            self.validator_type, config, interpolated_command, working_directory, context
+        )
+        if cached is not None:
+            return cached
+
         # Step 5: Execute command via subprocess with timeout
         try:
             # Use shell=True for command string execution
@@ -750,7 +837,7 @@ class TestPassValidator(Validator):
                 actual_exit_code, expected_exit_code, passed
             )
 
-            return ValidatorResult(
+            return _store_command_result(cache_key, context, ValidatorResult(
                 passed=passed,
                 message=message,
                 score=score,
@@ -765,7 +852,7 @@ class TestPassValidator(Validator):
                     "stderr": stderr,
                 },
                 validator_type=self.validator_type,
-            )
+            ))
 
         except subprocess.TimeoutExpired as e:
             # Step 10: Handle timeout as failure
@@ -917,6 +1004,84 @@ def _dict_to_searchable_text(d: dict, prefix: str = "") -> str:
     return "\n".join(parts)
 
 
+def _payload_search_texts(payload: Any, full_payload: Any = None) -> list[str]:
+    """
+    Texts of a tool_result payload that forbidden patterns are matched against.
+
+    The stored payload comes first. For an artifact-backed (truncated) event
+    the full payload follows, so content cut from the stored summary is
+    still checked.
+    """
+    texts = []
+    for value in (payload, full_payload):
+        if value is None:
+            continue
+        if isinstance(value, str):
+            texts.append(value)
+        elif isinstance(value, dict):
+            # Include all values in the search
+            texts.append(_dict_to_searchable_text(value))
+        else:
+            texts.append(str(value))
+    return texts
+
+
+def _find_forbidden_matches(
+    compiled_patterns: list[tuple[str, re.Pattern]],
+    texts: list[str],
+) -> list[dict[str, Any]]:
+    """
+    First match of each pattern in a payload's texts (stored payload first).
+
+    Returns the match fields of ForbiddenPatternsValidator results; callers
+    add the event fields.
+    """
+    found = []
+    for pattern_str, compiled_pattern in compiled_patterns:
+        for text in texts:
+            match = compiled_pattern.search(text)
+            if match:
+                found.append({
+                    "pattern": pattern_str,
+                    "matched_text": match.group(),
+                    "match_start": match.start(),
+                    "match_end": match.end(),
+                    # Include some context around the match
+                    "context": _get_match_context(text, match, context_chars=50),
+                })
+                break
+    return found
+
+
+def _load_full_payload(event: Any, project_dir: str | Path | None) -> Any:
+    """
+    Full payload of a truncated event from its artifact, or None.
+
+    Kernel artifacts are stored inline; EventRecorder artifacts need the
+    project directory to be read.
+    """
+    if not isinstance(getattr(event, "artifact_ref", None), str):
+        return None
+    artifact = getattr(event, "artifact", None)
+    if artifact is None:
+        return None
+
+    from api.agentspec_crud import get_artifact_content
+
+    try:
+        content = get_artifact_content(artifact, Path(project_dir) if project_dir else None)
+    except (OSError, ValueError) as e:
+        _logger.warning("Could not read artifact %s for event %s: %s", event.artifact_ref, event.id, e)
+        return None
+    if content is None:
+        return None
+    text = content.decode("utf-8", errors="replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
 def _get_match_context(text: str, match: re.Match, context_chars: int = 50) -> str:
     """
     Get context around a regex match.
@@ -966,6 +1131,9 @@ class LintCleanValidator(Validator):
         error_pattern (str, optional): Regex pattern to identify error lines in
             linter output. If not provided, counts all non-empty output lines.
         description (str, optional): Human-readable description of the check.
+        cache (bool, optional): Reuse the passing result of an identical
+            earlier run on an unchanged working tree, default True. Needs
+            project_dir in the context; see api/validator_cache.py.
 
     Context Variables:
         project_dir: Base project directory
@@ -988,6 +1156,8 @@ class LintCleanValidator(Validator):
     """
 
     validator_type: str = "lint_clean"
+    cost: int = COST_COMMAND
+    concurrent_safe: bool = True
 
     def evaluate(
         self,
@@ -1079,6 +1249,13 @@ class LintCleanValidator(Validator):
             interpolated_command, expected_exit_code, timeout_seconds, working_directory
         )
 
+        # Reuse the result of an identical run on an unchanged tree
+        cache_key, cached = _lookup_command_result(
+            self.validator_type, config, interpolated_command, working_directory, context
+        )
+        if cached is not None:
+            return cached
+
         # Execute linter command
         try:
             result = subprocess.run(
@@ -1129,7 +1306,7 @@ class LintCleanValidator(Validator):
                 actual_exit_code, expected_exit_code, issue_count
             )
 
-            return ValidatorResult(
+            return _store_command_result(cache_key, context, ValidatorResult(
                 passed=passed,
                 message=message,
                 score=score,
@@ -1145,7 +1322,7 @@ class LintCleanValidator(Validator):
                     "stderr": stderr,
                 },
                 validator_type=self.validator_type,
-            )
+            ))
 
         except subprocess.TimeoutExpired as e:
             stdout = e.stdout if e.stdout else ""
@@ -1415,6 +1592,7 @@ class TestEnforcementValidator(Validator):
     """
 
     validator_type: str = "test_enforcement"
+    cost: int = COST_EVENTS
 
     def evaluate(
         self,
@@ -1684,15 +1862,25 @@ class TestEnforcementValidator(Validator):
         if run is None or not hasattr(run, "events"):
             return False, event_data
 
-        # Find all tests_executed events
-        tests_executed_events = [
-            event for event in run.events
-            if event.event_type == "tests_executed"
-        ]
+        # Prefer the counts indexed while the run recorded its events
+        from api.run_event_index import get_complete_run_event_index
+
+        index = get_complete_run_event_index(run)
+        if index is not None:
+            event_count = index.tests_executed_count
+            latest_event = index.latest_tests_executed
+        else:
+            # Find all tests_executed events
+            tests_executed_events = [
+                event for event in run.events
+                if event.event_type == "tests_executed"
+            ]
+            event_count = len(tests_executed_events)
+            latest_event = tests_executed_events[-1] if tests_executed_events else None
 
-        event_data["event_count"] = len(tests_executed_events)
+        event_data["event_count"] = event_count
 
-        if not tests_executed_events:
+        if latest_event is None:
             _logger.debug(
                 "TestEnforcementValidator._check_tests_ran_from_events: no tests_executed events in run %s",
                 run.id
@@ -1700,7 +1888,6 @@ class TestEnforcementValidator(Validator):
             return False, event_data
 
         # Use the most recent tests_executed event
-        latest_event = tests_executed_events[-1]
         payload = latest_event.payload
 
         if payload and isinstance(payload, dict):
@@ -1711,7 +1898,7 @@ class TestEnforcementValidator(Validator):
 
         _logger.debug(
             "TestEnforcementValidator._check_tests_ran_from_events: found %d events, latest passed=%s",
-            len(tests_executed_events), event_data["passed"]
+            event_count, event_data["passed"]
         )
 
         return True, event_data
@@ -1799,6 +1986,139 @@ def evaluate_validator(
     return validator.evaluate(config, context, run)
 
 
+def _gate_outcome(
+    passed: list[bool | None],
+    required: list[bool],
+    gate_mode: str,
+    pending: bool,
+) -> tuple[bool, bool]:
+    """
+    (overall_passed, any_passed) of a gate, with undecided validators
+    (None in passed) assumed to return pending.
+
+    Both values only ever improve when a validator passes, so the verdict
+    is decided once pending=True and pending=False give the same outcome.
+    """
+    values = [pending if p is None else p for p in passed]
+    if not all(v for v, r in zip(values, required) if r):
+        # Required validators must always pass
+        overall = False
+    elif gate_mode == "any_pass":
+        overall = any(values)
+    else:  # all_pass, weighted or unknown
+        overall = all(values)
+    return overall, any(values)
+
+
+def _skipped_result(validator_def: dict[str, Any]) -> ValidatorResult:
+    """Placeholder for a validator not run because the verdict was decided."""
+    return ValidatorResult(
+        passed=False,
+        message="Skipped: acceptance verdict already decided",
+        score=0.0,
+        details={"skipped": True},
+        validator_type=validator_def.get("type") or "unknown",
+    )
+
+
+def run_validators(
+    validators: list[dict[str, Any]],
+    context: dict[str, Any],
+    run: "AgentRun | None" = None,
+    gate_mode: str = "all_pass",
+    *,
+    max_workers: int = DEFAULT_VALIDATOR_WORKERS,
+    short_circuit: bool = True,
+) -> list[ValidatorResult]:
+    """
+    Evaluate validator definitions cheapest first, commands concurrently.
+
+    - Validators run in order of their class's cost (stable for equal
+      costs), so file checks and event checks come before commands
+    - Concurrent-safe validators (test_pass, lint_clean) run in a pool of
+      up to max_workers threads; the rest run in the calling thread, which
+      owns the run's database session
+    - With short_circuit, once the gate's outcome can no longer change
+      (e.g. a required validator failed in all_pass mode and another
+      already passed), validators not yet started are skipped. Commands
+      already running are waited for and reported.
+
+    Args:
+        validators: List of validator definitions from AcceptanceSpec
+        context: Runtime context for variable interpolation
+        run: Optional AgentRun instance
+        gate_mode: How results are combined ("all_pass", "any_pass", "weighted")
+        max_workers: Maximum concurrently running command validators
+        short_circuit: Skip validators once the outcome is decided
+
+    Returns:
+        One ValidatorResult per definition, in definition order. Skipped
+        validators get a failed result with details {"skipped": True}.
+    """
+    results: list[ValidatorResult | None] = [None] * len(validators)
+    required = [bool(v.get("required", False)) for v in validators]
+
+    def decided() -> bool:
+        if not short_circuit:
+            return False
+        passed = [r.passed if r is not None else None for r in results]
+        return (
+            _gate_outcome(passed, required, gate_mode, pending=True)
+            == _gate_outcome(passed, required, gate_mode, pending=False)
+        )
+
+    def validator_class(index: int) -> type[Validator] | None:
+        validator_type = validators[index].get("type")
+        return VALIDATOR_REGISTRY.get(validator_type) if isinstance(validator_type, str) else None
+
+    order = sorted(
+        range(len(validators)),
+        key=lambda i: validator_class(i).cost if validator_class(i) else COST_CHEAP,
+    )
+    pooled = [
+        i for i in order
+        if validator_class(i) is not None and validator_class(i).concurrent_safe
+    ]
+    if len(pooled) < 2 or max_workers < 2:
+        pooled = []
+    inline = [i for i in order if i not in pooled]
+
+    for index in inline:
+        if decided():
+            break
+        results[index] = evaluate_validator(validators[index], context, run)
+
+    if pooled and not decided():
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(pooled)),
+            thread_name_prefix="validator",
+        ) as pool:
+            futures = {
+                pool.submit(evaluate_validator, validators[i], context, run): i
+                for i in pooled
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if decided():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        # Leaving the pool waited for commands that were already running
+        for future, index in futures.items():
+            if results[index] is None and not future.cancelled():
+                results[index] = future.result()
+
+    skipped = [i for i, r in enumerate(results) if r is None]
+    if skipped:
+        _logger.info(
+            "Acceptance verdict decided early: skipped %d of %d validator(s)",
+            len(skipped), len(validators)
+        )
+        for index in skipped:
+            results[index] = _skipped_result(validators[index])
+    return results
+
+
 def evaluate_acceptance_spec(
     validators: list[dict[str, Any]],
     context: dict[str, Any],
@@ -1808,6 +2128,9 @@ def evaluate_acceptance_spec(
     """
     Evaluate all validators in an acceptance spec.
 
+    Validators run through run_validators(): cheapest first, command
+    validators concurrently, and skipped once the outcome is decided.
+
     Args:
         validators: List of validator definitions from AcceptanceSpec
         context: Runtime context for variable interpolation
@@ -1815,15 +2138,12 @@ def evaluate_acceptance_spec(
         run: Optional AgentRun instance
 
     Returns:
-        Tuple of (overall_passed, list of ValidatorResults)
+        Tuple of (overall_passed, list of ValidatorResults in definition order)
     """
-    results = []
+    results = run_validators(validators, context, run, gate_mode)
     required_passed = True
 
-    for validator_def in validators:
-        result = evaluate_validator(validator_def, context, run)
-        results.append(result)
-
+    for validator_def, result in zip(validators, results):
         # Check if this was a required validator that failed
         is_required = validator_def.get("required", False)
         if is_required and not result.passed:
@@ -1976,27 +2296,17 @@ class AcceptanceGate:
                 summary="No validators defined, defaulting to passed",
             )
 
-        # Step 1-3: Iterate through validators, instantiate, and execute
-        validator_results: list[ValidatorResult] = []
+        # Step 1-3: Instantiate and execute validators (cheapest first,
+        # commands concurrently), results in definition order
+        validator_results = run_validators(validators_config, context, run, gate_mode)
         acceptance_results: list[dict[str, Any]] = []
         required_failed = False
 
-        for index, validator_def in enumerate(validators_config):
-            # Step 2: Instantiate appropriate validator class for each type
+        for index, (validator_def, result) in enumerate(zip(validators_config, validator_results)):
             validator_type = validator_def.get("type")
-            config = validator_def.get("config", {})
             is_required = validator_def.get("required", False)
             weight = validator_def.get("weight", 1.0)
 
-            self._logger.debug(
-                "Evaluating validator %d: type=%s, required=%s",
-                index, validator_type, is_required
-            )
-
-            # Step 3: Execute validator and collect ValidatorResult
-            result = evaluate_validator(validator_def, context, run)
-            validator_results.append(result)
-
             # Step 4: Check required flag - required validators must always pass
             if is_required and not result.passed:
                 required_failed = True
@@ -2034,6 +2344,7 @@ class AcceptanceGate:
             gate_mode=gate_mode,
             required_failed=required_failed,
             verdict=verdict,
+            skipped_count=sum(1 for r in validator_results if r.details.get("skipped") is True),
         )
 
         self._logger.info(
@@ -2207,12 +2518,16 @@ class AcceptanceGate:
         gate_mode: str,
         required_failed: bool,
         verdict: str,
+        skipped_count: int = 0,
     ) -> str:
         """Build a human-readable summary of the gate evaluation."""
         parts = []
 
         parts.append(f"{passed_count}/{total_count} validators passed")
 
+        if skipped_count:
+            parts.append(f"{skipped_count} skipped after verdict decided")
+
         if required_failed:
             parts.append("required validator failed")
 
@@ -58,6 +58,8 @@ FEATURE_MCP_TOOLS = [
     "mcp__features__feature_get_summary",  # Lightweight: id, name, status, deps only
     "mcp__features__feature_mark_in_progress",
     "mcp__features__feature_claim_and_get",  # Atomic claim + get details
+    "mcp__features__feature_claim_next",  # Atomic claim of best ready feature
+    "mcp__features__feature_renew_lease",  # Keep a claim_next lease alive
     "mcp__features__feature_mark_passing",
     "mcp__features__feature_mark_failing",  # Mark regression detected
     "mcp__features__feature_skip",
@@ -14,6 +14,8 @@ Tools:
 - feature_skip: Skip a feature (move to end of queue)
 - feature_mark_in_progress: Mark a feature as in-progress
 - feature_claim_and_get: Atomically claim and get feature details
+- feature_claim_next: Atomically claim the best ready feature
+- feature_renew_lease: Extend a worker's lease on a claimed feature
 - feature_clear_in_progress: Clear in-progress status
 - feature_create_bulk: Create multiple features at once
 - feature_create: Create a single feature
@@ -42,11 +44,21 @@ from pydantic import BaseModel, Field
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from api.database import Feature, create_database
-from api.dependency_resolver import (
-    MAX_DEPENDENCIES_PER_FEATURE,
-    compute_scheduling_scores,
-    would_create_circular_dependency,
+from api.dependency_order import find_dependency_cycle
+from api.dependency_queries import (
+    get_blocking_dependencies_map,
+    get_dependency_edges,
+    get_unblocked_by,
 )
+from api.dependency_resolver import MAX_DEPENDENCIES_PER_FEATURE
+from api.feature_claims import (
+    claim_feature,
+    claim_next_ready_feature,
+    release_feature,
+    renew_feature_lease,
+)
+from api.feature_graph import FeatureGraph
+from api.feature_lite import load_feature_lites
 from api.migration import migrate_json_to_sqlite
 
 # Configuration from environment
@@ -99,6 +111,10 @@ _engine = None
 # Lock for priority assignment to prevent race conditions
 _priority_lock = threading.Lock()
 
+# Dependency graph kept across feature_get_ready calls (scores survive status flips)
+_feature_graph = FeatureGraph()
+_feature_graph_lock = threading.Lock()
+
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
@@ -239,7 +255,8 @@ def feature_mark_passing(
         feature_id: The ID of the feature to mark as passing
 
     Returns:
-        JSON with success confirmation: {success, feature_id, name}
+        JSON with success confirmation: {success, feature_id, name, unblocked},
+        where unblocked lists the IDs of features that are now ready to start
     """
     session = get_session()
     try:
@@ -252,7 +269,12 @@ def feature_mark_passing(
         feature.in_progress = False
         session.commit()
 
-        return json.dumps({"success": True, "feature_id": feature_id, "name": feature.name})
+        return json.dumps({
+            "success": True,
+            "feature_id": feature_id,
+            "name": feature.name,
+            "unblocked": get_unblocked_by(session, feature_id),
+        })
     except Exception as e:
         session.rollback()
         return json.dumps({"error": f"Failed to mark feature passing: {str(e)}"})
@@ -381,6 +403,11 @@ def feature_mark_in_progress(
     """
     session = get_session()
     try:
+        # One guarded UPDATE: fails cleanly if someone else claimed it first
+        claimed = claim_feature(session, feature_id)
+        if claimed is not None:
+            return json.dumps(claimed)
+
         feature = session.query(Feature).filter(Feature.id == feature_id).first()
 
         if feature is None:
@@ -389,14 +416,7 @@ def feature_mark_in_progress(
         if feature.passes:
             return json.dumps({"error": f"Feature with ID {feature_id} is already passing"})
 
-        if feature.in_progress:
-            return json.dumps({"error": f"Feature with ID {feature_id} is already in-progress"})
-
-        feature.in_progress = True
-        session.commit()
-        session.refresh(feature)
-
-        return json.dumps(feature.to_dict())
+        return json.dumps({"error": f"Feature with ID {feature_id} is already in-progress"})
     except Exception as e:
         session.rollback()
         return json.dumps({"error": f"Failed to mark feature in-progress: {str(e)}"})
@@ -421,6 +441,12 @@ def feature_claim_and_get(
     """
     session = get_session()
     try:
+        # One guarded UPDATE: only one caller can win the claim
+        claimed = claim_feature(session, feature_id)
+        if claimed is not None:
+            claimed["already_claimed"] = False
+            return json.dumps(claimed)
+
         feature = session.query(Feature).filter(Feature.id == feature_id).first()
 
         if feature is None:
@@ -430,14 +456,8 @@ def feature_claim_and_get(
             return json.dumps({"error": f"Feature with ID {feature_id} is already passing"})
 
         # Idempotent: if already in-progress, just return details
-        already_claimed = feature.in_progress
-        if not already_claimed:
-            feature.in_progress = True
-            session.commit()
-            session.refresh(feature)
-
         result = feature.to_dict()
-        result["already_claimed"] = already_claimed
+        result["already_claimed"] = True
         return json.dumps(result)
     except Exception as e:
         session.rollback()
@@ -446,6 +466,84 @@ def feature_claim_and_get(
         session.close()
 
 
+@mcp.tool()
+def feature_claim_next(
+    worker_id: Annotated[str | None, Field(default=None, max_length=100, description="Identifier of the claiming worker (required for leases)")] = None,
+    lease_seconds: Annotated[int | None, Field(default=None, ge=30, le=86400, description="Optional lease; the claim expires unless renewed")] = None,
+) -> str:
+    """Atomically claim the highest-scoring ready feature and return its details.
+
+    The feature is chosen and marked in-progress by a single conditional
+    UPDATE, so concurrent callers always get different features. With a
+    lease, the claim is released automatically if it is not renewed
+    (feature_renew_lease) before it expires - e.g. because the agent died.
+
+    Args:
+        worker_id: Identifier of the claiming worker
+        lease_seconds: Lease duration in seconds (30-86400), or None for no expiry
+
+    Returns:
+        JSON with the claimed feature's details, or {"feature": null} if nothing is ready
+    """
+    if lease_seconds is not None and worker_id is None:
+        return json.dumps({"error": "worker_id is required when lease_seconds is set"})
+
+    session = get_session()
+    try:
+        rows = session.query(
+            Feature.id, Feature.priority, Feature.passes,
+            Feature.in_progress, Feature.dependencies,
+        ).all()
+
+        # Scheduling order only; readiness is re-checked inside the UPDATE
+        with _feature_graph_lock:
+            _feature_graph.sync(
+                {"id": r[0], "priority": r[1], "passes": r[2], "in_progress": r[3], "dependencies": r[4]}
+                for r in rows
+            )
+            order = _feature_graph.get_ready()
+
+        claimed = claim_next_ready_feature(
+            session, order=order, worker_id=worker_id, lease_seconds=lease_seconds
+        )
+        if claimed is None:
+            return json.dumps({"feature": None, "message": "No features are ready"})
+        return json.dumps(claimed)
+    except Exception as e:
+        session.rollback()
+        return json.dumps({"error": f"Failed to claim next feature: {str(e)}"})
+    finally:
+        session.close()
+
+
+@mcp.tool()
+def feature_renew_lease(
+    feature_id: Annotated[int, Field(description="The ID of the claimed feature", ge=1)],
+    worker_id: Annotated[str, Field(max_length=100, description="The worker_id used to claim the feature")],
+    lease_seconds: Annotated[int, Field(default=600, ge=30, le=86400, description="New lease duration from now")] = 600,
+) -> str:
+    """Extend the lease on a feature claimed with feature_claim_next.
+
+    Args:
+        feature_id: The ID of the claimed feature
+        worker_id: The worker_id used to claim it
+        lease_seconds: New lease duration in seconds, counted from now
+
+    Returns:
+        JSON with: success (bool), or error if the claim was lost
+    """
+    session = get_session()
+    try:
+        if renew_feature_lease(session, feature_id, worker_id, lease_seconds):
+            return json.dumps({"success": True, "feature_id": feature_id, "lease_seconds": lease_seconds})
+        return json.dumps({"error": f"Feature with ID {feature_id} is not claimed by {worker_id}"})
+    except Exception as e:
+        session.rollback()
+        return json.dumps({"error": f"Failed to renew lease: {str(e)}"})
+    finally:
+        session.close()
+
+
 @mcp.tool()
 def feature_clear_in_progress(
     feature_id: Annotated[int, Field(description="The ID of the feature to clear in-progress status", ge=1)]
@@ -463,15 +561,11 @@ def feature_clear_in_progress(
     """
     session = get_session()
     try:
-        feature = session.query(Feature).filter(Feature.id == feature_id).first()
-
-        if feature is None:
+        # Also drops any worker lease
+        if not release_feature(session, feature_id):
             return json.dumps({"error": f"Feature with ID {feature_id} not found"})
 
-        feature.in_progress = False
-        session.commit()
-        session.refresh(feature)
-
+        feature = session.query(Feature).filter(Feature.id == feature_id).first()
         return json.dumps(feature.to_dict())
     except Exception as e:
         session.rollback()
@@ -684,10 +778,7 @@ def feature_add_dependency(
             return json.dumps({"error": "Dependency already exists"})
 
         # Security: Circular dependency check
-        # would_create_circular_dependency(features, source_id, target_id)
-        # source_id = feature gaining the dependency, target_id = feature being depended upon
-        all_features = [f.to_dict() for f in session.query(Feature).all()]
-        if would_create_circular_dependency(all_features, feature_id, dependency_id):
+        if find_dependency_cycle(PROJECT_DIR, session, feature_id, [dependency_id]):
             return json.dumps({"error": "Cannot add: would create circular dependency"})
 
         # Add dependency
@@ -731,8 +822,10 @@ def feature_remove_dependency(
         if dependency_id not in current_deps:
             return json.dumps({"error": "Dependency does not exist"})
 
-        current_deps.remove(dependency_id)
-        feature.dependencies = current_deps if current_deps else None
+        # Assign a new list: an in-place edit of the loaded list is not
+        # detected as a change and would never be written
+        new_deps = [d for d in current_deps if d != dependency_id]
+        feature.dependencies = new_deps if new_deps else None
         session.commit()
 
         return json.dumps({
@@ -764,26 +857,24 @@ def feature_get_ready(
     """
     session = get_session()
     try:
-        all_features = session.query(Feature).all()
-        passing_ids = {f.id for f in all_features if f.passes}
-
-        ready = []
-        all_dicts = [f.to_dict() for f in all_features]
-        for f in all_features:
-            if f.passes or f.in_progress:
-                continue
-            deps = f.dependencies or []
-            if all(dep_id in passing_ids for dep_id in deps):
-                ready.append(f.to_dict())
-
-        # Sort by scheduling score (higher = first), then priority, then id
-        scores = compute_scheduling_scores(all_dicts)
-        ready.sort(key=lambda f: (-scores.get(f["id"], 0), f["priority"], f["id"]))
+        features = load_feature_lites(session)
+
+        with _feature_graph_lock:
+            _feature_graph.sync(features)
+            # Sorted by scheduling score (higher = first), then priority, then id
+            ready_ids = _feature_graph.get_ready(limit=limit)
+            total_ready = _feature_graph.ready_count
+
+        by_id = {
+            f.id: f.to_dict()
+            for f in session.query(Feature).filter(Feature.id.in_(ready_ids)).all()
+        } if ready_ids else {}
+        ready = [by_id[fid] for fid in ready_ids if fid in by_id]
 
         return json.dumps({
-            "features": ready[:limit],
-            "count": len(ready[:limit]),
-            "total_ready": len(ready)
+            "features": ready,
+            "count": len(ready),
+            "total_ready": total_ready
         })
     finally:
         session.close()
@@ -806,25 +897,24 @@ def feature_get_blocked(
     """
     session = get_session()
     try:
-        all_features = session.query(Feature).all()
-        passing_ids = {f.id for f in all_features if f.passes}
-
-        blocked = []
-        for f in all_features:
-            if f.passes:
-                continue
-            deps = f.dependencies or []
-            blocking = [d for d in deps if d not in passing_ids]
-            if blocking:
-                blocked.append({
-                    **f.to_dict(),
-                    "blocked_by": blocking
-                })
+        # Indexed query over the dependency edges; only the returned
+        # features are loaded as full rows
+        blocking = get_blocking_dependencies_map(session, pending_only=True)
+        page_ids = list(blocking)[:limit]
+
+        by_id = {
+            f.id: f.to_dict()
+            for f in session.query(Feature).filter(Feature.id.in_(page_ids)).all()
+        } if page_ids else {}
+        blocked = [
+            {**by_id[fid], "blocked_by": blocking[fid]}
+            for fid in page_ids if fid in by_id
+        ]
 
         return json.dumps({
-            "features": blocked[:limit],
-            "count": len(blocked[:limit]),
-            "total_blocked": len(blocked)
+            "features": blocked,
+            "count": len(blocked),
+            "total_blocked": len(blocking)
         })
     finally:
         session.close()
@@ -842,36 +932,36 @@ def feature_get_graph() -> str:
     """
     session = get_session()
     try:
-        all_features = session.query(Feature).all()
-        passing_ids = {f.id for f in all_features if f.passes}
+        blocked_ids = get_blocking_dependencies_map(session, pending_only=True).keys()
+        rows = session.query(
+            Feature.id, Feature.name, Feature.category, Feature.priority,
+            Feature.passes, Feature.in_progress, Feature.dependencies,
+        ).all()
 
         nodes = []
-        edges = []
-
-        for f in all_features:
-            deps = f.dependencies or []
-            blocking = [d for d in deps if d not in passing_ids]
-
-            if f.passes:
+        for fid, name, category, priority, passes, in_progress, deps in rows:
+            if passes:
                 status = "done"
-            elif blocking:
+            elif fid in blocked_ids:
                 status = "blocked"
-            elif f.in_progress:
+            elif in_progress:
                 status = "in_progress"
             else:
                 status = "pending"
 
             nodes.append({
-                "id": f.id,
-                "name": f.name,
-                "category": f.category,
+                "id": fid,
+                "name": name,
+                "category": category,
                 "status": status,
-                "priority": f.priority,
-                "dependencies": deps
+                "priority": priority,
+                "dependencies": deps or []
             })
 
-            for dep_id in deps:
-                edges.append({"source": dep_id, "target": f.id})
+        edges = [
+            {"source": depends_on_id, "target": feature_id}
+            for feature_id, depends_on_id in get_dependency_edges(session)
+        ]
 
         return json.dumps({
             "nodes": nodes,
@@ -916,25 +1006,18 @@ def feature_set_dependencies(
             return json.dumps({"error": f"Feature {feature_id} not found"})
 
         # Validate all dependencies exist
-        all_feature_ids = {f.id for f in session.query(Feature).all()}
-        missing = [d for d in dependency_ids if d not in all_feature_ids]
+        found_ids = {
+            row[0] for row in session.query(Feature.id).filter(Feature.id.in_(dependency_ids))
+        } if dependency_ids else set()
+        missing = [d for d in dependency_ids if d not in found_ids]
         if missing:
             return json.dumps({"error": f"Dependencies not found: {missing}"})
 
-        # Check for circular dependencies
-        all_features = [f.to_dict() for f in session.query(Feature).all()]
-        # Temporarily update the feature's dependencies for cycle check
-        test_features = []
-        for f in all_features:
-            if f["id"] == feature_id:
-                test_features.append({**f, "dependencies": dependency_ids})
-            else:
-                test_features.append(f)
-
-        for dep_id in dependency_ids:
-            # source_id = feature_id (gaining dep), target_id = dep_id (being depended upon)
-            if would_create_circular_dependency(test_features, feature_id, dep_id):
-                return json.dumps({"error": f"Cannot add dependency {dep_id}: would create circular dependency"})
+        # Check for circular dependencies (the feature's current dependencies
+        # play no part: a cycle needs a path from a new dependency back to it)
+        cycle = find_dependency_cycle(PROJECT_DIR, session, feature_id, dependency_ids)
+        if cycle:
+            return json.dumps({"error": f"Cannot add dependency {cycle[1]}: would create circular dependency"})
 
         # Set dependencies
         feature.dependencies = sorted(dependency_ids) if dependency_ids else None
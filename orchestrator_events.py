@@ -0,0 +1,106 @@
+"""
+Orchestrator Events
+===================
+
+Typed side channel from the orchestrator process to the server.
+
+The server's AgentProcessManager creates a pipe when it starts the
+orchestrator and passes the write end's file descriptor in
+AUTOBUILDR_EVENTS_FD. The orchestrator writes one JSON object per line to
+it, so the server learns about spawns, completions and scheduling state
+without parsing the human-readable stdout (which still feeds the log view).
+
+Every event has an "event" name and a "ts" (Unix time). Event names:
+
+- init_start / init_complete: initializer phase
+- scheduling: ready, passing, in_progress, blocked, total feature counts
+- capacity: ready features and free slots at the start of a spawning pass
+- at_capacity: all coding slots are busy
+- feature_start: feature_id, feature_name about to be started
+- agent_spawned: agent_type, feature_id, feature_name, pid
+- agent_completed: agent_type, feature_id, success, return_code,
+  duration_seconds
+- all_complete: every feature passes
+
+Events that change agent counts also carry the current coding_agents,
+testing_agents and max_concurrency values.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, TextIO
+
+# Environment variable holding the write end of the event pipe
+EVENTS_FD_ENV = "AUTOBUILDR_EVENTS_FD"
+
+
+class OrchestratorEventEmitter:
+    """Writes orchestrator events as JSON lines (thread-safe, never raises)."""
+
+    def __init__(self, stream: TextIO | None = None):
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "OrchestratorEventEmitter":
+        """Open the pipe named by AUTOBUILDR_EVENTS_FD (disabled if unset).
+
+        The variable is removed from the environment so agent subprocesses,
+        which do not inherit the descriptor, cannot pick up a stale number.
+        """
+        fd = os.environ.pop(EVENTS_FD_ENV, None)
+        if not fd:
+            return cls(None)
+        try:
+            stream = os.fdopen(int(fd), "w", encoding="utf-8", buffering=1)
+        except (ValueError, OSError):
+            return cls(None)
+        return cls(stream)
+
+    @property
+    def enabled(self) -> bool:
+        """True while events are being written."""
+        return self._stream is not None
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Write one event. The channel is disabled if the reader went away."""
+        if self._stream is None:
+            return
+        record = {"event": event, "ts": time.time(), **fields}
+        line = json.dumps(record, separators=(",", ":"), default=str)
+        with self._lock:
+            if self._stream is None:
+                return
+            try:
+                self._stream.write(line + "\n")
+                self._stream.flush()
+            except (OSError, ValueError):
+                self._stream = None
+
+    def close(self) -> None:
+        """Close the pipe."""
+        with self._lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+def parse_event_line(line: bytes | str) -> dict | None:
+    """Decode one event line; None for blank or malformed lines."""
+    if isinstance(line, bytes):
+        line = line.decode("utf-8", errors="replace")
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(event, dict) or not isinstance(event.get("event"), str):
+        return None
+    return event
@@ -24,6 +24,7 @@ import os
 import subprocess
 import sys
 import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Literal
@@ -31,15 +32,16 @@ from typing import Callable, Literal
 # Module-level logger for standard Python logging
 _logger = logging.getLogger(__name__)
 
-from api.database import Feature, create_database
-from api.dependency_resolver import (
-    are_dependencies_satisfied,
-    compute_scheduling_scores,
-    validate_dependency_graph,
-)
+from api.database import DataVersionWatcher, Feature, create_database
+from api.dependency_resolver import validate_dependency_graph
+from api.feature_claims import claim_feature
+from api.feature_graph import FeatureGraph
+from api.feature_lite import load_feature_lites
+from orchestrator_events import OrchestratorEventEmitter
 from progress import has_features
 from prompts import has_project_prompts
 from server.utils.process_utils import kill_process_tree
+from server.utils.stream_utils import iter_line_batches
 
 # Root directory of AutoBuildr (where this script and autonomous_agent_demo.py live)
 AUTOBUILDR_ROOT = Path(__file__).parent.resolve()
@@ -90,8 +92,7 @@ debug_log = DebugLogger()
 
 def _dump_database_state(session, label: str = ""):
     """Helper to dump full database state to debug log."""
-    from api.database import Feature
-    all_features = session.query(Feature).all()
+    all_features = load_feature_lites(session)
 
     passing = [f for f in all_features if f.passes]
     in_progress = [f for f in all_features if f.in_progress and not f.passes]
@@ -131,6 +132,7 @@ MAX_PARALLEL_AGENTS = 5
 MAX_TOTAL_AGENTS = 10
 DEFAULT_CONCURRENCY = 3
 POLL_INTERVAL = 5  # seconds between checking for ready features
+CHANGE_CHECK_INTERVAL = 0.25  # seconds between PRAGMA data_version checks while waiting
 MAX_FEATURE_RETRIES = 3  # Maximum times to retry a failed feature
 INITIALIZER_TIMEOUT = 1800  # 30 minutes timeout for initializer
 
@@ -201,10 +203,34 @@ class ParallelOrchestrator:
         # Database session for this orchestrator
         self._engine, self._session_maker = create_database(project_dir)
 
+        # In-memory dependency graph, synced from narrow-column reads and
+        # updated directly on the orchestrator's own writes
+        self._feature_graph = FeatureGraph()
+        self._graph_lock = threading.Lock()
+
+        # Change notification: feature state is only re-read after some
+        # connection (agent MCP servers, this orchestrator) committed
+        self._db_watcher = DataVersionWatcher(project_dir)
+        self._graph_data_version: int | None = None
+
+        # Typed events for the server (no-op unless started by the UI server)
+        self._events = OrchestratorEventEmitter.from_env()
+        # (agent_type, feature_id) -> time.monotonic() at spawn, for durations
+        self._agent_started_at: dict[tuple[str, int], float] = {}
+
     def get_session(self):
         """Get a new database session."""
         return self._session_maker()
 
+    def _agent_counts(self) -> dict[str, int]:
+        """Current agent counts, attached to events that change them."""
+        with self._lock:
+            return {
+                "coding_agents": len(self.running_coding_agents),
+                "testing_agents": len(self.running_testing_agents),
+                "max_concurrency": self.max_concurrency,
+            }
+
     def _run_dependency_health_check(self) -> bool:
         """Run dependency graph validation on startup.
 
@@ -420,161 +446,171 @@ class ParallelOrchestrator:
         finally:
             session.close()
 
-    def get_resumable_features(self) -> list[dict]:
-        """Get features that were left in_progress from a previous session.
+    def _refresh_feature_graph(self) -> FeatureGraph:
+        """Sync the in-memory feature graph with the database.
 
-        These are features where in_progress=True but passes=False, and they're
-        not currently being worked on by this orchestrator. This handles the case
-        where a previous session was interrupted before completing the feature.
+        Nothing is read unless the database changed since the last sync
+        (PRAGMA data_version). Otherwise only the scheduling columns are read
+        (as FeatureLite records, without the ORM), and only features whose state differs from the graph are updated, so
+        no rows are converted to dicts and scheduling scores are not
+        recomputed unless the structure changed.
         """
+        # Read the version first: a commit racing with the query below makes
+        # the next call sync again rather than being missed
+        version = self._db_watcher.current()
+        if version == self._graph_data_version:
+            return self._feature_graph
+
         session = self.get_session()
         try:
-            # Force fresh read from database to avoid stale cached data
-            # This is critical when agent subprocesses have committed changes
-            session.expire_all()
-
-            # Find features that are in_progress but not complete
-            stale = session.query(Feature).filter(
-                Feature.in_progress == True,
-                Feature.passes == False
-            ).all()
-
-            resumable = []
-            for f in stale:
-                # Skip if already running in this orchestrator instance
-                with self._lock:
-                    if f.id in self.running_coding_agents:
-                        continue
-                # Skip if feature has failed too many times
-                if self._failure_counts.get(f.id, 0) >= MAX_FEATURE_RETRIES:
-                    continue
-                resumable.append(f.to_dict())
-
-            # Sort by scheduling score (higher = first), then priority, then id
-            all_dicts = [f.to_dict() for f in session.query(Feature).all()]
-            scores = compute_scheduling_scores(all_dicts)
-            resumable.sort(key=lambda f: (-scores.get(f["id"], 0), f["priority"], f["id"]))
-            return resumable
+            features = load_feature_lites(session)
         finally:
             session.close()
-
-    def get_ready_features(self) -> list[dict]:
-        """Get features with satisfied dependencies, not already running."""
+        with self._graph_lock:
+            self._feature_graph.sync(features)
+        self._graph_data_version = version
+        return self._feature_graph
+
+    def _load_feature_dicts(self, feature_ids: list[int]) -> list[dict]:
+        """Load full feature dicts for the given IDs, preserving their order."""
+        if not feature_ids:
+            return []
         session = self.get_session()
         try:
-            # Force fresh read from database to avoid stale cached data
-            # This is critical when agent subprocesses have committed changes
-            session.expire_all()
-
-            all_features = session.query(Feature).all()
-            all_dicts = [f.to_dict() for f in all_features]
+            by_id = {
+                f.id: f.to_dict()
+                for f in session.query(Feature).filter(Feature.id.in_(feature_ids)).all()
+            }
+        finally:
+            session.close()
+        return [by_id[fid] for fid in feature_ids if fid in by_id]
 
-            # Pre-compute passing_ids once to avoid O(n^2) in the loop
-            passing_ids = {f.id for f in all_features if f.passes}
+    def _excluded_feature_ids(self) -> tuple[set[int], set[int]]:
+        """Return (running, permanently failed) feature IDs."""
+        with self._lock:
+            running = set(self.running_coding_agents)
+            failed = {fid for fid, count in self._failure_counts.items() if count >= MAX_FEATURE_RETRIES}
+        return running, failed
 
-            ready = []
-            skipped_reasons = {"passes": 0, "in_progress": 0, "running": 0, "failed": 0, "deps": 0}
-            for f in all_features:
-                if f.passes:
-                    skipped_reasons["passes"] += 1
-                    continue
-                if f.in_progress:
-                    skipped_reasons["in_progress"] += 1
-                    continue
-                # Skip if already running in this orchestrator
-                with self._lock:
-                    if f.id in self.running_coding_agents:
-                        skipped_reasons["running"] += 1
-                        continue
-                # Skip if feature has failed too many times
-                if self._failure_counts.get(f.id, 0) >= MAX_FEATURE_RETRIES:
-                    skipped_reasons["failed"] += 1
-                    continue
-                # Check dependencies (pass pre-computed passing_ids)
-                if are_dependencies_satisfied(f.to_dict(), all_dicts, passing_ids):
-                    ready.append(f.to_dict())
-                else:
-                    skipped_reasons["deps"] += 1
+    def get_resumable_features(self) -> list[dict]:
+        """Get features that were left in_progress from a previous session.
 
+        These are features where in_progress=True but passes=False, and they're
+        not currently being worked on by this orchestrator. This handles the case
+        where a previous session was interrupted before completing the feature.
+        """
+        # Picks up commits from agent subprocesses (only re-reads on change)
+        graph = self._refresh_feature_graph()
+        running, failed = self._excluded_feature_ids()
+
+        with self._graph_lock:
+            # Skip features already running here or that failed too many times
+            resumable_ids = [
+                fid for fid in graph.in_progress_ids()
+                if fid not in running and fid not in failed
+            ]
             # Sort by scheduling score (higher = first), then priority, then id
-            scores = compute_scheduling_scores(all_dicts)
-            ready.sort(key=lambda f: (-scores.get(f["id"], 0), f["priority"], f["id"]))
-
-            # Debug logging
-            passing = sum(1 for f in all_features if f.passes)
-            in_progress = sum(1 for f in all_features if f.in_progress and not f.passes)
-            print(
-                f"[DEBUG] get_ready_features: {len(ready)} ready, "
-                f"{passing} passing, {in_progress} in_progress, {len(all_features)} total",
-                flush=True
-            )
-            print(
-                f"[DEBUG]   Skipped: {skipped_reasons['passes']} passing, {skipped_reasons['in_progress']} in_progress, "
-                f"{skipped_reasons['running']} running, {skipped_reasons['failed']} failed, {skipped_reasons['deps']} blocked by deps",
-                flush=True
+            resumable_ids.sort(key=graph.sort_key)
+
+        return self._load_feature_dicts(resumable_ids)
+
+    def get_ready_features(self, limit: int | None = None) -> list[dict]:
+        """Get features with satisfied dependencies, not already running.
+
+        Args:
+            limit: Maximum number of features to return (None = all ready features).
+                Only the returned features are loaded as full rows.
+        """
+        # Picks up commits from agent subprocesses (only re-reads on change)
+        graph = self._refresh_feature_graph()
+        running, failed = self._excluded_feature_ids()
+
+        with self._graph_lock:
+            # Ordered by scheduling score (higher = first), then priority, then id
+            ready_ids = graph.get_ready(limit=limit, exclude=running | failed)
+
+            total = len(graph)
+            passing = graph.passing_count
+            in_progress = len(graph.in_progress_ids())
+            skipped_reasons = {"passes": passing, "in_progress": in_progress, "running": 0, "failed": 0, "deps": 0}
+            ready_count = graph.ready_count
+            for fid in running | failed:
+                if fid in graph and not graph.is_passing(fid) and not graph.is_in_progress(fid):
+                    skipped_reasons["running" if fid in running else "failed"] += 1
+                    if graph.is_ready(fid):
+                        ready_count -= 1
+            skipped_reasons["deps"] = (
+                total - passing - in_progress - skipped_reasons["running"]
+                - skipped_reasons["failed"] - ready_count
             )
 
-            # Log to debug file (but not every call to avoid spam)
-            debug_log.log("READY", "get_ready_features() called",
-                ready_count=len(ready),
-                ready_ids=[f['id'] for f in ready[:5]],  # First 5 only
-                passing=passing,
-                in_progress=in_progress,
-                total=len(all_features),
-                skipped=skipped_reasons)
+        ready = self._load_feature_dicts(ready_ids)
 
-            return ready
-        finally:
-            session.close()
+        # Debug logging
+        print(
+            f"[DEBUG] get_ready_features: {ready_count} ready, "
+            f"{passing} passing, {in_progress} in_progress, {total} total",
+            flush=True
+        )
+        print(
+            f"[DEBUG]   Skipped: {skipped_reasons['passes']} passing, {skipped_reasons['in_progress']} in_progress, "
+            f"{skipped_reasons['running']} running, {skipped_reasons['failed']} failed, {skipped_reasons['deps']} blocked by deps",
+            flush=True
+        )
+
+        self._events.emit(
+            "scheduling",
+            ready=ready_count,
+            passing=passing,
+            in_progress=in_progress,
+            blocked=skipped_reasons["deps"],
+            total=total,
+        )
+
+        # Log to debug file (but not every call to avoid spam)
+        debug_log.log("READY", "get_ready_features() called",
+            ready_count=ready_count,
+            ready_ids=ready_ids[:5],  # First 5 only
+            passing=passing,
+            in_progress=in_progress,
+            total=total,
+            skipped=skipped_reasons)
+
+        return ready
 
     def get_all_complete(self) -> bool:
         """Check if all features are complete or permanently failed.
 
         Returns False if there are no features (initialization needed).
         """
-        session = self.get_session()
-        try:
-            # Force fresh read from database to avoid stale cached data
-            # This is critical when agent subprocesses have committed changes
-            session.expire_all()
-
-            all_features = session.query(Feature).all()
-
-            # No features = NOT complete, need initialization
-            if len(all_features) == 0:
-                return False
+        # Picks up commits from agent subprocesses (only re-reads on change)
+        graph = self._refresh_feature_graph()
+        _, failed = self._excluded_feature_ids()
+
+        with self._graph_lock:
+            total = len(graph)
+            passing_count = graph.passing_count
+            # Permanently failed features count as "done"
+            failed_count = sum(1 for fid in failed if fid in graph and not graph.is_passing(fid))
+
+        # No features = NOT complete, need initialization
+        if total == 0:
+            return False
 
-            passing_count = 0
-            failed_count = 0
-            pending_count = 0
-            for f in all_features:
-                if f.passes:
-                    passing_count += 1
-                    continue  # Completed successfully
-                if self._failure_counts.get(f.id, 0) >= MAX_FEATURE_RETRIES:
-                    failed_count += 1
-                    continue  # Permanently failed, count as "done"
-                pending_count += 1
-
-            total = len(all_features)
-            is_complete = pending_count == 0
-            print(
-                f"[DEBUG] get_all_complete: {passing_count}/{total} passing, "
-                f"{failed_count} failed, {pending_count} pending -> {is_complete}",
-                flush=True
-            )
-            return is_complete
-        finally:
-            session.close()
+        pending_count = total - passing_count - failed_count
+        is_complete = pending_count == 0
+        print(
+            f"[DEBUG] get_all_complete: {passing_count}/{total} passing, "
+            f"{failed_count} failed, {pending_count} pending -> {is_complete}",
+            flush=True
+        )
+        return is_complete
 
     def get_passing_count(self) -> int:
         """Get the number of passing features."""
-        session = self.get_session()
-        try:
-            session.expire_all()
-            return session.query(Feature).filter(Feature.passes == True).count()
-        finally:
-            session.close()
+        graph = self._refresh_feature_graph()
+        with self._graph_lock:
+            return graph.passing_count
 
     def _maintain_testing_agents(self) -> None:
         """Maintain the desired count of testing agents independently.
@@ -649,27 +685,34 @@ class ParallelOrchestrator:
         # Mark as in_progress in database (or verify it's resumable)
         session = self.get_session()
         try:
-            feature = session.query(Feature).filter(Feature.id == feature_id).first()
-            if not feature:
-                return False, "Feature not found"
-            if feature.passes:
-                return False, "Feature already complete"
-
-            if resume:
+            claimed = None
+            if not resume:
+                # Starting fresh: one guarded UPDATE, so an agent claiming the
+                # same feature concurrently cannot also win
+                claimed = claim_feature(session, feature_id)
+                if claimed is not None:
+                    feature_name = claimed["name"]
+                    with self._graph_lock:
+                        self._feature_graph.set_in_progress(feature_id, True)
+
+            if resume or claimed is None:
+                feature = session.query(Feature).filter(Feature.id == feature_id).first()
+                if not feature:
+                    return False, "Feature not found"
+                if feature.passes:
+                    return False, "Feature already complete"
+                if not resume:
+                    # Starting fresh: feature should not be in_progress
+                    return False, "Feature already in progress"
                 # Resuming: feature should already be in_progress
                 if not feature.in_progress:
                     return False, "Feature not in progress, cannot resume"
-            else:
-                # Starting fresh: feature should not be in_progress
-                if feature.in_progress:
-                    return False, "Feature already in progress"
-                feature.in_progress = True
-                session.commit()
+                feature_name = feature.name
         finally:
             session.close()
 
         # Start coding agent subprocess
-        success, message = self._spawn_coding_agent(feature_id)
+        success, message = self._spawn_coding_agent(feature_id, feature_name)
         if not success:
             return False, message
 
@@ -678,7 +721,7 @@ class ParallelOrchestrator:
 
         return True, f"Started feature {feature_id}"
 
-    def _spawn_coding_agent(self, feature_id: int) -> tuple[bool, str]:
+    def _spawn_coding_agent(self, feature_id: int, feature_name: str | None = None) -> tuple[bool, str]:
         """Spawn a coding agent subprocess for a specific feature."""
         # Create abort event
         abort_event = threading.Event()
@@ -715,6 +758,8 @@ class ParallelOrchestrator:
                 if feature:
                     feature.in_progress = False
                     session.commit()
+                    with self._graph_lock:
+                        self._feature_graph.set_in_progress(feature_id, False)
             finally:
                 session.close()
             return False, f"Failed to start agent: {e}"
@@ -722,6 +767,7 @@ class ParallelOrchestrator:
         with self._lock:
             self.running_coding_agents[feature_id] = proc
             self.abort_events[feature_id] = abort_event
+            self._agent_started_at[("coding", feature_id)] = time.monotonic()
 
         # Start output reader thread
         threading.Thread(
@@ -734,6 +780,14 @@ class ParallelOrchestrator:
             self.on_status(feature_id, "running")
 
         print(f"Started coding agent for feature #{feature_id}", flush=True)
+        self._events.emit(
+            "agent_spawned",
+            agent_type="coding",
+            feature_id=feature_id,
+            feature_name=feature_name,
+            pid=proc.pid,
+            **self._agent_counts(),
+        )
         return True, f"Started feature {feature_id}"
 
     def _spawn_testing_agent(self) -> tuple[bool, str]:
@@ -796,6 +850,7 @@ class ParallelOrchestrator:
 
             # Register process with feature ID (same pattern as coding agents)
             self.running_testing_agents[feature_id] = proc
+            self._agent_started_at[("testing", feature_id)] = time.monotonic()
             testing_count = len(self.running_testing_agents)
 
         # Start output reader thread with feature ID (same as coding agents)
@@ -806,6 +861,13 @@ class ParallelOrchestrator:
         ).start()
 
         print(f"Started testing agent for feature #{feature_id} (PID {proc.pid})", flush=True)
+        self._events.emit(
+            "agent_spawned",
+            agent_type="testing",
+            feature_id=feature_id,
+            pid=proc.pid,
+            **self._agent_counts(),
+        )
         debug_log.log("TESTING", f"Successfully spawned testing agent for feature #{feature_id}",
             pid=proc.pid,
             feature_id=feature_id,
@@ -832,6 +894,7 @@ class ParallelOrchestrator:
             cmd.extend(["--model", self.model])
 
         print("Running initializer agent...", flush=True)
+        self._events.emit("init_start")
 
         proc = subprocess.Popen(
             cmd,
@@ -885,17 +948,22 @@ class ParallelOrchestrator:
         abort: threading.Event,
         agent_type: Literal["coding", "testing"] = "coding",
     ):
-        """Read output from subprocess and emit events."""
+        """Read output from subprocess and emit events.
+
+        Output is read in chunks; each chunk's lines are forwarded together
+        (one write and flush for the whole batch when printing).
+        """
         try:
-            for line in proc.stdout:
+            for lines in iter_line_batches(proc.stdout):
                 if abort.is_set():
                     break
-                line = line.rstrip()
                 if self.on_output:
-                    self.on_output(feature_id or 0, line)
+                    for line in lines:
+                        self.on_output(feature_id or 0, line)
                 else:
                     # Both coding and testing agents now use [Feature #X] format
-                    print(f"[Feature #{feature_id}] {line}", flush=True)
+                    prefix = f"[Feature #{feature_id}] "
+                    print("\n".join(prefix + line for line in lines), flush=True)
             proc.wait()
         finally:
             self._on_agent_complete(feature_id, proc.returncode, agent_type, proc)
@@ -946,6 +1014,40 @@ class ParallelOrchestrator:
             # Timeout reached without agent completion - this is normal, just check anyway
             pass
 
+    async def _wait_for_state_change(self, timeout: float = POLL_INTERVAL):
+        """Wait until feature state changes, an agent completes, or timeout expires.
+
+        Feature state changes are detected with PRAGMA data_version: any commit
+        by an agent's MCP server (or by this orchestrator) since the feature
+        graph was last synced wakes the loop within CHANGE_CHECK_INTERVAL.
+        While nothing changes, the loop stays idle instead of re-querying.
+
+        Args:
+            timeout: Maximum seconds to wait (default: POLL_INTERVAL)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            if self._db_watcher.changed_since(self._graph_data_version):
+                debug_log.log("EVENT", "Woke up - feature state changed")
+                return
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return
+            if self._agent_completed_event is None:
+                await asyncio.sleep(min(CHANGE_CHECK_INTERVAL, remaining))
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._agent_completed_event.wait(),
+                    timeout=min(CHANGE_CHECK_INTERVAL, remaining),
+                )
+                self._agent_completed_event.clear()
+                debug_log.log("EVENT", "Woke up immediately - agent completed")
+                return
+            except asyncio.TimeoutError:
+                pass
+
     def _on_agent_complete(
         self,
         feature_id: int | None,
@@ -974,6 +1076,7 @@ class ParallelOrchestrator:
 
             status = "completed" if return_code == 0 else "failed"
             print(f"Feature #{feature_id} testing {status}", flush=True)
+            self._emit_agent_completed("testing", feature_id, return_code)
             debug_log.log("COMPLETE", f"Testing agent for feature #{feature_id} finished",
                 pid=proc.pid,
                 feature_id=feature_id,
@@ -1009,6 +1112,10 @@ class ParallelOrchestrator:
                 feature.in_progress = False
                 session.commit()
                 debug_log.log("DB", f"Cleared in_progress for feature #{feature_id} (agent failed)")
+            if feature:
+                with self._graph_lock:
+                    self._feature_graph.set_passes(feature_id, feature_passes)
+                    self._feature_graph.set_in_progress(feature_id, feature_in_progress and feature_passes)
         finally:
             session.close()
 
@@ -1025,8 +1132,9 @@ class ParallelOrchestrator:
         status = "completed" if return_code == 0 else "failed"
         if self.on_status:
             self.on_status(feature_id, status)
-        # CRITICAL: This print triggers the WebSocket to emit agent_update with state='error' or 'success'
+        # Human-readable for the log view; the UI's agent state comes from the event
         print(f"Feature #{feature_id} {status}", flush=True)
+        self._emit_agent_completed("coding", feature_id, return_code)
 
         # Signal main loop that an agent slot is available
         self._signal_agent_completed()
@@ -1034,6 +1142,26 @@ class ParallelOrchestrator:
         # NOTE: Testing agents are now spawned in start_feature() when coding agents START,
         # not here when they complete. This ensures 1:1 ratio and proper termination.
 
+    def _emit_agent_completed(
+        self,
+        agent_type: Literal["coding", "testing"],
+        feature_id: int | None,
+        return_code: int,
+    ) -> None:
+        """Emit agent_completed with the agent's run time."""
+        with self._lock:
+            started_at = self._agent_started_at.pop((agent_type, feature_id), None)
+        duration = round(time.monotonic() - started_at, 3) if started_at is not None else None
+        self._events.emit(
+            "agent_completed",
+            agent_type=agent_type,
+            feature_id=feature_id,
+            success=return_code == 0,
+            return_code=return_code,
+            duration_seconds=duration,
+            **self._agent_counts(),
+        )
+
     def stop_feature(self, feature_id: int) -> tuple[bool, str]:
         """Stop a running coding agent and all its child processes."""
         with self._lock:
@@ -1152,6 +1280,7 @@ class ParallelOrchestrator:
             print(flush=True)
             print("=" * 70, flush=True)
             print("  INITIALIZATION COMPLETE - Starting feature loop", flush=True)
+            self._events.emit("init_complete")
             print("=" * 70, flush=True)
             print(flush=True)
 
@@ -1166,6 +1295,7 @@ class ParallelOrchestrator:
             if self._engine is not None:
                 self._engine.dispose()
             self._engine, self._session_maker = create_database(self.project_dir)
+            self._graph_data_version = None
 
             # Debug: Show state immediately after initialization
             print("[DEBUG] Post-initialization state check:", flush=True)
@@ -1177,8 +1307,8 @@ class ParallelOrchestrator:
             session = self.get_session()
             try:
                 feature_count = session.query(Feature).count()
-                all_features = session.query(Feature).all()
-                feature_names = [f"{f.id}: {f.name}" for f in all_features[:10]]
+                first_features = session.query(Feature.id, Feature.name).order_by(Feature.id).limit(10).all()
+                feature_names = [f"{fid}: {name}" for fid, name in first_features]
                 print(f"[DEBUG]   features in database={feature_count}", flush=True)
                 debug_log.log("INIT", "Post-initialization database state",
                     max_concurrency=self.max_concurrency,
@@ -1235,6 +1365,7 @@ class ParallelOrchestrator:
                 # Check if all complete
                 if self.get_all_complete():
                     print("\nAll features complete!", flush=True)
+                    self._events.emit("all_complete")
                     break
 
                 # Maintain testing agents independently (runs every iteration)
@@ -1255,6 +1386,7 @@ class ParallelOrchestrator:
 
                 if current >= self.max_concurrency:
                     debug_log.log("CAPACITY", "At max capacity, waiting for agent completion...")
+                    self._events.emit("at_capacity", **self._agent_counts())
                     await self._wait_for_agent_completion()
                     continue
 
@@ -1265,40 +1397,38 @@ class ParallelOrchestrator:
                     for feature in resumable[:slots]:
                         print(f"Resuming feature #{feature['id']}: {feature['name']}", flush=True)
                         self.start_feature(feature["id"], resume=True)
-                    await asyncio.sleep(2)
+                    await self._wait_for_state_change()
                     continue
 
                 # Priority 2: Start new ready features
-                ready = self.get_ready_features()
+                ready = self.get_ready_features(limit=self.max_concurrency - current)
                 if not ready:
                     # Wait for running features to complete
                     if current > 0:
-                        await self._wait_for_agent_completion()
+                        await self._wait_for_state_change()
                         continue
                     else:
                         # No ready features and nothing running
-                        # Force a fresh database check before declaring blocked
+                        # Force a fresh database read before declaring blocked
                         # This handles the case where subprocess commits weren't visible yet
-                        session = self.get_session()
-                        try:
-                            session.expire_all()
-                        finally:
-                            session.close()
+                        self._graph_data_version = None
 
                         # Recheck if all features are now complete
                         if self.get_all_complete():
                             print("\nAll features complete!", flush=True)
+                            self._events.emit("all_complete")
                             break
 
                         # Still have pending features but all are blocked by dependencies
                         print("No ready features available. All remaining features may be blocked by dependencies.", flush=True)
-                        await self._wait_for_agent_completion(timeout=POLL_INTERVAL * 2)
+                        await self._wait_for_state_change(timeout=POLL_INTERVAL * 2)
                         continue
 
                 # Start features up to capacity
                 slots = self.max_concurrency - current
                 print(f"[DEBUG] Spawning loop: {len(ready)} ready, {slots} slots available, max_concurrency={self.max_concurrency}", flush=True)
                 print(f"[DEBUG] Will attempt to start {min(len(ready), slots)} features", flush=True)
+                self._events.emit("capacity", ready=len(ready), slots=slots, max_concurrency=self.max_concurrency)
                 features_to_start = ready[:slots]
                 print(f"[DEBUG] Features to start: {[f['id'] for f in features_to_start]}", flush=True)
 
@@ -1307,8 +1437,10 @@ class ParallelOrchestrator:
                     slots_available=slots,
                     features_to_start=[f['id'] for f in features_to_start])
 
+                started_any = False
                 for i, feature in enumerate(features_to_start):
                     print(f"[DEBUG] Starting feature {i+1}/{len(features_to_start)}: #{feature['id']} - {feature['name']}", flush=True)
+                    self._events.emit("feature_start", feature_id=feature["id"], feature_name=feature["name"])
                     success, msg = self.start_feature(feature["id"])
                     if not success:
                         print(f"[DEBUG] Failed to start feature #{feature['id']}: {msg}", flush=True)
@@ -1316,6 +1448,7 @@ class ParallelOrchestrator:
                             feature_name=feature['name'],
                             error=msg)
                     else:
+                        started_any = True
                         print(f"[DEBUG] Successfully started feature #{feature['id']}", flush=True)
                         with self._lock:
                             running_count = len(self.running_coding_agents)
@@ -1324,7 +1457,12 @@ class ParallelOrchestrator:
                             feature_name=feature['name'],
                             running_coding_agents=running_count)
 
-                await asyncio.sleep(2)  # Brief pause between starts
+                if started_any:
+                    # Next pass runs as soon as an agent commits or completes
+                    await self._wait_for_state_change()
+                else:
+                    # Every start failed: don't retry until an agent finishes
+                    await self._wait_for_agent_completion()
 
             except Exception as e:
                 print(f"Orchestrator error: {e}", flush=True)
@@ -1341,7 +1479,9 @@ class ParallelOrchestrator:
             # Use short timeout since we're just waiting for final agents to finish
             await self._wait_for_agent_completion(timeout=1.0)
 
+        self._db_watcher.close()
         print("Orchestrator finished.", flush=True)
+        self._events.close()
 
     def get_status(self) -> dict:
         """Get current orchestrator status."""
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Garbage-collect (and optionally migrate) a project's artifact store.
+
+Large artifact content lives in a content-addressed object store under
+.autobuildr/artifacts/objects/, shared by every run. An object is kept as long
+as at least one Artifact row references it; this script deletes the rest.
+
+With --migrate, artifacts still stored in the legacy per-run layout
+(.autobuildr/artifacts/{run_id}/{hash}.blob) are first moved into the object
+store.
+
+Usage:
+    python3 scripts/artifact_gc.py PROJECT_DIR [--migrate] [--dry-run] [--grace-seconds N]
+
+Exits non-zero if the project has no features.db.
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Allow running from the repository root or the scripts/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.artifact_storage import GC_GRACE_PERIOD_SECONDS, ArtifactStorage
+from api.database import create_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Garbage-collect unreferenced artifact objects")
+    parser.add_argument("project_dir", type=Path, help="Project directory containing features.db")
+    parser.add_argument("--migrate", action="store_true",
+                        help="Move legacy per-run blobs into the object store first")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report what would change without deleting or rewriting anything")
+    parser.add_argument("--grace-seconds", type=float, default=GC_GRACE_PERIOD_SECONDS,
+                        help=f"Keep unreferenced files younger than this (default: {GC_GRACE_PERIOD_SECONDS})")
+    args = parser.parse_args()
+
+    project_dir = args.project_dir.resolve()
+    if not (project_dir / "features.db").exists():
+        print(f"No features.db in {project_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    engine, SessionLocal = create_database(project_dir)
+    storage = ArtifactStorage(project_dir)
+    session = SessionLocal()
+    try:
+        report = {}
+        if args.migrate:
+            report["migration"] = storage.migrate_legacy_blobs(session, dry_run=args.dry_run)
+        report["gc"] = storage.collect_garbage(
+            session, grace_seconds=args.grace_seconds, dry_run=args.dry_run
+        )
+        report["stats"] = storage.get_storage_stats()
+        print(json.dumps(report, indent=2))
+    finally:
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
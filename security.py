@@ -9,6 +9,8 @@ Uses an allowlist approach - only explicitly permitted commands can run.
 import os
 import re
 import shlex
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -110,6 +112,11 @@ DANGEROUS_COMMANDS = {
 }
 
 
+# Distinct command strings whose parse results are memoized. Agents repeat
+# the same commands (npm test, git status, ...) many times per session.
+PARSED_COMMAND_CACHE_SIZE = 1024
+
+
 def split_command_segments(command_string: str) -> list[str]:
     """
     Split a compound command into individual command segments.
@@ -122,8 +129,11 @@ def split_command_segments(command_string: str) -> list[str]:
     Returns:
         List of individual command segments
     """
-    import re
+    return list(_split_command_segments(command_string))
+
 
+@lru_cache(maxsize=PARSED_COMMAND_CACHE_SIZE)
+def _split_command_segments(command_string: str) -> tuple[str, ...]:
     # Split on && and || while preserving the ability to handle each segment
     # This regex splits on && or || that aren't inside quotes
     segments = re.split(r"\s*(?:&&|\|\|)\s*", command_string)
@@ -137,7 +147,7 @@ def split_command_segments(command_string: str) -> list[str]:
             if sub:
                 result.append(sub)
 
-    return result
+    return tuple(result)
 
 
 def extract_commands(command_string: str) -> list[str]:
@@ -153,11 +163,14 @@ def extract_commands(command_string: str) -> list[str]:
     Returns:
         List of command names found in the string
     """
+    return list(_extract_commands(command_string))
+
+
+@lru_cache(maxsize=PARSED_COMMAND_CACHE_SIZE)
+def _extract_commands(command_string: str) -> tuple[str, ...]:
     commands = []
 
     # shlex doesn't treat ; as a separator, so we need to pre-process
-    import re
-
     # Split on semicolons that aren't inside quotes (simple heuristic)
     # This handles common cases like "echo hello; ls"
     segments = re.split(r'(?<!["\'])\s*;\s*(?!["\'])', command_string)
@@ -172,7 +185,7 @@ def extract_commands(command_string: str) -> list[str]:
         except ValueError:
             # Malformed command (unclosed quotes, etc.)
             # Return empty to trigger block (fail-safe)
-            return []
+            return ()
 
         if not tokens:
             continue
@@ -221,7 +234,7 @@ def extract_commands(command_string: str) -> list[str]:
                 commands.append(cmd)
                 expect_command = False
 
-    return commands
+    return tuple(commands)
 
 
 # Default pkill process names (hardcoded baseline, always available)
@@ -370,7 +383,7 @@ def get_command_for_validation(cmd: str, segments: list[str]) -> str:
         The segment containing the command, or empty string if not found
     """
     for segment in segments:
-        segment_commands = extract_commands(segment)
+        segment_commands = _extract_commands(segment)
         if cmd in segment_commands:
             return segment
     return ""
@@ -632,6 +645,15 @@ def get_effective_commands(project_dir: Optional[Path]) -> tuple[set[str], set[s
     Returns:
         Tuple of (allowed_commands, blocked_commands)
     """
+    project_config = load_project_commands(project_dir) if project_dir else None
+    return _resolve_commands(load_org_config(), project_config)
+
+
+def _resolve_commands(
+    org_config: Optional[dict],
+    project_config: Optional[dict],
+) -> tuple[set[str], set[str]]:
+    """Apply the command hierarchy to already loaded org/project configs."""
     # Start with global allowed commands
     allowed = ALLOWED_COMMANDS.copy()
     blocked = BLOCKED_COMMANDS.copy()
@@ -639,8 +661,7 @@ def get_effective_commands(project_dir: Optional[Path]) -> tuple[set[str], set[s
     # Add dangerous commands to blocked (Phase 3 will add approval flow)
     blocked |= DANGEROUS_COMMANDS
 
-    # Load org config and apply
-    org_config = load_org_config()
+    # Apply org config
     if org_config:
         # Add org-level blocked commands (cannot be overridden)
         org_blocked = org_config.get("blocked_commands", [])
@@ -651,15 +672,13 @@ def get_effective_commands(project_dir: Optional[Path]) -> tuple[set[str], set[s
             if isinstance(cmd_config, dict) and "name" in cmd_config:
                 allowed.add(cmd_config["name"])
 
-    # Load project config and apply
-    if project_dir:
-        project_config = load_project_commands(project_dir)
-        if project_config:
-            # Add project-specific commands
-            for cmd_config in project_config.get("commands", []):
-                valid, error = validate_project_command(cmd_config)
-                if valid:
-                    allowed.add(cmd_config["name"])
+    # Apply project config
+    if project_config:
+        # Add project-specific commands
+        for cmd_config in project_config.get("commands", []):
+            valid, error = validate_project_command(cmd_config)
+            if valid:
+                allowed.add(cmd_config["name"])
 
     # Remove blocked commands from allowed (blocklist takes precedence)
     allowed -= blocked
@@ -698,23 +717,29 @@ def get_effective_pkill_processes(project_dir: Optional[Path]) -> set[str]:
     Returns:
         Set of allowed process names for pkill
     """
+    project_config = load_project_commands(project_dir) if project_dir else None
+    return _resolve_pkill_processes(load_org_config(), project_config)
+
+
+def _resolve_pkill_processes(
+    org_config: Optional[dict],
+    project_config: Optional[dict],
+) -> set[str]:
+    """Merge pkill process names from already loaded org/project configs."""
     # Start with default processes
     processes = DEFAULT_PKILL_PROCESSES.copy()
 
     # Add org-level pkill_processes
-    org_config = load_org_config()
     if org_config:
         org_processes = org_config.get("pkill_processes", [])
         if isinstance(org_processes, list):
             processes |= {p for p in org_processes if isinstance(p, str) and p.strip()}
 
     # Add project-level pkill_processes
-    if project_dir:
-        project_config = load_project_commands(project_dir)
-        if project_config:
-            proj_processes = project_config.get("pkill_processes", [])
-            if isinstance(proj_processes, list):
-                processes |= {p for p in proj_processes if isinstance(p, str) and p.strip()}
+    if project_config:
+        proj_processes = project_config.get("pkill_processes", [])
+        if isinstance(proj_processes, list):
+            processes |= {p for p in proj_processes if isinstance(p, str) and p.strip()}
 
     return processes
 
@@ -742,6 +767,116 @@ def is_command_allowed(command: str, allowed_commands: set[str]) -> bool:
     return False
 
 
+class CommandPolicy:
+    """
+    Effective command policy for one project, compiled for fast checks.
+
+    Holds the result of get_effective_commands() and
+    get_effective_pkill_processes(), with the allowlist patterns split by
+    kind so is_allowed() never loops over matches_pattern():
+
+    - Exact names: one set lookup
+    - Prefix wildcards ("swift*"): one str.startswith() over all prefixes
+    - Path patterns ("./scripts/build.sh"): a set of script names
+    """
+
+    def __init__(self, allowed: set[str], blocked: set[str], pkill_processes: set[str]):
+        self.allowed = frozenset(allowed)
+        self.blocked = frozenset(blocked)
+        self.pkill_processes = frozenset(pkill_processes)
+        # Configured processes beyond the defaults, as validate_pkill_command() takes them
+        self.extra_pkill_processes = (self.pkill_processes - DEFAULT_PKILL_PROCESSES) or None
+
+        prefixes = []
+        path_names = set()
+        for pattern in self.allowed:
+            if pattern.endswith("*"):
+                # Bare "*" (empty prefix) never matches, see matches_pattern()
+                if pattern[:-1]:
+                    prefixes.append(pattern[:-1])
+            elif "/" in pattern:
+                path_names.add(os.path.basename(pattern))
+        self._prefixes = tuple(prefixes)
+        self._path_names = frozenset(path_names)
+
+    def is_allowed(self, command: str) -> bool:
+        """Same result as is_command_allowed(command, self.allowed)."""
+        if command in self.allowed:
+            return True
+        if self._prefixes and command.startswith(self._prefixes):
+            return True
+        if self._path_names:
+            if command in self._path_names:
+                return True
+            if "/" in command and command.rsplit("/", 1)[1] in self._path_names:
+                return True
+        return False
+
+
+# project_dir (or None) -> (config file signature, compiled policy)
+_policy_cache: dict[Optional[str], tuple[tuple, CommandPolicy]] = {}
+_policy_cache_lock = threading.Lock()
+
+
+def _file_signature(path: Optional[Path]) -> Optional[tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of a file, or None if it does not exist."""
+    if path is None:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def get_command_policy(project_dir: Optional[Path]) -> CommandPolicy:
+    """
+    Get the compiled command policy for a project.
+
+    The policy is cached per project and rebuilt only when the org config or
+    the project's allowed_commands.yaml changes (path, mtime, size or inode),
+    so a Bash call costs two stat() calls instead of two YAML parses.
+
+    Args:
+        project_dir: Path to the project directory, or None
+
+    Returns:
+        CommandPolicy reflecting get_effective_commands() and
+        get_effective_pkill_processes() for the project
+    """
+    org_path = get_org_config_path()
+    project_path = project_dir / ".autobuildr" / "allowed_commands.yaml" if project_dir else None
+    # Taken before reading the files: a write racing with the load below
+    # changes the signature, so the next call reloads
+    signature = (
+        str(org_path), _file_signature(org_path),
+        str(project_path), _file_signature(project_path),
+    )
+    key = str(project_dir) if project_dir else None
+
+    with _policy_cache_lock:
+        cached = _policy_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    org_config = load_org_config()
+    project_config = load_project_commands(project_dir) if project_dir else None
+    allowed, blocked = _resolve_commands(org_config, project_config)
+    policy = CommandPolicy(allowed, blocked, _resolve_pkill_processes(org_config, project_config))
+
+    with _policy_cache_lock:
+        _policy_cache[key] = (signature, policy)
+    return policy
+
+
+def clear_command_policy_cache() -> None:
+    """Drop all cached command policies (and memoized command parses)."""
+    with _policy_cache_lock:
+        _policy_cache.clear()
+    _extract_commands.cache_clear()
+    _split_command_segments.cache_clear()
+
+
 async def bash_security_hook(input_data, tool_use_id=None, context=None):
     """
     Pre-tool-use hook that validates bash commands using an allowlist.
@@ -780,11 +915,9 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
         if project_dir_str:
             project_dir = Path(project_dir_str)
 
-    # Get effective commands using hierarchy resolution
-    allowed_commands, blocked_commands = get_effective_commands(project_dir)
-
-    # Get effective pkill processes (includes org/project config)
-    pkill_processes = get_effective_pkill_processes(project_dir)
+    # Effective commands and pkill processes after hierarchy resolution
+    # (cached until the org or project config file changes)
+    policy = get_command_policy(project_dir)
 
     # Split into segments for per-command validation
     segments = split_command_segments(command)
@@ -792,14 +925,14 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
     # Check each command against the blocklist and allowlist
     for cmd in commands:
         # Check blocklist first (highest priority)
-        if cmd in blocked_commands:
+        if cmd in policy.blocked:
             return {
                 "decision": "block",
                 "reason": f"Command '{cmd}' is blocked at organization level and cannot be approved.",
             }
 
         # Check allowlist (with pattern matching)
-        if not is_command_allowed(cmd, allowed_commands):
+        if not policy.is_allowed(cmd):
             # Provide helpful error message with config hint
             error_msg = f"Command '{cmd}' is not allowed.\n"
             error_msg += "To allow this command:\n"
@@ -820,8 +953,7 @@ async def bash_security_hook(input_data, tool_use_id=None, context=None):
 
             if cmd == "pkill":
                 # Pass configured extra processes (beyond defaults)
-                extra_procs = pkill_processes - DEFAULT_PKILL_PROCESSES
-                allowed, reason = validate_pkill_command(cmd_segment, extra_procs if extra_procs else None)
+                allowed, reason = validate_pkill_command(cmd_segment, policy.extra_pkill_processes)
                 if not allowed:
                     return {"decision": "block", "reason": reason}
             elif cmd == "chmod":
@@ -54,6 +54,7 @@ from .services.dev_server_manager import (
 )
 from .services.expand_chat_session import cleanup_all_expand_sessions
 from .services.process_manager import cleanup_all_managers, cleanup_orphaned_locks
+from .services.run_executor import cleanup_run_executor, get_run_executor
 from .services.scheduler_service import cleanup_scheduler, get_scheduler
 from .services.terminal_manager import cleanup_all_terminals
 from .websocket import project_websocket
@@ -77,10 +78,10 @@ async def lifespan(app: FastAPI):
     # Initialize the global database session maker for AgentRun/AgentSpec endpoints.
     # Use the project directory (where harness_kernel writes) rather than ROOT_DIR
     # so that the agent-runs API reads from the same DB as the execution engine.
-    from api.database import create_database, set_session_maker
+    from api.database import get_cached_database, set_session_maker
     db_dir = Path(os.environ.get("AUTOBUILDR_TEST_PROJECT_PATH", str(ROOT_DIR)))
     _logger.info("Global session maker DB dir: %s", db_dir)
-    _, session_maker = create_database(db_dir)
+    _, session_maker = get_cached_database(db_dir)
     set_session_maker(session_maker)
 
     # Feature #79: Clean up orphaned AgentRuns from previous server instance
@@ -103,6 +104,16 @@ async def lifespan(app: FastAPI):
         _logger.error("Failed to clean up orphaned runs: %s", e)
         # Don't fail startup on cleanup errors
 
+    # Start the spec run executor and re-queue runs accepted before a restart
+    run_executor = get_run_executor()
+    run_executor.attach_loop(asyncio.get_running_loop())
+    try:
+        requeued = await asyncio.to_thread(run_executor.recover_all)
+        if requeued > 0:
+            _logger.info("Re-queued %d AgentRuns on startup", requeued)
+    except Exception as e:
+        _logger.error("Failed to recover queued runs: %s", e)
+
     # Start the scheduler service
     scheduler = get_scheduler()
     await scheduler.start()
@@ -111,12 +122,16 @@ async def lifespan(app: FastAPI):
 
     # Shutdown - cleanup scheduler first to stop triggering new starts
     await cleanup_scheduler()
+    await cleanup_run_executor()
     # Then cleanup all running agents, sessions, terminals, and dev servers
     await cleanup_all_managers()
     await cleanup_assistant_sessions()
     await cleanup_all_expand_sessions()
     await cleanup_all_terminals()
     await cleanup_all_devservers()
+    # Finally close pooled connections held by the per-project engine cache
+    from api.database import dispose_all_cached_databases
+    dispose_all_cached_databases()
 
 
 # Create FastAPI app
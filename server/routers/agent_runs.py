@@ -12,6 +12,7 @@ Implements:
 - POST /api/agent-runs/:id/pause - Pause a running agent
 - POST /api/agent-runs/:id/resume - Resume a paused agent
 - POST /api/agent-runs/:id/cancel - Cancel a running or paused agent
+- GET /api/agent-runs/queue - Spec executor queue depth and worker usage
 """
 
 from typing import Optional
@@ -34,7 +35,9 @@ from server.schemas.agentspec import (
     AgentSpecResponse,
     ArtifactListItemResponse,
     ArtifactListResponse,
+    ExecutorQueueStatusResponse,
 )
+from server.services.run_executor import get_run_executor
 
 
 router = APIRouter(prefix="/api/agent-runs", tags=["agent-runs"])
@@ -192,6 +195,21 @@ async def list_agent_runs(
     )
 
 
+@router.get("/queue", response_model=ExecutorQueueStatusResponse)
+async def get_execution_queue() -> ExecutorQueueStatusResponse:
+    """
+    Report the spec executor's queue depth and worker usage.
+
+    Runs started via POST /api/projects/{project_name}/agent-specs/:id/execute
+    wait here for a worker; at most per_project_limit runs of one project
+    execute at the same time.
+
+    Returns:
+        ExecutorQueueStatusResponse with overall and per-project counts
+    """
+    return ExecutorQueueStatusResponse(**get_run_executor().status())
+
+
 @router.get("/{run_id}", response_model=AgentRunSummary)
 async def get_run_details(
     run_id: str,
@@ -560,8 +578,9 @@ async def pause_agent_run(
     # Step 7: Commit transaction
     db.commit()
 
-    # Step 8: Signal kernel to pause (via event broadcaster for UI updates)
-    # The kernel will check for pause signals during execution
+    # Step 8: Signal kernel to pause, then broadcast for UI updates
+    # The executor's RunControl is checked by the kernel between turns
+    get_run_executor().pause(run_id)
     # Note: We broadcast via sync wrapper since we may not know the project name here
     # The event has already been recorded in the database, so UI updates are optional
     try:
@@ -695,8 +714,9 @@ async def resume_agent_run(
     # Step 7: Commit transaction
     db.commit()
 
-    # Step 8: Signal kernel to resume (via event broadcaster for UI updates)
-    # The kernel will check for resume signals during execution
+    # Step 8: Signal kernel to resume, then broadcast for UI updates
+    # The executor's RunControl is checked by the kernel between turns
+    get_run_executor().resume(run_id)
     # Note: We broadcast via sync wrapper since we may not know the project name here
     # The event has already been recorded in the database, so UI updates are optional
     try:
@@ -847,8 +867,9 @@ async def cancel_agent_run(
     # Commit transaction
     db.commit()
 
-    # Step 9: Signal kernel to abort (via event broadcaster for UI updates)
-    # The kernel will check for abort signals during execution
+    # Step 9: Signal kernel to abort (or drop the queued run), then broadcast
+    # The executor's RunControl is checked by the kernel between turns
+    get_run_executor().cancel(run_id)
     # Note: We broadcast via sync wrapper since we may not know the project name here
     # The event has already been recorded in the database, so UI updates are optional
     try:
@@ -13,7 +13,6 @@ Implements:
 - POST /api/projects/{project_name}/agent-specs/:id/execute - Trigger execution
 """
 
-import asyncio
 import logging
 import uuid
 from contextlib import contextmanager
@@ -27,6 +26,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from api.agentspec_models import AgentRun as AgentRunModel
+from api.agentspec_models import AgentRunQueueEntry
 from api.agentspec_models import AgentSpec as AgentSpecModel
 from api.validators import normalize_acceptance_results_to_record
 from server.schemas.agentspec import (
@@ -41,6 +41,7 @@ from server.schemas.agentspec import (
     SpecValidationErrorResponse,
     ValidationErrorItem,
 )
+from ..services.run_executor import get_run_executor
 from ..utils.validation import validate_project_name
 
 
@@ -49,7 +50,7 @@ _logger = logging.getLogger(__name__)
 
 
 # Lazy imports to avoid circular dependencies
-_create_database = None
+_get_cached_database = None
 
 
 def _get_project_path(project_name: str) -> Path:
@@ -65,16 +66,16 @@ def _get_project_path(project_name: str) -> Path:
 
 def _get_db_classes():
     """Lazy import of database classes."""
-    global _create_database
-    if _create_database is None:
+    global _get_cached_database
+    if _get_cached_database is None:
         import sys
         from pathlib import Path
         root = Path(__file__).parent.parent.parent
         if str(root) not in sys.path:
             sys.path.insert(0, str(root))
-        from api.database import create_database
-        _create_database = create_database
-    return _create_database
+        from api.database import get_cached_database
+        _get_cached_database = get_cached_database
+    return _get_cached_database
 
 
 @contextmanager
@@ -82,9 +83,10 @@ def get_db_session(project_dir: Path):
     """
     Context manager for database sessions.
     Ensures session is always closed, even on exceptions.
+    Sessions come from the process-wide engine cached per project.
     """
-    create_database = _get_db_classes()
-    _, SessionLocal = create_database(project_dir)
+    get_cached_database = _get_db_classes()
+    _, SessionLocal = get_cached_database(project_dir)
     session = SessionLocal()
     try:
         yield session
@@ -604,174 +606,6 @@ async def get_agent_spec(
     )
 
 
-# =============================================================================
-# Execution Task Store (in-memory for async background tasks)
-# =============================================================================
-
-# Store for tracking background execution tasks
-_execution_tasks: dict[str, asyncio.Task] = {}
-
-
-async def _execute_spec_background(
-    project_dir: Path,
-    spec_id: str,
-    run_id: str,
-    project_name: str,
-) -> None:
-    """
-    Background task to execute an AgentSpec via HarnessKernel.
-
-    Feature #136: Wire execute endpoint to actually call HarnessKernel.execute().
-
-    This function:
-    1. Transitions the pre-created AgentRun to 'running' status
-    2. Broadcasts WebSocket notification (Feature #61)
-    3. Invokes HarnessKernel.execute(spec) for real kernel execution
-    4. Syncs results from the kernel's run back to the pre-created run
-    5. Handles errors gracefully, updating run status to 'failed' on failure
-
-    Args:
-        project_dir: Path to the project directory
-        spec_id: UUID of the AgentSpec to execute
-        run_id: UUID of the AgentRun record to update
-        project_name: Name of the project (for WebSocket broadcasting)
-    """
-    # Import WebSocket broadcast function for Feature #61
-    from api.websocket_events import broadcast_run_started
-
-    _logger.info(f"Starting background execution for run {run_id} (spec {spec_id})")
-
-    try:
-        with get_db_session(project_dir) as db:
-            # Get the run record
-            run = db.query(AgentRunModel).filter(AgentRunModel.id == run_id).first()
-            if not run:
-                _logger.error(f"AgentRun {run_id} not found")
-                return
-
-            # Get the spec for display_name and icon
-            spec = db.query(AgentSpecModel).filter(AgentSpecModel.id == spec_id).first()
-            if not spec:
-                _logger.error(f"AgentSpec {spec_id} not found for run {run_id}")
-                run.status = "failed"
-                run.completed_at = _utc_now()
-                run.error = f"AgentSpec '{spec_id}' not found"
-                db.commit()
-                return
-            display_name = spec.display_name if spec else f"Run {run_id[:8]}"
-            icon = spec.icon if spec else None
-
-            # Transition from pending to running
-            run.status = "running"
-            run.started_at = _utc_now()
-            db.commit()
-            _logger.info(f"Run {run_id} transitioned to 'running'")
-
-            # Feature #61: Broadcast agent_run_started WebSocket message
-            # Step 1: When AgentRun status changes to running, publish message
-            # Step 2: Message type: agent_run_started
-            # Step 3: Payload: run_id, spec_id, display_name, icon, started_at
-            # Step 4: Broadcast to all connected clients
-            await broadcast_run_started(
-                project_name=project_name,
-                run_id=run_id,
-                spec_id=spec_id,
-                display_name=display_name,
-                icon=icon,
-                started_at=run.started_at,
-            )
-
-        # Phase 2: Execute via HarnessKernel (Feature #136)
-        # Use a separate DB session for the kernel execution to ensure
-        # proper transaction isolation and commit behavior
-        from api.harness_kernel import HarnessKernel
-
-        with get_db_session(project_dir) as kernel_db:
-            # Load the spec in the kernel's session with acceptance_spec eagerly loaded
-            kernel_spec = kernel_db.query(AgentSpecModel).options(
-                joinedload(AgentSpecModel.acceptance_spec)
-            ).filter(AgentSpecModel.id == spec_id).first()
-
-            if not kernel_spec:
-                raise RuntimeError(f"AgentSpec '{spec_id}' not found in kernel session")
-
-            _logger.info(f"Invoking HarnessKernel.execute() for spec {spec_id}")
-
-            # Create kernel and execute the spec
-            # The kernel creates its own AgentRun internally and manages
-            # the full execution lifecycle (turns, events, acceptance, verdict)
-            kernel = HarnessKernel(db=kernel_db)
-            kernel_run = kernel.execute(
-                kernel_spec,
-                turn_executor=None,  # No Claude SDK executor yet; completes immediately
-                context={
-                    "project_dir": str(project_dir),
-                },
-            )
-
-            _logger.info(
-                f"HarnessKernel execution completed: kernel_run={kernel_run.id}, "
-                f"status={kernel_run.status}, verdict={kernel_run.final_verdict}, "
-                f"turns={kernel_run.turns_used}"
-            )
-
-            # Capture kernel run results before session closes
-            kernel_status = kernel_run.status
-            kernel_completed_at = kernel_run.completed_at
-            kernel_turns_used = kernel_run.turns_used
-            kernel_tokens_in = kernel_run.tokens_in
-            kernel_tokens_out = kernel_run.tokens_out
-            kernel_final_verdict = kernel_run.final_verdict
-            kernel_acceptance_results = kernel_run.acceptance_results
-            kernel_error = kernel_run.error
-            kernel_retry_count = kernel_run.retry_count
-
-        # Phase 3: Sync kernel results back to the pre-created run
-        # The endpoint returned run_id to the client, so we update that
-        # record with the actual execution results from HarnessKernel
-        with get_db_session(project_dir) as sync_db:
-            original_run = sync_db.query(AgentRunModel).filter(
-                AgentRunModel.id == run_id
-            ).first()
-
-            if original_run:
-                original_run.status = kernel_status
-                original_run.completed_at = kernel_completed_at or _utc_now()
-                original_run.turns_used = kernel_turns_used
-                original_run.tokens_in = kernel_tokens_in
-                original_run.tokens_out = kernel_tokens_out
-                original_run.final_verdict = kernel_final_verdict
-                original_run.acceptance_results = kernel_acceptance_results
-                original_run.error = kernel_error
-                original_run.retry_count = kernel_retry_count
-                sync_db.commit()
-
-                _logger.info(
-                    f"Synced kernel results to original run {run_id}: "
-                    f"status={kernel_status}, verdict={kernel_final_verdict}"
-                )
-            else:
-                _logger.warning(f"Original run {run_id} not found during result sync")
-
-    except Exception as e:
-        _logger.exception(f"Error executing spec {spec_id}: {e}")
-        # Mark run as failed with error details
-        try:
-            with get_db_session(project_dir) as db:
-                run = db.query(AgentRunModel).filter(AgentRunModel.id == run_id).first()
-                if run:
-                    run.status = "failed"
-                    run.completed_at = _utc_now()
-                    run.error = str(e)
-                    db.commit()
-        except Exception as db_error:
-            _logger.exception(f"Failed to update run status: {db_error}")
-    finally:
-        # Clean up task reference
-        if run_id in _execution_tasks:
-            del _execution_tasks[run_id]
-
-
 @router.post(
     "/{spec_id}/execute",
     response_model=AgentRunResponse,
@@ -824,9 +658,10 @@ async def execute_agent_spec(
     - Returns 400 with detailed validation errors if invalid
     - Only creates AgentRun and queues execution if spec passes validation
 
-    Creates a new AgentRun record with status=pending, then queues the
-    execution as a background task. Returns immediately with 202 Accepted
-    and the new AgentRun record.
+    Creates a new AgentRun record with status=pending plus its
+    agent_run_queue entry, then hands the run to the spec run executor
+    (a bounded worker pool with per-project limits). Returns immediately
+    with 202 Accepted and the new AgentRun record.
 
     The execution will:
     1. Validate AgentSpec (Feature #78, Steps 1-4)
@@ -929,19 +764,24 @@ async def execute_agent_spec(
             created_at=created_at,
         )
 
-        # Step 6: Commit run record to database
+        # Step 6: Commit run record to database, together with its entry in
+        # the durable execution queue
         db.add(db_run)
+        db.add(AgentRunQueueEntry(
+            run_id=run_id,
+            agent_spec_id=spec_id,
+            project_name=project_name,
+            enqueued_at=created_at,
+        ))
         db.commit()
         db.refresh(db_run)
 
         # Build response from the committed record
         run_dict = db_run.to_dict()
 
-    # Step 7: Queue execution task (async background)
-    task = asyncio.create_task(
-        _execute_spec_background(project_dir, spec_id, run_id, project_name)
-    )
-    _execution_tasks[run_id] = task
+    # Step 7: Hand the run to the executor's worker pool; the kernel runs
+    # on a worker thread so the event loop stays free
+    get_run_executor().submit(project_name, project_dir, spec_id, run_id)
 
     _logger.info(f"Queued execution for spec {spec_id}, run {run_id}")
 
@@ -7,23 +7,32 @@ API endpoints for Artifact metadata and content retrieval.
 Implements:
 - GET /api/artifacts/:id - Get artifact metadata (without content body)
 - GET /api/artifacts/:id/content - Download artifact content
+  (ETag / If-None-Match, Range / If-Range)
 """
 
 import mimetypes
 from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.agentspec_crud import get_artifact, get_artifact_content
+from api.artifact_storage import ZLIB_SUFFIX, ZSTD_SUFFIX, iter_blob_chunks
 from api.database import get_db
 from server.schemas.agentspec import ArtifactListItemResponse
 
 # Project root directory for resolving content_ref paths
 ROOT_DIR = Path(__file__).parent.parent.parent
 
+# Artifact content never changes for a given artifact ID
+ARTIFACT_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+# Object store codec suffix -> HTTP content coding. zlib streams are exactly
+# the HTTP "deflate" coding (RFC 9110 section 8.4.1.2).
+_CONTENT_CODINGS = {ZLIB_SUFFIX: "deflate", ZSTD_SUFFIX: "zstd"}
+
 
 router = APIRouter(prefix="/api/artifacts", tags=["artifacts"])
 
@@ -51,19 +60,86 @@ def _guess_content_type(artifact) -> str:
     return "application/octet-stream"
 
 
-def _generate_file_chunks(file_path: Path, chunk_size: int = 8192):
-    """Generator that yields file content in chunks for streaming.
+def _etag(content_hash: str, coding: str | None = None) -> str:
+    """Strong ETag for artifact content (per content coding when encoded)."""
+    if coding:
+        return f'"{content_hash}.{coding}"'
+    return f'"{content_hash}"'
 
-    Args:
-        file_path: Path to the file to stream
-        chunk_size: Size of each chunk in bytes
 
-    Yields:
-        Bytes chunks of file content
+def _match_etag(if_none_match: str, content_hash: str) -> Optional[str]:
+    """Return the ETag from If-None-Match that matches this content, if any.
+
+    Any representation of the same content (identity or content-coded) is a
+    match, compared weakly as RFC 9110 requires for If-None-Match.
+    """
+    valid = {_etag(content_hash)} | {_etag(content_hash, c) for c in _CONTENT_CODINGS.values()}
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return _etag(content_hash)
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag in valid:
+            return tag
+    return None
+
+
+def _accepts_encoding(accept_encoding: Optional[str], coding: str) -> bool:
+    """True if an Accept-Encoding header allows the given content coding."""
+    if not accept_encoding:
+        return False
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() != coding:
+            continue
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _parse_byte_range(range_header: str, size: int):
+    """Parse a single-range "bytes=" header against content of the given size.
+
+    Returns:
+        (start, end) with end exclusive; None if the header should be ignored
+        (malformed or multiple ranges - the full content is sent); () if the
+        range is not satisfiable.
     """
-    with open(file_path, "rb") as f:
-        while chunk := f.read(chunk_size):
-            yield chunk
+    units, _, spec = range_header.partition("=")
+    if units.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = min(int(last) + 1, size) if last else size
+        elif last:
+            start, end = max(size - int(last), 0), size
+        else:
+            return None
+    except ValueError:
+        return None
+    if start >= size or start >= end:
+        return ()
+    return start, end
+
+
+def _slice_chunks(chunks, start: int, end: int):
+    """Yield bytes [start, end) from an iterator of chunks."""
+    offset = 0
+    for chunk in chunks:
+        chunk_end = offset + len(chunk)
+        if chunk_end > start:
+            yield chunk[max(start - offset, 0):end - offset]
+        offset = chunk_end
+        if offset >= end:
+            break
 
 
 @router.get("/{artifact_id}", response_model=ArtifactListItemResponse)
@@ -111,6 +187,7 @@ async def get_artifact_metadata(
 @router.get("/{artifact_id}/content")
 async def download_artifact_content(
     artifact_id: str,
+    request: Request,
     db: Session = Depends(get_db),
 ):
     """
@@ -118,7 +195,16 @@ async def download_artifact_content(
 
     This endpoint retrieves the actual content of an artifact:
     - For small artifacts (<=4KB), content is stored inline and returned directly
-    - For large artifacts, content is stored in files and streamed
+    - For large artifacts, content is stored in files and served with
+      FileResponse (zero-copy when the ASGI server supports path sends)
+    - Objects compressed in the artifact store are sent as-is with a
+      Content-Encoding when the client accepts it, otherwise decompressed
+      on the fly
+
+    Caching: the ETag is the artifact's content_hash, so a conditional GET
+    (If-None-Match) is answered with 304 from the database row alone, without
+    touching the blob file. Byte ranges (Range / If-Range) are supported on the
+    decoded content.
 
     The response includes appropriate Content-Type and Content-Disposition headers
     for download.
@@ -128,11 +214,13 @@ async def download_artifact_content(
 
     Returns:
         Response with artifact content, appropriate Content-Type, and
-        Content-Disposition header for download
+        Content-Disposition header for download (206 for a satisfiable
+        Range request, 304 if the client's cached copy is current)
 
     Raises:
         404: If the Artifact is not found
         404: If the artifact references a file that no longer exists
+        416: If the requested byte range is outside the content
     """
     # Query artifact by ID
     artifact = get_artifact(db, artifact_id)
@@ -142,6 +230,20 @@ async def download_artifact_content(
             detail=f"Artifact {artifact_id} not found"
         )
 
+    # Content is immutable per artifact, so its hash is a strong validator
+    etag = _etag(artifact.content_hash)
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": ARTIFACT_CACHE_CONTROL,
+        "X-Artifact-Id": artifact_id,
+        "X-Content-Hash": artifact.content_hash,  # Feature #147: NOT NULL
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and artifact.content_hash:
+        matched = _match_etag(if_none_match, artifact.content_hash)
+        if matched is not None:
+            return Response(status_code=304, headers={**cache_headers, "ETag": matched})
+
     # Determine content type
     content_type = _guess_content_type(artifact)
 
@@ -154,17 +256,18 @@ async def download_artifact_content(
         hash_prefix = (artifact.content_hash or "unknown")[:8]  # Feature #147: content_hash is NOT NULL, fallback for safety
         filename = f"{artifact.artifact_type}_{hash_prefix}{extension}"
 
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        **cache_headers,
+    }
+
     # If content is inline, return it directly
     if artifact.content_inline is not None:
+        content = artifact.content_inline.encode("utf-8")
         return Response(
-            content=artifact.content_inline.encode("utf-8"),
+            content=content,
             media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(artifact.content_inline.encode("utf-8"))),
-                "X-Artifact-Id": artifact_id,
-                "X-Content-Hash": artifact.content_hash,  # Feature #147: NOT NULL
-            }
+            headers={**headers, "Content-Length": str(len(content))},
         )
 
     # Content is stored in file - verify file exists
@@ -182,16 +285,50 @@ async def download_artifact_content(
             detail=f"Artifact content file not found: {artifact.content_ref}"
         )
 
-    # Stream file content
-    file_size = file_path.stat().st_size
+    coding = _CONTENT_CODINGS.get(file_path.suffix)
+    if coding is None:
+        # Stored raw: FileResponse handles Range / If-Range against our ETag
+        # (Starlette >= 0.39, pinned in requirements.txt)
+        return FileResponse(file_path, media_type=content_type, headers=headers)
+
+    headers["Vary"] = "Accept-Encoding"
+    range_header = request.headers.get("range")
+
+    # Compressed object: hand the stored bytes to a client that can decode them
+    if range_header is None and _accepts_encoding(request.headers.get("accept-encoding"), coding):
+        headers["ETag"] = _etag(artifact.content_hash, coding)
+        headers["Content-Encoding"] = coding
+        return FileResponse(file_path, media_type=content_type, headers=headers)
+
+    # Otherwise decompress on the fly, honouring a single byte range
+    size = artifact.size_bytes if isinstance(artifact.size_bytes, int) else None
+    byte_range = None
+    if range_header is not None and size is not None:
+        if_range = request.headers.get("if-range")
+        if if_range is None or if_range == etag:
+            byte_range = _parse_byte_range(range_header, size)
+            if byte_range == ():
+                return Response(
+                    status_code=416,
+                    headers={**cache_headers, "Content-Range": f"bytes */{size}"},
+                )
+    headers["Accept-Ranges"] = "bytes"
+
+    if byte_range:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end - 1}/{size}"
+        headers["Content-Length"] = str(end - start)
+        return StreamingResponse(
+            _slice_chunks(iter_blob_chunks(file_path), start, end),
+            status_code=206,
+            media_type=content_type,
+            headers=headers,
+        )
 
+    if size is not None:
+        headers["Content-Length"] = str(size)
     return StreamingResponse(
-        _generate_file_chunks(file_path),
+        iter_blob_chunks(file_path),
         media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(file_size),
-            "X-Artifact-Id": artifact_id,
-            "X-Content-Hash": artifact.content_hash,  # Feature #147: NOT NULL
-        }
+        headers=headers,
     )
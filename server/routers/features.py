@@ -25,7 +25,7 @@ from ..schemas import (
 from ..utils.validation import validate_project_name
 
 # Lazy imports to avoid circular dependencies
-_create_database = None
+_get_cached_database = None
 _Feature = None
 
 logger = logging.getLogger(__name__)
@@ -44,17 +44,27 @@ def _get_project_path(project_name: str) -> Path:
 
 def _get_db_classes():
     """Lazy import of database classes."""
-    global _create_database, _Feature
-    if _create_database is None:
+    global _get_cached_database, _Feature
+    if _get_cached_database is None:
         import sys
         from pathlib import Path
         root = Path(__file__).parent.parent.parent
         if str(root) not in sys.path:
             sys.path.insert(0, str(root))
-        from api.database import Feature, create_database
-        _create_database = create_database
+        from api.database import Feature, get_cached_database
+        _get_cached_database = get_cached_database
         _Feature = Feature
-    return _create_database, _Feature
+    return _get_cached_database, _Feature
+
+
+def _get_dependency_queries():
+    """Lazy import of the dependency edge queries."""
+    import sys
+    root = Path(__file__).parent.parent.parent
+    if str(root) not in sys.path:
+        sys.path.insert(0, str(root))
+    from api import dependency_queries
+    return dependency_queries
 
 
 router = APIRouter(prefix="/api/projects/{project_name}/features", tags=["features"])
@@ -65,9 +75,10 @@ def get_db_session(project_dir: Path):
     """
     Context manager for database sessions.
     Ensures session is always closed, even on exceptions.
+    Sessions come from the process-wide engine cached per project.
     """
-    create_database, _ = _get_db_classes()
-    _, SessionLocal = create_database(project_dir)
+    get_cached_database, _ = _get_db_classes()
+    _, SessionLocal = get_cached_database(project_dir)
     session = SessionLocal()
     try:
         yield session
@@ -75,26 +86,22 @@ def get_db_session(project_dir: Path):
         session.close()
 
 
-def feature_to_response(f, passing_ids: set[int] | None = None) -> FeatureResponse:
+def feature_to_response(f, blocking: list[int] | None = None) -> FeatureResponse:
     """Convert a Feature model to a FeatureResponse.
 
     Handles legacy NULL values in boolean fields by treating them as False.
-    Computes blocked status if passing_ids is provided.
 
     Args:
         f: Feature model instance
-        passing_ids: Optional set of feature IDs that are passing (for computing blocked status)
+        blocking: Unmet dependency IDs of the feature (from
+            get_blocking_dependencies_map); None or empty means not blocked
 
     Returns:
-        FeatureResponse with computed blocked status
+        FeatureResponse with blocked status
     """
     deps = f.dependencies or []
-    if passing_ids is None:
-        blocking = []
-        blocked = False
-    else:
-        blocking = [d for d in deps if d not in passing_ids]
-        blocked = len(blocking) > 0
+    blocking = blocking or []
+    blocked = len(blocking) > 0
 
     return FeatureResponse(
         id=f.id,
@@ -136,20 +143,21 @@ async def list_features(project_name: str):
         return FeatureListResponse(pending=[], in_progress=[], done=[])
 
     _, Feature = _get_db_classes()
+    dependency_queries = _get_dependency_queries()
 
     try:
         with get_db_session(project_dir) as session:
             all_features = session.query(Feature).order_by(Feature.priority).all()
 
-            # Compute passing IDs for blocked status calculation
-            passing_ids = {f.id for f in all_features if f.passes}
+            # Unmet dependencies per feature, from the indexed edge table
+            blocking = dependency_queries.get_blocking_dependencies_map(session)
 
             pending = []
             in_progress = []
             done = []
 
             for f in all_features:
-                feature_response = feature_to_response(f, passing_ids)
+                feature_response = feature_to_response(f, blocking.get(f.id))
                 if f.passes:
                     done.append(feature_response)
                 elif f.in_progress:
@@ -331,39 +339,40 @@ async def get_dependency_graph(project_name: str):
         return DependencyGraphResponse(nodes=[], edges=[])
 
     _, Feature = _get_db_classes()
+    dependency_queries = _get_dependency_queries()
 
     try:
         with get_db_session(project_dir) as session:
-            all_features = session.query(Feature).all()
-            passing_ids = {f.id for f in all_features if f.passes}
+            blocked_ids = dependency_queries.get_blocking_dependencies_map(session, pending_only=True).keys()
+            rows = session.query(
+                Feature.id, Feature.name, Feature.category, Feature.priority,
+                Feature.passes, Feature.in_progress, Feature.dependencies,
+            ).all()
 
             nodes = []
-            edges = []
-
-            for f in all_features:
-                deps = f.dependencies or []
-                blocking = [d for d in deps if d not in passing_ids]
-
-                if f.passes:
+            for fid, name, category, priority, passes, in_progress, deps in rows:
+                if passes:
                     status = "done"
-                elif blocking:
+                elif fid in blocked_ids:
                     status = "blocked"
-                elif f.in_progress:
+                elif in_progress:
                     status = "in_progress"
                 else:
                     status = "pending"
 
                 nodes.append(DependencyGraphNode(
-                    id=f.id,
-                    name=f.name,
-                    category=f.category,
+                    id=fid,
+                    name=name,
+                    category=category,
                     status=status,
-                    priority=f.priority,
-                    dependencies=deps
+                    priority=priority,
+                    dependencies=deps or []
                 ))
 
-                for dep_id in deps:
-                    edges.append({"source": dep_id, "target": f.id})
+            edges = [
+                {"source": depends_on_id, "target": feature_id}
+                for feature_id, depends_on_id in dependency_queries.get_dependency_edges(session)
+            ]
 
             return DependencyGraphResponse(nodes=nodes, edges=edges)
     except HTTPException:
@@ -531,11 +540,9 @@ async def update_feature(project_name: str, feature_id: int, update: FeatureUpda
             session.commit()
             session.refresh(feature)
 
-            # Compute passing IDs for response
-            all_features = session.query(Feature).all()
-            passing_ids = {f.id for f in all_features if f.passes}
+            blocking = _get_dependency_queries().get_blocking_dependencies_map(session, [feature_id])
 
-            return feature_to_response(feature, passing_ids)
+            return feature_to_response(feature, blocking.get(feature_id))
     except HTTPException:
         raise
     except Exception:
@@ -572,7 +579,9 @@ async def delete_feature(project_name: str, feature_id: int):
             # Clean up dependency references in other features
             # This prevents orphaned dependencies that would block features forever
             affected_features = []
-            for f in session.query(Feature).all():
+            dependent_ids = _get_dependency_queries().get_dependents(session, feature_id)
+            dependents = session.query(Feature).filter(Feature.id.in_(dependent_ids)).all() if dependent_ids else []
+            for f in dependents:
                 if f.dependencies and feature_id in f.dependencies:
                     # Remove the deleted feature from this feature's dependencies
                     deps = [d for d in f.dependencies if d != feature_id]
@@ -645,8 +654,9 @@ def _get_dependency_resolver():
     root = Path(__file__).parent.parent.parent
     if str(root) not in sys.path:
         sys.path.insert(0, str(root))
-    from api.dependency_resolver import MAX_DEPENDENCIES_PER_FEATURE, would_create_circular_dependency
-    return would_create_circular_dependency, MAX_DEPENDENCIES_PER_FEATURE
+    from api.dependency_order import find_dependency_cycle
+    from api.dependency_resolver import MAX_DEPENDENCIES_PER_FEATURE
+    return find_dependency_cycle, MAX_DEPENDENCIES_PER_FEATURE
 
 
 @router.post("/{feature_id}/dependencies/{dep_id}")
@@ -670,7 +680,7 @@ async def add_dependency(project_name: str, feature_id: int, dep_id: int):
     if not project_dir.exists():
         raise HTTPException(status_code=404, detail="Project directory not found")
 
-    would_create_circular_dependency, MAX_DEPENDENCIES_PER_FEATURE = _get_dependency_resolver()
+    find_dependency_cycle, MAX_DEPENDENCIES_PER_FEATURE = _get_dependency_resolver()
     _, Feature = _get_db_classes()
 
     try:
@@ -693,9 +703,7 @@ async def add_dependency(project_name: str, feature_id: int, dep_id: int):
                 raise HTTPException(status_code=400, detail="Dependency already exists")
 
             # Security: Circular dependency check
-            # source_id = feature_id (gaining dep), target_id = dep_id (being depended upon)
-            all_features = [f.to_dict() for f in session.query(Feature).all()]
-            if would_create_circular_dependency(all_features, feature_id, dep_id):
+            if find_dependency_cycle(project_dir, session, feature_id, [dep_id]):
                 raise HTTPException(status_code=400, detail="Would create circular dependency")
 
             current_deps.append(dep_id)
@@ -734,8 +742,10 @@ async def remove_dependency(project_name: str, feature_id: int, dep_id: int):
             if dep_id not in current_deps:
                 raise HTTPException(status_code=400, detail="Dependency does not exist")
 
-            current_deps.remove(dep_id)
-            feature.dependencies = current_deps if current_deps else None
+            # Assign a new list: an in-place edit of the loaded list is not
+            # detected as a change and would never be written
+            new_deps = [d for d in current_deps if d != dep_id]
+            feature.dependencies = new_deps if new_deps else None
             session.commit()
 
             return {"success": True, "feature_id": feature_id, "dependencies": feature.dependencies or []}
@@ -771,7 +781,7 @@ async def set_dependencies(project_name: str, feature_id: int, update: Dependenc
     if len(dependency_ids) != len(set(dependency_ids)):
         raise HTTPException(status_code=400, detail="Duplicate dependencies not allowed")
 
-    would_create_circular_dependency, _ = _get_dependency_resolver()
+    find_dependency_cycle, _ = _get_dependency_resolver()
     _, Feature = _get_db_classes()
 
     try:
@@ -781,28 +791,22 @@ async def set_dependencies(project_name: str, feature_id: int, update: Dependenc
                 raise HTTPException(status_code=404, detail=f"Feature {feature_id} not found")
 
             # Validate all dependencies exist
-            all_feature_ids = {f.id for f in session.query(Feature).all()}
-            missing = [d for d in dependency_ids if d not in all_feature_ids]
+            found_ids = {
+                row[0] for row in session.query(Feature.id).filter(Feature.id.in_(dependency_ids))
+            } if dependency_ids else set()
+            missing = [d for d in dependency_ids if d not in found_ids]
             if missing:
                 raise HTTPException(status_code=400, detail=f"Dependencies not found: {missing}")
 
-            # Check for circular dependencies
-            all_features = [f.to_dict() for f in session.query(Feature).all()]
-            # Temporarily update the feature's dependencies for cycle check
-            test_features = []
-            for f in all_features:
-                if f["id"] == feature_id:
-                    test_features.append({**f, "dependencies": dependency_ids})
-                else:
-                    test_features.append(f)
-
-            for dep_id in dependency_ids:
-                # source_id = feature_id (gaining dep), target_id = dep_id (being depended upon)
-                if would_create_circular_dependency(test_features, feature_id, dep_id):
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Cannot add dependency {dep_id}: would create circular dependency"
-                    )
+            # Check for circular dependencies. Replacing the feature's own
+            # dependencies cannot matter: a cycle needs a path from a new
+            # dependency back to feature_id, which never leaves feature_id.
+            cycle = find_dependency_cycle(project_dir, session, feature_id, dependency_ids)
+            if cycle:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Cannot add dependency {cycle[1]}: would create circular dependency"
+                )
 
             # Set dependencies
             feature.dependencies = sorted(dependency_ids) if dependency_ids else None
@@ -30,7 +30,7 @@ _logger = logging.getLogger(__name__)
 
 
 # Lazy imports to avoid circular dependencies
-_create_database = None
+_get_cached_database = None
 
 
 def _get_project_path(project_name: str) -> Path:
@@ -46,16 +46,16 @@ def _get_project_path(project_name: str) -> Path:
 
 def _get_db_classes():
     """Lazy import of database classes."""
-    global _create_database
-    if _create_database is None:
+    global _get_cached_database
+    if _get_cached_database is None:
         import sys
         from pathlib import Path
         root = Path(__file__).parent.parent.parent
         if str(root) not in sys.path:
             sys.path.insert(0, str(root))
-        from api.database import create_database
-        _create_database = create_database
-    return _create_database
+        from api.database import get_cached_database
+        _get_cached_database = get_cached_database
+    return _get_cached_database
 
 
 @contextmanager
@@ -63,9 +63,10 @@ def get_db_session(project_dir: Path):
     """
     Context manager for database sessions.
     Ensures session is always closed, even on exceptions.
+    Sessions come from the process-wide engine cached per project.
     """
-    create_database = _get_db_classes()
-    _, SessionLocal = create_database(project_dir)
+    get_cached_database = _get_db_classes()
+    _, SessionLocal = get_cached_database(project_dir)
     session = SessionLocal()
     try:
         yield session
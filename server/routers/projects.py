@@ -279,6 +279,10 @@ async def delete_project(name: str, delete_files: bool = False):
             detail="Cannot delete project while agent is running. Stop the agent first."
         )
 
+    # Release the cached engine before files (and features.db) go away
+    from api.database import dispose_cached_database
+    dispose_cached_database(project_dir)
+
     # Optionally delete files
     if delete_files and project_dir.exists():
         try:
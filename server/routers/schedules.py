@@ -63,7 +63,7 @@ def _get_db_session(project_name: str) -> Generator[Tuple[Session, Path], None,
             # ... use db ...
         # db is automatically closed
     """
-    from api.database import create_database
+    from api.database import get_cached_database
 
     project_name = validate_project_name(project_name)
     project_path = _get_project_path(project_name)
@@ -80,7 +80,7 @@ def _get_db_session(project_name: str) -> Generator[Tuple[Session, Path], None,
             detail=f"Project directory not found: {project_path}"
         )
 
-    _, SessionLocal = create_database(project_path)
+    _, SessionLocal = get_cached_database(project_path)
     db = SessionLocal()
     try:
         yield db, project_path
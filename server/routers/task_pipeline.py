@@ -43,7 +43,7 @@ _logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/task-pipeline", tags=["task-pipeline"])
 
 # Lazy import for project-specific database
-_create_database = None
+_get_cached_database = None
 
 # Docker path mapping configuration
 # Maps container paths to host paths when API runs on host
@@ -103,23 +103,23 @@ def _translate_docker_path(path_str: str) -> str:
 
 
 def _get_db_factory():
-    """Get the create_database function with lazy import."""
-    global _create_database
-    if _create_database is None:
+    """Get the cached database factory with lazy import."""
+    global _get_cached_database
+    if _get_cached_database is None:
         import sys
         from pathlib import Path
         root = Path(__file__).parent.parent.parent
         if str(root) not in sys.path:
             sys.path.insert(0, str(root))
-        from api.database import create_database
-        _create_database = create_database
-    return _create_database
+        from api.database import get_cached_database
+        _get_cached_database = get_cached_database
+    return _get_cached_database
 
 
 def get_project_session(project_dir: Path) -> Session:
     """Get a database session for a specific project directory."""
-    create_database = _get_db_factory()
-    _, SessionLocal = create_database(project_dir)
+    get_cached_database = _get_db_factory()
+    _, SessionLocal = get_cached_database(project_dir)
     return SessionLocal()
 
 
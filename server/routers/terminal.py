@@ -39,6 +39,12 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/terminal", tags=["terminal"])
 
+# Flow control: PTY reads pause while more than OUTPUT_HIGH_WATER_BYTES are
+# waiting to be sent to a client, and resume once it is down to
+# OUTPUT_LOW_WATER_BYTES
+OUTPUT_HIGH_WATER_BYTES = 1024 * 1024
+OUTPUT_LOW_WATER_BYTES = 256 * 1024
+
 
 class TerminalCloseCode:
     """WebSocket close codes for terminal endpoint."""
@@ -248,6 +254,9 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     - {"type": "exit", "code": 0} - Shell process exited
     - {"type": "pong"} - Keep-alive response
     - {"type": "error", "message": "..."} - Error message
+
+    A client joining a running session first receives the session's recent
+    output (scrollback) as a single "output" message.
     """
     # Validate project name
     if not validate_project_name(project_name):
@@ -295,16 +304,24 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
 
     # Queue for output data to send to client
     output_queue: asyncio.Queue[bytes] = asyncio.Queue()
+    # Bytes queued or being sent, for flow control
+    queued_bytes = 0
 
     # Callback to receive terminal output and queue it for sending
     def on_output(data: bytes) -> None:
         """Queue terminal output for async sending to WebSocket."""
-        try:
-            output_queue.put_nowait(data)
-        except asyncio.QueueFull:
-            logger.warning(f"Output queue full for {project_name}, dropping data")
-
-    # Register the output callback
+        nonlocal queued_bytes
+        output_queue.put_nowait(data)
+        queued_bytes += len(data)
+        if queued_bytes > OUTPUT_HIGH_WATER_BYTES:
+            # Client is behind: stop reading the PTY until it catches up
+            session.pause_output(on_output)
+
+    # Replay recent output so a (re)connecting client sees the current screen,
+    # then register the output callback (no output can arrive in between)
+    scrollback = session.get_scrollback()
+    if scrollback:
+        on_output(scrollback)
     session.add_output_callback(on_output)
 
     # Track if we need to wait for initial resize before starting
@@ -314,15 +331,23 @@ async def terminal_websocket(websocket: WebSocket, project_name: str, terminal_i
     # Task to send queued output to WebSocket
     async def send_output_task() -> None:
         """Continuously send queued output to the WebSocket client."""
+        nonlocal queued_bytes
         try:
             while True:
-                # Wait for output data
-                data = await output_queue.get()
+                # Wait for output data, then take everything else already queued
+                chunks = [await output_queue.get()]
+                while not output_queue.empty():
+                    chunks.append(output_queue.get_nowait())
+                data = b"".join(chunks)
 
                 # Encode as base64 and send
                 encoded = base64.b64encode(data).decode("ascii")
                 await websocket.send_json({"type": "output", "data": encoded})
 
+                queued_bytes -= len(data)
+                if queued_bytes <= OUTPUT_LOW_WATER_BYTES:
+                    session.resume_output(on_output)
+
         except asyncio.CancelledError:
             raise
         except WebSocketDisconnect:
@@ -725,6 +725,36 @@ class AgentRunSummary(BaseModel):
     artifact_count: int
 
 
+class ProjectQueueStatus(BaseModel):
+    """Executor usage for one project."""
+
+    running: int = Field(..., ge=0, description="Runs executing on a worker")
+    queued: int = Field(..., ge=0, description="Runs waiting for a worker")
+
+
+class ExecutorQueueStatusResponse(BaseModel):
+    """Response for GET /api/agent-runs/queue (spec executor queue depth).
+
+    Example:
+        {
+            "max_workers": 4,
+            "per_project_limit": 2,
+            "running": 2,
+            "queued": 8,
+            "projects": {"my-app": {"running": 2, "queued": 8}}
+        }
+    """
+
+    max_workers: int = Field(..., ge=1, description="Worker threads in the pool")
+    per_project_limit: int = Field(..., ge=1, description="Max concurrent runs per project")
+    running: int = Field(..., ge=0, description="Runs executing across all projects")
+    queued: int = Field(..., ge=0, description="Runs waiting across all projects")
+    projects: dict[str, ProjectQueueStatus] = Field(
+        default_factory=dict,
+        description="Counts per project (projects with no runs are omitted)",
+    )
+
+
 class RunStatusUpdate(BaseModel):
     """Request schema for updating run status."""
 
@@ -759,7 +789,7 @@ class ArtifactListItemResponse(BaseModel):
             "run_id": "def456-...",
             "artifact_type": "test_result",
             "path": "/path/to/test/output.log",
-            "content_ref": ".autobuildr/artifacts/abc123/sha256.blob",
+            "content_ref": ".autobuildr/artifacts/objects/ab/c123def456.zz",
             "content_hash": "abc123def456...",
             "size_bytes": 1024,
             "created_at": "2024-01-27T12:00:00Z",
@@ -844,7 +874,7 @@ class ArtifactResponse(BaseModel):
             "run_id": "def456-...",
             "artifact_type": "test_result",
             "path": "/path/to/test/output.log",
-            "content_ref": ".autobuildr/artifacts/abc123/sha256.blob",
+            "content_ref": ".autobuildr/artifacts/objects/ab/c123def456.zz",
             "content_hash": "abc123def456...",
             "size_bytes": 1024,
             "created_at": "2024-01-27T12:00:00Z",
@@ -25,6 +25,7 @@ import psutil
 
 from registry import list_registered_projects
 from server.utils.process_utils import kill_process_tree
+from server.utils.stream_utils import aiter_line_batches
 
 logger = logging.getLogger(__name__)
 
@@ -234,11 +235,16 @@ class DevServerProcessManager:
 
     async def _broadcast_output(self, line: str) -> None:
         """Broadcast output line to all registered callbacks."""
+        await self._broadcast_lines([line])
+
+    async def _broadcast_lines(self, lines: list[str]) -> None:
+        """Broadcast a batch of output lines, in order, to all registered callbacks."""
         with self._callbacks_lock:
             callbacks = list(self._output_callbacks)
 
-        for callback in callbacks:
-            await self._safe_callback(callback, line)
+        for line in lines:
+            for callback in callbacks:
+                await self._safe_callback(callback, line)
 
     async def _stream_output(self) -> None:
         """Stream process output to callbacks and detect URL."""
@@ -246,29 +252,21 @@ class DevServerProcessManager:
             return
 
         try:
-            loop = asyncio.get_running_loop()
-            while True:
-                # Use run_in_executor for blocking readline
-                line = await loop.run_in_executor(
-                    None, self.process.stdout.readline
-                )
-                if not line:
-                    break
-
-                decoded = line.decode("utf-8", errors="replace").rstrip()
-                sanitized = sanitize_output(decoded)
-
+            # Chunked reads on the event loop; each read yields a batch of lines
+            async for lines in aiter_line_batches(self.process.stdout):
                 # Try to detect URL from output (only if not already detected)
                 if not self._detected_url:
-                    url = extract_url(decoded)
-                    if url:
-                        self._detected_url = url
-                        logger.info(
-                            "Dev server URL detected for %s: %s",
-                            self.project_name, url
-                        )
-
-                await self._broadcast_output(sanitized)
+                    for decoded in lines:
+                        url = extract_url(decoded)
+                        if url:
+                            self._detected_url = url
+                            logger.info(
+                                "Dev server URL detected for %s: %s",
+                                self.project_name, url
+                            )
+                            break
+
+                await self._broadcast_lines([sanitize_output(decoded) for decoded in lines])
 
         except asyncio.CancelledError:
             raise
@@ -382,10 +382,10 @@ class ExpandChatSession:
         if str(root) not in sys.path:
             sys.path.insert(0, str(root))
 
-        from api.database import Feature, create_database
+        from api.database import Feature, get_cached_database
 
         # Get database session
-        _, SessionLocal = create_database(self.project_dir)
+        _, SessionLocal = get_cached_database(self.project_dir)
         session = SessionLocal()
 
         try:
@@ -23,7 +23,9 @@ import psutil
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from auth import AUTH_ERROR_HELP_SERVER as AUTH_ERROR_HELP  # noqa: E402
 from auth import is_auth_error
+from orchestrator_events import EVENTS_FD_ENV, parse_event_line
 from server.utils.process_utils import kill_process_tree
+from server.utils.stream_utils import aiter_line_batches
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +82,9 @@ class AgentProcessManager:
         self._status: Literal["stopped", "running", "paused", "crashed"] = "stopped"
         self.started_at: datetime | None = None
         self._output_task: asyncio.Task | None = None
+        self._events_task: asyncio.Task | None = None
+        # True while the running orchestrator reports typed events on a pipe
+        self.structured_events: bool = False
         self.yolo_mode: bool = False  # YOLO mode for rapid prototyping
         self.model: str | None = None  # Model being used
         self.parallel_mode: bool = False  # Parallel execution mode
@@ -89,6 +94,7 @@ class AgentProcessManager:
         # Support multiple callbacks (for multiple WebSocket clients)
         self._output_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
         self._status_callbacks: Set[Callable[[str], Awaitable[None]]] = set()
+        self._event_callbacks: Set[Callable[[dict], Awaitable[None]]] = set()
         self._callbacks_lock = threading.Lock()
 
         # Lock file to prevent multiple instances (stored in project directory)
@@ -146,6 +152,16 @@ class AgentProcessManager:
         with self._callbacks_lock:
             self._status_callbacks.discard(callback)
 
+    def add_event_callback(self, callback: Callable[[dict], Awaitable[None]]) -> None:
+        """Add a callback for typed orchestrator events (see orchestrator_events)."""
+        with self._callbacks_lock:
+            self._event_callbacks.add(callback)
+
+    def remove_event_callback(self, callback: Callable[[dict], Awaitable[None]]) -> None:
+        """Remove an event callback."""
+        with self._callbacks_lock:
+            self._event_callbacks.discard(callback)
+
     @property
     def pid(self) -> int | None:
         return self.process.pid if self.process else None
@@ -228,11 +244,16 @@ class AgentProcessManager:
 
     async def _broadcast_output(self, line: str) -> None:
         """Broadcast output line to all registered callbacks."""
+        await self._broadcast_lines([line])
+
+    async def _broadcast_lines(self, lines: list[str]) -> None:
+        """Broadcast a batch of output lines, in order, to all registered callbacks."""
         with self._callbacks_lock:
             callbacks = list(self._output_callbacks)
 
-        for callback in callbacks:
-            await self._safe_callback(callback, line)
+        for line in lines:
+            for callback in callbacks:
+                await self._safe_callback(callback, line)
 
     async def _stream_output(self) -> None:
         """Stream process output to callbacks."""
@@ -243,31 +264,24 @@ class AgentProcessManager:
         output_buffer = []  # Buffer recent lines for auth error detection
 
         try:
-            loop = asyncio.get_running_loop()
-            while True:
-                # Use run_in_executor for blocking readline
-                line = await loop.run_in_executor(
-                    None, self.process.stdout.readline
-                )
-                if not line:
-                    break
-
-                decoded = line.decode("utf-8", errors="replace").rstrip()
-                sanitized = sanitize_output(decoded)
+            # Chunked reads on the event loop; each read yields a batch of lines
+            async for lines in aiter_line_batches(self.process.stdout):
+                batch = []
+                for decoded in lines:
+                    # Buffer recent output for auth error detection
+                    output_buffer.append(decoded)
+                    if len(output_buffer) > 20:
+                        output_buffer.pop(0)
 
-                # Buffer recent output for auth error detection
-                output_buffer.append(decoded)
-                if len(output_buffer) > 20:
-                    output_buffer.pop(0)
+                    # Check for auth errors
+                    if not auth_error_detected and is_auth_error(decoded):
+                        auth_error_detected = True
+                        # Broadcast auth error help message
+                        batch.extend(AUTH_ERROR_HELP.strip().split('\n'))
 
-                # Check for auth errors
-                if not auth_error_detected and is_auth_error(decoded):
-                    auth_error_detected = True
-                    # Broadcast auth error help message
-                    for help_line in AUTH_ERROR_HELP.strip().split('\n'):
-                        await self._broadcast_output(help_line)
+                    batch.append(sanitize_output(decoded))
 
-                await self._broadcast_output(sanitized)
+                await self._broadcast_lines(batch)
 
         except asyncio.CancelledError:
             raise
@@ -289,6 +303,21 @@ class AgentProcessManager:
                     self.status = "stopped"
                 self._remove_lock()
 
+    async def _stream_events(self, events_file) -> None:
+        """Read typed orchestrator events from the side-channel pipe."""
+        try:
+            async for lines in aiter_line_batches(events_file):
+                events = [event for event in map(parse_event_line, lines) if event is not None]
+                with self._callbacks_lock:
+                    callbacks = list(self._event_callbacks)
+                for event in events:
+                    for callback in callbacks:
+                        await self._safe_callback(callback, event)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Event streaming error: {e}")
+
     async def start(
         self,
         yolo_mode: bool = False,
@@ -346,17 +375,37 @@ class AgentProcessManager:
         # Add testing agent configuration
         cmd.extend(["--testing-ratio", str(testing_agent_ratio)])
 
+        # Typed event side channel: the orchestrator writes JSON lines to the
+        # inherited write end of a pipe. Needs pass_fds, so POSIX only; on
+        # Windows the UI falls back to parsing stdout.
+        env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+        popen_kwargs = {}
+        events_read_fd = events_write_fd = None
+        if os.name != "nt":
+            events_read_fd, events_write_fd = os.pipe()
+            env[EVENTS_FD_ENV] = str(events_write_fd)
+            popen_kwargs["pass_fds"] = (events_write_fd,)
+
         try:
             # Start subprocess with piped stdout/stderr
             # Use project_dir as cwd so Claude SDK sandbox allows access to project files
             # IMPORTANT: Set PYTHONUNBUFFERED to ensure output isn't delayed
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                cwd=str(self.project_dir),
-                env={**os.environ, "PYTHONUNBUFFERED": "1"},
-            )
+            try:
+                self.process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    cwd=str(self.project_dir),
+                    env=env,
+                    **popen_kwargs,
+                )
+            finally:
+                # Only the child keeps the write end, so the pipe reaches EOF
+                # when the orchestrator exits
+                if events_write_fd is not None:
+                    os.close(events_write_fd)
+            events_file = os.fdopen(events_read_fd, "rb") if events_read_fd is not None else None
+            events_read_fd = None
 
             # Atomic lock creation - if it fails, another process beat us
             if not self._create_lock():
@@ -367,6 +416,8 @@ class AgentProcessManager:
                 except subprocess.TimeoutExpired:
                     self.process.kill()
                 self.process = None
+                if events_file is not None:
+                    events_file.close()
                 return False, "Another agent instance is already running for this project"
 
             self.started_at = datetime.now()
@@ -374,10 +425,15 @@ class AgentProcessManager:
 
             # Start output streaming task
             self._output_task = asyncio.create_task(self._stream_output())
+            self.structured_events = events_file is not None
+            if events_file is not None:
+                self._events_task = asyncio.create_task(self._stream_events(events_file))
 
             return True, f"Agent started with PID {self.process.pid}"
         except Exception as e:
             logger.exception("Failed to start agent")
+            if events_read_fd is not None:
+                os.close(events_read_fd)
             return False, f"Failed to start agent: {e}"
 
     async def stop(self) -> tuple[bool, str]:
@@ -412,6 +468,17 @@ class AgentProcessManager:
                 result.children_terminated, result.children_killed
             )
 
+            # Stop event streaming only now: with the orchestrator gone its
+            # end of the event pipe is closed, so no read can still be pending
+            if self._events_task:
+                self._events_task.cancel()
+                try:
+                    await self._events_task
+                except asyncio.CancelledError:
+                    pass
+                self._events_task = None
+            self.structured_events = False
+
             self._remove_lock()
             self.status = "stopped"
             self.process = None
@@ -0,0 +1,543 @@
+"""
+Spec Run Executor
+=================
+
+Runs AgentSpec executions (POST /agent-specs/{id}/execute) off the event loop.
+
+HarnessKernel.execute() is synchronous and a run can take minutes, so runs
+are handed to a bounded pool of worker threads instead of being awaited on
+the FastAPI event loop:
+
+- Durable queue: every accepted run has an agent_run_queue row, committed
+  with its pending AgentRun, so queued runs survive a restart (recover()).
+- Per-project limits: at most per_project_limit runs of one project execute
+  at once; the rest wait in FIFO order without holding up other projects.
+- Cancellation: the pause/resume/cancel endpoints reach the kernel through a
+  RunControl checked between turns; a run cancelled while queued is dropped.
+- Queue depth: status() reports running and queued runs per project.
+
+Threads rather than processes: the kernel works on SQLAlchemy sessions and
+in-process callbacks and spends its time waiting on I/O (SQLite, tools, the
+Claude API), so the GIL is not what limits throughput.
+"""
+
+import asyncio
+import itertools
+import logging
+import os
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+from sqlalchemy.orm import joinedload
+
+# Add parent directory for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from api.agentspec_models import AgentRun, AgentRunQueueEntry, AgentSpec
+from api.harness_kernel import RunControl
+
+logger = logging.getLogger(__name__)
+
+# Constants
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PER_PROJECT_LIMIT = 2
+MAX_WORKERS_ENV = "AUTOBUILDR_SPEC_WORKERS"
+PER_PROJECT_LIMIT_ENV = "AUTOBUILDR_SPEC_WORKERS_PER_PROJECT"
+
+
+def _utc_now() -> datetime:
+    """Return current UTC time."""
+    return datetime.now(timezone.utc)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.environ.get(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={os.environ.get(name)!r}")
+        return default
+    return value if value > 0 else default
+
+
+@contextmanager
+def _project_session(project_dir: Path):
+    """Session on the cached engine for a project database."""
+    from api.database import get_cached_database
+
+    _, SessionLocal = get_cached_database(project_dir)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _claim_queued_run(project_dir: Path, run_id: str) -> bool:
+    """Mark a queue row as picked up. False if it was removed (cancelled)."""
+    with _project_session(project_dir) as db:
+        entry = db.get(AgentRunQueueEntry, run_id)
+        if entry is None:
+            return False
+        entry.claimed_at = _utc_now()
+        db.commit()
+        return True
+
+
+def _release_queued_run(project_dir: Path, run_id: str) -> None:
+    """Delete a queue row once its run has finished or was cancelled."""
+    with _project_session(project_dir) as db:
+        db.query(AgentRunQueueEntry).filter(AgentRunQueueEntry.run_id == run_id).delete()
+        db.commit()
+
+
+@dataclass
+class QueuedRun:
+    """A run accepted by the executor, waiting or executing."""
+
+    project_name: str
+    project_dir: Path
+    spec_id: str
+    run_id: str
+    control: RunControl = field(default_factory=RunControl)
+    # Global submission order, so queues of different projects stay FIFO overall
+    order: int = 0
+
+
+def execute_queued_run(job: QueuedRun, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Execute one queued AgentSpec run via HarnessKernel (runs on a worker thread).
+
+    Feature #136: Wire execute endpoint to actually call HarnessKernel.execute().
+
+    This function:
+    1. Transitions the pre-created AgentRun to 'running' status
+    2. Broadcasts WebSocket notification on the server loop (Feature #61)
+    3. Invokes HarnessKernel.execute(spec) for real kernel execution
+    4. Syncs results from the kernel's run back to the pre-created run
+    5. Handles errors gracefully, updating run status to 'failed' on failure
+
+    A run that is no longer pending when picked up (cancelled while queued)
+    is skipped, and results are not synced over a run the user cancelled
+    while it executed.
+
+    Args:
+        job: The queued run (project, spec, run ids and its RunControl)
+        loop: Server event loop for WebSocket broadcasts (None skips them)
+    """
+    from api.websocket_events import broadcast_run_started
+
+    project_dir, spec_id, run_id = job.project_dir, job.spec_id, job.run_id
+    logger.info(f"Starting execution for run {run_id} (spec {spec_id})")
+
+    try:
+        with _project_session(project_dir) as db:
+            # Get the run record
+            run = db.query(AgentRun).filter(AgentRun.id == run_id).first()
+            if not run:
+                logger.error(f"AgentRun {run_id} not found")
+                return
+            if run.status != "pending":
+                logger.info(f"Run {run_id} is '{run.status}', not pending; skipping")
+                return
+
+            # Get the spec for display_name and icon
+            spec = db.query(AgentSpec).filter(AgentSpec.id == spec_id).first()
+            if not spec:
+                logger.error(f"AgentSpec {spec_id} not found for run {run_id}")
+                run.status = "failed"
+                run.completed_at = _utc_now()
+                run.error = f"AgentSpec '{spec_id}' not found"
+                db.commit()
+                return
+            display_name = spec.display_name
+            icon = spec.icon
+
+            # Transition from pending to running
+            run.status = "running"
+            run.started_at = _utc_now()
+            db.commit()
+            logger.info(f"Run {run_id} transitioned to 'running'")
+
+            # Feature #61: Broadcast agent_run_started WebSocket message.
+            # WebSocket connections belong to the server loop, so the
+            # coroutine is scheduled there rather than run on this thread.
+            if loop is not None and not loop.is_closed():
+                asyncio.run_coroutine_threadsafe(
+                    broadcast_run_started(
+                        project_name=job.project_name,
+                        run_id=run_id,
+                        spec_id=spec_id,
+                        display_name=display_name,
+                        icon=icon,
+                        started_at=run.started_at,
+                    ),
+                    loop,
+                )
+
+        # Phase 2: Execute via HarnessKernel (Feature #136)
+        # Use a separate DB session for the kernel execution to ensure
+        # proper transaction isolation and commit behavior
+        from api.harness_kernel import HarnessKernel
+
+        with _project_session(project_dir) as kernel_db:
+            # Load the spec in the kernel's session with acceptance_spec eagerly loaded
+            kernel_spec = kernel_db.query(AgentSpec).options(
+                joinedload(AgentSpec.acceptance_spec)
+            ).filter(AgentSpec.id == spec_id).first()
+
+            if not kernel_spec:
+                raise RuntimeError(f"AgentSpec '{spec_id}' not found in kernel session")
+
+            logger.info(f"Invoking HarnessKernel.execute() for spec {spec_id}")
+
+            # The kernel creates its own AgentRun internally and manages
+            # the full execution lifecycle (turns, events, acceptance, verdict)
+            kernel = HarnessKernel(db=kernel_db)
+            kernel_run = kernel.execute(
+                kernel_spec,
+                turn_executor=None,  # No Claude SDK executor yet; completes immediately
+                context={
+                    "project_dir": str(project_dir),
+                },
+                control=job.control,
+            )
+
+            logger.info(
+                f"HarnessKernel execution completed: kernel_run={kernel_run.id}, "
+                f"status={kernel_run.status}, verdict={kernel_run.final_verdict}, "
+                f"turns={kernel_run.turns_used}"
+            )
+
+            # Capture kernel run results before session closes
+            kernel_status = kernel_run.status
+            kernel_completed_at = kernel_run.completed_at
+            kernel_turns_used = kernel_run.turns_used
+            kernel_tokens_in = kernel_run.tokens_in
+            kernel_tokens_out = kernel_run.tokens_out
+            kernel_final_verdict = kernel_run.final_verdict
+            kernel_acceptance_results = kernel_run.acceptance_results
+            kernel_error = kernel_run.error
+            kernel_retry_count = kernel_run.retry_count
+
+        # Phase 3: Sync kernel results back to the pre-created run
+        # The endpoint returned run_id to the client, so we update that
+        # record with the actual execution results from HarnessKernel
+        with _project_session(project_dir) as sync_db:
+            original_run = sync_db.query(AgentRun).filter(AgentRun.id == run_id).first()
+
+            if original_run is None:
+                logger.warning(f"Original run {run_id} not found during result sync")
+            elif original_run.is_terminal:
+                # Cancelled through the API while executing; keep that outcome
+                logger.info(f"Run {run_id} already '{original_run.status}'; not syncing kernel results")
+            else:
+                original_run.status = kernel_status
+                original_run.completed_at = kernel_completed_at or _utc_now()
+                original_run.turns_used = kernel_turns_used
+                original_run.tokens_in = kernel_tokens_in
+                original_run.tokens_out = kernel_tokens_out
+                original_run.final_verdict = kernel_final_verdict
+                original_run.acceptance_results = kernel_acceptance_results
+                original_run.error = kernel_error
+                original_run.retry_count = kernel_retry_count
+                sync_db.commit()
+
+                logger.info(
+                    f"Synced kernel results to original run {run_id}: "
+                    f"status={kernel_status}, verdict={kernel_final_verdict}"
+                )
+
+    except Exception as e:
+        logger.exception(f"Error executing spec {spec_id}: {e}")
+        # Mark run as failed with error details
+        try:
+            with _project_session(project_dir) as db:
+                run = db.query(AgentRun).filter(AgentRun.id == run_id).first()
+                if run and not run.is_terminal:
+                    run.status = "failed"
+                    run.completed_at = _utc_now()
+                    run.error = str(e)
+                    db.commit()
+        except Exception as db_error:
+            logger.exception(f"Failed to update run status: {db_error}")
+
+
+class SpecRunExecutor:
+    """
+    Bounded worker pool with per-project FIFO queues.
+
+    A run is dispatched to a worker only when a slot is free both globally
+    (max_workers) and for its project (per_project_limit); among eligible
+    projects the oldest submission goes first. All bookkeeping happens under
+    one lock; the runs themselves execute outside it.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        per_project_limit: Optional[int] = None,
+        run_func: Optional[Callable[[QueuedRun, Optional[asyncio.AbstractEventLoop]], None]] = None,
+    ):
+        self.max_workers = max_workers or _env_int(MAX_WORKERS_ENV, DEFAULT_MAX_WORKERS)
+        self.per_project_limit = per_project_limit or _env_int(
+            PER_PROJECT_LIMIT_ENV, DEFAULT_PER_PROJECT_LIMIT
+        )
+        self._run_func = run_func or execute_queued_run
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="spec-run"
+        )
+        self._lock = threading.Lock()
+        self._queued: dict[str, deque[QueuedRun]] = {}
+        self._running: dict[str, QueuedRun] = {}
+        self._running_per_project: dict[str, int] = {}
+        self._order = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closed = False
+
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Set the event loop WebSocket broadcasts are scheduled on."""
+        self._loop = loop
+
+    def submit(self, project_name: str, project_dir: Path, spec_id: str, run_id: str) -> QueuedRun:
+        """
+        Queue a run whose pending AgentRun and queue row are already committed.
+
+        Submitting a run the executor already knows returns the existing entry.
+        """
+        if self._loop is None:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Spec run executor is shut down")
+            existing = self._running.get(run_id) or self._find_queued_locked(run_id)
+            if existing is not None:
+                return existing
+
+            job = QueuedRun(
+                project_name=project_name,
+                project_dir=Path(project_dir),
+                spec_id=spec_id,
+                run_id=run_id,
+                order=next(self._order),
+            )
+            self._queued.setdefault(project_name, deque()).append(job)
+            self._dispatch_locked()
+        logger.info(f"Queued run {run_id} for project '{project_name}'")
+        return job
+
+    def cancel(self, run_id: str) -> bool:
+        """
+        Cancel a queued or executing run.
+
+        A queued run is removed from the queue (and its queue row deleted); an
+        executing run is stopped by the kernel at its next turn boundary.
+
+        Returns:
+            True if the executor knew the run
+        """
+        with self._lock:
+            job = self._running.get(run_id)
+            if job is not None:
+                job.control.cancel()
+                return True
+            job = self._find_queued_locked(run_id)
+            if job is None:
+                return False
+            queue = self._queued[job.project_name]
+            queue.remove(job)
+            if not queue:
+                del self._queued[job.project_name]
+
+        try:
+            _release_queued_run(job.project_dir, run_id)
+        except Exception as e:
+            logger.warning(f"Could not remove queue entry for cancelled run {run_id}: {e}")
+        logger.info(f"Cancelled queued run {run_id}")
+        return True
+
+    def pause(self, run_id: str) -> bool:
+        """Hold an executing run at its next turn boundary. False if not executing."""
+        with self._lock:
+            job = self._running.get(run_id)
+        if job is None:
+            return False
+        job.control.pause()
+        return True
+
+    def resume(self, run_id: str) -> bool:
+        """Let a paused run continue. False if not executing."""
+        with self._lock:
+            job = self._running.get(run_id)
+        if job is None:
+            return False
+        job.control.resume()
+        return True
+
+    def status(self) -> dict:
+        """Queue depth and worker usage, overall and per project."""
+        with self._lock:
+            projects: dict[str, dict[str, int]] = {}
+            for name, count in self._running_per_project.items():
+                if count:
+                    projects[name] = {"running": count, "queued": 0}
+            for name, queue in self._queued.items():
+                projects.setdefault(name, {"running": 0, "queued": 0})["queued"] = len(queue)
+            return {
+                "max_workers": self.max_workers,
+                "per_project_limit": self.per_project_limit,
+                "running": len(self._running),
+                "queued": sum(len(q) for q in self._queued.values()),
+                "projects": projects,
+            }
+
+    def recover(self, project_name: str, project_dir: Path) -> int:
+        """
+        Re-queue a project's runs left in agent_run_queue by a previous server.
+
+        Unclaimed rows whose run is still pending are submitted again. Claimed
+        rows belong to runs interrupted mid-execution; those runs are failed
+        as orphaned (they may have had side effects, so they are not re-run).
+
+        Returns:
+            Number of runs re-queued
+        """
+        from api.orphaned_run_cleanup import ORPHANED_ERROR_MESSAGE
+
+        requeue: list[tuple[str, str]] = []
+        with _project_session(project_dir) as db:
+            entries = db.query(AgentRunQueueEntry).order_by(AgentRunQueueEntry.enqueued_at).all()
+            for entry in entries:
+                run = db.get(AgentRun, entry.run_id)
+                if entry.claimed_at is None and run is not None and run.status == "pending":
+                    requeue.append((entry.agent_spec_id, entry.run_id))
+                    continue
+                if run is not None and not run.is_terminal:
+                    run.status = "failed"
+                    run.error = ORPHANED_ERROR_MESSAGE
+                    run.completed_at = _utc_now()
+                db.delete(entry)
+            db.commit()
+
+        for spec_id, run_id in requeue:
+            self.submit(project_name, project_dir, spec_id, run_id)
+        if requeue:
+            logger.info(f"Re-queued {len(requeue)} run(s) for project '{project_name}'")
+        return len(requeue)
+
+    def recover_all(self) -> int:
+        """Recover queued runs for all registered projects. Returns count re-queued."""
+        from registry import list_registered_projects
+
+        total = 0
+        try:
+            projects = list_registered_projects()
+        except Exception as e:
+            logger.error(f"Error listing projects for run recovery: {e}")
+            return 0
+        for project_name, info in projects.items():
+            project_dir = Path(info.get("path", ""))
+            if not (project_dir / "features.db").exists():
+                continue
+            try:
+                total += self.recover(project_name, project_dir)
+            except Exception as e:
+                logger.error(f"Error recovering queued runs for {project_name}: {e}")
+        return total
+
+    def shutdown(self) -> None:
+        """
+        Stop dispatching. Queued runs stay in agent_run_queue for the next
+        server start; runs already executing are left to finish.
+        """
+        with self._lock:
+            self._closed = True
+            self._queued.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _find_queued_locked(self, run_id: str) -> Optional[QueuedRun]:
+        for queue in self._queued.values():
+            for job in queue:
+                if job.run_id == run_id:
+                    return job
+        return None
+
+    def _dispatch_locked(self) -> None:
+        """Hand queued runs to free workers, respecting per-project limits."""
+        while len(self._running) < self.max_workers:
+            queue = None
+            for name, candidate in self._queued.items():
+                if self._running_per_project.get(name, 0) >= self.per_project_limit:
+                    continue
+                if queue is None or candidate[0].order < queue[0].order:
+                    queue = candidate
+            if queue is None:
+                return
+
+            job = queue.popleft()
+            if not queue:
+                del self._queued[job.project_name]
+            self._running[job.run_id] = job
+            self._running_per_project[job.project_name] = (
+                self._running_per_project.get(job.project_name, 0) + 1
+            )
+            self._pool.submit(self._work, job)
+
+    def _work(self, job: QueuedRun) -> None:
+        try:
+            if _claim_queued_run(job.project_dir, job.run_id):
+                self._run_func(job, self._loop)
+        except Exception as e:
+            logger.exception(f"Spec run {job.run_id} crashed: {e}")
+        finally:
+            try:
+                _release_queued_run(job.project_dir, job.run_id)
+            except Exception as e:
+                logger.warning(f"Could not remove queue entry for run {job.run_id}: {e}")
+            with self._lock:
+                self._running.pop(job.run_id, None)
+                remaining = self._running_per_project.get(job.project_name, 1) - 1
+                if remaining > 0:
+                    self._running_per_project[job.project_name] = remaining
+                else:
+                    self._running_per_project.pop(job.project_name, None)
+                if not self._closed:
+                    self._dispatch_locked()
+
+
+# Global executor instance
+_executor: Optional[SpecRunExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_run_executor() -> SpecRunExecutor:
+    """Get the global spec run executor."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = SpecRunExecutor()
+        return _executor
+
+
+async def cleanup_run_executor():
+    """Shut down the spec run executor on server shutdown."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown()
@@ -7,12 +7,14 @@ Uses winpty (ConPTY) on Windows and built-in pty module on Unix.
 """
 
 import asyncio
+import errno
 import logging
 import os
 import platform
 import shutil
 import threading
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -20,6 +22,18 @@ from typing import Callable, Set
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per PTY read
+PTY_READ_SIZE = 65536
+
+# PTY output arriving within this window (seconds) is sent as one chunk
+OUTPUT_COALESCE_INTERVAL = 0.01
+
+# Pending output is sent right away once it reaches this size
+OUTPUT_COALESCE_MAX_BYTES = 64 * 1024
+
+# Recent output kept per terminal for clients that (re)connect
+SCROLLBACK_MAX_BYTES = 256 * 1024
+
 
 @dataclass
 class TerminalInfo:
@@ -52,7 +66,6 @@ else:
     # Unix systems use built-in pty module
     import fcntl
     import pty
-    import select
     import signal
     import struct
     import termios
@@ -95,6 +108,13 @@ class TerminalSession:
 
     Provides cross-platform PTY support with async output streaming
     and multiple output callbacks for WebSocket clients.
+
+    On Unix the PTY master is watched with loop.add_reader(), so an idle
+    terminal costs nothing. Output is coalesced for OUTPUT_COALESCE_INTERVAL
+    before it is broadcast and appended to a bounded scrollback buffer.
+    Consumers that fall behind can pause_output(); reading stops until every
+    paused consumer has resumed, which lets the kernel apply backpressure to
+    the shell instead of buffering without bound.
     """
 
     def __init__(self, project_name: str, project_dir: Path):
@@ -121,6 +141,21 @@ class TerminalSession:
         self._output_callbacks: Set[Callable[[bytes], None]] = set()
         self._callbacks_lock = threading.Lock()
 
+        # Coalescing buffer, flushed by a call_later() timer
+        self._pending_output = bytearray()
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Scrollback ring: chunks of recent output, at most SCROLLBACK_MAX_BYTES
+        self._scrollback: deque[bytes] = deque()
+        self._scrollback_size = 0
+
+        # Flow control: consumers that asked to pause, and the reader state
+        self._paused_by: Set[object] = set()
+        self._reading = False
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
+        self._reader_done: asyncio.Future | None = None
+
     @property
     def is_active(self) -> bool:
         """Check if the terminal session is currently active."""
@@ -159,6 +194,77 @@ class TerminalSession:
         """
         with self._callbacks_lock:
             self._output_callbacks.discard(callback)
+        # A departing consumer must not keep the terminal paused
+        self.resume_output(callback)
+
+    def get_scrollback(self) -> bytes:
+        """
+        Get the most recent output (up to SCROLLBACK_MAX_BYTES).
+
+        Call this right before add_output_callback() so a joining client
+        sees recent output followed by everything new, without gaps.
+        """
+        return b"".join(self._scrollback)
+
+    def pause_output(self, consumer: object) -> None:
+        """
+        Stop reading PTY output until consumer calls resume_output().
+
+        Args:
+            consumer: Any hashable token identifying the slow consumer
+        """
+        self._paused_by.add(consumer)
+        self._update_reading()
+
+    def resume_output(self, consumer: object) -> None:
+        """
+        Withdraw a pause_output() request.
+
+        Args:
+            consumer: The token passed to pause_output()
+        """
+        if consumer in self._paused_by:
+            self._paused_by.discard(consumer)
+            self._update_reading()
+
+    @property
+    def output_paused(self) -> bool:
+        """True while a consumer has paused reading."""
+        return bool(self._paused_by)
+
+    def _queue_output(self, data: bytes) -> None:
+        """Add PTY output to the coalescing buffer."""
+        self._pending_output += data
+        if len(self._pending_output) >= OUTPUT_COALESCE_MAX_BYTES:
+            self._flush_output()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                OUTPUT_COALESCE_INTERVAL, self._flush_output
+            )
+
+    def _flush_output(self) -> None:
+        """Send coalesced output to the scrollback buffer and all callbacks."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_output:
+            return
+        data = bytes(self._pending_output)
+        self._pending_output.clear()
+
+        self._scrollback.append(data)
+        self._scrollback_size += len(data)
+        while self._scrollback_size > SCROLLBACK_MAX_BYTES:
+            excess = self._scrollback_size - SCROLLBACK_MAX_BYTES
+            oldest = self._scrollback[0]
+            if len(oldest) <= excess:
+                self._scrollback.popleft()
+                self._scrollback_size -= len(oldest)
+            else:
+                self._scrollback[0] = oldest[excess:]
+                self._scrollback_size -= excess
+
+        self._broadcast_output(data)
 
     def _broadcast_output(self, data: bytes) -> None:
         """Broadcast output data to all registered callbacks."""
@@ -295,6 +401,9 @@ class TerminalSession:
         try:
             while self._is_active and self._pty_process is not None:
                 try:
+                    # Flow control: don't read while a consumer is behind
+                    await self._resume_event.wait()
+
                     # Use run_in_executor for non-blocking read
                     # winpty read() is blocking, so we need to run it in executor
                     data = await loop.run_in_executor(None, read_data)
@@ -303,7 +412,7 @@ class TerminalSession:
                         # winpty may return string, convert to bytes if needed
                         if isinstance(data, str):
                             data = data.encode("utf-8", errors="replace")
-                        self._broadcast_output(data)
+                        self._queue_output(data)
                     else:
                         # Check if process is still alive
                         if self._pty_process is None or not self._pty_process.isalive():
@@ -321,50 +430,31 @@ class TerminalSession:
         except asyncio.CancelledError:
             pass
         finally:
+            self._flush_output()
             if self._is_active:
                 self._is_active = False
                 logger.info(f"Terminal output stream ended for {self.project_name}")
 
     async def _read_output_unix(self) -> None:
-        """Read output from Unix PTY and broadcast to callbacks."""
+        """Read output from Unix PTY and broadcast to callbacks.
+
+        The master fd is registered with loop.add_reader() (see
+        _update_reading); this task only waits for end of output.
+        """
         if self._master_fd is None:
             return
 
-        loop = asyncio.get_running_loop()
+        self._reader_done = asyncio.get_running_loop().create_future()
 
         try:
-            while self._is_active and self._master_fd is not None:
-                try:
-                    # Use run_in_executor with select for non-blocking read
-                    def read_with_select():
-                        if self._master_fd is None:
-                            return b""
-                        try:
-                            # Wait up to 100ms for data
-                            readable, _, _ = select.select([self._master_fd], [], [], 0.1)
-                            if readable:
-                                return os.read(self._master_fd, 4096)
-                            return b""
-                        except (OSError, ValueError):
-                            return b""
-
-                    data = await loop.run_in_executor(None, read_with_select)
-
-                    if data:
-                        self._broadcast_output(data)
-                    elif not self._check_child_alive():
-                        break
-
-                except asyncio.CancelledError:
-                    raise
-                except Exception as e:
-                    if self._is_active:
-                        logger.warning(f"Unix PTY read error: {e}")
-                    break
-
+            self._update_reading()
+            await self._reader_done
         except asyncio.CancelledError:
             pass
         finally:
+            self._set_unix_reader(False)
+            self._reader_done = None
+            self._flush_output()
             if self._is_active:
                 self._is_active = False
                 logger.info(f"Terminal output stream ended for {self.project_name}")
@@ -377,17 +467,44 @@ class TerminalSession:
                 except Exception:
                     pass
 
-    def _check_child_alive(self) -> bool:
-        """Check if the Unix child process is still alive."""
-        if self._child_pid is None:
-            return False
+    def _update_reading(self) -> None:
+        """Start or stop reading PTY output according to the pause requests."""
+        paused = bool(self._paused_by)
+        if paused:
+            self._resume_event.clear()
+        else:
+            self._resume_event.set()
+        if not IS_WINDOWS:
+            self._set_unix_reader(not paused and self._reader_done is not None)
+
+    def _set_unix_reader(self, enabled: bool) -> None:
+        """Register or unregister the master fd with the event loop."""
+        if enabled == self._reading or self._master_fd is None:
+            return
+        loop = asyncio.get_running_loop()
+        if enabled:
+            loop.add_reader(self._master_fd, self._on_pty_readable)
+        else:
+            loop.remove_reader(self._master_fd)
+        self._reading = enabled
+
+    def _on_pty_readable(self) -> None:
+        """Event loop callback: read what the PTY has and queue it."""
         try:
-            # Use signal 0 to check if process exists without reaping it.
-            # This avoids race conditions with os.waitpid which can reap the process.
-            os.kill(self._child_pid, 0)
-            return True
-        except OSError:
-            return False
+            data = os.read(self._master_fd, PTY_READ_SIZE)  # type: ignore[arg-type]
+        except BlockingIOError:
+            return
+        except OSError as e:
+            # EIO once the child has exited and the slave side is closed
+            if self._is_active and e.errno != errno.EIO:
+                logger.warning(f"Unix PTY read error: {e}")
+            data = b""
+
+        if data:
+            self._queue_output(data)
+        elif self._reader_done is not None and not self._reader_done.done():
+            self._set_unix_reader(False)
+            self._reader_done.set_result(None)
 
     def write(self, data: bytes) -> None:
         """
@@ -0,0 +1,151 @@
+"""
+Stream Utilities
+================
+
+Chunked, batched line reading for subprocess output pipes.
+
+Reading a pipe one readline() at a time costs a syscall (and, from asyncio,
+a thread-pool hop) per line. These helpers read up to READ_CHUNK_SIZE bytes
+at a time and split them into lines incrementally, so a burst of output is
+handled as one batch of lines per read.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import IO, AsyncIterator, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Bytes requested per read from an output pipe
+READ_CHUNK_SIZE = 64 * 1024
+
+# Longer lines are split rather than buffered without bound
+MAX_LINE_BYTES = 1024 * 1024
+
+
+class LineSplitter:
+    """Incrementally splits a byte stream into decoded lines.
+
+    Bytes after the last newline are kept until the next feed() or until
+    flush() at end of stream. Trailing whitespace (including "\\r") is
+    stripped from each line, matching the previous readline().rstrip().
+    """
+
+    def __init__(self, max_line_bytes: int = MAX_LINE_BYTES):
+        self.max_line_bytes = max_line_bytes
+        self._partial = b""
+
+    def feed(self, data: bytes) -> list[str]:
+        """Add a chunk and return the complete lines it finishes."""
+        if self._partial:
+            data = self._partial + data
+        parts = data.split(b"\n")
+        self._partial = parts.pop()
+        if len(self._partial) > self.max_line_bytes:
+            parts.append(self._partial)
+            self._partial = b""
+        return [part.decode("utf-8", errors="replace").rstrip() for part in parts]
+
+    def flush(self) -> list[str]:
+        """Return the unterminated last line, if any."""
+        partial, self._partial = self._partial, b""
+        if not partial:
+            return []
+        return [partial.decode("utf-8", errors="replace").rstrip()]
+
+
+def iter_line_batches(pipe: IO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[list[str]]:
+    """Blocking: yield batches of lines from a pipe until EOF.
+
+    Reads the raw file descriptor, so the pipe's own (text or buffered)
+    layer must not be used by anyone else.
+    """
+    fd = pipe.fileno()
+    splitter = LineSplitter()
+    while True:
+        data = os.read(fd, chunk_size)
+        if not data:
+            break
+        lines = splitter.feed(data)
+        if lines:
+            yield lines
+    tail = splitter.flush()
+    if tail:
+        yield tail
+
+
+async def aiter_line_batches(pipe: IO, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[list[str]]:
+    """Yield batches of lines from a subprocess pipe until EOF.
+
+    On POSIX the pipe is registered with the event loop (connect_read_pipe),
+    so no thread is involved. Where the loop cannot watch the pipe (Windows
+    with anonymous pipes) each chunk is read in the default executor - one
+    hop per chunk instead of per line.
+
+    The pipe is closed when iteration ends. If that happens (cancellation)
+    while an executor read is still blocked, the reading thread closes the
+    pipe once its read returns: closing a buffered file from the loop thread
+    would block until the writer goes away.
+    """
+    loop = asyncio.get_running_loop()
+    splitter = LineSplitter()
+    close_lock = threading.Lock()
+    reading = False
+    close_requested = False
+
+    reader = asyncio.StreamReader(limit=chunk_size)
+    transport = None
+    try:
+        pipe.fileno()  # Streams without a descriptor go straight to the fallback
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), pipe
+        )
+    except (NotImplementedError, OSError, ValueError) as e:
+        logger.debug(f"Falling back to executor pipe reads: {e}")
+
+    try:
+        if transport is not None:
+            while True:
+                data = await reader.read(chunk_size)
+                if not data:
+                    break
+                lines = splitter.feed(data)
+                if lines:
+                    yield lines
+        else:
+            read = getattr(pipe, "read1", pipe.read)
+
+            def read_chunk() -> bytes:
+                nonlocal reading
+                try:
+                    return read(chunk_size)
+                finally:
+                    with close_lock:
+                        reading = False
+                        if close_requested:
+                            pipe.close()
+
+            while True:
+                with close_lock:
+                    reading = True
+                data = await loop.run_in_executor(None, read_chunk)
+                if not data:
+                    break
+                lines = splitter.feed(data)
+                if lines:
+                    yield lines
+
+        tail = splitter.flush()
+        if tail:
+            yield tail
+    finally:
+        if transport is not None:
+            transport.close()
+        else:
+            with close_lock:
+                if reading:
+                    close_requested = True
+                else:
+                    pipe.close()
@@ -10,9 +10,11 @@ import json
 import logging
 import re
 import sqlite3
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Set
+from typing import Awaitable, Callable, Set
 
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -21,23 +23,8 @@ from .services.dev_server_manager import get_devserver_manager
 from .services.process_manager import get_manager
 from .event_broadcaster import get_event_broadcaster
 
-# Lazy imports
-_count_passing_tests = None
-
 logger = logging.getLogger(__name__)
 
-# Pattern to extract feature ID from parallel orchestrator output
-# Both coding and testing agents now use the same [Feature #X] format
-FEATURE_ID_PATTERN = re.compile(r'\[Feature #(\d+)\]\s*(.*)')
-
-# Pattern to detect testing agent start message (includes feature ID)
-# Matches: "Started testing agent for feature #123 (PID xxx)"
-TESTING_AGENT_START_PATTERN = re.compile(r'Started testing agent for feature #(\d+)')
-
-# Pattern to detect testing agent completion
-# Matches: "Feature #123 testing completed" or "Feature #123 testing failed"
-TESTING_AGENT_COMPLETE_PATTERN = re.compile(r'Feature #(\d+) testing (completed|failed)')
-
 # Patterns for detecting agent activity and thoughts
 THOUGHT_PATTERNS = [
     # Claude's tool usage patterns (actual format: [Tool: name])
@@ -67,11 +54,108 @@ ORCHESTRATOR_PATTERNS = {
     'testing_spawn': re.compile(r'Started testing agent for feature #(\d+)'),
     'coding_complete': re.compile(r'Feature #(\d+) (completed|failed)'),
     'testing_complete': re.compile(r'Feature #(\d+) testing (completed|failed)'),
-    'all_complete': re.compile(r'All features complete'),
     'blocked_features': re.compile(r'(\d+) blocked by dependencies'),
+    'all_complete': re.compile(r'All features complete'),
 }
 
 
+def _first_match_pattern(names_and_patterns: list[tuple[str, re.Pattern]], flags: int = 0) -> re.Pattern:
+    """
+    Combine patterns into one regex that reports which of them matches first.
+
+    Each pattern becomes a lookahead alternative tried at position 0, so
+    ``combined.match(text).lastgroup`` names the first pattern in list order
+    that ``.search()`` would find in ``text`` - the same answer as trying the
+    patterns one by one, in a single call.
+    """
+    return re.compile(
+        '|'.join(f'(?=.*?(?P<{name}>{pattern.pattern}))' for name, pattern in names_and_patterns),
+        flags,
+    )
+
+
+# All orchestrator events in one regex, in the priority order of the
+# OrchestratorTracker.process_line() if/elif chain
+ORCHESTRATOR_EVENT_PATTERN = _first_match_pattern(list(ORCHESTRATOR_PATTERNS.items()))
+
+# All thought patterns in one regex (group "t<i>" is THOUGHT_PATTERNS[i])
+THOUGHT_PATTERN = _first_match_pattern(
+    [(f't{i}', pattern) for i, (pattern, _) in enumerate(THOUGHT_PATTERNS)],
+    re.I,
+)
+
+# Line shapes AgentTracker reacts to, all anchored at the start of the line:
+# - "Started coding agent for feature #X" / "Started testing agent for feature #X (PID xxx)"
+# - "Feature #X testing completed|failed" / "Feature #X completed|failed"
+# - "[Feature #X] content" - both coding and testing agents use this format
+AGENT_LINE_PATTERN = re.compile(
+    r'(?P<coding_start>Started coding agent for feature #(?P<coding_start_id>\d+))'
+    r'|(?P<testing_start>Started testing agent for feature #(?P<testing_start_id>\d+))'
+    r'|(?P<testing_complete>Feature #(?P<testing_complete_id>\d+) testing (?P<testing_result>completed|failed))'
+    r'|(?P<coding_complete>Feature #(?P<coding_complete_id>\d+)(?!.*testing)(?=.*(?:completed|failed)))'
+    r'|(?P<feature_output>\[Feature #(?P<feature_output_id>\d+)\]\s*(?P<content>.*))'
+)
+
+
+@dataclass
+class ParsedLine:
+    """One line of orchestrator output, classified once per project."""
+
+    line: str
+    # coding_start, testing_start, testing_complete, coding_complete or
+    # feature_output ("[Feature #X] ..." agent output), or None
+    agent_event: str | None = None
+    feature_id: int | None = None
+    # Text after the "[Feature #X]" prefix (feature_output only)
+    content: str = ''
+    # completed / failed (completion events only)
+    result: str | None = None
+    # Key of ORCHESTRATOR_PATTERNS and its match, or None
+    orchestrator_event: str | None = None
+    orchestrator_match: re.Match | None = None
+
+
+def parse_output_line(line: str, orchestrator: bool = True) -> ParsedLine:
+    """Classify an output line for both trackers with two regex calls.
+
+    With orchestrator=False the orchestrator patterns are skipped (used when
+    the orchestrator reports its state as typed events instead).
+    """
+    parsed = ParsedLine(line=line)
+
+    match = AGENT_LINE_PATTERN.match(line)
+    if match:
+        event = match.lastgroup
+        parsed.agent_event = event
+        parsed.feature_id = int(match.group(f'{event}_id'))
+        if event == 'feature_output':
+            parsed.content = match.group('content')
+        elif event == 'testing_complete':
+            parsed.result = match.group('testing_result')
+        elif event == 'coding_complete':
+            parsed.result = 'completed' if 'completed' in line else 'failed'
+
+    match = ORCHESTRATOR_EVENT_PATTERN.match(line) if orchestrator else None
+    if match:
+        event = match.lastgroup
+        parsed.orchestrator_event = event
+        parsed.orchestrator_match = ORCHESTRATOR_PATTERNS[event].match(match.group(event))
+
+    return parsed
+
+
+def classify_thought(content: str) -> tuple[str, str | None]:
+    """Return (state, thought) for agent output, per THOUGHT_PATTERNS."""
+    match = THOUGHT_PATTERN.match(content)
+    if not match:
+        return 'working', None
+    index = int(match.lastgroup[1:])
+    pattern, state = THOUGHT_PATTERNS[index]
+    thought_match = pattern.match(match.group(match.lastgroup))
+    thought = thought_match.group(1) if thought_match.lastindex else content[:100]
+    return state, thought
+
+
 class AgentTracker:
     """Tracks active agents and their states for multi-agent mode.
 
@@ -86,53 +170,34 @@ class AgentTracker:
         self._next_agent_index = 0
         self._lock = asyncio.Lock()
 
-    async def process_line(self, line: str) -> dict | None:
+    async def process_line(self, parsed: ParsedLine) -> dict | None:
         """
-        Process an output line and return an agent_update message if relevant.
+        Process a classified output line and return an agent_update message if relevant.
 
         Returns None if no update should be emitted.
         """
-        # Check for orchestrator status messages first
-        # These don't have [Feature #X] prefix
+        event = parsed.agent_event
+        if event is None:
+            return None
 
-        # Coding agent start: "Started coding agent for feature #X"
-        if line.startswith("Started coding agent for feature #"):
-            try:
-                feature_id = int(re.search(r'#(\d+)', line).group(1))
-                return await self._handle_agent_start(feature_id, line, agent_type="coding")
-            except (AttributeError, ValueError):
-                pass
+        feature_id = parsed.feature_id
 
-        # Testing agent start: "Started testing agent for feature #X (PID xxx)"
-        testing_start_match = TESTING_AGENT_START_PATTERN.match(line)
-        if testing_start_match:
-            feature_id = int(testing_start_match.group(1))
-            return await self._handle_agent_start(feature_id, line, agent_type="testing")
-
-        # Testing agent complete: "Feature #X testing completed/failed"
-        testing_complete_match = TESTING_AGENT_COMPLETE_PATTERN.match(line)
-        if testing_complete_match:
-            feature_id = int(testing_complete_match.group(1))
-            is_success = testing_complete_match.group(2) == "completed"
-            return await self._handle_agent_complete(feature_id, is_success, agent_type="testing")
-
-        # Coding agent complete: "Feature #X completed/failed" (without "testing" keyword)
-        if line.startswith("Feature #") and ("completed" in line or "failed" in line) and "testing" not in line:
-            try:
-                feature_id = int(re.search(r'#(\d+)', line).group(1))
-                is_success = "completed" in line
-                return await self._handle_agent_complete(feature_id, is_success, agent_type="coding")
-            except (AttributeError, ValueError):
-                pass
-
-        # Check for feature-specific output lines: [Feature #X] content
+        # Orchestrator status messages (no [Feature #X] prefix):
+        # "Started coding/testing agent for feature #X", "Feature #X [testing] completed/failed"
+        if event in ('coding_start', 'testing_start'):
+            # Try to extract feature name from line
+            name_match = re.search(r'#\d+:\s*(.+)$', parsed.line)
+            feature_name = name_match.group(1) if name_match else None
+            agent_type = "coding" if event == 'coding_start' else "testing"
+            return await self._handle_agent_start(feature_id, feature_name, agent_type=agent_type)
+        if event == 'testing_complete':
+            return await self._handle_agent_complete(feature_id, parsed.result == "completed", agent_type="testing")
+        if event == 'coding_complete':
+            return await self._handle_agent_complete(feature_id, parsed.result == "completed", agent_type="coding")
+
+        # Feature-specific output lines: [Feature #X] content
         # Both coding and testing agents use this format now
-        match = FEATURE_ID_PATTERN.match(line)
-        if not match:
-            return None
-
-        feature_id = int(match.group(1))
-        content = match.group(2)
+        content = parsed.content
 
         async with self._lock:
             # Check if either coding or testing agent exists for this feature
@@ -161,15 +226,7 @@ class AgentTracker:
             agent = self.active_agents[key]
 
             # Detect state and thought from content
-            state = 'working'
-            thought = None
-
-            for pattern, detected_state in THOUGHT_PATTERNS:
-                m = pattern.search(content)
-                if m:
-                    state = detected_state
-                    thought = m.group(1) if m.lastindex else content[:100]
-                    break
+            state, thought = classify_thought(content)
 
             # Only emit update if state changed or we have a new thought
             if state != agent['state'] or thought != agent['last_thought']:
@@ -191,6 +248,21 @@ class AgentTracker:
 
         return None
 
+    async def process_event(self, event: dict) -> dict | None:
+        """
+        Process a typed orchestrator event (see orchestrator_events) and
+        return an agent_update message for agent spawns and completions.
+        """
+        name = event.get('event')
+        feature_id = event.get('feature_id')
+        if feature_id is None or name not in ('agent_spawned', 'agent_completed'):
+            return None
+
+        agent_type = event.get('agent_type', 'coding')
+        if name == 'agent_spawned':
+            return await self._handle_agent_start(feature_id, event.get('feature_name'), agent_type=agent_type)
+        return await self._handle_agent_complete(feature_id, bool(event.get('success')), agent_type=agent_type)
+
     async def get_agent_info(self, feature_id: int, agent_type: str = "coding") -> tuple[int | None, str | None]:
         """Get agent index and name for a feature ID and agent type.
 
@@ -222,18 +294,19 @@ class AgentTracker:
             self.active_agents.clear()
             self._next_agent_index = 0
 
-    async def _handle_agent_start(self, feature_id: int, line: str, agent_type: str = "coding") -> dict | None:
+    async def _handle_agent_start(
+        self,
+        feature_id: int,
+        feature_name: str | None = None,
+        agent_type: str = "coding",
+    ) -> dict | None:
         """Handle agent start message from orchestrator."""
         async with self._lock:
             key = (feature_id, agent_type)  # Composite key for separate tracking
             agent_index = self._next_agent_index
             self._next_agent_index += 1
 
-            # Try to extract feature name from line
-            feature_name = f'Feature #{feature_id}'
-            name_match = re.search(r'#\d+:\s*(.+)$', line)
-            if name_match:
-                feature_name = name_match.group(1)
+            feature_name = feature_name or f'Feature #{feature_id}'
 
             self.active_agents[key] = {
                 'name': AGENT_MASCOTS[agent_index % len(AGENT_MASCOTS)],
@@ -304,8 +377,10 @@ class AgentTracker:
 class OrchestratorTracker:
     """Tracks orchestrator state for Mission Control observability.
 
-    Parses orchestrator stdout for key events and emits orchestrator_update
-    WebSocket messages showing what decisions the orchestrator is making.
+    Follows the orchestrator's typed events (process_event) or, when no event
+    channel is available, its stdout (process_line), and emits
+    orchestrator_update WebSocket messages showing what decisions the
+    orchestrator is making.
     """
 
     def __init__(self):
@@ -318,17 +393,24 @@ class OrchestratorTracker:
         self.recent_events: list[dict] = []
         self._lock = asyncio.Lock()
 
-    async def process_line(self, line: str) -> dict | None:
+    async def process_line(self, parsed: ParsedLine) -> dict | None:
         """
-        Process an output line and return an orchestrator_update message if relevant.
+        Process a classified output line and return an orchestrator_update message if relevant.
 
         Returns None if no update should be emitted.
         """
+        event = parsed.orchestrator_event
+        if event is None:
+            return None
+
+        line = parsed.line
+        match = parsed.orchestrator_match
+
         async with self._lock:
             update = None
 
             # Check for initializer start
-            if ORCHESTRATOR_PATTERNS['init_start'].search(line):
+            if event == 'init_start':
                 self.state = 'initializing'
                 update = self._create_update(
                     'init_start',
@@ -336,7 +418,7 @@ class OrchestratorTracker:
                 )
 
             # Check for initializer complete
-            elif ORCHESTRATOR_PATTERNS['init_complete'].search(line):
+            elif event == 'init_complete':
                 self.state = 'scheduling'
                 update = self._create_update(
                     'init_complete',
@@ -344,7 +426,7 @@ class OrchestratorTracker:
                 )
 
             # Check for capacity status
-            elif match := ORCHESTRATOR_PATTERNS['capacity_check'].search(line):
+            elif event == 'capacity_check':
                 self.ready_count = int(match.group(1))
                 slots = int(match.group(2))
                 self.state = 'scheduling' if self.ready_count > 0 else 'monitoring'
@@ -354,7 +436,7 @@ class OrchestratorTracker:
                 )
 
             # Check for at capacity
-            elif ORCHESTRATOR_PATTERNS['at_capacity'].search(line):
+            elif event == 'at_capacity':
                 self.state = 'monitoring'
                 update = self._create_update(
                     'at_capacity',
@@ -362,7 +444,7 @@ class OrchestratorTracker:
                 )
 
             # Check for feature start
-            elif match := ORCHESTRATOR_PATTERNS['feature_start'].search(line):
+            elif event == 'feature_start':
                 feature_id = int(match.group(1))
                 feature_name = match.group(2).strip()
                 self.state = 'spawning'
@@ -374,7 +456,7 @@ class OrchestratorTracker:
                 )
 
             # Check for coding agent spawn
-            elif match := ORCHESTRATOR_PATTERNS['coding_spawn'].search(line):
+            elif event == 'coding_spawn':
                 feature_id = int(match.group(1))
                 self.coding_agents += 1
                 self.state = 'spawning'
@@ -385,7 +467,7 @@ class OrchestratorTracker:
                 )
 
             # Check for testing agent spawn
-            elif match := ORCHESTRATOR_PATTERNS['testing_spawn'].search(line):
+            elif event == 'testing_spawn':
                 feature_id = int(match.group(1))
                 self.testing_agents += 1
                 self.state = 'spawning'
@@ -396,7 +478,7 @@ class OrchestratorTracker:
                 )
 
             # Check for coding agent complete
-            elif match := ORCHESTRATOR_PATTERNS['coding_complete'].search(line):
+            elif event == 'coding_complete':
                 # Only match if "testing" is not in the line
                 if 'testing' not in line.lower():
                     feature_id = int(match.group(1))
@@ -409,7 +491,7 @@ class OrchestratorTracker:
                     )
 
             # Check for testing agent complete
-            elif match := ORCHESTRATOR_PATTERNS['testing_complete'].search(line):
+            elif event == 'testing_complete':
                 feature_id = int(match.group(1))
                 self.testing_agents = max(0, self.testing_agents - 1)
                 self.state = 'monitoring'
@@ -420,11 +502,11 @@ class OrchestratorTracker:
                 )
 
             # Check for blocked features count
-            elif match := ORCHESTRATOR_PATTERNS['blocked_features'].search(line):
+            elif event == 'blocked_features':
                 self.blocked_count = int(match.group(1))
 
             # Check for all complete
-            elif ORCHESTRATOR_PATTERNS['all_complete'].search(line):
+            elif event == 'all_complete':
                 self.state = 'complete'
                 self.coding_agents = 0
                 self.testing_agents = 0
@@ -435,6 +517,94 @@ class OrchestratorTracker:
 
             return update
 
+    async def process_event(self, event: dict) -> dict | None:
+        """
+        Process a typed orchestrator event and return an orchestrator_update
+        message if relevant.
+
+        Agent counts are taken from the event rather than incremented, so they
+        cannot drift if a message is missed.
+        """
+        name = event.get('event')
+        feature_id = event.get('feature_id')
+
+        async with self._lock:
+            for field, attr in (
+                ('coding_agents', 'coding_agents'),
+                ('testing_agents', 'testing_agents'),
+                ('max_concurrency', 'max_concurrency'),
+            ):
+                if isinstance(event.get(field), int):
+                    setattr(self, attr, event[field])
+
+            if name == 'init_start':
+                self.state = 'initializing'
+                return self._create_update('init_start', 'Initializing project features...')
+
+            if name == 'init_complete':
+                self.state = 'scheduling'
+                return self._create_update(
+                    'init_complete',
+                    'Initialization complete, preparing to schedule features'
+                )
+
+            if name == 'scheduling':
+                self.ready_count = event.get('ready', self.ready_count)
+                self.blocked_count = event.get('blocked', self.blocked_count)
+                return None
+
+            if name == 'capacity':
+                self.ready_count = event.get('ready', 0)
+                slots = event.get('slots', 0)
+                self.state = 'scheduling' if self.ready_count > 0 else 'monitoring'
+                return self._create_update(
+                    'capacity_check',
+                    f'{self.ready_count} features ready, {slots} slots available'
+                )
+
+            if name == 'at_capacity':
+                self.state = 'monitoring'
+                return self._create_update(
+                    'at_capacity',
+                    'At maximum capacity, monitoring active agents'
+                )
+
+            if name == 'feature_start' and feature_id is not None:
+                feature_name = event.get('feature_name') or f'Feature #{feature_id}'
+                self.state = 'spawning'
+                return self._create_update(
+                    'feature_start',
+                    f'Preparing Feature #{feature_id}: {feature_name}',
+                    feature_id=feature_id,
+                    feature_name=feature_name
+                )
+
+            if name == 'agent_spawned' and feature_id is not None:
+                agent_type = event.get('agent_type', 'coding')
+                self.state = 'spawning'
+                return self._create_update(
+                    f'{agent_type}_spawn',
+                    f'Spawned {agent_type} agent for Feature #{feature_id}',
+                    feature_id=feature_id
+                )
+
+            if name == 'agent_completed' and feature_id is not None:
+                agent_type = event.get('agent_type', 'coding')
+                self.state = 'monitoring'
+                return self._create_update(
+                    f'{agent_type}_complete',
+                    f'{agent_type.capitalize()} agent finished Feature #{feature_id}',
+                    feature_id=feature_id
+                )
+
+            if name == 'all_complete':
+                self.state = 'complete'
+                self.coding_agents = 0
+                self.testing_agents = 0
+                return self._create_update('all_complete', 'All features complete!')
+
+            return None
+
     def _create_update(
         self,
         event_type: str,
@@ -500,29 +670,380 @@ def _get_project_path(project_name: str) -> Path:
     return get_project_path(project_name)
 
 
-def _get_count_passing_tests():
-    """Lazy import of count_passing_tests."""
-    global _count_passing_tests
-    if _count_passing_tests is None:
-        import sys
-        root = Path(__file__).parent.parent
-        if str(root) not in sys.path:
-            sys.path.insert(0, str(root))
-        from progress import count_passing_tests
-        _count_passing_tests = count_passing_tests
-    return _count_passing_tests
+# Seconds between PRAGMA data_version checks in a project's progress poller
+PROGRESS_POLL_INTERVAL = 1.0
+
+
+def _progress_message(passing: int, in_progress: int, total: int) -> dict:
+    """Build a progress WebSocket message from aggregate counts."""
+    percentage = (passing / total * 100) if total > 0 else 0
+    return {
+        "type": "progress",
+        "passing": passing,
+        "in_progress": in_progress,
+        "total": total,
+        "percentage": round(percentage, 1),
+    }
+
+
+class ProjectProgressPoller:
+    """
+    Polls one project's features.db on behalf of all of its WebSocket clients.
+
+    A single persistent SQLite connection checks ``PRAGMA data_version`` every
+    PROGRESS_POLL_INTERVAL seconds; the value only moves when another
+    connection (an agent's MCP server, the features router) commits, so an
+    idle project costs one pragma per second regardless of how many tabs are
+    open. When it moves, the feature rows are read once and only the
+    differences are broadcast: a progress message when the counts changed and
+    one feature_update per feature whose passes flag flipped or that is new
+    (Feature #152).
+    """
+
+    def __init__(
+        self,
+        project_name: str,
+        project_dir: Path,
+        broadcast: Callable[[dict], Awaitable[None]],
+    ):
+        self.project_name = project_name
+        self.project_dir = project_dir
+        self._broadcast = broadcast
+        self._conn: sqlite3.Connection | None = None
+        self._data_version: int | None = None
+        # feature_id -> (passes, in_progress)
+        self._features: dict[int, tuple[bool, bool]] | None = None
+        self._task: asyncio.Task | None = None
+        self.progress: dict = _progress_message(0, 0, 0)
+
+    async def start(self) -> None:
+        """Take the initial snapshot, then poll in a background task."""
+        await self.poll_once()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the poll task and close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._close()
+
+    async def poll_once(self) -> list[dict]:
+        """
+        Check for database changes and return the messages they produce.
+
+        The first call only records the baseline snapshot (and progress), so
+        it never yields feature_update messages.
+        """
+        rows = await asyncio.to_thread(self._read_if_changed)
+        if rows is None:
+            return []
+
+        features = {row[0]: (bool(row[1]), bool(row[2])) for row in rows}
+        previous, self._features = self._features, features
+        messages: list[dict] = []
+
+        passing = sum(1 for passes, _ in features.values() if passes)
+        in_progress = sum(1 for _, active in features.values() if active)
+        progress = _progress_message(passing, in_progress, len(features))
+        if progress != self.progress:
+            self.progress = progress
+            messages.append(progress)
+
+        if previous is not None:
+            for feature_id, (passes, _) in features.items():
+                old = previous.get(feature_id)
+                if old is None or old[0] != passes:
+                    messages.append({
+                        "type": "feature_update",
+                        "feature_id": feature_id,
+                        "passes": passes,
+                    })
+        return messages
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(PROGRESS_POLL_INTERVAL)
+            try:
+                for message in await self.poll_once():
+                    await self._broadcast(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Progress polling error for {self.project_name}: {e}")
+                self._close()
+
+    def _read_if_changed(self) -> list[tuple] | None:
+        """Return all feature rows if the database changed, else None (worker thread)."""
+        db_file = self.project_dir / "features.db"
+        if self._conn is None:
+            if not db_file.exists():
+                return None
+            self._conn = sqlite3.connect(db_file, timeout=2, check_same_thread=False)
+            self._data_version = None
+
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version and self._features is not None:
+            return None
+
+        try:
+            rows = self._conn.execute(
+                "SELECT id, passes, in_progress FROM features"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # Legacy databases without in_progress (or before the table exists)
+            try:
+                rows = [
+                    (feature_id, passes, False)
+                    for feature_id, passes in self._conn.execute(
+                        "SELECT id, passes FROM features"
+                    )
+                ]
+            except sqlite3.OperationalError:
+                rows = []
+        self._data_version = version
+        return rows
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._data_version = None
+
+
+# Seconds of agent output coalesced into one WebSocket "batch" frame
+FRAME_INTERVAL = 0.05
+
+# Frames a client may have waiting before its oldest log lines are dropped
+MAX_PENDING_FRAMES = 40
+
+
+class ClientFrameQueue:
+    """
+    Outbox for one WebSocket client of a ProjectOutputStream.
+
+    Frames are sent by a dedicated task, so a slow client never holds up the
+    stream or the other clients. When more than MAX_PENDING_FRAMES are
+    waiting, the oldest frame's log lines are dropped (its agent_update,
+    orchestrator_update and agent_status messages are carried into the next
+    frame so the client's view of agent state stays correct) and the client
+    is told how many lines it missed.
+    """
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self._frames: deque[list[dict]] = deque()
+        self._ready = asyncio.Event()
+        self._dropped_lines = 0
+        self._closed = False
+        self._task = asyncio.create_task(self._send_loop())
+
+    @property
+    def pending(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._frames)
+
+    def put(self, messages: list[dict]) -> None:
+        """Queue a frame without waiting for the client."""
+        if self._closed:
+            return
+        if len(self._frames) >= MAX_PENDING_FRAMES:
+            oldest = self._frames.popleft()
+            kept = [m for m in oldest if m['type'] != 'log']
+            self._dropped_lines += len(oldest) - len(kept)
+            if kept:
+                if self._frames:
+                    self._frames[0] = kept + self._frames[0]
+                else:
+                    messages = kept + messages
+        self._frames.append(messages)
+        self._ready.set()
+
+    async def close(self) -> None:
+        """Stop sending; frames still queued are discarded."""
+        self._closed = True
+        self._frames.clear()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _send_loop(self) -> None:
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            while self._frames:
+                messages = self._frames.popleft()
+                if self._dropped_lines:
+                    messages = [{
+                        'type': 'log',
+                        'line': f'[{self._dropped_lines} log lines skipped: connection too slow]',
+                        'timestamp': datetime.now().isoformat(),
+                    }] + messages
+                    self._dropped_lines = 0
+                try:
+                    await self.websocket.send_json({'type': 'batch', 'messages': messages})
+                except Exception:
+                    # Connection closed; the endpoint unsubscribes it
+                    self._closed = True
+                    self._frames.clear()
+                    return
+
+
+class ProjectOutputStream:
+    """
+    Parses a project's orchestrator output once for all of its WebSocket clients.
+
+    Registered as a single output/status/event callback on the project's
+    AgentProcessManager. Agent lifecycle and scheduling state come from the
+    orchestrator's typed events when the manager has an event channel
+    (structured_events); otherwise each line is classified once
+    (parse_output_line) for both trackers. Either way the resulting log, agent_update, orchestrator_update and agent_status
+    messages are coalesced into FRAME_INTERVAL frames and handed to every
+    subscriber's ClientFrameQueue.
+    """
+
+    def __init__(self, agent_manager):
+        self.agent_manager = agent_manager
+        self.agent_tracker = AgentTracker()
+        self.orchestrator_tracker = OrchestratorTracker()
+        self._clients: dict[WebSocket, ClientFrameQueue] = {}
+        self._pending: list[dict] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def start(self) -> None:
+        """Start receiving the project's output and status changes."""
+        self.agent_manager.add_output_callback(self.on_output)
+        self.agent_manager.add_status_callback(self.on_status_change)
+        self.agent_manager.add_event_callback(self.on_event)
+
+    async def stop(self) -> None:
+        """Unregister from the agent manager and close all client queues."""
+        self.agent_manager.remove_output_callback(self.on_output)
+        self.agent_manager.remove_status_callback(self.on_status_change)
+        self.agent_manager.remove_event_callback(self.on_event)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = []
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            await client.close()
+
+    def subscribe(self, websocket: WebSocket) -> None:
+        """Start sending frames to a client."""
+        if websocket not in self._clients:
+            self._clients[websocket] = ClientFrameQueue(websocket)
+
+    async def unsubscribe(self, websocket: WebSocket) -> None:
+        """Stop sending frames to a client."""
+        client = self._clients.pop(websocket, None)
+        if client is not None:
+            await client.close()
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of subscribed clients."""
+        return len(self._clients)
+
+    async def on_output(self, line: str) -> None:
+        """Classify an output line and queue the messages it produces."""
+        structured = self.agent_manager.structured_events
+        parsed = parse_output_line(line, orchestrator=not structured)
+
+        # Send the raw log line with optional feature/agent attribution
+        log_msg = {
+            "type": "log",
+            "line": line,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if parsed.agent_event == 'feature_output':
+            log_msg["featureId"] = parsed.feature_id
+            agent_index, _ = await self.agent_tracker.get_agent_info(parsed.feature_id)
+            if agent_index is not None:
+                log_msg["agentIndex"] = agent_index
+        self._queue(log_msg)
+
+        # With typed events only "[Feature #X]" lines still matter here;
+        # spawn/complete lines are left to on_event
+        if structured and parsed.agent_event != 'feature_output':
+            return
+
+        # Agent activity (parallel mode) -> agent_update
+        agent_update = await self.agent_tracker.process_line(parsed)
+        if agent_update:
+            self._queue(agent_update)
+
+        # Orchestrator events -> orchestrator_update
+        orch_update = await self.orchestrator_tracker.process_line(parsed)
+        if orch_update:
+            self._queue(orch_update)
+
+    async def on_event(self, event: dict) -> None:
+        """Queue the agent_update/orchestrator_update messages for a typed event."""
+        agent_update = await self.agent_tracker.process_event(event)
+        if agent_update:
+            self._queue(agent_update)
+
+        orch_update = await self.orchestrator_tracker.process_event(event)
+        if orch_update:
+            self._queue(orch_update)
+
+    async def on_status_change(self, status: str) -> None:
+        """Queue an agent_status message, resetting trackers when the agent stops."""
+        self._queue({
+            "type": "agent_status",
+            "status": status,
+        })
+        # Reset trackers when agent stops OR crashes to prevent ghost agents on restart
+        if status in ("stopped", "crashed"):
+            await self.agent_tracker.reset()
+            await self.orchestrator_tracker.reset()
+
+    def flush(self) -> None:
+        """Send the pending messages to all subscribers as one frame."""
+        self._flush_handle = None
+        if not self._pending:
+            return
+        frame, self._pending = self._pending, []
+        for client in self._clients.values():
+            client.put(frame)
+
+    def _queue(self, message: dict) -> None:
+        self._pending.append(message)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(FRAME_INTERVAL, self.flush)
 
 
 class ConnectionManager:
-    """Manages WebSocket connections per project."""
+    """Manages WebSocket connections per project.
+
+    Each project with at least one connection has a ProjectProgressPoller
+    and a ProjectOutputStream whose messages are fanned out to all of that
+    project's connections.
+    """
 
     def __init__(self):
         # project_name -> set of WebSocket connections
         self.active_connections: dict[str, Set[WebSocket]] = {}
+        # project_name -> shared progress poller
+        self.pollers: dict[str, ProjectProgressPoller] = {}
+        # project_name -> shared output parser / frame fan-out
+        self.output_streams: dict[str, ProjectOutputStream] = {}
         self._lock = asyncio.Lock()
 
-    async def connect(self, websocket: WebSocket, project_name: str):
-        """Accept a WebSocket connection for a project."""
+    async def connect(self, websocket: WebSocket, project_name: str, project_dir: Path | None = None):
+        """Accept a WebSocket connection for a project.
+
+        When project_dir is given, the project's progress poller and output
+        stream are started if this is its first subscriber, and the
+        connection is subscribed to the output stream.
+        """
         await websocket.accept()
 
         async with self._lock:
@@ -530,13 +1051,49 @@ class ConnectionManager:
                 self.active_connections[project_name] = set()
             self.active_connections[project_name].add(websocket)
 
+            if project_dir is not None and project_name not in self.pollers:
+                poller = ProjectProgressPoller(
+                    project_name,
+                    project_dir,
+                    lambda message: self.broadcast_to_project(project_name, message),
+                )
+                await poller.start()
+                self.pollers[project_name] = poller
+
+            if project_dir is not None:
+                stream = self.output_streams.get(project_name)
+                if stream is None:
+                    stream = ProjectOutputStream(get_manager(project_name, project_dir, ROOT_DIR))
+                    stream.start()
+                    self.output_streams[project_name] = stream
+                stream.subscribe(websocket)
+
     async def disconnect(self, websocket: WebSocket, project_name: str):
-        """Remove a WebSocket connection."""
+        """Remove a WebSocket connection, stopping the project's poller and
+        output stream after the last one."""
+        poller = None
+        stream = None
         async with self._lock:
-            if project_name in self.active_connections:
-                self.active_connections[project_name].discard(websocket)
-                if not self.active_connections[project_name]:
+            connections = self.active_connections.get(project_name)
+            if connections is not None:
+                connections.discard(websocket)
+                if not connections:
                     del self.active_connections[project_name]
+                    poller = self.pollers.pop(project_name, None)
+                    stream = self.output_streams.pop(project_name, None)
+            shared_stream = self.output_streams.get(project_name)
+
+        if shared_stream is not None:
+            await shared_stream.unsubscribe(websocket)
+        if poller is not None:
+            await poller.stop()
+        if stream is not None:
+            await stream.stop()
+
+    def get_progress(self, project_name: str) -> dict:
+        """Latest progress message for a project (zero counts if not polled)."""
+        poller = self.pollers.get(project_name)
+        return dict(poller.progress) if poller else _progress_message(0, 0, 0)
 
     async def broadcast_to_project(self, project_name: str, message: dict):
         """Broadcast a message to all connections for a project."""
@@ -575,86 +1132,6 @@ def validate_project_name(name: str) -> bool:
     return bool(re.match(r'^[a-zA-Z0-9_-]{1,50}$', name))
 
 
-def _get_feature_statuses(project_dir: Path) -> dict[int, bool]:
-    """
-    Get a snapshot of all feature pass/fail statuses from the database.
-
-    Returns a dict mapping feature_id -> passes (bool).
-    Uses direct SQLite access for performance (no ORM overhead).
-    """
-    db_file = project_dir / "features.db"
-    if not db_file.exists():
-        return {}
-
-    try:
-        conn = sqlite3.connect(db_file, timeout=2)
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, passes FROM features")
-        statuses = {row[0]: bool(row[1]) for row in cursor.fetchall()}
-        conn.close()
-        return statuses
-    except Exception:
-        return {}
-
-
-async def poll_progress(websocket: WebSocket, project_name: str, project_dir: Path):
-    """Poll database for progress changes and send updates.
-
-    Also tracks individual feature status changes and emits feature_update
-    WebSocket messages when a feature's passes status changes. This ensures
-    the UI refreshes within ~1 second of a feature status change (Feature #152).
-    """
-    count_passing_tests = _get_count_passing_tests()
-    last_passing = -1
-    last_in_progress = -1
-    last_total = -1
-    # Track per-feature statuses for feature_update messages (Feature #152)
-    last_feature_statuses: dict[int, bool] = {}
-
-    while True:
-        try:
-            passing, in_progress, total = count_passing_tests(project_dir)
-
-            # Only send progress if changed
-            if passing != last_passing or in_progress != last_in_progress or total != last_total:
-                last_passing = passing
-                last_in_progress = in_progress
-                last_total = total
-                percentage = (passing / total * 100) if total > 0 else 0
-
-                await websocket.send_json({
-                    "type": "progress",
-                    "passing": passing,
-                    "in_progress": in_progress,
-                    "total": total,
-                    "percentage": round(percentage, 1),
-                })
-
-            # Feature #152: Detect individual feature status changes and emit
-            # feature_update messages so the UI can invalidate React Query caches
-            # and refresh within ~1 second without waiting for the 5s polling fallback.
-            current_statuses = _get_feature_statuses(project_dir)
-            if last_feature_statuses:
-                for feature_id, passes in current_statuses.items():
-                    old_passes = last_feature_statuses.get(feature_id)
-                    # Emit feature_update when status changes (pass/fail toggle)
-                    # or when a new feature appears
-                    if old_passes is None or old_passes != passes:
-                        await websocket.send_json({
-                            "type": "feature_update",
-                            "feature_id": feature_id,
-                            "passes": passes,
-                        })
-            last_feature_statuses = current_statuses
-
-            await asyncio.sleep(1)  # Poll every 1 second for sub-second UI updates
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            logger.warning(f"Progress polling error: {e}")
-            break
-
-
 async def project_websocket(websocket: WebSocket, project_name: str):
     """
     WebSocket endpoint for project updates.
@@ -663,6 +1140,10 @@ async def project_websocket(websocket: WebSocket, project_name: str):
     - Progress updates (passing/total counts)
     - Agent status changes
     - Agent stdout/stderr lines
+    - agent_update / orchestrator_update messages
+
+    Agent output and status changes arrive in "batch" frames of up to
+    FRAME_INTERVAL seconds of messages.
     """
     if not validate_project_name(project_name):
         await websocket.close(code=4000, reason="Invalid project name")
@@ -677,72 +1158,12 @@ async def project_websocket(websocket: WebSocket, project_name: str):
         await websocket.close(code=4004, reason="Project directory not found")
         return
 
-    await manager.connect(websocket, project_name)
+    await manager.connect(websocket, project_name, project_dir)
 
-    # Get agent manager and register callbacks
+    # Agent output, agent_update and orchestrator_update messages reach this
+    # connection as batched frames from the project's shared output stream
     agent_manager = get_manager(project_name, project_dir, ROOT_DIR)
 
-    # Create agent tracker for multi-agent mode
-    agent_tracker = AgentTracker()
-
-    # Create orchestrator tracker for observability
-    orchestrator_tracker = OrchestratorTracker()
-
-    async def on_output(line: str):
-        """Handle agent output - broadcast to this WebSocket."""
-        try:
-            # Extract feature ID from line if present
-            feature_id = None
-            agent_index = None
-            match = FEATURE_ID_PATTERN.match(line)
-            if match:
-                feature_id = int(match.group(1))
-                agent_index, _ = await agent_tracker.get_agent_info(feature_id)
-
-            # Send the raw log line with optional feature/agent attribution
-            log_msg = {
-                "type": "log",
-                "line": line,
-                "timestamp": datetime.now().isoformat(),
-            }
-            if feature_id is not None:
-                log_msg["featureId"] = feature_id
-            if agent_index is not None:
-                log_msg["agentIndex"] = agent_index
-
-            await websocket.send_json(log_msg)
-
-            # Check if this line indicates agent activity (parallel mode)
-            # and emit agent_update messages if so
-            agent_update = await agent_tracker.process_line(line)
-            if agent_update:
-                await websocket.send_json(agent_update)
-
-            # Also check for orchestrator events and emit orchestrator_update messages
-            orch_update = await orchestrator_tracker.process_line(line)
-            if orch_update:
-                await websocket.send_json(orch_update)
-        except Exception:
-            pass  # Connection may be closed
-
-    async def on_status_change(status: str):
-        """Handle status change - broadcast to this WebSocket."""
-        try:
-            await websocket.send_json({
-                "type": "agent_status",
-                "status": status,
-            })
-            # Reset trackers when agent stops OR crashes to prevent ghost agents on restart
-            if status in ("stopped", "crashed"):
-                await agent_tracker.reset()
-                await orchestrator_tracker.reset()
-        except Exception:
-            pass  # Connection may be closed
-
-    # Register callbacks
-    agent_manager.add_output_callback(on_output)
-    agent_manager.add_status_callback(on_status_change)
-
     # Get dev server manager and register callbacks
     devserver_manager = get_devserver_manager(project_name, project_dir)
 
@@ -784,9 +1205,6 @@ async def project_websocket(websocket: WebSocket, project_name: str):
 
     event_broadcaster.set_broadcast_callback(broadcast_event_to_websocket)
 
-    # Start progress polling task
-    poll_task = asyncio.create_task(poll_progress(websocket, project_name, project_dir))
-
     try:
         # Send initial agent status
         await websocket.send_json({
@@ -801,17 +1219,8 @@ async def project_websocket(websocket: WebSocket, project_name: str):
             "url": devserver_manager.detected_url,
         })
 
-        # Send initial progress
-        count_passing_tests = _get_count_passing_tests()
-        passing, in_progress, total = count_passing_tests(project_dir)
-        percentage = (passing / total * 100) if total > 0 else 0
-        await websocket.send_json({
-            "type": "progress",
-            "passing": passing,
-            "in_progress": in_progress,
-            "total": total,
-            "percentage": round(percentage, 1),
-        })
+        # Send initial progress from the project's shared poller
+        await websocket.send_json(manager.get_progress(project_name))
 
         # Keep connection alive and handle incoming messages
         while True:
@@ -833,17 +1242,6 @@ async def project_websocket(websocket: WebSocket, project_name: str):
                 break
 
     finally:
-        # Clean up
-        poll_task.cancel()
-        try:
-            await poll_task
-        except asyncio.CancelledError:
-            pass
-
-        # Unregister agent callbacks
-        agent_manager.remove_output_callback(on_output)
-        agent_manager.remove_status_callback(on_status_change)
-
         # Unregister dev server callbacks
         devserver_manager.remove_output_callback(on_dev_output)
         devserver_manager.remove_status_callback(on_dev_status_change)
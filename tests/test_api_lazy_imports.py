@@ -0,0 +1,102 @@
+"""
+Tests for lazy attribute loading in the api package.
+
+Verifies:
+1. Every public name in api.__all__ still resolves
+2. Aliased re-exports resolve to the aliased object
+3. Unknown names raise AttributeError
+4. Importing api.database does not import dspy or unrelated submodules
+5. Import-time budget: api.* modules imported by "import api.database"
+   stay under a fixed self-time threshold (python -X importtime)
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import api
+
+project_root = Path(__file__).parent.parent
+
+# Summed self time (microseconds) of api.* modules when importing api.database.
+# Third-party imports (sqlalchemy) are excluded so the budget tracks our code.
+API_DATABASE_IMPORT_BUDGET_US = 250_000
+
+# Modules that must never be pulled in by importing api.database
+HEAVY_MODULES = ("dspy", "litellm", "anthropic", "claude_agent_sdk", "api.spec_builder", "api.dspy_signatures")
+
+
+def _run_python(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+class TestPublicNames:
+    """The lazy package exposes the same names as before."""
+
+    def test_all_names_resolve(self):
+        for name in api.__all__:
+            getattr(api, name)
+
+    def test_all_names_are_exported(self):
+        missing = [name for name in api.__all__ if name not in api._LAZY_EXPORTS]
+        assert missing == []
+
+    def test_resolves_to_defining_module_object(self):
+        from api.database import Feature
+        assert api.Feature is Feature
+
+    def test_aliased_export(self):
+        from api.tool_policy import ToolDefinition as PolicyToolDefinition
+        from api.tool_provider import ToolDefinition
+        assert api.ProviderToolDefinition is ToolDefinition
+        assert api.ToolDefinition is PolicyToolDefinition
+
+    def test_from_import(self):
+        from api import HarnessKernel, create_database  # noqa: F401
+
+    def test_unknown_name_raises_attribute_error(self):
+        with pytest.raises(AttributeError):
+            api.definitely_not_exported
+
+    def test_dir_lists_lazy_names(self):
+        assert "HarnessKernel" in dir(api)
+
+
+class TestImportCost:
+    """Importing api.database stays cheap."""
+
+    def test_database_import_skips_heavy_modules(self):
+        code = (
+            "import sys, api.database; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        result = _run_python(code)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == ""
+
+    def test_database_import_time_budget(self):
+        result = _run_python("import api.database", "-X", "importtime")
+        assert result.returncode == 0, result.stderr
+
+        self_time_us = 0
+        api_modules = []
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+            if name == "api" or name.startswith("api."):
+                self_time_us += int(self_us)
+                api_modules.append(name)
+
+        assert sorted(api_modules) == ["api", "api.database"]
+        assert self_time_us < API_DATABASE_IMPORT_BUDGET_US, (
+            f"api.* import self time {self_time_us / 1000:.1f} ms exceeds "
+            f"{API_DATABASE_IMPORT_BUDGET_US / 1000:.0f} ms budget"
+        )
@@ -0,0 +1,170 @@
+"""
+Tests for HTTP caching and range support on GET /api/artifacts/{id}/content.
+
+Verifies:
+1. The ETag is the artifact content_hash
+2. If-None-Match returns 304 without touching the blob file
+3. Range requests on raw blob files return 206 with the requested bytes
+4. Range requests on compressed objects return the decoded byte range
+5. If-Range with a stale validator returns the full content
+6. Unsatisfiable ranges return 416
+7. Compressed objects are passed through with Content-Encoding when accepted
+"""
+import hashlib
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.artifact_storage import write_object
+from api.database import get_db
+from server.routers.artifacts import router
+
+COMPRESSIBLE = b"".join(b"line %06d of a long test log\n" % i for i in range(20_000))
+INCOMPRESSIBLE = os.urandom(50_000)
+
+
+def _artifact(project_dir: Path, content: bytes):
+    artifact = MagicMock()
+    artifact.id = "artifact-1"
+    artifact.artifact_type = "log"
+    artifact.path = "output.log"
+    artifact.content_inline = None
+    artifact.content_ref = write_object(project_dir, content)
+    artifact.content_hash = hashlib.sha256(content).hexdigest()
+    artifact.size_bytes = len(content)
+    return artifact
+
+
+@pytest.fixture
+def client_for(tmp_path):
+    """Return a factory: content -> (TestClient, artifact), with the route patched to serve it."""
+    patches = []
+
+    def _make(content: bytes):
+        artifact = _artifact(tmp_path, content)
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: MagicMock()
+        for p in (
+            patch("server.routers.artifacts.get_artifact", return_value=artifact),
+            patch("server.routers.artifacts.ROOT_DIR", tmp_path),
+        ):
+            p.start()
+            patches.append(p)
+        return TestClient(app), artifact
+
+    yield _make
+    for p in patches:
+        p.stop()
+
+
+URL = "/api/artifacts/artifact-1/content"
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+class TestETag:
+    """Conditional GETs keyed on content_hash."""
+
+    def test_etag_is_content_hash(self, client_for):
+        client, artifact = client_for(INCOMPRESSIBLE)
+        response = client.get(URL)
+        assert response.headers["etag"] == f'"{artifact.content_hash}"'
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_if_none_match_returns_304_without_disk_access(self, client_for, tmp_path):
+        client, artifact = client_for(INCOMPRESSIBLE)
+        (tmp_path / artifact.content_ref).unlink()
+
+        response = client.get(URL, headers={"If-None-Match": f'"{artifact.content_hash}"'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_weak_and_listed_etags_match(self, client_for):
+        client, artifact = client_for(INCOMPRESSIBLE)
+        header = f'"other", W/"{artifact.content_hash}"'
+        assert client.get(URL, headers={"If-None-Match": header}).status_code == 304
+
+    def test_encoded_etag_matches(self, client_for):
+        client, artifact = client_for(COMPRESSIBLE)
+        etag = client.get(URL).headers["etag"]
+        assert etag == f'"{artifact.content_hash}.deflate"'
+        assert client.get(URL, headers={"If-None-Match": etag}).status_code == 304
+
+    def test_mismatch_returns_content(self, client_for):
+        client, _ = client_for(INCOMPRESSIBLE)
+        response = client.get(URL, headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == INCOMPRESSIBLE
+
+
+class TestRange:
+    """Byte ranges on raw and compressed content."""
+
+    def test_raw_file_range(self, client_for):
+        client, _ = client_for(INCOMPRESSIBLE)
+        response = client.get(URL, headers={"Range": "bytes=100-199"})
+        assert response.status_code == 206
+        assert response.content == INCOMPRESSIBLE[100:200]
+        assert response.headers["content-range"] == f"bytes 100-199/{len(INCOMPRESSIBLE)}"
+
+    @pytest.mark.parametrize("spec,expected", [
+        ("bytes=100000-100099", slice(100000, 100100)),
+        ("bytes=-50", slice(-50, None)),
+        ("bytes=600000-", slice(600000, None)),
+    ])
+    def test_compressed_object_range(self, client_for, spec, expected):
+        client, _ = client_for(COMPRESSIBLE)
+        response = client.get(URL, headers={"Range": spec})
+        assert response.status_code == 206
+        assert response.content == COMPRESSIBLE[expected]
+        assert response.headers["content-length"] == str(len(COMPRESSIBLE[expected]))
+
+    def test_if_range_mismatch_sends_full_content(self, client_for):
+        client, _ = client_for(COMPRESSIBLE)
+        response = client.get(URL, headers={**IDENTITY, "Range": "bytes=0-9", "If-Range": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == COMPRESSIBLE
+
+    def test_raw_if_range_uses_content_hash(self, client_for):
+        client, artifact = client_for(INCOMPRESSIBLE)
+        response = client.get(
+            URL, headers={"Range": "bytes=0-9", "If-Range": f'"{artifact.content_hash}"'}
+        )
+        assert response.status_code == 206
+        assert response.content == INCOMPRESSIBLE[:10]
+
+    def test_unsatisfiable_range(self, client_for):
+        client, _ = client_for(COMPRESSIBLE)
+        response = client.get(URL, headers={"Range": f"bytes={len(COMPRESSIBLE)}-"})
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(COMPRESSIBLE)}"
+
+
+class TestContentEncoding:
+    """Compressed objects are served as stored when the client can decode them."""
+
+    def test_passthrough_when_accepted(self, client_for, tmp_path):
+        client, artifact = client_for(COMPRESSIBLE)
+        response = client.get(URL, headers={"Accept-Encoding": "deflate"})
+
+        assert response.headers["content-encoding"] == "deflate"
+        assert response.headers["content-length"] == str((tmp_path / artifact.content_ref).stat().st_size)
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.content == COMPRESSIBLE  # decoded by the client
+
+    def test_decoded_when_not_accepted(self, client_for):
+        client, _ = client_for(COMPRESSIBLE)
+        response = client.get(URL, headers={"Accept-Encoding": "gzip, deflate;q=0"})
+
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == str(len(COMPRESSIBLE))
+        assert response.content == COMPRESSIBLE
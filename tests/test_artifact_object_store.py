@@ -0,0 +1,280 @@
+"""
+Tests for the project-wide content-addressed artifact object store.
+
+Verifies:
+1. Large content is stored once per project under objects/ab/cdef...
+2. Compressible content is compressed; incompressible content is stored raw
+3. read_blob() / iter_blob_chunks() return the original bytes
+4. Reference counts come from Artifact rows
+5. collect_garbage() removes only unreferenced files older than the grace period
+6. delete_content() leaves shared objects alone
+7. migrate_legacy_blobs() moves per-run .blob files into the object store
+8. EventRecorder and create_artifact() write to the object store
+9. The download route streams decompressed content
+"""
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.agentspec_crud import create_artifact, get_artifact_content
+from api.agentspec_models import AgentRun, AgentSpec, Artifact, generate_uuid
+from api.artifact_storage import (
+    ArtifactStorage,
+    is_object_ref,
+    iter_blob_chunks,
+    read_blob,
+    write_object,
+)
+from api.database import create_database
+from api.event_recorder import EventRecorder
+
+COMPRESSIBLE = ("All tests passed\n" * 2000).encode("utf-8")
+INCOMPRESSIBLE = os.urandom(20_000)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine, SessionLocal = create_database(tmp_path)
+    session = SessionLocal()
+    yield tmp_path, session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def runs(db):
+    _, session = db
+    spec = AgentSpec(
+        id=generate_uuid(), name="cas-spec", display_name="CAS", objective="o",
+        task_type="testing", tool_policy={"policy_version": "v1", "allowed_tools": []},
+    )
+    run1 = AgentRun(id=generate_uuid(), agent_spec_id=spec.id, status="running")
+    run2 = AgentRun(id=generate_uuid(), agent_spec_id=spec.id, status="running")
+    session.add_all([spec, run1, run2])
+    session.commit()
+    return run1.id, run2.id
+
+
+def _age(path: Path, seconds: float = 7200) -> None:
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+class TestObjectLayout:
+    """Objects are addressed by hash and shared across runs."""
+
+    def test_object_path(self, tmp_path):
+        digest = hashlib.sha256(COMPRESSIBLE).hexdigest()
+        ref = write_object(tmp_path, COMPRESSIBLE)
+        assert ref.startswith(f".autobuildr/artifacts/objects/{digest[:2]}/{digest[2:]}")
+        assert is_object_ref(ref)
+        assert not is_object_ref(f".autobuildr/artifacts/run-1/{digest}.blob")
+
+    def test_shared_across_runs(self, db, runs):
+        project_dir, session = db
+        storage = ArtifactStorage(project_dir)
+        a1 = storage.store(session, runs[0], "log", COMPRESSIBLE)
+        a2 = storage.store(session, runs[1], "log", COMPRESSIBLE)
+
+        assert a1.id != a2.id
+        assert a1.content_ref == a2.content_ref
+        assert storage.get_storage_stats()["object_count"] == 1
+
+
+class TestCompression:
+    """Transparent compression."""
+
+    def test_compressible_content_shrinks(self, tmp_path):
+        path = tmp_path / write_object(tmp_path, COMPRESSIBLE)
+        assert path.suffix in (".zst", ".zz")
+        assert path.stat().st_size < len(COMPRESSIBLE) // 10
+        assert read_blob(path) == COMPRESSIBLE
+
+    def test_incompressible_content_stored_raw(self, tmp_path):
+        path = tmp_path / write_object(tmp_path, INCOMPRESSIBLE)
+        assert path.suffix == ""
+        assert path.read_bytes() == INCOMPRESSIBLE
+
+    @pytest.mark.parametrize("content", [COMPRESSIBLE, INCOMPRESSIBLE])
+    def test_streaming_matches(self, tmp_path, content):
+        path = tmp_path / write_object(tmp_path, content)
+        chunks = list(iter_blob_chunks(path, chunk_size=1024))
+        assert b"".join(chunks) == content
+
+    def test_retrieve_and_iter_content(self, db, runs):
+        project_dir, session = db
+        storage = ArtifactStorage(project_dir)
+        artifact = storage.store(session, runs[0], "log", COMPRESSIBLE)
+        assert storage.retrieve(artifact) == COMPRESSIBLE
+        assert b"".join(storage.iter_content(artifact)) == COMPRESSIBLE
+
+
+class TestReferenceCounting:
+    """Refcounts and garbage collection."""
+
+    def test_reference_counts(self, db, runs):
+        project_dir, session = db
+        storage = ArtifactStorage(project_dir)
+        a1 = storage.store(session, runs[0], "log", COMPRESSIBLE)
+        storage.store(session, runs[1], "log", COMPRESSIBLE)
+        assert storage.reference_counts(session) == {a1.content_ref: 2}
+
+    def test_gc_removes_unreferenced_only(self, db, runs):
+        project_dir, session = db
+        storage = ArtifactStorage(project_dir)
+        kept = storage.store(session, runs[0], "log", COMPRESSIBLE)
+        orphan_ref = write_object(project_dir, INCOMPRESSIBLE)
+        session.commit()
+        for ref in (kept.content_ref, orphan_ref):
+            _age(project_dir / ref)
+
+        report = storage.collect_garbage(session)
+
+        assert report["deleted"] == 1
+        assert report["referenced"] == 1
+        assert (project_dir / kept.content_ref).exists()
+        assert not (project_dir / orphan_ref).exists()
+        assert not (project_dir / orphan_ref).parent.exists()
+
+    def test_gc_grace_period_keeps_fresh_objects(self, db):
+        project_dir, session = db
+        ref = write_object(project_dir, INCOMPRESSIBLE)
+        report = ArtifactStorage(project_dir).collect_garbage(session)
+        assert report["deleted"] == 0
+        assert (project_dir / ref).exists()
+
+    def test_gc_dry_run(self, db):
+        project_dir, session = db
+        ref = write_object(project_dir, INCOMPRESSIBLE)
+        _age(project_dir / ref)
+        report = ArtifactStorage(project_dir).collect_garbage(session, dry_run=True)
+        assert report["deleted"] == 1
+        assert (project_dir / ref).exists()
+
+    def test_object_freed_after_last_reference_removed(self, db, runs):
+        project_dir, session = db
+        storage = ArtifactStorage(project_dir)
+        a1 = storage.store(session, runs[0], "log", COMPRESSIBLE)
+        a2 = storage.store(session, runs[1], "log", COMPRESSIBLE)
+        _age(project_dir / a1.content_ref)
+
+        assert storage.delete_content(a1, session) is False  # still shared with a2
+        session.delete(a1)
+        session.delete(a2)
+        session.commit()
+
+        assert storage.collect_garbage(session)["deleted"] == 1
+
+
+class TestMigration:
+    """Legacy per-run blobs move into the object store."""
+
+    def _legacy_artifact(self, project_dir, session, run_id, content, content_hash=None):
+        digest = hashlib.sha256(content).hexdigest()
+        path = project_dir / ".autobuildr" / "artifacts" / run_id / f"{digest}.blob"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+        artifact = Artifact(
+            id=generate_uuid(), run_id=run_id, artifact_type="log",
+            content_hash=content_hash or digest, size_bytes=len(content),
+            content_ref=str(path.relative_to(project_dir)),
+        )
+        session.add(artifact)
+        session.commit()
+        return artifact, path
+
+    def test_migrates_and_dedups(self, db, runs):
+        project_dir, session = db
+        a1, p1 = self._legacy_artifact(project_dir, session, runs[0], COMPRESSIBLE)
+        a2, p2 = self._legacy_artifact(project_dir, session, runs[1], COMPRESSIBLE)
+
+        report = ArtifactStorage(project_dir).migrate_legacy_blobs(session)
+
+        assert report["migrated"] == 2
+        assert report["removed_files"] == 2
+        assert is_object_ref(a1.content_ref)
+        assert a1.content_ref == a2.content_ref
+        assert not p1.exists() and not p2.parent.exists()
+        assert get_artifact_content(a1, project_dir) == COMPRESSIBLE
+
+    def test_hash_mismatch_left_in_place(self, db, runs):
+        project_dir, session = db
+        artifact, path = self._legacy_artifact(
+            project_dir, session, runs[0], COMPRESSIBLE, content_hash="0" * 64
+        )
+
+        report = ArtifactStorage(project_dir).migrate_legacy_blobs(session)
+
+        assert report["mismatched"] == 1
+        assert path.exists()
+        assert not is_object_ref(artifact.content_ref)
+
+    def test_legacy_refs_still_readable(self, db, runs):
+        project_dir, session = db
+        artifact, _ = self._legacy_artifact(project_dir, session, runs[0], COMPRESSIBLE)
+        assert ArtifactStorage(project_dir).retrieve(artifact) == COMPRESSIBLE
+
+
+class TestWriters:
+    """Other artifact writers use the object store."""
+
+    def test_event_recorder_large_payload(self, db, runs):
+        project_dir, session = db
+        recorder = EventRecorder(session, project_dir)
+        payload = {"output": "line\n" * 5000}
+        recorder.record_tool_result(runs[0], "bash", payload)
+
+        artifact = session.query(Artifact).one()
+        assert is_object_ref(artifact.content_ref)
+        stored = json.loads(read_blob(project_dir / artifact.content_ref))
+        assert stored["result"] == payload
+
+    def test_create_artifact(self, db, runs):
+        project_dir, session = db
+        artifact = create_artifact(session, runs[0], "log", COMPRESSIBLE, project_dir=project_dir)
+        assert is_object_ref(artifact.content_ref)
+        assert get_artifact_content(artifact, project_dir) == COMPRESSIBLE
+
+
+class TestDownloadRoute:
+    """GET /api/artifacts/{id}/content decompresses on the fly."""
+
+    def test_streams_decompressed_content(self, tmp_path):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from api.database import get_db
+        from server.routers.artifacts import router
+
+        ref = write_object(tmp_path, COMPRESSIBLE)
+        artifact = MagicMock()
+        artifact.id = "a1"
+        artifact.artifact_type = "log"
+        artifact.path = None
+        artifact.content_inline = None
+        artifact.content_ref = ref
+        artifact.content_hash = hashlib.sha256(COMPRESSIBLE).hexdigest()
+        artifact.size_bytes = len(COMPRESSIBLE)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_db] = lambda: MagicMock()
+
+        with patch("server.routers.artifacts.get_artifact", return_value=artifact), \
+                patch("server.routers.artifacts.ROOT_DIR", tmp_path):
+            response = TestClient(app).get(
+                "/api/artifacts/a1/content", headers={"Accept-Encoding": "identity"}
+            )
+
+        assert response.status_code == 200
+        assert response.content == COMPRESSIBLE
+        assert response.headers["content-length"] == str(len(COMPRESSIBLE))
@@ -33,7 +33,7 @@ from api.agentspec_models import (
     Artifact,
     generate_uuid,
 )
-from api.artifact_storage import ArtifactStorage
+from api.artifact_storage import ArtifactStorage, read_blob
 
 
 # =============================================================================
@@ -335,7 +335,7 @@ class TestInlineStorage:
 
 
 # =============================================================================
-# Step 5: If large, write to file .autobuildr/artifacts/{run_id}/{hash}.blob
+# Step 5: If large, write to the object store .autobuildr/artifacts/objects/{hash[:2]}/{hash[2:]}
 # =============================================================================
 
 class TestFileStorage:
@@ -354,7 +354,7 @@ class TestFileStorage:
         assert artifact.content_ref is not None
 
     def test_file_path_format(self, storage, db_session, agent_run):
-        """File is stored at .autobuildr/artifacts/{run_id}/{hash}.blob."""
+        """File is stored at .autobuildr/artifacts/objects/{hash[:2]}/{hash[2:]}[.codec]."""
         content = "x" * 5000
         artifact = storage.store(
             session=db_session,
@@ -363,8 +363,11 @@ class TestFileStorage:
             content=content,
         )
 
-        expected_path = f".autobuildr/artifacts/{agent_run.id}/{artifact.content_hash}.blob"
-        assert artifact.content_ref == expected_path
+        expected_path = (
+            f".autobuildr/artifacts/objects/{artifact.content_hash[:2]}/{artifact.content_hash[2:]}"
+        )
+        assert artifact.content_ref.startswith(expected_path)
+        assert artifact.content_ref[len(expected_path):] in ("", ".zst", ".zz")
 
     def test_file_content_matches(self, storage, db_session, agent_run, temp_project_dir):
         """File content matches original content."""
@@ -378,7 +381,7 @@ class TestFileStorage:
 
         file_path = temp_project_dir / artifact.content_ref
         assert file_path.exists()
-        assert file_path.read_text() == content
+        assert read_blob(file_path).decode("utf-8") == content
 
     def test_file_storage_with_bytes(self, storage, db_session, agent_run, temp_project_dir):
         """Bytes content is stored correctly in file."""
@@ -392,7 +395,7 @@ class TestFileStorage:
 
         file_path = temp_project_dir / artifact.content_ref
         assert file_path.exists()
-        assert file_path.read_bytes() == content
+        assert read_blob(file_path) == content
 
 
 # =============================================================================
@@ -418,26 +421,28 @@ class TestDirectoryCreation:
         )
 
         # Now directories exist
-        run_dir = artifacts_dir / agent_run.id
-        assert run_dir.exists()
-        assert run_dir.is_dir()
+        fanout_dir = artifacts_dir / "objects" / artifact.content_hash[:2]
+        assert fanout_dir.exists()
+        assert fanout_dir.is_dir()
 
-    def test_multiple_runs_separate_directories(
+    def test_multiple_runs_share_object(
         self, storage, db_session, agent_spec, temp_project_dir
     ):
-        """Each run gets its own directory."""
+        """Identical content from different runs is stored once."""
         run1 = AgentRun(id=generate_uuid(), agent_spec_id=agent_spec.id, status="running")
         run2 = AgentRun(id=generate_uuid(), agent_spec_id=agent_spec.id, status="running")
         db_session.add_all([run1, run2])
         db_session.flush()
 
         content = "x" * 5000
-        storage.store(session=db_session, run_id=run1.id, artifact_type="log", content=content)
-        storage.store(session=db_session, run_id=run2.id, artifact_type="log", content=content)
+        a1 = storage.store(session=db_session, run_id=run1.id, artifact_type="log", content=content)
+        a2 = storage.store(session=db_session, run_id=run2.id, artifact_type="log", content=content)
 
+        assert a1.id != a2.id
+        assert a1.content_ref == a2.content_ref
         artifacts_dir = temp_project_dir / ".autobuildr" / "artifacts"
-        assert (artifacts_dir / run1.id).exists()
-        assert (artifacts_dir / run2.id).exists()
+        assert not (artifacts_dir / run1.id).exists()
+        assert not (artifacts_dir / run2.id).exists()
 
 
 # =============================================================================
@@ -529,8 +534,8 @@ class TestDeduplication:
         assert artifact1.content_ref == artifact2.content_ref
 
         # Only one file on disk
-        run_dir = temp_project_dir / ".autobuildr" / "artifacts" / agent_run.id
-        blob_files = list(run_dir.glob("*.blob"))
+        objects_dir = temp_project_dir / ".autobuildr" / "artifacts" / "objects"
+        blob_files = [p for p in objects_dir.rglob("*") if p.is_file()]
         assert len(blob_files) == 1
 
 
@@ -0,0 +1,185 @@
+"""
+Tests for the linear-time compute_scheduling_scores() implementation.
+
+Verifies:
+1. Descendant counts are exact: shared descendants in a diamond count once
+2. Descendant counts match a brute-force DFS on random DAGs
+3. Depth is the longest path from a root
+4. Duplicate dependency entries do not inflate counts
+5. FeatureGraph caches scores per structural version
+6. Benchmark: synthetic 10k and 50k feature DAGs score in bounded time
+
+Run the benchmark directly with: python tests/test_compute_scheduling_scores_linear.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import api.dependency_resolver as dependency_resolver
+from api.dependency_resolver import _count_descendants, compute_scheduling_scores
+from api.feature_graph import FeatureGraph
+
+# Wall-clock budgets for scoring synthetic DAGs (generous for slow CI machines)
+MAX_SCORE_10K_SECONDS = 2.0
+MAX_SCORE_50K_SECONDS = 10.0
+
+
+def _synthetic_dag(n: int, seed: int = 42, max_deps: int = 3, window: int = 200) -> list[dict]:
+    """Random DAG where each feature depends on up to max_deps recent features."""
+    rng = random.Random(seed)
+    features = []
+    for fid in range(1, n + 1):
+        low = max(1, fid - window)
+        candidates = range(low, fid)
+        deps = rng.sample(candidates, min(len(candidates), rng.randint(0, max_deps)))
+        features.append({"id": fid, "priority": rng.randint(1, 20), "dependencies": deps})
+    return features
+
+
+def _brute_force_descendants(features: list[dict]) -> dict[int, int]:
+    children: dict[int, set[int]] = {f["id"]: set() for f in features}
+    for f in features:
+        for dep in f["dependencies"]:
+            if dep in children:
+                children[dep].add(f["id"])
+
+    counts = {}
+    for fid in children:
+        seen: set[int] = set()
+        stack = list(children[fid])
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(children[node])
+        counts[fid] = len(seen)
+    return counts
+
+
+def _descendants(features: list[dict]) -> dict[int, int]:
+    """Run _count_descendants through the same topological order as the scorer."""
+    index = {f["id"]: i for i, f in enumerate(features)}
+    children = [[] for _ in features]
+    in_degree = [0] * len(features)
+    for f in features:
+        for dep in set(f["dependencies"]):
+            if dep in index:
+                children[index[dep]].append(index[f["id"]])
+                in_degree[index[f["id"]]] += 1
+    order = [i for i, d in enumerate(in_degree) if d == 0]
+    for node in order:
+        for child in children[node]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                order.append(child)
+    counts = _count_descendants(order, children)
+    return {f["id"]: counts[index[f["id"]]] for f in features}
+
+
+class TestExactDescendants:
+    """Downstream work counts each descendant once."""
+
+    def test_diamond_counts_shared_descendant_once(self):
+        features = [
+            {"id": 1, "priority": 1, "dependencies": []},
+            {"id": 2, "priority": 1, "dependencies": [1]},
+            {"id": 3, "priority": 1, "dependencies": [1]},
+            {"id": 4, "priority": 1, "dependencies": [2, 3]},
+        ]
+        assert _descendants(features) == {1: 3, 2: 1, 3: 1, 4: 0}
+
+    def test_matches_brute_force(self):
+        features = _synthetic_dag(400, seed=9, window=30)
+        assert _descendants(features) == _brute_force_descendants(features)
+
+    def test_duplicate_dependencies_ignored(self):
+        once = [
+            {"id": 1, "priority": 1, "dependencies": []},
+            {"id": 2, "priority": 1, "dependencies": [1]},
+        ]
+        twice = [
+            {"id": 1, "priority": 1, "dependencies": []},
+            {"id": 2, "priority": 1, "dependencies": [1, 1]},
+        ]
+        assert compute_scheduling_scores(once) == compute_scheduling_scores(twice)
+
+    def test_equal_unblock_for_diamond_branches(self):
+        features = [
+            {"id": 1, "priority": 5, "dependencies": []},
+            {"id": 2, "priority": 5, "dependencies": [1]},
+            {"id": 3, "priority": 5, "dependencies": [1]},
+            {"id": 4, "priority": 5, "dependencies": [2, 3]},
+        ]
+        scores = compute_scheduling_scores(features)
+        # Root unblocks 3 features, each branch unblocks 1: 1000 * 1/3
+        assert scores[1] - scores[2] > 600
+        assert scores[2] == scores[3]
+
+
+class TestDepth:
+    """Depth is the longest path from a root."""
+
+    def test_longest_path_depth(self):
+        # 4 is reachable in one hop from 1 and in three hops via 2 -> 3
+        features = [
+            {"id": 1, "priority": 10, "dependencies": []},
+            {"id": 2, "priority": 10, "dependencies": [1]},
+            {"id": 3, "priority": 10, "dependencies": [2]},
+            {"id": 4, "priority": 10, "dependencies": [1, 3]},
+        ]
+        scores = compute_scheduling_scores(features)
+        # Leaf at max depth: no unblock, depth_score 0, priority_factor 0
+        assert scores[4] == 0
+
+
+class TestFeatureGraphCache:
+    """FeatureGraph rescoring is keyed on its structural version."""
+
+    def test_status_flips_do_not_rescore(self):
+        features = _synthetic_dag(200)
+        for f in features:
+            f["passes"] = False
+            f["in_progress"] = False
+        graph = FeatureGraph.from_features(features)
+
+        with patch.object(dependency_resolver, "compute_scheduling_scores",
+                          wraps=dependency_resolver.compute_scheduling_scores) as spy:
+            graph.get_ready(limit=5)
+            for fid in range(1, 50):
+                graph.set_passes(fid, True)
+                graph.get_ready(limit=5)
+            assert spy.call_count == 1
+
+            graph.set_dependencies(200, [1])
+            graph.get_ready(limit=5)
+            assert spy.call_count == 2
+
+
+def _time_scores(n: int) -> float:
+    features = _synthetic_dag(n)
+    start = time.perf_counter()
+    compute_scheduling_scores(features)
+    return time.perf_counter() - start
+
+
+class TestBenchmark:
+    """Scoring large synthetic DAGs stays fast."""
+
+    def test_score_10k(self):
+        elapsed = _time_scores(10_000)
+        assert elapsed < MAX_SCORE_10K_SECONDS, f"10k DAG took {elapsed:.2f}s"
+
+    def test_score_50k(self):
+        elapsed = _time_scores(50_000)
+        assert elapsed < MAX_SCORE_50K_SECONDS, f"50k DAG took {elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    for size in (10_000, 50_000):
+        print(f"compute_scheduling_scores on {size:,} features: {_time_scores(size) * 1000:.1f} ms")
@@ -0,0 +1,113 @@
+"""
+Tests for the per-project engine cache in api/database.py.
+
+Verifies:
+1. get_cached_database() returns the same engine/session maker per project
+2. Migrations (create_database) run once per database file
+3. Different projects get different engines
+4. dispose_cached_database() invalidates a single project
+5. A deleted database file triggers a rebuild
+6. dispose_all_cached_databases() clears the registry
+"""
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import inspect
+
+import api.database as database
+from api.database import (
+    Feature,
+    dispose_all_cached_databases,
+    dispose_cached_database,
+    get_cached_database,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_engine_cache():
+    """Ensure each test starts and ends with an empty registry."""
+    dispose_all_cached_databases()
+    yield
+    dispose_all_cached_databases()
+
+
+class TestGetCachedDatabase:
+    """Reuse of engines across calls."""
+
+    def test_returns_same_pair_for_same_project(self, tmp_path):
+        first = get_cached_database(tmp_path)
+        second = get_cached_database(tmp_path)
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+
+    def test_create_database_runs_once(self, tmp_path):
+        with patch.object(database, "create_database", wraps=database.create_database) as spy:
+            for _ in range(5):
+                get_cached_database(tmp_path)
+        assert spy.call_count == 1
+
+    def test_schema_is_migrated(self, tmp_path):
+        engine, _ = get_cached_database(tmp_path)
+        tables = inspect(engine).get_table_names()
+        assert "features" in tables
+        assert "agent_runs" in tables
+
+    def test_sessions_share_engine(self, tmp_path):
+        _, SessionLocal = get_cached_database(tmp_path)
+        with SessionLocal() as session:
+            session.add(Feature(priority=1, category="c", name="n", description="d", steps=[]))
+            session.commit()
+
+        _, SessionLocal = get_cached_database(tmp_path)
+        with SessionLocal() as session:
+            assert session.query(Feature).count() == 1
+
+    def test_distinct_projects_get_distinct_engines(self, tmp_path):
+        project_a = tmp_path / "a"
+        project_b = tmp_path / "b"
+        project_a.mkdir()
+        project_b.mkdir()
+        engine_a, _ = get_cached_database(project_a)
+        engine_b, _ = get_cached_database(project_b)
+        assert engine_a is not engine_b
+
+    def test_equivalent_paths_share_entry(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        engine_a, _ = get_cached_database(tmp_path)
+        engine_b, _ = get_cached_database(tmp_path / "sub" / "..")
+        assert engine_a is engine_b
+
+
+class TestInvalidation:
+    """Dropping engines from the registry."""
+
+    def test_dispose_project(self, tmp_path):
+        engine, _ = get_cached_database(tmp_path)
+        assert dispose_cached_database(tmp_path) is True
+        assert dispose_cached_database(tmp_path) is False
+
+        new_engine, _ = get_cached_database(tmp_path)
+        assert new_engine is not engine
+
+    def test_deleted_database_file_is_rebuilt(self, tmp_path):
+        engine, _ = get_cached_database(tmp_path)
+        engine.dispose()
+        for suffix in ("", "-wal", "-shm"):
+            path = tmp_path / f"features.db{suffix}"
+            if path.exists():
+                path.unlink()
+
+        new_engine, _ = get_cached_database(tmp_path)
+        assert new_engine is not engine
+        assert "features" in inspect(new_engine).get_table_names()
+
+    def test_dispose_all(self, tmp_path):
+        project_a = tmp_path / "a"
+        project_b = tmp_path / "b"
+        project_a.mkdir()
+        project_b.mkdir()
+        get_cached_database(project_a)
+        get_cached_database(project_b)
+
+        assert dispose_all_cached_databases() == 2
+        assert dispose_all_cached_databases() == 0
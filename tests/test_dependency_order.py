@@ -0,0 +1,226 @@
+"""
+Tests for the incremental topological order (api/dependency_order.py).
+
+Verifies:
+1. Adding an edge keeps every dependency before its dependents, repairing
+   the order only when needed
+2. Cycles are detected exactly (matching a brute-force reachability check)
+   and reported as the path they would close
+3. Rejected edges are reported by cycles() and accepted again once the
+   cycle is broken
+4. sync() applies a snapshot diff; long chains need no recursion
+5. find_dependency_cycle() follows database changes through the edge table
+6. Benchmark: building and extending a large graph stays near-linear
+
+Run the benchmark directly with: python tests/test_dependency_order.py
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.dependency_order import DependencyOrder
+
+# Wall-clock budgets (generous for slow CI machines)
+MAX_BUILD_50K_SECONDS = 5.0
+MAX_ADD_1K_EDGES_SECONDS = 5.0
+
+
+def _assert_valid(order: DependencyOrder) -> None:
+    position = {n: i for i, n in enumerate(order.order())}
+    for f, deps in order._deps.items():
+        for d in deps:
+            assert position[d] < position[f], f"{d} should come before {f}"
+
+
+def _reaches(edges: set[tuple[int, int]], start: int, goal: int) -> bool:
+    """Brute force: does start (transitively) depend on goal?"""
+    seen = {start}
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node == goal:
+            return True
+        for f, d in edges:
+            if f == node and d not in seen:
+                seen.add(d)
+                stack.append(d)
+    return False
+
+
+class TestAddDependency:
+    """Edge insertion and order repair."""
+
+    def test_repairs_order(self):
+        order = DependencyOrder.from_edges([], nodes=[1, 2, 3])
+        assert order.order() == [1, 2, 3]
+        # 1 now depends on 3: 3 must move ahead of 1
+        assert order.add_dependency(1, 3) is None
+        _assert_valid(order)
+        order.add_dependency(3, 2)
+        _assert_valid(order)
+        assert order.order().index(2) < order.order().index(3) < order.order().index(1)
+
+    def test_detects_cycle(self):
+        order = DependencyOrder.from_edges([(2, 1), (3, 2)])
+        assert order.find_cycle(1, 3) == [1, 3, 2]
+        assert order.find_cycle(1, 1) == [1]
+        assert order.find_cycle(3, 1) is None
+        assert order.find_cycle(1, 99) is None
+
+        assert order.add_dependency(1, 3) == [1, 3, 2]
+        assert order.cycles() == [[1, 3, 2]]
+        _assert_valid(order)
+
+    def test_random_graphs_match_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            order = DependencyOrder.from_edges([], nodes=range(12))
+            accepted: set[tuple[int, int]] = set()
+            for _ in range(40):
+                f, d = rng.sample(range(12), 2)
+                expect_cycle = _reaches(accepted, d, f)
+                cycle = order.find_cycle(f, d)
+                assert (cycle is not None) == expect_cycle
+                if cycle is None:
+                    # Like the API, only edges that close no cycle are added
+                    assert order.add_dependency(f, d) is None
+                    accepted.add((f, d))
+                else:
+                    # Every step of the reported cycle is a real edge
+                    steps = list(zip(cycle, cycle[1:] + cycle[:1]))
+                    assert steps[0] == (f, d)
+                    assert all(step in accepted for step in steps[1:])
+                _assert_valid(order)
+
+
+class TestRemoval:
+    """Removing edges and features."""
+
+    def test_rejected_edge_accepted_after_cycle_broken(self):
+        order = DependencyOrder.from_edges([(2, 1), (3, 2), (1, 3)])
+        assert order.cycles() == [[1, 3, 2]]
+
+        order.remove_dependency(3, 2)
+        assert order.cycles() == []
+        assert order.edges() == {(2, 1), (1, 3)}
+        _assert_valid(order)
+
+    def test_remove_feature(self):
+        order = DependencyOrder.from_edges([(2, 1), (3, 2), (1, 3)])
+        order.remove_feature(2)
+        assert 2 not in order
+        assert order.edges() == {(1, 3)}
+        assert order.cycles() == []
+
+
+class TestSync:
+    """Snapshot diffs and large graphs."""
+
+    def test_sync_applies_diff(self):
+        order = DependencyOrder.from_edges([(2, 1), (3, 2)])
+        order.sync(nodes=[1, 2, 3, 4], edges=[(2, 1), (4, 3)])
+        assert order.edges() == {(2, 1), (4, 3)}
+        assert len(order) == 4
+        assert order.find_cycle(1, 3) is None
+        assert order.find_cycle(3, 4) == [3, 4]
+
+        order.sync(nodes=[1, 2], edges=[(2, 1)])
+        assert 4 not in order
+        assert order.edges() == {(2, 1)}
+
+    def test_long_chain(self):
+        n = 20_000
+        order = DependencyOrder.from_edges([(i + 1, i) for i in range(n)])
+        assert order.find_cycle(0, n) == [0] + list(range(n, 0, -1))
+        assert order.find_cycle(n, 0) is None
+
+        # Built edge by edge against the initial order, too (each edge moves
+        # the whole chain built so far, so keep this one short)
+        m = 500
+        order = DependencyOrder.from_edges([], nodes=range(m + 1))
+        for i in reversed(range(m)):
+            assert order.add_dependency(i, i + 1) is None
+        assert order.order() == list(range(m, -1, -1))
+        assert order.find_cycle(m, 0) is not None
+
+
+class TestProjectOrder:
+    """Per-project order kept in step with the database."""
+
+    def test_follows_database_changes(self, tmp_path):
+        pytest.importorskip("sqlalchemy")
+        from api.database import Feature, create_database, dispose_cached_database
+        from api.dependency_order import find_dependency_cycle
+
+        engine, session_maker = create_database(tmp_path)
+        session = session_maker()
+        try:
+            for fid, deps in ((1, None), (2, [1]), (3, [2])):
+                session.add(Feature(
+                    id=fid, priority=fid, category="test", name=f"Feature {fid}",
+                    description="desc", steps=["step"], dependencies=deps,
+                ))
+            session.commit()
+            assert find_dependency_cycle(tmp_path, session, 1, [3]) == [1, 3, 2]
+            assert find_dependency_cycle(tmp_path, session, 3, [1]) is None
+
+            session.get(Feature, 3).dependencies = [1]
+            session.commit()
+            assert find_dependency_cycle(tmp_path, session, 1, [3]) == [1, 3]
+            assert find_dependency_cycle(tmp_path, session, 2, [3]) is None
+        finally:
+            session.close()
+            dispose_cached_database(tmp_path)
+            engine.dispose()
+
+
+def _synthetic_edges(n: int, seed: int = 42, max_deps: int = 3, window: int = 200) -> list[tuple[int, int]]:
+    """Random DAG where each feature depends on up to max_deps recent features."""
+    rng = random.Random(seed)
+    edges = []
+    for fid in range(1, n + 1):
+        candidates = range(max(1, fid - window), fid)
+        for dep in rng.sample(candidates, min(len(candidates), rng.randint(0, max_deps))):
+            edges.append((fid, dep))
+    return edges
+
+
+def _time_build(n: int) -> float:
+    edges = _synthetic_edges(n)
+    start = time.perf_counter()
+    DependencyOrder.from_edges(edges, nodes=range(1, n + 1))
+    return time.perf_counter() - start
+
+
+def _time_add_edges(n: int, count: int) -> float:
+    order = DependencyOrder.from_edges(_synthetic_edges(n), nodes=range(1, n + 1))
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(count):
+        f, d = rng.sample(range(1, n + 1), 2)
+        order.add_dependency(f, d)
+    return time.perf_counter() - start
+
+
+class TestBenchmark:
+    """Bulk loads and individual edits stay fast on large graphs."""
+
+    def test_build_50k(self):
+        elapsed = _time_build(50_000)
+        assert elapsed < MAX_BUILD_50K_SECONDS, f"50k build took {elapsed:.2f}s"
+
+    def test_add_1k_edges(self):
+        elapsed = _time_add_edges(10_000, 1_000)
+        assert elapsed < MAX_ADD_1K_EDGES_SECONDS, f"1k edge additions took {elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    for size in (10_000, 50_000):
+        print(f"DependencyOrder.from_edges on {size:,} features: {_time_build(size) * 1000:.1f} ms")
+    print(f"1,000 random add_dependency calls on 10,000 features: {_time_add_edges(10_000, 1_000) * 1000:.1f} ms")
@@ -0,0 +1,161 @@
+"""
+Tests for the feature_dependencies edge table and its queries
+(api/database.py, api/dependency_queries.py).
+
+Verifies:
+1. Triggers keep feature_dependencies in step with Feature.dependencies on
+   insert, update and delete, ignoring malformed JSON and non-integer entries
+2. The migration backfills edges from existing JSON dependencies
+3. Ready / blocked / dependents / unblocked-by queries match the
+   dependency_resolver rules (missing dependencies block)
+"""
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.database import (
+    Feature,
+    _migrate_add_feature_dependencies_table,
+    create_database,
+)
+from api.dependency_queries import (
+    count_ready_features,
+    get_blocking_dependencies_map,
+    get_dependency_edges,
+    get_dependents,
+    get_ready_feature_ids,
+    get_unblocked_by,
+)
+from api.dependency_resolver import get_blocked_features
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine, session_maker = create_database(tmp_path)
+    yield engine, session_maker
+    engine.dispose()
+
+
+@pytest.fixture
+def session(db):
+    _, session_maker = db
+    session = session_maker()
+    yield session
+    session.close()
+
+
+def _add(session, *features: dict) -> None:
+    for f in features:
+        session.add(Feature(
+            id=f["id"],
+            priority=f.get("priority", f["id"]),
+            category="test",
+            name=f"Feature {f['id']}",
+            description="desc",
+            steps=["step"],
+            passes=f.get("passes", False),
+            in_progress=f.get("in_progress", False),
+            dependencies=f.get("dependencies"),
+        ))
+    session.commit()
+
+
+class TestEdgeSync:
+    """The edge table mirrors the JSON column whatever writes it."""
+
+    def test_insert_update_delete(self, session):
+        _add(session, {"id": 1}, {"id": 2}, {"id": 3, "dependencies": [1, 2]})
+        assert get_dependency_edges(session) == [(3, 1), (3, 2)]
+
+        feature = session.get(Feature, 3)
+        feature.dependencies = [2]
+        session.commit()
+        assert get_dependency_edges(session) == [(3, 2)]
+
+        feature.dependencies = None
+        session.commit()
+        assert get_dependency_edges(session) == []
+
+        feature.dependencies = [1]
+        session.commit()
+        session.delete(feature)
+        session.commit()
+        assert get_dependency_edges(session) == []
+
+    def test_malformed_dependencies_ignored(self, session):
+        _add(
+            session,
+            {"id": 1},
+            {"id": 2, "dependencies": {"not": "a list"}},
+            {"id": 3, "dependencies": [1, "x", 1.5, None]},
+        )
+        assert get_dependency_edges(session) == [(3, 1)]
+
+    def test_raw_sql_writes_are_mirrored(self, session):
+        _add(session, {"id": 1}, {"id": 2})
+        session.execute(text("UPDATE features SET dependencies = '[1]' WHERE id = 2"))
+        session.commit()
+        assert get_dependents(session, 1) == [2]
+
+    def test_migration_backfills_existing_json(self, db, session):
+        engine, _ = db
+        _add(session, {"id": 1}, {"id": 2, "dependencies": [1]}, {"id": 3, "dependencies": [1, 2]})
+        # Simulate a database from before the edge table existed
+        session.execute(text("DELETE FROM feature_dependencies"))
+        session.commit()
+
+        _migrate_add_feature_dependencies_table(engine)
+        _migrate_add_feature_dependencies_table(engine)  # idempotent
+        assert get_dependency_edges(session) == [(2, 1), (3, 1), (3, 2)]
+
+
+class TestQueries:
+    """SQL-side ready/blocked queries."""
+
+    @pytest.fixture
+    def populated(self, session):
+        _add(
+            session,
+            {"id": 1, "passes": True},
+            {"id": 2, "dependencies": [1]},          # ready
+            {"id": 3, "dependencies": [1, 2]},       # blocked by #2
+            {"id": 4, "dependencies": [99]},         # missing dependency
+            {"id": 5, "in_progress": True},
+            {"id": 6, "priority": 0},                # ready, first by priority
+            {"id": 7, "dependencies": [2, 6]},       # blocked by #2 and #6
+        )
+        return session
+
+    def test_ready(self, populated):
+        assert get_ready_feature_ids(populated) == [6, 2]
+        assert get_ready_feature_ids(populated, limit=1) == [6]
+        assert count_ready_features(populated) == 2
+
+    def test_blocking_map_matches_resolver(self, populated):
+        blocking = get_blocking_dependencies_map(populated, pending_only=True)
+        assert blocking == {3: [2], 4: [99], 7: [2, 6]}
+
+        features = [f.to_dict() for f in populated.query(Feature).all()]
+        expected = {f["id"]: sorted(f["blocked_by"]) for f in get_blocked_features(features)}
+        assert blocking == expected
+
+    def test_blocking_map_for_selected_features(self, populated):
+        assert get_blocking_dependencies_map(populated, [3, 2]) == {3: [2]}
+        assert get_blocking_dependencies_map(populated, []) == {}
+
+    def test_dependents_and_unblocked_by(self, populated):
+        assert get_dependents(populated, 2) == [3, 7]
+        # #7 still waits for #6 after #2 passes
+        assert get_unblocked_by(populated, 2) == [3]
+        assert get_unblocked_by(populated, 6) == []
+
+        feature = populated.get(Feature, 2)
+        feature.passes = True
+        populated.commit()
+        assert get_unblocked_by(populated, 6) == [7]
+        assert get_ready_feature_ids(populated) == [6, 3]
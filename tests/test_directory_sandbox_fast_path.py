@@ -0,0 +1,214 @@
+"""
+Tests for the precomputed directory-sandbox checks (DirectorySandbox in
+api/tool_policy.py).
+
+Verifies:
+1. DirectorySandbox.contains() agrees with is_path_under_directories(),
+   including sibling-prefix and nested allowed directories
+2. validate_directory_access() with a sandbox returns exactly what the
+   uncached checks return, over symlinks that stay inside, escape, break,
+   loop or chain, and over traversal payloads (audit timestamps aside)
+3. Symlinks created after a path was checked are seen on the next check
+4. ToolPolicyEnforcer builds its sandbox once and rebuilds it when
+   allowed_directories is replaced
+5. Benchmark: sandbox checks of deep in-project paths are faster than the
+   uncached checks
+
+Run the benchmark directly with: python tests/test_directory_sandbox_fast_path.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.tool_policy import (
+    DirectorySandbox,
+    ToolPolicyEnforcer,
+    is_path_under_directories,
+    validate_directory_access,
+)
+
+# A sandbox check must be at least this many times faster than the uncached one
+MIN_SANDBOX_SPEEDUP = 1.5
+
+BENCHMARK_CALLS = 2_000
+
+TRAVERSAL_PAYLOADS = [
+    "../secret.txt",
+    "../../../../../etc/passwd",
+    "../../../etc/passwd%00",
+    "..%2f%2e%2e%2f..%2fetc/passwd",
+    "project/%2e%2e/etc/passwd",
+    "project/..\\..\\windows",
+    "project/%252e%252e/etc",
+]
+
+posix_only = pytest.mark.skipif(os.name != "posix", reason="symlink fixtures need POSIX")
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """A project with symlinks of every kind, plus an outside directory."""
+    project = tmp_path / "project"
+    outside = tmp_path / "outside"
+    (project / "src" / "pkg").mkdir(parents=True)
+    (project / "docs").mkdir()
+    outside.mkdir()
+    (project / "src" / "pkg" / "mod.py").write_text("x = 1\n")
+    (outside / "secret.txt").write_text("secret\n")
+    # Sibling sharing the project's name as a string prefix
+    (tmp_path / "project-evil").mkdir()
+
+    (project / "inside_link").symlink_to(project / "src" / "pkg" / "mod.py")
+    (project / "escape_link").symlink_to(outside / "secret.txt")
+    (project / "escape_dir").symlink_to(outside)
+    (project / "broken_link").symlink_to(project / "missing.txt")
+    (project / "loop_a").symlink_to(project / "loop_b")
+    (project / "loop_b").symlink_to(project / "loop_a")
+    (project / "chain_1").symlink_to(project / "chain_2")
+    (project / "chain_2").symlink_to(outside / "secret.txt")
+    (project / "relative_escape").symlink_to(Path("..") / "outside" / "secret.txt")
+    return tmp_path, project
+
+
+def _candidate_paths(root: Path, project: Path) -> list[str]:
+    names = [
+        "src/pkg/mod.py", "src/pkg", "src", ".", "", "new_file.py", "src/new/deep/file.py",
+        "src/./pkg/mod.py", "src/pkg/", "inside_link", "escape_link", "escape_dir",
+        "escape_dir/secret.txt", "escape_dir/missing", "broken_link", "loop_a",
+        "loop_b/child", "chain_1", "relative_escape", "src/pkg/mod.py/child",
+    ]
+    paths = names + [str(project / name) for name in names]
+    paths += [str(root / "project-evil" / "x"), str(root / "outside" / "secret.txt"), "/etc/passwd", "//etc/passwd"]
+    return paths + TRAVERSAL_PAYLOADS
+
+
+def _without_timestamps(details: dict) -> dict:
+    details = dict(details)
+    audit = details.get("security_audit")
+    if isinstance(audit, dict):
+        details["security_audit"] = {k: v for k, v in audit.items() if k != "timestamp"}
+    return details
+
+
+def _check(tool_name, path, allowed, base_dir, sandbox, allow_broken_symlinks=False):
+    try:
+        allowed_, reason, details = validate_directory_access(
+            tool_name, path, allowed, base_dir,
+            allow_broken_symlinks=allow_broken_symlinks, sandbox=sandbox,
+        )
+    except Exception as e:  # noqa: BLE001 - both paths must fail alike
+        return type(e), str(e)
+    return allowed_, reason, _without_timestamps(details)
+
+
+class TestContains:
+    """Trie containment matches relative_to() checks."""
+
+    def test_matches_is_path_under_directories(self, tmp_path):
+        allowed = [tmp_path / "a", tmp_path / "a" / "b", tmp_path / "c" / "d"]
+        sandbox = DirectorySandbox(allowed)
+        for path in (
+            tmp_path, tmp_path / "a", tmp_path / "a" / "x", tmp_path / "ab", tmp_path / "a" / "b" / "c",
+            tmp_path / "c", tmp_path / "c" / "d", tmp_path / "c" / "dd", tmp_path / "c" / "d" / "e", Path("/"),
+        ):
+            assert sandbox.contains(path) == is_path_under_directories(path, allowed), path
+
+    def test_empty_means_unrestricted(self):
+        assert DirectorySandbox([]).contains(Path("/etc/passwd"))
+        assert DirectorySandbox([Path("/")]).contains(Path("/etc/passwd"))
+
+
+@posix_only
+class TestEquivalence:
+    """validate_directory_access() gives identical results with a sandbox."""
+
+    @pytest.mark.parametrize("allow_broken_symlinks", [False, True])
+    def test_matches_uncached_checks(self, tree, allow_broken_symlinks):
+        root, project = tree
+        allowed = [project, root / "elsewhere"]
+        sandbox = DirectorySandbox(allowed)
+        for _ in range(2):
+            # Second pass runs with warm caches
+            for path in _candidate_paths(root, project):
+                for base_dir in (str(project), None):
+                    expected = _check("Read", path, allowed, base_dir, None, allow_broken_symlinks)
+                    actual = _check("Read", path, allowed, base_dir, sandbox, allow_broken_symlinks)
+                    assert actual == expected, (path, base_dir)
+
+    def test_new_symlinks_are_seen(self, tree):
+        root, project = tree
+        sandbox = DirectorySandbox([project])
+        target = project / "src" / "later"
+        assert validate_directory_access("Write", str(target / "f.py"), [project], sandbox=sandbox)[0]
+
+        target.symlink_to(root / "outside")
+        allowed, reason, details = validate_directory_access("Write", str(target / "f.py"), [project], sandbox=sandbox)
+        assert not allowed
+        assert details["resolved_path"] == str(root / "outside" / "f.py")
+
+
+class TestEnforcer:
+    """The enforcer reuses its sandbox."""
+
+    def test_sandbox_follows_allowed_directories(self, tmp_path):
+        enforcer = ToolPolicyEnforcer(spec_id="s", allowed_directories=[tmp_path / "a"])
+        sandbox = enforcer.directory_sandbox
+        assert enforcer.directory_sandbox is sandbox
+
+        enforcer.allowed_directories = [tmp_path / "b"]
+        assert enforcer.directory_sandbox is not sandbox
+        assert enforcer.directory_sandbox.contains(tmp_path / "b" / "x")
+        assert not enforcer.directory_sandbox.contains(tmp_path / "a" / "x")
+
+    def test_sandbox_follows_in_place_edit(self, tmp_path):
+        enforcer = ToolPolicyEnforcer(spec_id="s", allowed_directories=[tmp_path / "a"])
+        assert enforcer.directory_sandbox.contains(tmp_path / "a" / "x")
+
+        enforcer.allowed_directories[0] = tmp_path / "b"
+        assert enforcer.directory_sandbox.contains(tmp_path / "b" / "x")
+        assert not enforcer.directory_sandbox.contains(tmp_path / "a" / "x")
+
+
+def _benchmark_setup(root: Path) -> tuple[list[Path], list[str]]:
+    project = root / "project"
+    deep = project / "src" / "pkg" / "sub" / "inner"
+    deep.mkdir(parents=True)
+    allowed = [project] + [root / f"shared_{i}" for i in range(8)]
+    paths = [str(deep / f"mod_{i}.py") for i in range(20)] + [str(project / "README.md")]
+    return allowed, paths
+
+
+def _time_checks(allowed: list[Path], paths: list[str], sandbox: DirectorySandbox | None) -> float:
+    start = time.perf_counter()
+    for i in range(BENCHMARK_CALLS):
+        validate_directory_access("Read", paths[i % len(paths)], allowed, sandbox=sandbox)
+    return time.perf_counter() - start
+
+
+class TestBenchmark:
+    """Checks of allowed, symlink-free paths get cheaper."""
+
+    @posix_only
+    def test_sandbox_is_faster(self, tmp_path):
+        allowed, paths = _benchmark_setup(tmp_path)
+        sandbox = DirectorySandbox(allowed)
+        uncached = _time_checks(allowed, paths, None)
+        cached = _time_checks(allowed, paths, sandbox)
+        assert uncached / cached >= MIN_SANDBOX_SPEEDUP, f"sandbox {cached:.3f}s vs uncached {uncached:.3f}s"
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        allowed, paths = _benchmark_setup(Path(tmp))
+        sandbox = DirectorySandbox(allowed)
+        for label, box in (("uncached", None), ("sandbox", sandbox)):
+            elapsed = _time_checks(allowed, paths, box)
+            print(f"{label:>8}: {elapsed / BENCHMARK_CALLS * 1e6:.1f} us per check")
@@ -0,0 +1,269 @@
+"""
+Tests for the buffered (group commit) mode of EventRecorder.
+
+Verifies:
+1. Queued events are not visible to other connections until flushed
+2. Size threshold triggers a group commit
+3. Time threshold triggers a group commit on the next record
+4. Run-state transitions (completed, failed, paused, ...) flush immediately
+5. Sequences stay contiguous across flushes
+6. Large payload artifacts are committed with their events
+7. Context manager and clear_sequence_cache() flush pending events
+8. A failed commit keeps events queued for retry
+9. Benchmark: buffered recording needs far fewer commits than unbuffered
+"""
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.agentspec_models import (
+    EVENT_PAYLOAD_MAX_SIZE,
+    AgentEvent,
+    AgentRun,
+    AgentSpec,
+    Artifact,
+    generate_uuid,
+)
+from api.database import create_database
+from api.event_recorder import EventRecorder, clear_recorder_cache, get_event_recorder
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine, SessionLocal = create_database(tmp_path)
+    yield tmp_path, SessionLocal
+    engine.dispose()
+
+
+@pytest.fixture
+def run_id(db):
+    _, SessionLocal = db
+    session = SessionLocal()
+    spec = AgentSpec(
+        id=generate_uuid(), name="buffered-spec", display_name="Buffered", objective="o",
+        task_type="testing", tool_policy={"policy_version": "v1", "allowed_tools": []},
+    )
+    run = AgentRun(id=generate_uuid(), agent_spec_id=spec.id, status="running")
+    session.add_all([spec, run])
+    session.commit()
+    run_id = run.id
+    session.close()
+    return run_id
+
+
+def _committed_sequences(SessionLocal, run_id):
+    """Sequences visible from a separate session (i.e. committed)."""
+    session = SessionLocal()
+    try:
+        rows = session.query(AgentEvent.sequence).filter(AgentEvent.run_id == run_id).all()
+        return sorted(r[0] for r in rows)
+    finally:
+        session.close()
+
+
+class TestGroupCommit:
+    """Events are written in batches."""
+
+    def test_events_queued_until_flush(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=60)
+
+        for i in range(5):
+            recorder.record_tool_call(run_id, "bash", {"i": i})
+
+        assert recorder.pending_count == 5
+        assert _committed_sequences(SessionLocal, run_id) == []
+
+        assert recorder.flush() == 5
+        assert _committed_sequences(SessionLocal, run_id) == [1, 2, 3, 4, 5]
+        session.close()
+
+    def test_size_threshold(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=3, flush_interval=60)
+
+        for i in range(7):
+            recorder.record_tool_call(run_id, "bash", {"i": i})
+
+        assert _committed_sequences(SessionLocal, run_id) == [1, 2, 3, 4, 5, 6]
+        assert recorder.pending_count == 1
+        session.close()
+
+    def test_time_threshold(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=0.05)
+
+        recorder.record_tool_call(run_id, "bash", {})
+        time.sleep(0.1)
+        recorder.record_tool_call(run_id, "bash", {})
+
+        assert _committed_sequences(SessionLocal, run_id) == [1, 2]
+        session.close()
+
+    @pytest.mark.parametrize("transition", ["completed", "failed", "paused"])
+    def test_run_state_transition_flushes(self, db, run_id, transition):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=60)
+
+        recorder.record_tool_call(run_id, "bash", {})
+        recorder.record_tool_result(run_id, "bash", "ok")
+        event_id = recorder.record(run_id, transition, payload={})
+
+        assert _committed_sequences(SessionLocal, run_id) == [1, 2, 3]
+        assert recorder.pending_count == 0
+        assert isinstance(event_id, int)
+        session.close()
+
+    def test_queued_record_returns_none(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=2, flush_interval=60)
+
+        assert recorder.record_tool_call(run_id, "bash", {}) is None
+        event_id = recorder.record_tool_call(run_id, "bash", {})
+        assert session.get(AgentEvent, event_id).sequence == 2
+        session.close()
+
+    def test_get_event_recorder_honors_buffered(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        try:
+            recorder = get_event_recorder(session, project_dir)
+            assert get_event_recorder(session, project_dir, buffered=True) is recorder
+            assert recorder.buffered is True
+
+            recorder.record_tool_call(run_id, "bash", {})
+            assert recorder.pending_count == 1
+            get_event_recorder(session, project_dir)
+            assert recorder.buffered is False
+            assert _committed_sequences(SessionLocal, run_id) == [1]
+        finally:
+            clear_recorder_cache()
+            session.close()
+
+    def test_large_payload_artifact_committed_with_event(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=60)
+
+        recorder.record_tool_result(run_id, "bash", "x" * (EVENT_PAYLOAD_MAX_SIZE + 100))
+        recorder.flush()
+
+        check = SessionLocal()
+        event = check.query(AgentEvent).filter(AgentEvent.run_id == run_id).one()
+        assert event.artifact_ref is not None
+        assert check.query(Artifact).filter(Artifact.id == event.artifact_ref).count() == 1
+        check.close()
+        session.close()
+
+
+class TestDurability:
+    """Queued events are not silently dropped."""
+
+    def test_context_manager_flushes(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        with EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=60) as recorder:
+            recorder.record_tool_call(run_id, "bash", {})
+
+        assert _committed_sequences(SessionLocal, run_id) == [1]
+        session.close()
+
+    def test_clear_sequence_cache_flushes_first(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=60)
+
+        recorder.record_tool_call(run_id, "bash", {})
+        recorder.clear_sequence_cache(run_id)
+        recorder.record_tool_call(run_id, "bash", {})
+        recorder.flush()
+
+        assert _committed_sequences(SessionLocal, run_id) == [1, 2]
+        session.close()
+
+    def test_failed_commit_keeps_events_queued(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir, buffered=True, flush_size=100, flush_interval=60)
+        recorder.record_tool_call(run_id, "bash", {})
+
+        with patch.object(session, "commit", side_effect=RuntimeError("disk full")):
+            with pytest.raises(RuntimeError):
+                recorder.flush()
+
+        assert recorder.pending_count == 1
+        assert recorder.flush() == 1
+        assert _committed_sequences(SessionLocal, run_id) == [1]
+        session.close()
+
+    def test_unbuffered_default_commits_each_event(self, db, run_id):
+        project_dir, SessionLocal = db
+        session = SessionLocal()
+        recorder = EventRecorder(session, project_dir)
+
+        recorder.record_tool_call(run_id, "bash", {})
+
+        assert recorder.pending_count == 0
+        assert _committed_sequences(SessionLocal, run_id) == [1]
+        session.close()
+
+
+def _count_commits(session, buffered: bool, run_id: str, events: int = 200) -> int:
+    recorder = EventRecorder(session, buffered=buffered, flush_interval=60)
+    with patch.object(session, "commit", wraps=session.commit) as spy:
+        for i in range(events):
+            recorder.record_tool_call(run_id, "bash", {"i": i})
+        recorder.record_completed(run_id)
+        return spy.call_count
+
+
+class TestBenchmark:
+    """Group commit removes most per-event commits."""
+
+    def test_commit_count(self, db, run_id):
+        _, SessionLocal = db
+        session = SessionLocal()
+        unbuffered = _count_commits(session, buffered=False, run_id=run_id)
+        buffered = _count_commits(session, buffered=True, run_id=run_id)
+        session.close()
+
+        assert unbuffered == 201
+        assert buffered <= 201 // 64 + 1
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, SessionLocal = create_database(Path(tmp))
+        session = SessionLocal()
+        spec = AgentSpec(
+            id=generate_uuid(), name="bench", display_name="Bench", objective="o",
+            task_type="testing", tool_policy={"policy_version": "v1", "allowed_tools": []},
+        )
+        session.add(spec)
+        session.commit()
+        for buffered in (False, True):
+            run = AgentRun(id=generate_uuid(), agent_spec_id=spec.id, status="running")
+            session.add(run)
+            session.commit()
+            recorder = EventRecorder(session, buffered=buffered)
+            start = time.perf_counter()
+            for i in range(1000):
+                recorder.record_tool_call(run.id, "bash", {"i": i})
+            recorder.record_completed(run.id)
+            elapsed = time.perf_counter() - start
+            print(f"buffered={buffered}: 1,000 tool events in {elapsed * 1000:.1f} ms")
+        session.close()
+        engine.dispose()
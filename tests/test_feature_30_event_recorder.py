@@ -29,6 +29,7 @@ from api.agentspec_models import (
     EVENT_PAYLOAD_MAX_SIZE,
     generate_uuid,
 )
+from api.artifact_storage import read_blob
 from api.event_recorder import (
     EventRecorder,
     get_event_recorder,
@@ -248,7 +249,7 @@ class TestArtifactCreation:
         # Check file exists and contains full payload
         storage_path = project_dir / artifact.content_ref
         assert storage_path.exists()
-        content = json.loads(storage_path.read_text())
+        content = json.loads(read_blob(storage_path))
         assert content == large_payload
 
     def test_truncated_payload_summary(self, db_session, project_dir, test_run):
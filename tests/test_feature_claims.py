@@ -0,0 +1,192 @@
+"""
+Tests for race-free feature claiming (api/feature_claims.py).
+
+Verifies:
+1. claim_feature() claims once; a second claim of the same feature fails
+2. claim_next_ready_feature() only picks ready features, in the given order
+3. Concurrent workers never claim the same feature
+4. Leases expire, can be renewed, and only the holder can renew or release
+"""
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.database import Feature, create_database
+from api.feature_claims import (
+    claim_feature,
+    claim_next_ready_feature,
+    release_feature,
+    renew_feature_lease,
+)
+
+
+@pytest.fixture
+def session_maker(tmp_path):
+    engine, session_maker = create_database(tmp_path)
+    yield session_maker
+    engine.dispose()
+
+
+def _add(session_maker, *features: dict) -> None:
+    session = session_maker()
+    try:
+        for f in features:
+            session.add(Feature(
+                id=f["id"],
+                priority=f.get("priority", f["id"]),
+                category="test",
+                name=f"Feature {f['id']}",
+                description="desc",
+                steps=["step"],
+                passes=f.get("passes", False),
+                in_progress=f.get("in_progress", False),
+                dependencies=f.get("dependencies"),
+            ))
+        session.commit()
+    finally:
+        session.close()
+
+
+def _claim_next(session_maker, **kwargs):
+    session = session_maker()
+    try:
+        return claim_next_ready_feature(session, **kwargs)
+    finally:
+        session.close()
+
+
+class TestClaimFeature:
+    """Claiming a specific feature."""
+
+    def test_claim_once(self, session_maker):
+        _add(session_maker, {"id": 1})
+        session = session_maker()
+        try:
+            claimed = claim_feature(session, 1)
+            assert claimed["id"] == 1
+            assert claimed["in_progress"] is True
+            assert claimed["steps"] == ["step"]
+            assert claim_feature(session, 1) is None
+        finally:
+            session.close()
+
+    def test_passing_and_missing_not_claimable(self, session_maker):
+        _add(session_maker, {"id": 1, "passes": True})
+        session = session_maker()
+        try:
+            assert claim_feature(session, 1) is None
+            assert claim_feature(session, 99) is None
+        finally:
+            session.close()
+
+
+class TestClaimNextReady:
+    """Selection and claim happen in one statement."""
+
+    def test_skips_unready(self, session_maker):
+        _add(
+            session_maker,
+            {"id": 1, "passes": True},
+            {"id": 2, "dependencies": [1]},
+            {"id": 3, "dependencies": [2]},      # blocked by #2
+            {"id": 4, "dependencies": [99]},     # missing dependency
+            {"id": 5, "in_progress": True},
+        )
+        assert _claim_next(session_maker)["id"] == 2
+        assert _claim_next(session_maker) is None
+
+    def test_follows_given_order(self, session_maker):
+        _add(session_maker, {"id": 1}, {"id": 2}, {"id": 3})
+        assert _claim_next(session_maker, order=[3, 1])["id"] == 3
+        assert _claim_next(session_maker, order=[3, 1])["id"] == 1
+        # Unlisted ready features follow by priority
+        assert _claim_next(session_maker, order=[3, 1])["id"] == 2
+
+    def test_malformed_dependencies_count_as_none(self, session_maker):
+        _add(session_maker, {"id": 1, "dependencies": {"not": "a list"}})
+        assert _claim_next(session_maker)["id"] == 1
+
+    def test_concurrent_claims_are_distinct(self, session_maker):
+        _add(session_maker, *({"id": i} for i in range(1, 21)))
+        results: list[int | None] = []
+        lock = threading.Lock()
+
+        def worker():
+            claimed = _claim_next(session_maker)
+            with lock:
+                results.append(claimed["id"] if claimed else None)
+
+        threads = [threading.Thread(target=worker) for _ in range(30)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        ids = [r for r in results if r is not None]
+        assert sorted(ids) == list(range(1, 21))
+        assert results.count(None) == 10
+
+
+class TestLeases:
+    """Leases let claims of dead workers be recovered."""
+
+    def _expire(self, session_maker, feature_id):
+        session = session_maker()
+        try:
+            feature = session.get(Feature, feature_id)
+            feature.lease_expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            session.commit()
+        finally:
+            session.close()
+
+    def test_expired_lease_is_reclaimed(self, session_maker):
+        _add(session_maker, {"id": 1})
+        assert _claim_next(session_maker, worker_id="a", lease_seconds=60)["id"] == 1
+        assert _claim_next(session_maker, worker_id="b", lease_seconds=60) is None
+
+        self._expire(session_maker, 1)
+        assert _claim_next(session_maker, worker_id="b", lease_seconds=60)["id"] == 1
+
+        session = session_maker()
+        try:
+            # The original holder lost the claim
+            assert not renew_feature_lease(session, 1, "a", 60)
+            assert renew_feature_lease(session, 1, "b", 60)
+            assert not release_feature(session, 1, worker_id="a")
+            assert release_feature(session, 1, worker_id="b")
+            feature = session.get(Feature, 1)
+            session.refresh(feature)
+            assert feature.in_progress is False
+            assert feature.claimed_by is None
+        finally:
+            session.close()
+
+    def test_renew_extends_lease(self, session_maker):
+        _add(session_maker, {"id": 1})
+        assert _claim_next(session_maker, worker_id="a", lease_seconds=60)["id"] == 1
+        session = session_maker()
+        try:
+            before = session.get(Feature, 1).lease_expires_at
+            assert renew_feature_lease(session, 1, "a", 3600)
+            feature = session.get(Feature, 1)
+            session.refresh(feature)
+            assert feature.lease_expires_at > before + timedelta(seconds=3000)
+            assert feature.claimed_by == "a"
+        finally:
+            session.close()
+
+    def test_claim_without_lease_never_expires(self, session_maker):
+        _add(session_maker, {"id": 1})
+        assert _claim_next(session_maker)["id"] == 1
+        session = session_maker()
+        try:
+            assert session.get(Feature, 1).lease_expires_at is None
+        finally:
+            session.close()
+        assert _claim_next(session_maker) is None
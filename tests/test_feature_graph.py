@@ -0,0 +1,291 @@
+"""
+Tests for the incremental FeatureGraph used by the scheduler.
+
+Verifies:
+1. Readiness matches dependency_resolver rules (passing deps, missing deps, in_progress)
+2. Ready ordering matches compute_scheduling_scores (-score, priority, id)
+3. passes / in_progress flips update dependents without rescoring
+4. Dependency and priority changes bump the graph version and reorder
+5. sync() applies only the differences from a snapshot
+6. get_ready() honours limit and exclude
+7. Randomized equivalence with a from-scratch computation
+8. ParallelOrchestrator reads go through the graph and see subprocess writes
+9. Benchmark: status flip + next-N query on 2,000 features
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from api.dependency_resolver import compute_scheduling_scores, get_ready_features
+from api.feature_graph import FeatureGraph
+
+# Mean time allowed for one status flip followed by a next-5 ready query
+MAX_FLIP_AND_QUERY_SECONDS = 0.001
+
+
+def _feature(fid, deps=None, priority=None, passes=False, in_progress=False):
+    return {
+        "id": fid,
+        "priority": fid if priority is None else priority,
+        "passes": passes,
+        "in_progress": in_progress,
+        "dependencies": deps or [],
+    }
+
+
+def _reference_ready(features):
+    """Ready IDs computed from scratch, as the scheduler used to."""
+    passing = {f["id"] for f in features if f["passes"]}
+    ready = [
+        f for f in features
+        if not f["passes"] and not f["in_progress"]
+        and all(d in passing for d in f["dependencies"])
+    ]
+    scores = compute_scheduling_scores(features)
+    ready.sort(key=lambda f: (-scores.get(f["id"], 0), f["priority"], f["id"]))
+    return [f["id"] for f in ready]
+
+
+def _random_features(n, seed):
+    rng = random.Random(seed)
+    features = []
+    for fid in range(1, n + 1):
+        candidates = range(1, fid)
+        deps = rng.sample(candidates, min(len(candidates), rng.randint(0, 3)))
+        features.append(_feature(fid, deps, priority=rng.randint(1, 50),
+                                 passes=rng.random() < 0.3, in_progress=rng.random() < 0.1))
+    return features
+
+
+class TestReadiness:
+    """Which features are ready."""
+
+    def test_roots_are_ready(self):
+        graph = FeatureGraph.from_features([_feature(1), _feature(2, [1])])
+        assert graph.get_ready() == [1]
+
+    def test_passing_dependency_unblocks(self):
+        graph = FeatureGraph.from_features([_feature(1, passes=True), _feature(2, [1])])
+        assert graph.get_ready() == [2]
+
+    def test_missing_dependency_blocks(self):
+        graph = FeatureGraph.from_features([_feature(2, [99])])
+        assert graph.get_ready() == []
+        assert graph.get_blocking(2) == [99]
+
+    def test_missing_dependency_added_later_as_passing(self):
+        graph = FeatureGraph.from_features([_feature(2, [99])])
+        graph.upsert_feature(_feature(99, passes=True))
+        assert graph.get_ready() == [2]
+
+    def test_removed_passing_dependency_blocks_again(self):
+        graph = FeatureGraph.from_features([_feature(1, passes=True), _feature(2, [1])])
+        graph.remove_feature(1)
+        assert graph.get_ready() == []
+
+    def test_in_progress_is_not_ready(self):
+        graph = FeatureGraph.from_features([_feature(1, in_progress=True)])
+        assert graph.get_ready() == []
+        assert graph.in_progress_ids() == [1]
+
+
+class TestIncrementalUpdates:
+    """Status and structure changes."""
+
+    def test_status_flip_keeps_scores(self):
+        graph = FeatureGraph.from_features([_feature(1), _feature(2, [1]), _feature(3, [1])])
+        graph.get_ready()
+        version = graph.version
+
+        graph.set_passes(1, True)
+
+        assert graph.version == version
+        assert graph.get_ready() == _reference_ready(
+            [_feature(1, passes=True), _feature(2, [1]), _feature(3, [1])]
+        )
+
+    def test_unpassing_reblocks_dependents(self):
+        graph = FeatureGraph.from_features([_feature(1, passes=True), _feature(2, [1])])
+        graph.set_passes(1, False)
+        assert graph.get_ready() == [1]
+
+    def test_in_progress_flip(self):
+        graph = FeatureGraph.from_features([_feature(1), _feature(2)])
+        graph.set_in_progress(1, True)
+        assert graph.get_ready() == [2]
+        graph.set_in_progress(1, False)
+        assert sorted(graph.get_ready()) == [1, 2]
+
+    def test_dependency_change_bumps_version(self):
+        graph = FeatureGraph.from_features([_feature(1), _feature(2)])
+        version = graph.version
+        graph.set_dependencies(2, [1])
+        assert graph.version > version
+        assert graph.get_ready() == [1]
+        assert graph.get_dependents(1) == {2}
+        assert graph.dependent_count(1) == 1
+
+    def test_priority_change_reorders(self):
+        graph = FeatureGraph.from_features([_feature(1, priority=1), _feature(2, priority=2)])
+        assert graph.get_ready() == [1, 2]
+        graph.set_priority(1, 5)
+        assert graph.get_ready() == [2, 1]
+
+    def test_sync_counts_changes(self):
+        features = [_feature(1), _feature(2, [1]), _feature(3)]
+        graph = FeatureGraph.from_features(features)
+        assert graph.sync(features) == 0
+
+        features[0]["passes"] = True
+        del features[2]
+        assert graph.sync(features) == 2
+        assert len(graph) == 2
+        assert graph.get_ready() == [2]
+
+
+class TestGetReady:
+    """Limit and exclusion."""
+
+    def test_limit(self):
+        graph = FeatureGraph.from_features([_feature(i) for i in range(1, 6)])
+        assert graph.get_ready(limit=2) == [1, 2]
+        # Query does not consume the heap
+        assert graph.get_ready(limit=2) == [1, 2]
+
+    def test_exclude(self):
+        graph = FeatureGraph.from_features([_feature(i) for i in range(1, 6)])
+        assert graph.get_ready(limit=2, exclude={1, 3}) == [2, 4]
+
+    def test_resolver_get_ready_features_reuses_graph(self):
+        features = [_feature(1), _feature(2, [1]), _feature(3)]
+        graph = FeatureGraph()
+        assert [f["id"] for f in get_ready_features(features, graph=graph)] == [1, 3]
+
+        features[0]["passes"] = True
+        version = graph.version
+        assert [f["id"] for f in get_ready_features(features, graph=graph)] == _reference_ready(features)
+        assert graph.version == version
+
+
+class TestEquivalence:
+    """Incremental results match a from-scratch computation."""
+
+    def test_random_flips_match_reference(self):
+        rng = random.Random(7)
+        features = _random_features(300, seed=7)
+        graph = FeatureGraph.from_features(features)
+
+        for _ in range(500):
+            f = rng.choice(features)
+            if rng.random() < 0.5:
+                f["passes"] = not f["passes"]
+                graph.set_passes(f["id"], f["passes"])
+            else:
+                f["in_progress"] = not f["in_progress"]
+                graph.set_in_progress(f["id"], f["in_progress"])
+            assert graph.get_ready() == _reference_ready(features)
+
+    def test_random_structure_changes_match_reference(self):
+        rng = random.Random(11)
+        features = _random_features(200, seed=11)
+        graph = FeatureGraph.from_features(features)
+
+        for _ in range(50):
+            f = rng.choice(features)
+            f["dependencies"] = rng.sample(range(1, f["id"]), min(f["id"] - 1, 2))
+            f["priority"] = rng.randint(1, 50)
+            graph.sync(features)
+            assert graph.get_ready() == _reference_ready(features)
+
+
+class TestOrchestratorIntegration:
+    """ParallelOrchestrator keeps its graph in sync with the database."""
+
+    def _make_orchestrator(self, project_dir, features):
+        from api.database import Feature, create_database
+        from parallel_orchestrator import ParallelOrchestrator
+
+        _, SessionLocal = create_database(project_dir)
+        session = SessionLocal()
+        for f in features:
+            session.add(Feature(
+                id=f["id"], priority=f["priority"], category="core", name=f"Feature {f['id']}",
+                description="d", steps=["s"], passes=f["passes"], in_progress=f["in_progress"],
+                dependencies=f["dependencies"] or None,
+            ))
+        session.commit()
+        session.close()
+        return ParallelOrchestrator(project_dir=project_dir, max_concurrency=2), SessionLocal
+
+    def test_ready_features_match_reference(self, tmp_path):
+        features = _random_features(60, seed=5)
+        orchestrator, _ = self._make_orchestrator(tmp_path, features)
+
+        ready = orchestrator.get_ready_features()
+        assert [f["id"] for f in ready] == _reference_ready(features)
+        assert [f["id"] for f in orchestrator.get_ready_features(limit=2)] == _reference_ready(features)[:2]
+        assert "name" in ready[0]
+
+    def test_sees_external_writes(self, tmp_path):
+        from api.database import Feature
+
+        orchestrator, SessionLocal = self._make_orchestrator(tmp_path, [_feature(1), _feature(2, [1])])
+        assert [f["id"] for f in orchestrator.get_ready_features()] == [1]
+
+        # An agent subprocess marks #1 passing
+        session = SessionLocal()
+        session.query(Feature).filter(Feature.id == 1).update({"passes": True})
+        session.commit()
+        session.close()
+
+        assert [f["id"] for f in orchestrator.get_ready_features()] == [2]
+        assert orchestrator.get_all_complete() is False
+
+    def test_resumable_and_failed(self, tmp_path):
+        orchestrator, _ = self._make_orchestrator(
+            tmp_path, [_feature(1, in_progress=True), _feature(2, passes=True), _feature(3)]
+        )
+        assert [f["id"] for f in orchestrator.get_resumable_features()] == [1]
+
+        orchestrator._failure_counts = {1: 99, 3: 99}
+        assert orchestrator.get_resumable_features() == []
+        assert orchestrator.get_ready_features() == []
+        assert orchestrator.get_all_complete() is True
+
+
+def _time_flip_and_query(n: int = 2000, iterations: int = 500) -> float:
+    """Return mean seconds for one passes flip plus a next-5 ready query."""
+    features = _random_features(n, seed=3)
+    graph = FeatureGraph.from_features(features)
+    graph.get_ready(limit=5)
+    rng = random.Random(3)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fid = rng.randint(1, n)
+        graph.set_passes(fid, not graph.is_passing(fid))
+        graph.get_ready(limit=5)
+    return (time.perf_counter() - start) / iterations
+
+
+class TestBenchmark:
+    """Incremental updates stay far below a full rescoring pass."""
+
+    def test_flip_and_query_is_cheap(self):
+        mean = _time_flip_and_query()
+        assert mean < MAX_FLIP_AND_QUERY_SECONDS, (
+            f"Flip + next-5 query took {mean * 1000:.3f} ms "
+            f"(budget {MAX_FLIP_AND_QUERY_SECONDS * 1000:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    features = _random_features(2000, seed=3)
+    start = time.perf_counter()
+    _reference_ready(features)
+    print(f"From-scratch ready list (2,000 features): {(time.perf_counter() - start) * 1000:.2f} ms")
+    print(f"Incremental flip + next-5 query: {_time_flip_and_query() * 1000:.4f} ms")
@@ -0,0 +1,223 @@
+"""
+Tests for compact scheduling records (api/feature_lite.py).
+
+Verifies:
+1. load_feature_lites() reads the scheduling columns from a sqlite3
+   connection, normalizing flags and malformed dependency JSON
+2. Parsed dependency tuples are cached and shared between equal values
+3. FeatureLite reads like a feature dict and feeds FeatureGraph.sync()
+4. Benchmark: at 10k features the loader is faster and smaller than
+   loading ORM Feature objects and converting them with to_dict()
+
+Run the benchmark directly with: python tests/test_feature_lite.py
+"""
+import gc
+import json
+import random
+import sqlite3
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.feature_graph import FeatureGraph
+from api.feature_lite import FeatureLite, load_feature_lites, parse_dependencies
+
+# Wall-clock budget for loading 10k features (generous for slow CI machines)
+MAX_LOAD_10K_SECONDS = 1.0
+
+BENCHMARK_SIZE = 10_000
+
+
+def _create_features_table(conn: sqlite3.Connection) -> None:
+    """The columns load_feature_lites() reads, as api.database defines them."""
+    conn.execute("""
+        CREATE TABLE features (
+            id INTEGER PRIMARY KEY,
+            priority INTEGER NOT NULL,
+            category VARCHAR(100) NOT NULL DEFAULT '',
+            name VARCHAR(255) NOT NULL DEFAULT '',
+            description TEXT NOT NULL DEFAULT '',
+            steps JSON NOT NULL DEFAULT '[]',
+            passes BOOLEAN DEFAULT 0,
+            in_progress BOOLEAN DEFAULT 0,
+            dependencies JSON
+        )
+    """)
+
+
+def _insert(conn: sqlite3.Connection, rows: list[tuple]) -> None:
+    conn.executemany(
+        "INSERT INTO features (id, priority, passes, in_progress, dependencies) VALUES (?, ?, ?, ?, ?)",
+        rows,
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    _create_features_table(conn)
+    yield conn
+    conn.close()
+
+
+class TestLoader:
+    """Raw loading and normalization."""
+
+    def test_loads_scheduling_fields(self, conn):
+        _insert(conn, [
+            (2, 5, 0, 1, "[1]"),
+            (1, 1, 1, 0, None),
+            (3, 3, None, None, "[1, 2, 1]"),
+        ])
+        assert load_feature_lites(conn) == [
+            FeatureLite(1, 1, True, False, ()),
+            FeatureLite(2, 5, False, True, (1,)),
+            # NULL flags read as False, duplicates collapse
+            FeatureLite(3, 3, False, False, (1, 2)),
+        ]
+
+    def test_malformed_dependencies(self):
+        assert parse_dependencies("not json") == ()
+        assert parse_dependencies('{"not": "a list"}') == ()
+        assert parse_dependencies('[1, "x", 1.5, null, true, 2]') == (1, 2)
+        assert parse_dependencies("[]") == ()
+        assert parse_dependencies(None) == ()
+
+    def test_parsed_dependencies_are_shared(self, conn):
+        _insert(conn, [(1, 1, 0, 0, None), (2, 2, 0, 0, "[1]"), (3, 3, 0, 0, "[1]")])
+        first = load_feature_lites(conn)
+        second = load_feature_lites(conn)
+        assert first[1].dependencies is first[2].dependencies
+        assert first[1].dependencies is second[1].dependencies
+
+
+class TestRecord:
+    """FeatureLite as a stand-in for scheduling dicts."""
+
+    def test_dict_access(self):
+        feature = FeatureLite(7, 2, False, True, (3, 4))
+        assert feature["id"] == 7
+        assert feature.get("dependencies") == (3, 4)
+        assert feature.get("name", "unnamed") == "unnamed"
+        with pytest.raises(KeyError):
+            feature["name"]
+        assert feature.to_dict() == {
+            "id": 7, "priority": 2, "passes": False, "in_progress": True, "dependencies": [3, 4],
+        }
+        assert not hasattr(feature, "__dict__")
+
+    def test_feeds_feature_graph(self, conn):
+        _insert(conn, [
+            (1, 1, 1, 0, None),
+            (2, 2, 0, 0, "[1]"),
+            (3, 3, 0, 0, "[2]"),
+            (4, 0, 0, 0, "[99]"),
+        ])
+        lites = load_feature_lites(conn)
+        graph = FeatureGraph.from_features(lites)
+        reference = FeatureGraph.from_features(f.to_dict() for f in lites)
+        assert graph.get_ready() == reference.get_ready() == [2]
+
+        conn.execute("UPDATE features SET passes = 1 WHERE id = 2")
+        assert graph.sync(load_feature_lites(conn)) == 1
+        assert graph.get_ready() == [3]
+        # An unchanged snapshot touches nothing
+        assert graph.sync(load_feature_lites(conn)) == 0
+
+
+def _benchmark_rows(n: int, seed: int = 42) -> list[tuple]:
+    rng = random.Random(seed)
+    rows = []
+    for fid in range(1, n + 1):
+        candidates = range(max(1, fid - 200), fid)
+        deps = rng.sample(candidates, min(len(candidates), rng.randint(0, 3)))
+        rows.append((fid, rng.randint(1, 20), int(rng.random() < 0.3), 0, json.dumps(deps) if deps else None))
+    return rows
+
+
+def _measure(load) -> tuple[float, int]:
+    """(seconds, bytes still allocated by the result) for one load() call."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, size
+
+
+def _lite_vs_orm(tmp_path: Path, n: int) -> dict[str, tuple[float, int]]:
+    from api.database import Feature, create_database
+
+    engine, session_maker = create_database(tmp_path)
+    try:
+        session = session_maker()
+        try:
+            session.add_all(
+                Feature(
+                    id=fid, priority=priority, category="bench", name=f"Feature {fid}",
+                    description="Benchmark feature " * 8, steps=["step one", "step two"],
+                    passes=bool(passes), in_progress=bool(in_progress),
+                    dependencies=json.loads(deps) if deps else None,
+                )
+                for fid, priority, passes, in_progress, deps in _benchmark_rows(n)
+            )
+            session.commit()
+        finally:
+            session.close()
+
+        def load_orm():
+            session = session_maker()
+            try:
+                return [f.to_dict() for f in session.query(Feature).all()]
+            finally:
+                session.close()
+
+        def load_lite():
+            session = session_maker()
+            try:
+                return load_feature_lites(session)
+            finally:
+                session.close()
+
+        # Warm both paths (mapper configuration, dependency cache)
+        load_orm()
+        load_lite()
+        return {"orm": _measure(load_orm), "lite": _measure(load_lite)}
+    finally:
+        engine.dispose()
+
+
+class TestBenchmark:
+    """Loading 10k features."""
+
+    def test_load_10k(self, conn):
+        _insert(conn, _benchmark_rows(BENCHMARK_SIZE))
+        load_feature_lites(conn)
+        elapsed, _ = _measure(lambda: load_feature_lites(conn))
+        assert elapsed < MAX_LOAD_10K_SECONDS, f"10k load took {elapsed:.2f}s"
+
+    def test_smaller_and_faster_than_orm(self, tmp_path):
+        pytest.importorskip("sqlalchemy")
+        results = _lite_vs_orm(tmp_path, BENCHMARK_SIZE)
+        orm_seconds, orm_bytes = results["orm"]
+        lite_seconds, lite_bytes = results["lite"]
+        assert lite_bytes < orm_bytes / 2
+        assert lite_seconds < orm_seconds
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for path, (seconds, size) in _lite_vs_orm(Path(tmp), BENCHMARK_SIZE).items():
+            print(f"{path:>4}: {BENCHMARK_SIZE:,} features in {seconds * 1000:.1f} ms, {size / 1024:.0f} KiB")
@@ -0,0 +1,310 @@
+"""
+Tests for the combined forbidden-pattern matcher used by ToolPolicyEnforcer.
+
+Verifies:
+1. iter_argument_strings() renders each key and value of nested arguments as a JSON literal
+2. The reported pattern is the first matching pattern in list order
+3. Patterns that cannot be combined (backreferences, named groups, inline flags) still match
+4. Results agree with per-pattern matching on random argument strings
+5. ToolPolicyEnforcer builds the matcher once and rebuilds it if the pattern list changes
+6. Single-field matches agree with serialize_tool_arguments() + per-pattern matching
+7. Required-literal prefilter never hides a match (including non-ASCII text)
+8. Benchmark: combined matching beats serialize + per-pattern matching
+"""
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import api.tool_policy as tool_policy
+from api.tool_policy import (
+    STANDARD_FORBIDDEN_PATTERNS,
+    TASK_SPECIFIC_FORBIDDEN_PATTERNS,
+    ForbiddenPatternMatcher,
+    ToolCallBlocked,
+    ToolPolicyEnforcer,
+    check_arguments_against_patterns,
+    compile_forbidden_patterns,
+    iter_argument_strings,
+    serialize_tool_arguments,
+)
+
+# Combined matching must be at least this much faster than the legacy path
+MIN_SPEEDUP = 2.0
+
+ALL_PATTERNS = STANDARD_FORBIDDEN_PATTERNS + TASK_SPECIFIC_FORBIDDEN_PATTERNS["audit"]
+
+
+def _reference(strings, patterns):
+    """First pattern (in list order) that matches any string, one regex at a time."""
+    for pattern in patterns:
+        if any(pattern.regex.search(s) for s in strings):
+            return pattern
+    return None
+
+
+class TestIterArgumentStrings:
+    """String collection from tool arguments."""
+
+    def test_nested_keys_and_values(self):
+        args = {"command": "ls", "opts": {"env": ["A=1", "B=2"], "count": 3, "flag": True}}
+        assert sorted(iter_argument_strings(args)) == sorted(
+            ['"command"', '"ls"', '"opts"', '"env"', '"A=1"', '"B=2"', '"count"', "3", '"flag"', "true"]
+        )
+
+    def test_strings_escaped_as_in_json(self):
+        assert sorted(iter_argument_strings({"k": 'x"y\n', "n": None})) == sorted(
+            ['"k"', '"x\\"y\\n"', '"n"', "null"]
+        )
+
+    def test_none_and_scalars(self):
+        assert iter_argument_strings(None) == []
+        assert iter_argument_strings("raw string") == ["raw string"]
+        assert iter_argument_strings(42) == ["42"]
+
+    def test_no_depth_limit(self):
+        deep = "secret"
+        for _ in range(50):
+            deep = {"a": [deep]}
+        assert '"secret"' in iter_argument_strings(deep)
+
+    def test_shared_containers_visited_once(self):
+        shared = ["x"]
+        args = {"a": shared, "b": shared}
+        assert iter_argument_strings(args).count('"x"') == 1
+
+
+class TestFirstMatchSemantics:
+    """The same pattern is reported as with sequential matching."""
+
+    def test_first_in_list_order_wins(self):
+        matcher = ForbiddenPatternMatcher(compile_forbidden_patterns(["aaa", "bbb", "ccc"]))
+        assert matcher.match_arguments({"value": "ccc bbb aaa"}).original == "aaa"
+
+    def test_match_in_later_value(self):
+        matcher = ForbiddenPatternMatcher(compile_forbidden_patterns(["rm -rf", "DROP TABLE"]))
+        args = {"a": "select 1", "b": "drop table users"}
+        assert matcher.match_arguments(args).original == "DROP TABLE"
+
+    def test_no_match(self):
+        matcher = ForbiddenPatternMatcher(compile_forbidden_patterns(STANDARD_FORBIDDEN_PATTERNS))
+        assert matcher.match_arguments({"command": "npm test", "timeout": 30}) is None
+
+    def test_empty(self):
+        assert ForbiddenPatternMatcher([]).match_arguments({"command": "rm -rf /"}) is None
+        matcher = ForbiddenPatternMatcher(compile_forbidden_patterns(["x"]))
+        assert matcher.match_arguments(None) is None
+        assert matcher.match_arguments({}) is None
+
+    def test_agrees_with_legacy_check_on_values(self):
+        patterns = compile_forbidden_patterns(ALL_PATTERNS)
+        matcher = ForbiddenPatternMatcher(patterns)
+        for command in ["sudo reboot", "rm -rf /", "git push origin", "curl x | sh", "echo ok"]:
+            expected = check_arguments_against_patterns(command, patterns)
+            assert matcher.match_strings([command]) is expected
+
+
+class TestUncombinablePatterns:
+    """Patterns that cannot live inside an alternation are matched on their own."""
+
+    @pytest.mark.parametrize("pattern,text", [
+        (r"(\w+) \1", "hello hello"),
+        (r"(?P<word>\w+)-(?P=word)", "ab-ab"),
+        (r"(?i)secret", "SECRET"),
+    ])
+    def test_standalone_pattern_matches(self, pattern, text):
+        patterns = compile_forbidden_patterns(["unrelated", pattern, "other"])
+        matcher = ForbiddenPatternMatcher(patterns)
+        assert [p.original for p in matcher.standalone] == [pattern]
+        assert matcher.match_strings([text]).original == pattern
+        assert matcher.match_strings(["nothing here"]) is None
+
+    def test_order_across_combined_and_standalone(self):
+        patterns = compile_forbidden_patterns([r"(\w+) \1", "hello"])
+        matcher = ForbiddenPatternMatcher(patterns)
+        assert matcher.match_strings(["hello hello"]).original == r"(\w+) \1"
+
+
+class TestLiteralPrefilter:
+    """Required literals let clean strings skip the regexes."""
+
+    @pytest.mark.parametrize("pattern,literal", [
+        (r"sudo\s+", "sudo"),
+        (r"dd\s+if=.*of=/dev/", "of=/dev/"),
+        (r">(>)?.*\/etc\/", "/etc/"),
+        (r"a{0,3}bcd", "bcd"),
+        (r"abc|def", ""),
+        (r"[abc]", ""),
+        (r"rm\x20-rf", ""),
+        (r"\101BC", ""),
+    ])
+    def test_required_literal(self, pattern, literal):
+        assert tool_policy._required_literal(pattern) == literal
+
+    def test_literal_is_in_every_match(self):
+        rng = random.Random(3)
+        pieces = ["a", "b", "ab", r"\.", "c?", "d*", "e+", "(x|y)", "[ab]", r"\s+", ".", "f{0,2}", "g{2}"]
+        alphabet = "abcdefgxy. "
+        for _ in range(500):
+            pattern = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 5)))
+            literal = tool_policy._required_literal(pattern)
+            regex = compile_forbidden_patterns([pattern])[0].regex
+            for _ in range(20):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+                if regex.search(text):
+                    assert literal in text.lower(), (pattern, literal, text)
+
+    @pytest.mark.parametrize("pattern,text", [
+        (r"rm\x20-rf", "rm -rf /"),
+        (r"e\x41f", "eAf"),
+        (r"\101BC", "ABC"),
+        (r"\060rm", "0rm"),
+        (r"r\u006d -rf", "rm -rf"),
+        (r"r\U0000006d -rf", "rm -rf"),
+        (r"rm\N{SPACE}-rf", "rm -rf"),
+        (r"(rm) \1 -rf", "rm rm -rf"),
+    ])
+    def test_multi_character_escapes(self, pattern, text):
+        patterns = compile_forbidden_patterns(["unrelated", pattern])
+        matcher = ForbiddenPatternMatcher(patterns)
+        expected = check_arguments_against_patterns(text, patterns)
+        assert expected is not None
+        assert matcher.match_strings([text]) is expected
+        assert matcher.match_arguments({"command": text}) is expected
+
+    def test_non_ascii_text_uses_full_match(self):
+        # U+017F (long s) matches "s" under re.IGNORECASE, but "sudo" is not a substring
+        matcher = ForbiddenPatternMatcher(compile_forbidden_patterns([r"sudo\s+"]))
+        assert matcher.match_strings(["\u017fudo reboot"]).original == r"sudo\s+"
+
+
+class TestRandomizedEquivalence:
+    """Combined matching agrees with one-regex-at-a-time matching."""
+
+    def test_random_strings(self):
+        rng = random.Random(5)
+        words = ["rm", "-rf", "/", "sudo", "git", "push", "DROP", "TABLE", "cp", "ls",
+                 "chmod", "777", "curl", "|", "sh", "echo", "x", "/etc/", ">", "mkfs."]
+        patterns = compile_forbidden_patterns(ALL_PATTERNS + [r"(\w+) \1"])
+        matcher = ForbiddenPatternMatcher(patterns)
+        for _ in range(2000):
+            strings = [
+                " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+                for _ in range(rng.randint(1, 3))
+            ]
+            assert matcher.match_strings(strings) is _reference(strings, patterns)
+
+
+class TestEnforcerIntegration:
+    """ToolPolicyEnforcer uses the combined matcher."""
+
+    def test_blocks_with_first_pattern(self):
+        enforcer = ToolPolicyEnforcer.from_tool_policy(
+            "spec", {"forbidden_patterns": ["aaa", "bbb"]}
+        )
+        with pytest.raises(ToolCallBlocked) as exc:
+            enforcer.validate_tool_call("Bash", {"command": "bbb then aaa"})
+        assert exc.value.pattern_matched == "aaa"
+
+    def test_matcher_built_once(self):
+        enforcer = ToolPolicyEnforcer.from_tool_policy("spec", {"forbidden_patterns": ALL_PATTERNS})
+        with patch.object(tool_policy, "ForbiddenPatternMatcher",
+                          wraps=tool_policy.ForbiddenPatternMatcher) as spy:
+            for i in range(50):
+                enforcer.validate_tool_call("Read", {"file_path": f"src/file_{i}.py"})
+            assert spy.call_count == 1
+
+    def test_rebuilt_when_patterns_change(self):
+        enforcer = ToolPolicyEnforcer.from_tool_policy("spec", {"forbidden_patterns": ["aaa"]})
+        enforcer.validate_tool_call("Bash", {"command": "bbb"})
+        enforcer.forbidden_patterns = compile_forbidden_patterns(["aaa", "bbb"])
+        with pytest.raises(ToolCallBlocked):
+            enforcer.validate_tool_call("Bash", {"command": "bbb"})
+
+    def test_rebuilt_when_list_edited_in_place(self):
+        enforcer = ToolPolicyEnforcer.from_tool_policy("spec", {"forbidden_patterns": ["aaa"]})
+        enforcer.validate_tool_call("Bash", {"command": "bbb"})
+        enforcer.forbidden_patterns[0] = compile_forbidden_patterns(["bbb"])[0]
+        with pytest.raises(ToolCallBlocked):
+            enforcer.validate_tool_call("Bash", {"command": "bbb"})
+
+    def test_does_not_serialize_arguments(self):
+        enforcer = ToolPolicyEnforcer.from_tool_policy("spec", {"forbidden_patterns": ["x"]})
+        with patch.object(tool_policy, "serialize_tool_arguments") as spy:
+            enforcer.validate_tool_call("Bash", {"command": "ls"})
+        spy.assert_not_called()
+
+    def test_values_matched_as_json_literals(self):
+        # Patterns written against the serialized form keep working
+        enforcer = ToolPolicyEnforcer.from_tool_policy(
+            "spec", {"forbidden_patterns": [r'--\"', r"rm\s+.*\.db$"]}
+        )
+        with pytest.raises(ToolCallBlocked):
+            enforcer.validate_tool_call("Bash", {"command": "SELECT * FROM users --"})
+        # The closing quote sits before end-of-string, exactly as with json.dumps
+        enforcer.validate_tool_call("Bash", {"command": "rm features.db"})
+
+    def test_agrees_with_legacy_serialization(self):
+        patterns = compile_forbidden_patterns(ALL_PATTERNS + [r'--\"', r'"command":\s*"rm'])
+        matcher = ForbiddenPatternMatcher(patterns)
+        for command in ["SELECT 1 --", 'echo "x"\nrm -rf /', "git push", "ls", "caf\u00e9 sudo ls"]:
+            args = {"command": command}
+            legacy = check_arguments_against_patterns(serialize_tool_arguments(args), patterns)
+            combined = matcher.match_arguments(args)
+            if legacy is None or legacy.original != r'"command":\s*"rm':
+                assert combined is legacy, command
+
+
+def _benchmark_calls(n: int = 2000) -> list[dict]:
+    rng = random.Random(1)
+    body = "def handler(request):\n    return render(request, 'page.html')\n" * 40
+    calls = []
+    for i in range(n):
+        if rng.random() < 0.5:
+            calls.append({"command": f"pytest tests/test_case_{i}.py -q", "timeout": 120})
+        else:
+            calls.append({"file_path": f"src/module_{i}.py", "content": body})
+    return calls
+
+
+def _time_legacy(calls, patterns) -> float:
+    start = time.perf_counter()
+    for args in calls:
+        check_arguments_against_patterns(serialize_tool_arguments(args), patterns)
+    return time.perf_counter() - start
+
+
+def _time_combined(calls, matcher) -> float:
+    start = time.perf_counter()
+    for args in calls:
+        matcher.match_arguments(args)
+    return time.perf_counter() - start
+
+
+class TestBenchmark:
+    """Clean tool calls are checked with one pass instead of one per pattern."""
+
+    def test_combined_is_faster(self):
+        calls = _benchmark_calls()
+        patterns = compile_forbidden_patterns(ALL_PATTERNS)
+        matcher = ForbiddenPatternMatcher(patterns)
+        legacy = min(_time_legacy(calls, patterns) for _ in range(3))
+        combined = min(_time_combined(calls, matcher) for _ in range(3))
+        assert legacy / combined >= MIN_SPEEDUP, (
+            f"legacy {legacy * 1000:.1f} ms vs combined {combined * 1000:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    calls = _benchmark_calls()
+    patterns = compile_forbidden_patterns(ALL_PATTERNS)
+    matcher = ForbiddenPatternMatcher(patterns)
+    print(f"{len(patterns)} patterns, {len(calls):,} tool calls")
+    print(f"serialize + per-pattern: {_time_legacy(calls, patterns) * 1000:.1f} ms")
+    print(f"combined matcher:        {_time_combined(calls, matcher) * 1000:.1f} ms")
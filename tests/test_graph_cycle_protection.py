@@ -6,8 +6,8 @@ resolver have proper cycle protection mechanisms:
 1. resolve_dependencies() - uses Kahn's algorithm with in_degree tracking
 2. _detect_cycles() - uses visited and rec_stack sets with iteration limit
 3. compute_scheduling_scores() - uses queued_depths tracking with iteration limit
-4. would_create_circular_dependency() - uses visited set with depth limit
-5. _detect_cycles_for_validation() - uses visited and rec_stack sets with iteration limit
+4. would_create_circular_dependency() - exact iterative search, no depth cap
+5. _detect_cycles_for_validation() - incremental topological order, no recursion
 """
 
 import logging
@@ -18,9 +18,11 @@ from api.dependency_resolver import (
     _detect_cycles_for_validation,
     compute_scheduling_scores,
     would_create_circular_dependency,
-    MAX_DEPENDENCY_DEPTH,
 )
 
+# Longer than any recursion or depth limit could handle
+LONG_CHAIN = 5000
+
 
 class TestResolveDependenciesKahnsAlgorithm:
     """Verify resolve_dependencies uses Kahn's algorithm with proper cycle handling."""
@@ -178,6 +180,16 @@ class TestDetectCyclesForValidationVisitedTracking:
         # Should find exactly one unique cycle, not two
         assert len(cycles) == 1
 
+    def test_validation_finds_very_long_cycle(self):
+        """_detect_cycles_for_validation finds cycles far beyond the recursion limit."""
+        features = [
+            {"id": i, "priority": i, "dependencies": [(i + 1) % LONG_CHAIN], "passes": False}
+            for i in range(LONG_CHAIN)
+        ]
+        feature_map = {f["id"]: f for f in features}
+        cycles = _detect_cycles_for_validation(features, feature_map)
+        assert cycles == [list(range(LONG_CHAIN))]
+
 
 class TestComputeSchedulingScoresQueuedTracking:
     """Verify compute_scheduling_scores uses queued_depths tracking."""
@@ -239,7 +251,7 @@ class TestComputeSchedulingScoresQueuedTracking:
 
 
 class TestWouldCreateCircularDependencyVisited:
-    """Verify would_create_circular_dependency uses visited set and depth limit."""
+    """Verify would_create_circular_dependency is exact on graphs of any depth."""
 
     def test_would_create_cycle_uses_visited_set(self):
         """would_create_circular_dependency should use a visited set."""
@@ -271,11 +283,10 @@ class TestWouldCreateCircularDependencyVisited:
         result = would_create_circular_dependency(features, 1, 1)
         assert result == True
 
-    def test_would_create_cycle_depth_limit(self):
-        """would_create_circular_dependency should respect depth limit."""
-        # Create a chain longer than MAX_DEPENDENCY_DEPTH
+    def test_would_create_cycle_long_chain(self):
+        """would_create_circular_dependency has no depth cap."""
         features = []
-        for i in range(MAX_DEPENDENCY_DEPTH + 10):
+        for i in range(LONG_CHAIN):
             deps = [i - 1] if i > 0 else []
             features.append({
                 "id": i,
@@ -283,11 +294,11 @@ class TestWouldCreateCircularDependencyVisited:
                 "dependencies": deps,
                 "passes": False,
             })
-        # Adding dependency from last to first would create huge cycle
-        last_id = MAX_DEPENDENCY_DEPTH + 9
-        result = would_create_circular_dependency(features, 0, last_id)
-        # Should return True (fail-safe when depth exceeded)
-        assert result == True
+        # Adding dependency from first to last would create a huge cycle
+        last_id = LONG_CHAIN - 1
+        assert would_create_circular_dependency(features, 0, last_id) == True
+        # The other direction only extends the chain - not refused for depth
+        assert would_create_circular_dependency(features, last_id, 0) == False
 
     def test_would_create_cycle_nonexistent_features(self):
         """would_create_circular_dependency should handle non-existent features."""
@@ -312,13 +323,6 @@ class TestIterationLimitsLogging:
         assert "_logger.error" in source
         assert "iteration limit exceeded" in source.lower()
 
-    def test_detect_cycles_for_validation_logs_on_limit(self, caplog):
-        """_detect_cycles_for_validation should log error when limit exceeded."""
-        import inspect
-        source = inspect.getsource(_detect_cycles_for_validation)
-        assert "_logger.error" in source
-        assert "iteration limit exceeded" in source.lower()
-
     def test_compute_scheduling_scores_logs_on_limit(self, caplog):
         """compute_scheduling_scores should log error when limit exceeded."""
         import inspect
@@ -344,14 +348,6 @@ class TestCycleProtectionCodeAudit:
         assert "rec_stack" in source
         assert "max_iterations" in source or "iteration" in source.lower()
 
-    def test_detect_cycles_for_validation_uses_visited_and_rec_stack(self):
-        """_detect_cycles_for_validation should use both visited and rec_stack sets."""
-        import inspect
-        source = inspect.getsource(_detect_cycles_for_validation)
-        assert "visited" in source
-        assert "rec_stack" in source
-        assert "max_iterations" in source or "iteration" in source.lower()
-
     def test_compute_scheduling_scores_uses_queued_tracking(self):
         """compute_scheduling_scores should use queued tracking for BFS."""
         import inspect
@@ -359,14 +355,6 @@ class TestCycleProtectionCodeAudit:
         assert "queued" in source.lower() or "visited" in source.lower()
         assert "max_iterations" in source or "iteration" in source.lower()
 
-    def test_would_create_circular_dependency_uses_visited(self):
-        """would_create_circular_dependency should use visited set."""
-        import inspect
-        source = inspect.getsource(would_create_circular_dependency)
-        assert "visited" in source
-        # Also check for depth limit
-        assert "depth" in source.lower() or "MAX_DEPENDENCY_DEPTH" in source
-
 
 class TestEdgeCases:
     """Test edge cases for cycle protection."""
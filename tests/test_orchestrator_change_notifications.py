@@ -0,0 +1,155 @@
+"""
+Tests for event-driven orchestrator wakeups.
+
+Verifies:
+1. DataVersionWatcher reports commits from other connections only
+2. Orchestrator reads skip the feature query when nothing changed
+3. _wait_for_state_change() wakes on an external commit
+4. _wait_for_state_change() wakes on agent completion
+5. _wait_for_state_change() returns after the timeout when idle
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from api.database import DataVersionWatcher, Feature, create_database
+
+
+def _add_feature(SessionLocal, fid, passes=False, dependencies=None):
+    session = SessionLocal()
+    session.add(Feature(
+        id=fid, priority=fid, category="core", name=f"Feature {fid}",
+        description="d", steps=["s"], passes=passes, in_progress=False,
+        dependencies=dependencies,
+    ))
+    session.commit()
+    session.close()
+
+
+def _mark_passing(SessionLocal, fid):
+    session = SessionLocal()
+    session.query(Feature).filter(Feature.id == fid).update({"passes": True})
+    session.commit()
+    session.close()
+
+
+def _make_orchestrator(project_dir):
+    from parallel_orchestrator import ParallelOrchestrator
+
+    _, SessionLocal = create_database(project_dir)
+    _add_feature(SessionLocal, 1)
+    _add_feature(SessionLocal, 2, dependencies=[1])
+    return ParallelOrchestrator(project_dir=project_dir, max_concurrency=2), SessionLocal
+
+
+class TestDataVersionWatcher:
+    """PRAGMA data_version based change detection."""
+
+    def test_unchanged_without_commits(self, tmp_path):
+        create_database(tmp_path)
+        watcher = DataVersionWatcher(tmp_path)
+        version = watcher.current()
+        assert watcher.changed_since(version) is False
+        watcher.close()
+
+    def test_changed_after_commit(self, tmp_path):
+        _, SessionLocal = create_database(tmp_path)
+        watcher = DataVersionWatcher(tmp_path)
+        version = watcher.current()
+
+        _add_feature(SessionLocal, 1)
+
+        assert watcher.changed_since(version) is True
+        watcher.close()
+
+    def test_none_means_changed(self, tmp_path):
+        create_database(tmp_path)
+        watcher = DataVersionWatcher(tmp_path)
+        assert watcher.changed_since(None) is True
+        watcher.close()
+
+
+class TestRefreshSkipsQueries:
+    """Feature state is only re-read after a commit."""
+
+    def test_no_feature_query_when_unchanged(self, tmp_path):
+        orchestrator, _ = _make_orchestrator(tmp_path)
+        orchestrator.get_all_complete()
+
+        statements = []
+
+        def _on_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _on_execute)
+        try:
+            orchestrator.get_all_complete()
+            orchestrator.get_passing_count()
+            orchestrator.get_resumable_features()
+        finally:
+            event.remove(Engine, "before_cursor_execute", _on_execute)
+
+        assert not any("FROM features" in s for s in statements)
+
+    def test_external_commit_is_seen(self, tmp_path):
+        orchestrator, SessionLocal = _make_orchestrator(tmp_path)
+        assert orchestrator.get_passing_count() == 0
+
+        _mark_passing(SessionLocal, 1)
+
+        assert orchestrator.get_passing_count() == 1
+        assert [f["id"] for f in orchestrator.get_ready_features()] == [2]
+
+
+class TestWaitForStateChange:
+    """The main loop sleeps until something happens."""
+
+    def test_wakes_on_external_commit(self, tmp_path):
+        orchestrator, SessionLocal = _make_orchestrator(tmp_path)
+        orchestrator.get_all_complete()
+
+        async def _run():
+            orchestrator._agent_completed_event = asyncio.Event()
+            timer = threading.Timer(0.2, _mark_passing, args=(SessionLocal, 1))
+            timer.start()
+            start = time.monotonic()
+            await orchestrator._wait_for_state_change(timeout=10)
+            timer.join()
+            return time.monotonic() - start
+
+        assert asyncio.run(_run()) < 5
+
+    def test_wakes_on_agent_completion(self, tmp_path):
+        orchestrator, _ = _make_orchestrator(tmp_path)
+        orchestrator.get_all_complete()
+
+        async def _run():
+            orchestrator._agent_completed_event = asyncio.Event()
+            orchestrator._event_loop = asyncio.get_running_loop()
+            asyncio.get_running_loop().call_later(0.1, orchestrator._signal_agent_completed)
+            start = time.monotonic()
+            await orchestrator._wait_for_state_change(timeout=10)
+            return time.monotonic() - start
+
+        assert asyncio.run(_run()) < 5
+
+    def test_times_out_when_idle(self, tmp_path):
+        orchestrator, _ = _make_orchestrator(tmp_path)
+        orchestrator.get_all_complete()
+
+        async def _run():
+            orchestrator._agent_completed_event = asyncio.Event()
+            start = time.monotonic()
+            await orchestrator._wait_for_state_change(timeout=0.5)
+            return time.monotonic() - start
+
+        assert 0.4 < asyncio.run(_run()) < 5
@@ -0,0 +1,168 @@
+"""
+Tests for the orchestrator -> server event side channel.
+
+Verifies:
+1. OrchestratorEventEmitter writes JSON lines that parse_event_line() reads back
+2. from_env() consumes AUTOBUILDR_EVENTS_FD and is a no-op without it
+3. The emitter disables itself when the reader goes away
+4. ProjectOutputStream drives the trackers from typed events and ignores
+   lifecycle log lines while structured events are active
+"""
+
+import asyncio
+import io
+import os
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from orchestrator_events import EVENTS_FD_ENV, OrchestratorEventEmitter, parse_event_line
+
+
+class TestEmitter:
+    """Round trip through the JSON line format."""
+
+    def test_emit_round_trip(self):
+        buffer = io.StringIO()
+        emitter = OrchestratorEventEmitter(buffer)
+        emitter.emit("agent_spawned", agent_type="coding", feature_id=4, pid=123)
+
+        event = parse_event_line(buffer.getvalue())
+        assert event["event"] == "agent_spawned"
+        assert event["feature_id"] == 4
+        assert event["pid"] == 123
+        assert "ts" in event
+
+    @pytest.mark.parametrize("line", [b"", b"   \n", b"not json\n", b"[1, 2]\n", b'{"no_event": 1}\n'])
+    def test_parse_rejects_malformed(self, line):
+        assert parse_event_line(line) is None
+
+    def test_disabled_without_stream(self):
+        emitter = OrchestratorEventEmitter()
+        assert not emitter.enabled
+        emitter.emit("all_complete")  # must not raise
+
+    def test_from_env_pipe(self, monkeypatch):
+        read_fd, write_fd = os.pipe()
+        monkeypatch.setenv(EVENTS_FD_ENV, str(write_fd))
+
+        emitter = OrchestratorEventEmitter.from_env()
+        assert emitter.enabled
+        # Removed so agent subprocesses don't see a descriptor they lack
+        assert EVENTS_FD_ENV not in os.environ
+
+        emitter.emit("init_start")
+        emitter.close()
+        with os.fdopen(read_fd, "rb") as reader:
+            assert parse_event_line(reader.readline())["event"] == "init_start"
+
+    def test_from_env_unset(self, monkeypatch):
+        monkeypatch.delenv(EVENTS_FD_ENV, raising=False)
+        assert not OrchestratorEventEmitter.from_env().enabled
+
+    def test_disables_when_reader_closed(self):
+        read_fd, write_fd = os.pipe()
+        os.close(read_fd)
+        emitter = OrchestratorEventEmitter(os.fdopen(write_fd, "w", buffering=1))
+        emitter.emit("init_start")
+        assert not emitter.enabled
+
+
+def _stream(structured: bool):
+    from server.websocket import ProjectOutputStream
+
+    agent_manager = MagicMock()
+    agent_manager.structured_events = structured
+    stream = ProjectOutputStream(agent_manager)
+    stream.start()
+    return stream
+
+
+async def _messages(client) -> list[dict]:
+    import server.websocket as ws_module
+
+    await asyncio.sleep(ws_module.FRAME_INTERVAL * 3)
+    return [m for call in client.send_json.await_args_list for m in call.args[0]["messages"]]
+
+
+class TestStructuredStream:
+    """Typed events replace regex matching for agent lifecycle and scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_spawn_and_complete_from_events(self):
+        stream = _stream(structured=True)
+        client = AsyncMock()
+        stream.subscribe(client)
+
+        await stream.on_event({
+            "event": "agent_spawned", "agent_type": "coding", "feature_id": 5,
+            "feature_name": "Login", "coding_agents": 1, "testing_agents": 0, "max_concurrency": 4,
+        })
+        await stream.on_event({
+            "event": "agent_completed", "agent_type": "coding", "feature_id": 5,
+            "success": True, "coding_agents": 0, "testing_agents": 0, "max_concurrency": 4,
+        })
+
+        messages = await _messages(client)
+        agent_updates = [m for m in messages if m["type"] == "agent_update"]
+        assert [m["state"] for m in agent_updates] == ["thinking", "success"]
+        assert agent_updates[0]["featureName"] == "Login"
+
+        orch_updates = [m for m in messages if m["type"] == "orchestrator_update"]
+        assert [m["eventType"] for m in orch_updates] == ["coding_spawn", "coding_complete"]
+        assert orch_updates[0]["codingAgents"] == 1
+        assert orch_updates[0]["maxConcurrency"] == 4
+        assert orch_updates[1]["codingAgents"] == 0
+        await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_lines_ignored(self):
+        stream = _stream(structured=True)
+        client = AsyncMock()
+        stream.subscribe(client)
+
+        await stream.on_output("Started coding agent for feature #1: Login")
+        await stream.on_output("Feature #1 completed")
+
+        messages = await _messages(client)
+        assert [m["type"] for m in messages] == ["log", "log"]
+        assert stream.orchestrator_tracker.coding_agents == 0
+        await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_feature_output_still_drives_thoughts(self):
+        stream = _stream(structured=True)
+        client = AsyncMock()
+        stream.subscribe(client)
+
+        await stream.on_event({"event": "agent_spawned", "agent_type": "coding", "feature_id": 2})
+        await stream.on_output("[Feature #2] [Tool: Bash] npm test")
+
+        messages = await _messages(client)
+        log = [m for m in messages if m["type"] == "log"][0]
+        assert log["agentIndex"] == 0
+        assert messages[-1]["type"] == "agent_update"
+        assert messages[-1]["state"] == "testing"
+        await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_scheduling_updates_counts_silently(self):
+        stream = _stream(structured=True)
+        client = AsyncMock()
+        stream.subscribe(client)
+
+        await stream.on_event({"event": "scheduling", "ready": 3, "blocked": 2, "passing": 1})
+        await stream.on_event({"event": "capacity", "ready": 3, "slots": 2, "max_concurrency": 2})
+
+        messages = await _messages(client)
+        assert len(messages) == 1
+        assert messages[0]["eventType"] == "capacity_check"
+        assert messages[0]["readyCount"] == 3
+        assert messages[0]["blockedCount"] == 2
+        assert messages[0]["maxConcurrency"] == 2
+        await stream.stop()
@@ -0,0 +1,253 @@
+"""
+Tests for the per-run acceptance index (api/run_event_index.py).
+
+Verifies:
+1. Matches indexed as tool_result events arrive equal the post-run scan of
+   ForbiddenPatternsValidator, including full artifact-backed payloads
+2. Only forbidden_patterns configs that compile are indexed; the latest
+   tests_executed event is tracked by sequence
+3. The validators use an index only when it saw every stored event, and
+   otherwise fall back to scanning run.events
+4. HarnessKernel runs fill the index and the acceptance gate uses it
+5. Benchmark: reading indexed results is much cheaper than the post-run
+   scan of a long run
+
+Run the benchmark directly with: python tests/test_run_event_index.py
+"""
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.run_event_index import (
+    RunEventIndex,
+    close_run_event_index,
+    get_run_event_index,
+    observe_event,
+    open_run_event_index,
+)
+from api.validators import ForbiddenPatternsValidator
+
+# Reading indexed matches must be at least this many times faster than a scan
+MIN_INDEXED_SPEEDUP = 20.0
+
+BENCHMARK_EVENTS = 5_000
+
+PATTERNS = [r"rm -rf /", r"password\s*=\s*\S+", r"DROP TABLE"]
+
+VALIDATORS = [
+    {"type": "forbidden_patterns", "config": {"patterns": PATTERNS}},
+    {"type": "forbidden_patterns", "config": {"patterns": ["drop table"], "case_sensitive": False}},
+    {"type": "forbidden_patterns", "config": {"patterns": ["(unclosed"]}},
+    {"type": "file_exists", "config": {"path": "x"}},
+]
+
+
+def _event(sequence: int, event_type: str, payload, *, artifact=None, run_id: str = "run-1"):
+    return SimpleNamespace(
+        id=sequence * 10,
+        run_id=run_id,
+        sequence=sequence,
+        event_type=event_type,
+        tool_name="Bash",
+        payload=payload,
+        payload_truncated=None,
+        artifact_ref=artifact.id if artifact else None,
+        artifact=artifact,
+    )
+
+
+def _sample_events() -> list[tuple[SimpleNamespace, dict | None]]:
+    """(event, full payload) pairs covering the payload shapes the scan handles."""
+    full = {"tool": "Bash", "is_error": False, "result": "x" * 5000 + " password = hunter2"}
+    truncated = {"tool": "Bash", "is_error": False, "result": {"_truncated": True, "_original_size": 5060}}
+    artifact = SimpleNamespace(id="artifact-1", content_inline=json.dumps(full), content_ref=None)
+    return [
+        (_event(1, "started", {"message": "rm -rf /"}), None),
+        (_event(2, "tool_result", {"tool": "Bash", "result": "ok"}), None),
+        (_event(3, "tool_result", {"tool": "Bash", "result": "ran rm -rf / and DROP TABLE users"}), None),
+        (_event(4, "tool_result", "password=abc; drop table t"), None),
+        (_event(5, "tool_result", None), None),
+        (_event(6, "tool_result", {"result": [{"nested": {"sql": "DROP TABLE x"}}, "rm -rf /"]}), None),
+        (_event(7, "tool_result", truncated, artifact=artifact), full),
+        (_event(8, "tests_executed", {"passed": False, "total_tests": 3}), None),
+        (_event(9, "tests_executed", {"passed": True, "total_tests": 4}), None),
+    ]
+
+
+def _scan(config: dict, events: list) -> dict:
+    """ForbiddenPatternsValidator result from the post-run scan."""
+    run = SimpleNamespace(id="scanned-run", events=events)
+    return ForbiddenPatternsValidator().evaluate(config, {}, run).to_dict()
+
+
+class TestIndexMatchesScan:
+    """Indexed results equal the post-run scan."""
+
+    def test_matches_equal_scan(self):
+        index = RunEventIndex("run-1", VALIDATORS)
+        pairs = [(event, full) for event, full in _sample_events() if event.artifact is None]
+        for event, full in pairs:
+            index.observe(event, full)
+        events = [event for event, _ in pairs]
+
+        for validator_def in VALIDATORS[:2]:
+            config = validator_def["config"]
+            scanned = _scan(config, events)
+            indexed = index.forbidden_matches(config["patterns"], config.get("case_sensitive", True))
+            assert indexed == scanned["details"]["matches"]
+            assert indexed
+
+    def test_artifact_payloads_matched_in_full(self):
+        # The scan reads artifacts through api.agentspec_crud
+        pytest.importorskip("sqlalchemy")
+        index = RunEventIndex("run-1", VALIDATORS[:1])
+        pairs = _sample_events()
+        for event, full in pairs:
+            index.observe(event, full)
+
+        indexed = index.forbidden_matches(PATTERNS)
+        assert indexed == _scan({"patterns": PATTERNS}, [event for event, _ in pairs])["details"]["matches"]
+        assert any(m["event_sequence"] == 7 and m["matched_text"] == "password = hunter2" for m in indexed)
+
+    def test_counts_and_configs(self):
+        index = RunEventIndex("run-1", VALIDATORS)
+        for event, full in _sample_events():
+            index.observe(event, full)
+        assert index.tool_result_count == 6
+        assert index.tests_executed_count == 2
+        assert index.latest_tests_executed.sequence == 9
+        # Bad patterns and unknown configs are not indexed
+        assert index.forbidden_matches(["(unclosed"]) is None
+        assert index.forbidden_matches(["other"]) is None
+        assert index.forbidden_matches(["drop table"], case_sensitive=True) is None
+
+
+class TestRegistry:
+    """Events reach the open index of their run only."""
+
+    def test_observe_event_routes_by_run(self):
+        index = open_run_event_index("run-1", VALIDATORS[:1])
+        try:
+            observe_event(_event(1, "tool_result", "DROP TABLE a"))
+            observe_event(_event(2, "tool_result", "DROP TABLE b", run_id="run-2"))
+            assert get_run_event_index("run-1") is index
+            assert [m["event_sequence"] for m in index.forbidden_matches(PATTERNS)] == [1]
+        finally:
+            close_run_event_index("run-1")
+        assert get_run_event_index("run-1") is None
+
+    def test_validator_scans_without_index(self):
+        open_run_event_index("run-1", VALIDATORS[:1])
+        try:
+            # Not a mapped run: no session to prove completeness, so scan
+            run = SimpleNamespace(id="run-1", events=[_event(1, "tool_result", "DROP TABLE a")])
+            result = ForbiddenPatternsValidator().evaluate({"patterns": PATTERNS}, {}, run)
+            assert not result.passed
+            assert result.details["events_checked"] == 1
+        finally:
+            close_run_event_index("run-1")
+
+
+class TestKernelIntegration:
+    """End to end through HarnessKernel and the database."""
+
+    def test_kernel_run_uses_index(self, monkeypatch):
+        pytest.importorskip("sqlalchemy")
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+
+        import api.run_event_index as run_event_index
+        from api.agentspec_models import AcceptanceSpec, AgentSpec
+        from api.database import Base
+        from api.harness_kernel import HarnessKernel
+
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            spec = AgentSpec(
+                id="index-spec", name="index-spec", display_name="Index Spec",
+                objective="Test", task_type="testing", tool_policy={"allowed_tools": ["Bash"]},
+                max_turns=5, timeout_seconds=300,
+            )
+            session.add(spec)
+            session.add(AcceptanceSpec(
+                agent_spec_id=spec.id,
+                validators=[{"type": "forbidden_patterns", "config": {"patterns": PATTERNS}, "required": True}],
+                gate_mode="all_pass",
+            ))
+            session.commit()
+            session.refresh(spec)
+
+            def executor(run, spec):
+                events = [
+                    {"tool_name": "Bash", "arguments": {"command": "ls"}, "result": "a\nb"},
+                    {"tool_name": "Bash", "arguments": {}, "result": "y" * 6000 + " DROP TABLE users"},
+                ]
+                return True, {}, events, 10, 10
+
+            used = []
+            real = run_event_index.get_complete_run_event_index
+            monkeypatch.setattr(
+                run_event_index, "get_complete_run_event_index",
+                lambda run: used.append(real(run)) or used[-1],
+            )
+            run = HarnessKernel(session).execute(spec, turn_executor=executor)
+
+            assert used and used[0] is not None
+            assert run.final_verdict == "failed"
+            [result] = run.acceptance_results
+            [match] = result["details"]["matches"]
+            # Found in the artifact-backed part of the payload
+            assert match["matched_text"] == "DROP TABLE"
+            assert get_run_event_index(run.id) is None
+        finally:
+            session.close()
+            engine.dispose()
+
+
+def _long_run(n: int) -> tuple[RunEventIndex, list]:
+    index = RunEventIndex("bench-run", VALIDATORS[:1])
+    events = []
+    for i in range(1, n + 1):
+        output = f"line {i}\n" * 40 + ("DROP TABLE t\n" if i % 1000 == 0 else "")
+        event = _event(i, "tool_result", {"tool": "Bash", "is_error": False, "result": output}, run_id="bench-run")
+        index.observe(event)
+        events.append(event)
+    return index, events
+
+
+def _time_verdicts(index: RunEventIndex, events: list) -> tuple[float, float]:
+    start = time.perf_counter()
+    scanned = _scan({"patterns": PATTERNS}, events)["details"]["matches"]
+    scan_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = index.forbidden_matches(PATTERNS)
+    index_seconds = time.perf_counter() - start
+    assert indexed == scanned
+    return scan_seconds, index_seconds
+
+
+class TestBenchmark:
+    """The verdict no longer pays for a full scan."""
+
+    def test_indexed_read_is_faster(self):
+        index, events = _long_run(BENCHMARK_EVENTS)
+        scan_seconds, index_seconds = _time_verdicts(index, events)
+        assert scan_seconds / max(index_seconds, 1e-9) >= MIN_INDEXED_SPEEDUP, (
+            f"indexed {index_seconds:.4f}s vs scan {scan_seconds:.4f}s"
+        )
+
+
+if __name__ == "__main__":
+    index, events = _long_run(BENCHMARK_EVENTS)
+    scan_seconds, index_seconds = _time_verdicts(index, events)
+    print(f"post-run scan of {BENCHMARK_EVENTS:,} tool_result events: {scan_seconds * 1000:.1f} ms")
+    print(f"indexed matches: {index_seconds * 1000:.3f} ms")
@@ -0,0 +1,204 @@
+"""
+Tests for the versioned schema migration runner in api/database.py.
+
+Verifies:
+1. A fresh database is stamped with SCHEMA_VERSION (one row per migration)
+2. An up-to-date database costs a single SELECT in create_database()
+3. Legacy (pre-versioning) databases are upgraded in place
+4. Only pending migrations run on a partially migrated database
+5. A failing migration rolls back the whole batch
+6. Benchmark: opening a fully migrated database stays cheap
+
+Run the benchmark directly with: python tests/test_schema_migrations.py
+"""
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Engine
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import api.database as database
+from api.database import (
+    MIGRATIONS,
+    SCHEMA_VERSION,
+    create_database,
+    get_schema_version,
+    run_migrations,
+)
+
+# Mean time allowed to open an up-to-date database (engine + version check)
+MAX_OPEN_MIGRATED_DB_SECONDS = 0.05
+
+
+class _StatementCounter:
+    """Count SQL statements executed by any engine while active."""
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(Engine, "before_cursor_execute", self._on_execute)
+
+
+def _create_legacy_database(project_dir: Path) -> None:
+    """Create a features.db as written by the original, unversioned schema."""
+    conn = sqlite3.connect(project_dir / "features.db")
+    conn.execute(
+        "CREATE TABLE features ("
+        "id INTEGER PRIMARY KEY, priority INTEGER NOT NULL, category VARCHAR(100) NOT NULL, "
+        "name VARCHAR(255) NOT NULL, description TEXT NOT NULL, steps JSON NOT NULL, "
+        "passes BOOLEAN)"
+    )
+    conn.execute(
+        "INSERT INTO features (priority, category, name, description, steps, passes) "
+        "VALUES (1, 'core', 'legacy', 'legacy row', '[]', NULL)"
+    )
+    conn.commit()
+    conn.close()
+
+
+class TestFreshDatabase:
+    """New databases are created and stamped."""
+
+    def test_stamped_with_latest_version(self, tmp_path):
+        engine, _ = create_database(tmp_path)
+        assert get_schema_version(engine) == SCHEMA_VERSION
+
+    def test_one_row_per_migration(self, tmp_path):
+        engine, _ = create_database(tmp_path)
+        with engine.connect() as conn:
+            rows = conn.execute(text("SELECT version, name FROM schema_version ORDER BY version")).fetchall()
+        assert [(v, n) for v, n, _ in MIGRATIONS] == [tuple(r) for r in rows]
+
+    def test_registry_versions_are_strictly_increasing(self):
+        versions = [v for v, _, _ in MIGRATIONS]
+        assert versions == sorted(set(versions))
+        assert SCHEMA_VERSION == versions[-1]
+
+    def test_missing_database_reports_version_zero(self, tmp_path):
+        from sqlalchemy import create_engine
+        engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+        assert get_schema_version(engine) == 0
+
+
+class TestUpToDateDatabase:
+    """Reopening a migrated database does no schema work."""
+
+    def test_single_select(self, tmp_path):
+        create_database(tmp_path)
+
+        with _StatementCounter() as counter:
+            create_database(tmp_path)
+
+        assert counter.statements == ["SELECT MAX(version) FROM schema_version"]
+
+    def test_run_migrations_is_noop(self, tmp_path):
+        engine, _ = create_database(tmp_path)
+        assert run_migrations(engine) == []
+
+
+class TestLegacyUpgrade:
+    """Databases created before schema versioning are upgraded."""
+
+    def test_legacy_database_is_migrated(self, tmp_path):
+        _create_legacy_database(tmp_path)
+
+        engine, _ = create_database(tmp_path)
+
+        columns = {c["name"] for c in inspect(engine).get_columns("features")}
+        assert {"in_progress", "dependencies"} <= columns
+        assert "agent_runs" in inspect(engine).get_table_names()
+        assert get_schema_version(engine) == SCHEMA_VERSION
+
+        with engine.connect() as conn:
+            passes, in_progress = conn.execute(
+                text("SELECT passes, in_progress FROM features")
+            ).one()
+        assert passes == 0
+        assert in_progress == 0
+
+    def test_only_pending_migrations_run(self, tmp_path, monkeypatch):
+        engine, _ = create_database(tmp_path)
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM schema_version WHERE version > 12"))
+
+        calls = []
+        patched = [
+            (version, name, (lambda conn, v=version: calls.append(v)))
+            for version, name, _ in MIGRATIONS
+        ]
+        monkeypatch.setattr(database, "MIGRATIONS", patched)
+
+        assert run_migrations(engine) == [13, 14, 15, 16, 17]
+        assert calls == [13, 14, 15, 16, 17]
+        assert get_schema_version(engine) == SCHEMA_VERSION
+
+
+class TestFailedMigration:
+    """A failing step leaves the database at its previous version."""
+
+    def test_failure_rolls_back_batch(self, tmp_path, monkeypatch):
+        create_database(tmp_path)
+
+        def _add_table(conn):
+            conn.execute(text("CREATE TABLE half_done (id INTEGER)"))
+
+        def _boom(conn):
+            raise RuntimeError("migration failed")
+
+        monkeypatch.setattr(database, "MIGRATIONS", MIGRATIONS + [
+            (SCHEMA_VERSION + 1, "add_table", _add_table),
+            (SCHEMA_VERSION + 2, "boom", _boom),
+        ])
+        monkeypatch.setattr(database, "SCHEMA_VERSION", SCHEMA_VERSION + 2)
+
+        with pytest.raises(RuntimeError):
+            create_database(tmp_path)
+
+        monkeypatch.undo()
+        engine, _ = create_database(tmp_path)
+        assert get_schema_version(engine) == SCHEMA_VERSION
+        assert "half_done" not in inspect(engine).get_table_names()
+
+
+def _time_open_migrated_db(project_dir: Path, iterations: int = 50) -> float:
+    """Return mean seconds to open an already migrated database."""
+    create_database(project_dir)[0].dispose()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        engine, _ = create_database(project_dir)
+        engine.dispose()
+    return (time.perf_counter() - start) / iterations
+
+
+class TestBenchmark:
+    """Opening a fully migrated database."""
+
+    def test_open_migrated_db_is_cheap(self, tmp_path):
+        mean = _time_open_migrated_db(tmp_path)
+        assert mean < MAX_OPEN_MIGRATED_DB_SECONDS, (
+            f"Opening a migrated DB took {mean * 1000:.2f} ms "
+            f"(budget {MAX_OPEN_MIGRATED_DB_SECONDS * 1000:.0f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        mean = _time_open_migrated_db(Path(tmp), iterations=200)
+        print(f"create_database() on a migrated DB: {mean * 1000:.3f} ms/open")
@@ -0,0 +1,201 @@
+"""
+Tests for the cached command policy used by bash_security_hook (security.py).
+
+Verifies:
+1. CommandPolicy.is_allowed() agrees with is_command_allowed() for exact,
+   prefix-wildcard and path patterns
+2. get_command_policy() reuses the compiled policy until the org or project
+   config file changes, and never parses YAML on a cache hit
+3. Parsed command strings are memoized without sharing mutable results
+4. Benchmark: a hook call with cached policy is much cheaper than resolving
+   the configs on every call
+
+Run the benchmark directly with: python tests/test_security_policy_cache.py
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import security
+from security import (
+    CommandPolicy,
+    bash_security_hook,
+    clear_command_policy_cache,
+    extract_commands,
+    get_command_policy,
+    get_effective_commands,
+    get_effective_pkill_processes,
+    is_command_allowed,
+)
+
+# A cached hook call must be at least this many times faster than the uncached path
+MIN_CACHED_SPEEDUP = 3.0
+
+BENCHMARK_CALLS = 500
+
+PROJECT_CONFIG = """version: 1
+commands:
+  - name: swift*
+  - name: ./scripts/build.sh
+  - name: cargo
+pkill_processes:
+  - cargo
+"""
+
+ORG_CONFIG = """version: 1
+allowed_commands:
+  - name: terraform
+blocked_commands:
+  - curl
+"""
+
+
+@pytest.fixture
+def env(tmp_path, monkeypatch):
+    """A temporary home (org config) and project, with an empty policy cache."""
+    home = tmp_path / "home"
+    project = tmp_path / "project"
+    (home / ".autobuildr").mkdir(parents=True)
+    (project / ".autobuildr").mkdir(parents=True)
+    monkeypatch.setattr(security, "get_org_config_path", lambda: home / ".autobuildr" / "config.yaml")
+    clear_command_policy_cache()
+    yield home / ".autobuildr" / "config.yaml", project
+    clear_command_policy_cache()
+
+
+def _write(path: Path, text: str) -> None:
+    path.write_text(text)
+    # Make sure the change is visible even on coarse-mtime filesystems
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _run_hook(command: str, project: Path) -> dict:
+    return asyncio.run(bash_security_hook(
+        {"tool_name": "Bash", "tool_input": {"command": command}},
+        context={"project_dir": str(project)},
+    ))
+
+
+class TestCompiledMatching:
+    """Precompiled matchers give the same answers as matches_pattern()."""
+
+    def test_matches_is_command_allowed(self):
+        allowed = {"ls", "swift*", "./scripts/build.sh", "tools/lint.sh", "*", "x*"}
+        policy = CommandPolicy(allowed, set(), set())
+        for command in (
+            "ls", "lsof", "swift", "swiftc", "swif", "build.sh", "./scripts/build.sh",
+            "other/build.sh", "build.shx", "lint.sh", "x", "xargs", "*", "y", "",
+        ):
+            assert policy.is_allowed(command) == is_command_allowed(command, allowed), command
+
+    def test_extra_pkill_processes(self):
+        policy = CommandPolicy(set(), set(), security.DEFAULT_PKILL_PROCESSES | {"cargo"})
+        assert policy.extra_pkill_processes == {"cargo"}
+        assert CommandPolicy(set(), set(), security.DEFAULT_PKILL_PROCESSES).extra_pkill_processes is None
+
+
+class TestPolicyCache:
+    """Policies are rebuilt only when a config file changes."""
+
+    def test_matches_uncached_resolution(self, env):
+        org_path, project = env
+        _write(org_path, ORG_CONFIG)
+        _write(project / ".autobuildr" / "allowed_commands.yaml", PROJECT_CONFIG)
+
+        policy = get_command_policy(project)
+        allowed, blocked = get_effective_commands(project)
+        assert policy.allowed == allowed
+        assert policy.blocked == blocked
+        assert policy.pkill_processes == get_effective_pkill_processes(project)
+
+    def test_cache_hit_skips_yaml(self, env):
+        _, project = env
+        _write(project / ".autobuildr" / "allowed_commands.yaml", PROJECT_CONFIG)
+        first = get_command_policy(project)
+        with patch.object(security.yaml, "safe_load", side_effect=AssertionError("parsed")):
+            assert get_command_policy(project) is first
+            assert _run_hook("swiftc main.swift && pkill cargo", project) == {}
+
+    def test_config_changes_invalidate(self, env):
+        org_path, project = env
+        project_config = project / ".autobuildr" / "allowed_commands.yaml"
+        assert _run_hook("cargo build", project)["decision"] == "block"
+
+        _write(project_config, PROJECT_CONFIG)
+        assert _run_hook("cargo build", project) == {}
+
+        _write(org_path, "version: 1\nblocked_commands:\n  - cargo\n")
+        assert _run_hook("cargo build", project)["decision"] == "block"
+
+        org_path.unlink()
+        assert _run_hook("cargo build", project) == {}
+
+        project_config.unlink()
+        assert _run_hook("cargo build", project)["decision"] == "block"
+
+    def test_policies_are_per_project(self, env, tmp_path):
+        _, project = env
+        _write(project / ".autobuildr" / "allowed_commands.yaml", PROJECT_CONFIG)
+        other = tmp_path / "other"
+        other.mkdir()
+        assert get_command_policy(project).is_allowed("cargo")
+        assert not get_command_policy(other).is_allowed("cargo")
+        assert not get_command_policy(None).is_allowed("cargo")
+
+
+class TestParseMemo:
+    """Memoized parsing hands out independent results."""
+
+    def test_results_are_fresh_lists(self):
+        first = extract_commands("npm install && npm test")
+        first.append("rm")
+        assert extract_commands("npm install && npm test") == ["npm", "npm"]
+
+
+def _time_hook(project: Path, cached: bool) -> float:
+    commands = ["npm test", "git status && git diff", "ls -la | grep src", "swiftc main.swift", "pkill cargo"]
+    start = time.perf_counter()
+    for i in range(BENCHMARK_CALLS):
+        if not cached:
+            clear_command_policy_cache()
+        _run_hook(commands[i % len(commands)], project)
+    return time.perf_counter() - start
+
+
+class TestBenchmark:
+    """The cached hook avoids per-call YAML parsing."""
+
+    def test_cached_hook_is_faster(self, env):
+        org_path, project = env
+        _write(org_path, ORG_CONFIG)
+        _write(project / ".autobuildr" / "allowed_commands.yaml", PROJECT_CONFIG)
+
+        uncached = _time_hook(project, cached=False)
+        cached = _time_hook(project, cached=True)
+        assert uncached / cached >= MIN_CACHED_SPEEDUP, f"cached {cached:.3f}s vs uncached {uncached:.3f}s"
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        home = Path(tmp) / "home"
+        project = Path(tmp) / "project"
+        (home / ".autobuildr").mkdir(parents=True)
+        (project / ".autobuildr").mkdir(parents=True)
+        _write(home / ".autobuildr" / "config.yaml", ORG_CONFIG)
+        _write(project / ".autobuildr" / "allowed_commands.yaml", PROJECT_CONFIG)
+        with patch.object(security, "get_org_config_path", lambda: home / ".autobuildr" / "config.yaml"):
+            for cached in (False, True):
+                elapsed = _time_hook(project, cached)
+                label = "cached policy" if cached else "uncached"
+                print(f"{label:>13}: {elapsed / BENCHMARK_CALLS * 1e6:.1f} us per hook call")
@@ -0,0 +1,362 @@
+"""
+Tests for the spec run executor behind POST /agent-specs/{id}/execute.
+
+Verifies:
+1. The worker pool never runs more than max_workers runs at once
+2. Per-project limits hold while other projects keep running, oldest first
+3. The execute endpoint returns immediately and writes a durable queue row
+4. recover() re-queues unclaimed runs and fails runs interrupted mid-execution
+5. Cancel drops queued runs and stops executing runs at the next turn
+6. Pause holds the kernel between turns until resumed
+7. Queue depth is reported per project (GET /api/agent-runs/queue)
+8. Orphaned-run cleanup leaves queued runs alone
+"""
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.agentspec_models import AgentRun, AgentRunQueueEntry, AgentSpec, generate_uuid
+from api.database import create_database, dispose_cached_database
+from api.harness_kernel import RUN_CANCELLED_ERROR, HarnessKernel, RunControl
+from api.orphaned_run_cleanup import cleanup_orphaned_runs, get_orphaned_runs
+from server.services.run_executor import SpecRunExecutor, execute_queued_run
+
+WAIT_SECONDS = 5
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine, SessionLocal = create_database(tmp_path)
+    yield tmp_path, SessionLocal
+    engine.dispose()
+    # Executor workers use the process-wide engine cache
+    dispose_cached_database(tmp_path)
+
+
+def _add_spec(SessionLocal, name="exec-spec"):
+    session = SessionLocal()
+    spec = AgentSpec(
+        id=generate_uuid(), name=name, display_name="Exec", objective="Run the executor tests",
+        task_type="testing", max_turns=10, timeout_seconds=600,
+        tool_policy={"policy_version": "v1", "allowed_tools": ["Read"]},
+    )
+    session.add(spec)
+    session.commit()
+    spec_id = spec.id
+    session.close()
+    return spec_id
+
+
+def _add_queued_run(SessionLocal, spec_id, project_name="proj", claimed=False, status="pending"):
+    session = SessionLocal()
+    run = AgentRun(id=generate_uuid(), agent_spec_id=spec_id, status=status)
+    session.add(run)
+    session.flush()
+    session.add(AgentRunQueueEntry(
+        run_id=run.id, agent_spec_id=spec_id, project_name=project_name,
+        claimed_at=datetime.now(timezone.utc) if claimed else None,
+    ))
+    session.commit()
+    run_id = run.id
+    session.close()
+    return run_id
+
+
+def _wait_for(predicate, timeout=WAIT_SECONDS):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _GatedRunner:
+    """run_func that blocks every run until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.started: list[str] = []
+
+    def __call__(self, job, loop):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.started.append(job.run_id)
+        self.release.wait(WAIT_SECONDS)
+        with self.lock:
+            self.active -= 1
+
+
+class TestWorkerPool:
+    """Bounded concurrency, globally and per project."""
+
+    def test_max_workers_bound(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        runner = _GatedRunner()
+        executor = SpecRunExecutor(max_workers=2, per_project_limit=10, run_func=runner)
+        run_ids = [_add_queued_run(SessionLocal, spec_id) for _ in range(5)]
+        for run_id in run_ids:
+            executor.submit("proj", project_dir, spec_id, run_id)
+
+        assert _wait_for(lambda: runner.active == 2)
+        status = executor.status()
+        assert status["running"] == 2 and status["queued"] == 3
+
+        runner.release.set()
+        assert _wait_for(lambda: executor.status()["running"] == 0)
+        assert runner.peak == 2
+        assert set(runner.started[:2]) == set(run_ids[:2])
+        assert sorted(runner.started) == sorted(run_ids)
+        executor.shutdown()
+
+    def test_per_project_limit(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        runner = _GatedRunner()
+        executor = SpecRunExecutor(max_workers=4, per_project_limit=1, run_func=runner)
+        a1, a2, b1 = (_add_queued_run(SessionLocal, spec_id) for _ in range(3))
+        executor.submit("a", project_dir, spec_id, a1)
+        executor.submit("a", project_dir, spec_id, a2)
+        executor.submit("b", project_dir, spec_id, b1)
+
+        assert _wait_for(lambda: runner.active == 2)
+        assert set(runner.started) == {a1, b1}
+        assert executor.status()["projects"] == {
+            "a": {"running": 1, "queued": 1},
+            "b": {"running": 1, "queued": 0},
+        }
+
+        runner.release.set()
+        assert _wait_for(lambda: executor.status()["running"] == 0)
+        assert runner.started[-1] == a2
+        executor.shutdown()
+
+    def test_queue_row_removed_after_run(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        run_id = _add_queued_run(SessionLocal, spec_id)
+        executor = SpecRunExecutor(max_workers=1, per_project_limit=1, run_func=lambda job, loop: None)
+        executor.submit("proj", project_dir, spec_id, run_id)
+
+        session = SessionLocal()
+        assert _wait_for(lambda: session.query(AgentRunQueueEntry).count() == 0)
+        session.close()
+        executor.shutdown()
+
+
+class TestExecuteQueuedRun:
+    """The worker-thread runner drives HarnessKernel."""
+
+    def test_run_completes(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        run_id = _add_queued_run(SessionLocal, spec_id)
+        executor = SpecRunExecutor(max_workers=1, per_project_limit=1)
+        executor.submit("proj", project_dir, spec_id, run_id)
+
+        def _status():
+            session = SessionLocal()
+            try:
+                return session.get(AgentRun, run_id).status
+            finally:
+                session.close()
+
+        assert _wait_for(lambda: _status() == "completed")
+        executor.shutdown()
+
+    def test_cancelled_while_queued_is_skipped(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        run_id = _add_queued_run(SessionLocal, spec_id, status="failed")
+        executor = SpecRunExecutor(max_workers=1, run_func=lambda job, loop: None)
+        job = executor.submit("proj", project_dir, spec_id, run_id)
+        executor.shutdown()
+
+        with patch("api.harness_kernel.HarnessKernel.execute") as execute:
+            execute_queued_run(job, None)
+        execute.assert_not_called()
+
+
+class TestDurableQueue:
+    """Queued runs survive a restart."""
+
+    def test_recover(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        waiting = _add_queued_run(SessionLocal, spec_id)
+        interrupted = _add_queued_run(SessionLocal, spec_id, claimed=True, status="running")
+
+        runner = _GatedRunner()
+        executor = SpecRunExecutor(max_workers=1, run_func=runner)
+        assert executor.recover("proj", project_dir) == 1
+        assert _wait_for(lambda: runner.started == [waiting])
+
+        session = SessionLocal()
+        run = session.get(AgentRun, interrupted)
+        assert run.status == "failed"
+        assert run.error == "orphaned_on_restart"
+        assert session.get(AgentRunQueueEntry, interrupted) is None
+        session.close()
+
+        runner.release.set()
+        executor.shutdown()
+
+    def test_orphan_cleanup_skips_queued_runs(self, db):
+        _, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        queued = _add_queued_run(SessionLocal, spec_id)
+        claimed = _add_queued_run(SessionLocal, spec_id, claimed=True)
+
+        session = SessionLocal()
+        assert [r.id for r in get_orphaned_runs(session)] == [claimed]
+        cleanup_orphaned_runs(session, force_cleanup_all=True)
+        session.expire_all()
+        assert session.get(AgentRun, queued).status == "pending"
+        assert session.get(AgentRunQueueEntry, queued) is not None
+        assert session.get(AgentRun, claimed).status == "failed"
+        session.close()
+
+
+class TestCancellation:
+    """Cancel and pause reach queued and executing runs."""
+
+    def test_cancel_queued(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        runner = _GatedRunner()
+        executor = SpecRunExecutor(max_workers=1, run_func=runner)
+        first = _add_queued_run(SessionLocal, spec_id)
+        second = _add_queued_run(SessionLocal, spec_id)
+        executor.submit("proj", project_dir, spec_id, first)
+        executor.submit("proj", project_dir, spec_id, second)
+
+        assert executor.cancel(second) is True
+        assert executor.status()["queued"] == 0
+        session = SessionLocal()
+        assert session.get(AgentRunQueueEntry, second) is None
+        session.close()
+
+        runner.release.set()
+        assert _wait_for(lambda: executor.status()["running"] == 0)
+        assert runner.started == [first]
+        assert executor.cancel("unknown") is False
+        executor.shutdown()
+
+    def test_cancel_running_sets_control(self, db):
+        project_dir, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        runner = _GatedRunner()
+        executor = SpecRunExecutor(max_workers=1, run_func=runner)
+        run_id = _add_queued_run(SessionLocal, spec_id)
+        job = executor.submit("proj", project_dir, spec_id, run_id)
+        assert _wait_for(lambda: runner.active == 1)
+
+        assert executor.pause(run_id) is True
+        assert job.control.paused
+        assert executor.cancel(run_id) is True
+        assert job.control.cancelled
+
+        runner.release.set()
+        executor.shutdown()
+
+    def test_kernel_stops_between_turns(self, db):
+        _, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        session = SessionLocal()
+        spec = session.get(AgentSpec, spec_id)
+        control = RunControl()
+        turns = []
+
+        def _turn(run, spec):
+            turns.append(run.turns_used)
+            control.cancel()
+            return False, {}, [], 10, 5
+
+        run = HarnessKernel(session).execute(spec, turn_executor=_turn, control=control)
+
+        assert len(turns) == 1
+        assert run.status == "failed"
+        assert run.error == RUN_CANCELLED_ERROR
+        session.close()
+
+    def test_kernel_waits_while_paused(self, db):
+        _, SessionLocal = db
+        spec_id = _add_spec(SessionLocal)
+        control = RunControl()
+        turns = []
+
+        def _turn(run, spec):
+            turns.append(time.monotonic())
+            if len(turns) == 1:
+                control.pause()
+                threading.Timer(0.2, control.resume).start()
+            return len(turns) == 2, {}, [], 0, 0
+
+        session = SessionLocal()
+        run = HarnessKernel(session).execute(
+            session.get(AgentSpec, spec_id), turn_executor=_turn, control=control
+        )
+
+        assert run.status == "completed"
+        assert turns[1] - turns[0] >= 0.15
+        session.close()
+
+
+class TestEndpoints:
+    """The HTTP API does not wait for the run."""
+
+    @pytest.fixture
+    def client(self, db):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from server.routers.agent_runs import router as runs_router
+        from server.routers.agent_specs import router as specs_router
+
+        project_dir, SessionLocal = db
+        runner = _GatedRunner()
+        executor = SpecRunExecutor(max_workers=1, per_project_limit=1, run_func=runner)
+        app = FastAPI()
+        app.include_router(specs_router)
+        app.include_router(runs_router)
+        with patch("server.routers.agent_specs._get_project_path", return_value=project_dir), \
+                patch("server.routers.agent_specs.get_run_executor", return_value=executor), \
+                patch("server.routers.agent_runs.get_run_executor", return_value=executor):
+            yield TestClient(app), SessionLocal, runner
+        runner.release.set()
+        executor.shutdown()
+
+    def test_execute_returns_while_runs_wait(self, client):
+        http, SessionLocal, runner = client
+        spec_id = _add_spec(SessionLocal)
+
+        start = time.monotonic()
+        run_ids = []
+        for _ in range(3):
+            response = http.post(f"/api/projects/proj/agent-specs/{spec_id}/execute")
+            assert response.status_code == 202
+            run_ids.append(response.json()["id"])
+        assert time.monotonic() - start < WAIT_SECONDS / 2
+
+        session = SessionLocal()
+        assert {e.run_id for e in session.query(AgentRunQueueEntry)} == set(run_ids)
+        session.close()
+
+        assert _wait_for(lambda: runner.active == 1)
+        queue = http.get("/api/agent-runs/queue").json()
+        assert queue["running"] == 1
+        assert queue["queued"] == 2
+        assert queue["projects"] == {"proj": {"running": 1, "queued": 2}}
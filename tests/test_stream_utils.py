@@ -0,0 +1,183 @@
+"""
+Tests for chunked subprocess output reading (server/utils/stream_utils.py).
+
+Verifies:
+1. LineSplitter handles lines split across chunks, CRLF and unterminated tails
+2. Over-long lines are split instead of buffered without bound
+3. iter_line_batches() / aiter_line_batches() deliver every line in order
+4. aiter_line_batches() falls back to executor reads for non-pipe streams;
+   cancelling a blocked fallback read does not block the event loop
+5. Benchmark: a subprocess pipe is drained at >= 100k lines/s
+"""
+import asyncio
+import io
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from server.utils.stream_utils import LineSplitter, aiter_line_batches, iter_line_batches
+
+# Lines per second the async pipeline must sustain
+MIN_LINES_PER_SECOND = 100_000
+
+BENCHMARK_LINES = 200_000
+
+# Child that writes BENCHMARK_LINES agent-like lines as fast as it can
+WRITER_SCRIPT = (
+    "import sys\n"
+    "out = sys.stdout.buffer\n"
+    "line = b'[Tool: Bash] npm test -- --reporter=dot some/test/file.spec.ts\\n'\n"
+    "for _ in range({n} // 1000):\n"
+    "    out.write(line * 1000)\n"
+    "out.flush()\n"
+)
+
+
+class TestLineSplitter:
+    """Incremental splitting matches readline().rstrip() per line."""
+
+    def test_lines_across_chunks(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"first\nsec") == ["first"]
+        assert splitter.feed(b"ond\nthi") == ["second"]
+        assert splitter.feed(b"rd\n") == ["third"]
+        assert splitter.flush() == []
+
+    def test_crlf_and_trailing_whitespace(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"a\r\nb  \n") == ["a", "b"]
+
+    def test_unterminated_tail(self):
+        splitter = LineSplitter()
+        assert splitter.feed(b"done\npartial") == ["done"]
+        assert splitter.flush() == ["partial"]
+        assert splitter.flush() == []
+
+    def test_multibyte_character_split_between_chunks(self):
+        splitter = LineSplitter()
+        data = "héllo\n".encode()
+        assert splitter.feed(data[:2]) == []
+        assert splitter.feed(data[2:]) == ["héllo"]
+
+    def test_long_line_is_split(self):
+        splitter = LineSplitter(max_line_bytes=8)
+        assert splitter.feed(b"0123456789") == ["0123456789"]
+        assert splitter.feed(b"ab\n") == ["ab"]
+
+
+def _spawn_writer(n: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-c", WRITER_SCRIPT.format(n=n)],
+        stdout=subprocess.PIPE,
+    )
+
+
+class TestIterLineBatches:
+    """All lines arrive in order, in batches."""
+
+    def test_blocking_reader(self):
+        proc = _spawn_writer(5000)
+        batches = list(iter_line_batches(proc.stdout))
+        proc.wait()
+        lines = [line for batch in batches for line in batch]
+        assert len(lines) == 5000
+        assert len(batches) < len(lines)
+
+    @pytest.mark.asyncio
+    async def test_async_reader(self):
+        proc = _spawn_writer(5000)
+        count = 0
+        batches = 0
+        async for batch in aiter_line_batches(proc.stdout):
+            count += len(batch)
+            batches += 1
+        proc.wait()
+        assert count == 5000
+        assert batches < count
+        assert proc.stdout.closed
+
+    @pytest.mark.asyncio
+    async def test_executor_fallback_for_non_pipe(self):
+        stream = io.BytesIO(b"one\ntwo\nthree")
+        lines = [line async for batch in aiter_line_batches(stream) for line in batch]
+        assert lines == ["one", "two", "three"]
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_pipe_fd(self):
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"event one\nevent two\n")
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as reader:
+            lines = [line async for batch in aiter_line_batches(reader) for line in batch]
+        assert lines == ["event one", "event two"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_blocked_executor_read(self):
+        read_fd, write_fd = os.pipe()
+        reader = os.fdopen(read_fd, "rb")
+        loop = asyncio.get_running_loop()
+
+        async def consume():
+            async for _ in aiter_line_batches(reader):
+                pass
+
+        # Unblocks the read should cancellation wait for it (test fails, not hangs)
+        watchdog = threading.Timer(5.0, os.write, (write_fd, b"\n"))
+        watchdog.start()
+        with patch.object(loop, "connect_read_pipe", side_effect=NotImplementedError):
+            task = asyncio.create_task(consume())
+            await asyncio.sleep(0.1)
+            task.cancel()
+            start = time.perf_counter()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        watchdog.cancel()
+        assert time.perf_counter() - start < 1.0
+        assert not reader.closed
+
+        # The reading thread closes the pipe once its read returns
+        os.close(write_fd)
+        for _ in range(100):
+            if reader.closed:
+                break
+            await asyncio.sleep(0.01)
+        assert reader.closed
+
+
+async def _drain(n: int) -> float:
+    """Seconds to read n lines from a subprocess through aiter_line_batches()."""
+    proc = _spawn_writer(n)
+    start = time.perf_counter()
+    count = 0
+    async for batch in aiter_line_batches(proc.stdout):
+        count += len(batch)
+    elapsed = time.perf_counter() - start
+    proc.wait()
+    assert count == n
+    return elapsed
+
+
+class TestBenchmark:
+    """The async pipeline keeps up with very chatty agents."""
+
+    @pytest.mark.asyncio
+    async def test_throughput(self):
+        elapsed = await _drain(BENCHMARK_LINES)
+        rate = BENCHMARK_LINES / elapsed
+        assert rate >= MIN_LINES_PER_SECOND, f"{rate:,.0f} lines/s"
+
+
+if __name__ == "__main__":
+    elapsed = asyncio.run(_drain(BENCHMARK_LINES))
+    print(f"{BENCHMARK_LINES:,} lines in {elapsed * 1000:.1f} ms "
+          f"({BENCHMARK_LINES / elapsed:,.0f} lines/s)")
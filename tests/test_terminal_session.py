@@ -0,0 +1,137 @@
+"""
+Tests for PTY output handling in server/services/terminal_manager.py.
+
+Verifies:
+1. Output is read via the event loop and coalesced into few callbacks
+2. The scrollback buffer keeps only the most recent SCROLLBACK_MAX_BYTES
+3. pause_output() stops reading until every paused consumer resumes
+4. The session ends when the shell exits
+"""
+
+import asyncio
+import platform
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import server.services.terminal_manager as terminal_manager
+from server.services.terminal_manager import TerminalSession
+
+pytestmark = pytest.mark.skipif(platform.system() == "Windows", reason="Unix PTY tests")
+
+
+async def _wait_for(predicate, timeout: float = 5.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            raise AssertionError("timed out")
+        await asyncio.sleep(0.01)
+
+
+async def _start(tmp_path) -> tuple[TerminalSession, list[bytes]]:
+    session = TerminalSession("test", tmp_path)
+    received: list[bytes] = []
+    session.add_output_callback(received.append)
+    assert await session.start()
+    return session, received
+
+
+# Commands quote their marker so the terminal's echo of the typed command
+# doesn't match it; only the command's output does
+
+
+class TestOutputCoalescing:
+    """A burst of output reaches callbacks in a handful of chunks."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self, tmp_path):
+        session, received = await _start(tmp_path)
+        try:
+            session.write(b"for i in $(seq 1 2000); do echo line$i; done; echo DO\"NE\"\n")
+            await _wait_for(lambda: b"DONE\r\n" in b"".join(received))
+            output = b"".join(received)
+            assert b"line2000" in output
+            # Far fewer callbacks than lines
+            assert len(received) < 200
+        finally:
+            await session.stop()
+
+
+class TestScrollback:
+    """Recent output is kept for joining clients, bounded in size."""
+
+    @pytest.mark.asyncio
+    async def test_scrollback_has_recent_output(self, tmp_path):
+        session, received = await _start(tmp_path)
+        try:
+            session.write(b"echo hello-\"scrollback\"\n")
+            await _wait_for(lambda: b"hello-scrollback\r\n" in session.get_scrollback())
+            assert session.get_scrollback() == b"".join(received)
+        finally:
+            await session.stop()
+
+    @pytest.mark.asyncio
+    async def test_scrollback_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(terminal_manager, "SCROLLBACK_MAX_BYTES", 1000)
+        session = TerminalSession("test", tmp_path)
+        for i in range(50):
+            session._queue_output(f"chunk {i:03d} ".encode() * 10)
+            session._flush_output()
+        scrollback = session.get_scrollback()
+        assert len(scrollback) == 1000
+        assert scrollback.endswith(b"chunk 049 ")
+
+
+class TestFlowControl:
+    """Paused consumers stop PTY reads; output resumes afterwards."""
+
+    @pytest.mark.asyncio
+    async def test_pause_and_resume(self, tmp_path):
+        session, received = await _start(tmp_path)
+        try:
+            session.write(b"echo re\"ady\"\n")
+            await _wait_for(lambda: b"ready\r\n" in b"".join(received))
+
+            slow_a, slow_b = object(), object()
+            session.pause_output(slow_a)
+            session.pause_output(slow_b)
+            assert session.output_paused
+            received.clear()
+            session.write(b"echo while-\"paused\"\n")
+            await asyncio.sleep(0.2)
+            assert received == []
+
+            session.resume_output(slow_a)
+            await asyncio.sleep(0.1)
+            assert received == []
+
+            session.resume_output(slow_b)
+            await _wait_for(lambda: b"while-paused\r\n" in b"".join(received))
+        finally:
+            await session.stop()
+
+    @pytest.mark.asyncio
+    async def test_removing_callback_resumes(self, tmp_path):
+        session, received = await _start(tmp_path)
+        try:
+            session.pause_output(received.append)
+            session.remove_output_callback(received.append)
+            assert not session.output_paused
+        finally:
+            await session.stop()
+
+
+class TestExit:
+    """The session becomes inactive when the shell exits."""
+
+    @pytest.mark.asyncio
+    async def test_shell_exit_ends_session(self, tmp_path):
+        session, received = await _start(tmp_path)
+        session.write(b"exit\n")
+        await _wait_for(lambda: not session.is_active)
+        await session.stop()
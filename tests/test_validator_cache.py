@@ -0,0 +1,284 @@
+"""
+Tests for the command validator result cache (api/validator_cache.py).
+
+Verifies:
+1. Re-evaluating test_pass and lint_clean on an unchanged tree returns the
+   stored result with a cache_hit marker, without running the command
+2. Editing, adding or deleting a file, changing the environment or the
+   config misses; edits to ignored files and tool caches do not
+3. Same-size rewrites within one mtime tick are caught by content hashing
+4. Failures, timeouts and launch errors are never cached; "cache": false opts out
+5. Results are shared through the project's cache file
+6. Benchmark: a cache hit is much cheaper than re-running the command
+
+Run the benchmark directly with: python tests/test_validator_cache.py
+"""
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import api.validator_cache as validator_cache
+from api.validator_cache import (
+    CACHE_FILE,
+    ValidatorResultCache,
+    clear_validator_caches,
+    tree_fingerprint,
+)
+from api.validators import LintCleanValidator, TestPassValidator
+
+# A cache hit must be at least this many times faster than running the command
+MIN_CACHE_SPEEDUP = 5.0
+
+# Seconds the benchmark command sleeps
+COMMAND_SECONDS = 0.3
+
+BENCHMARK_FILES = 2_000
+
+has_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_validator_caches()
+    yield
+    clear_validator_caches()
+
+
+def _counting_command(counter: Path, exit_code: int = 0) -> str:
+    """A command that appends to counter (outside the project) and exits."""
+    code = f"open({str(counter)!r}, 'a').write('x'); print('checked'); raise SystemExit({exit_code})"
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
+
+
+def _runs(counter: Path) -> int:
+    return len(counter.read_text()) if counter.exists() else 0
+
+
+def _project(root: Path) -> Path:
+    project = root / "project"
+    (project / "src").mkdir(parents=True)
+    (project / "src" / "app.py").write_text("x = 1\n")
+    (project / ".gitignore").write_text("*.log\nbuild/\n")
+    (project / "build").mkdir()
+    (project / "build" / "out.bin").write_text("0")
+    _age(project)
+    return project
+
+
+def _age(root: Path) -> None:
+    """Backdate every file so fingerprints use stat() rather than hashing."""
+    old = time.time_ns() - 60 * 1_000_000_000
+    for path in root.rglob("*"):
+        os.utime(path, ns=(old, old), follow_symlinks=False)
+
+
+def _git_init(project: Path) -> None:
+    subprocess.Popen(["git", "init", "-q", str(project)]).wait()
+
+
+@pytest.fixture(params=["walk", "git"])
+def project(request, tmp_path):
+    project = _project(tmp_path)
+    if request.param == "git":
+        if shutil.which("git") is None:
+            pytest.skip("git not installed")
+        _git_init(project)
+    return project
+
+
+def _evaluate(validator_cls, project: Path, counter: Path, **config):
+    config = {"command": _counting_command(counter), **config}
+    return validator_cls().evaluate(config, {"project_dir": str(project)})
+
+
+class TestHits:
+    """Unchanged trees reuse stored results."""
+
+    @pytest.mark.parametrize("validator_cls", [TestPassValidator, LintCleanValidator])
+    def test_identical_result_with_marker(self, project, tmp_path, validator_cls):
+        counter = tmp_path / "runs"
+        first = _evaluate(validator_cls, project, counter)
+        second = _evaluate(validator_cls, project, counter)
+        assert _runs(counter) == 1
+        assert "cache_hit" not in first.details
+        assert second.details.pop("cache_hit") is True
+        assert second.to_dict() == first.to_dict()
+
+    def test_ignored_changes_still_hit(self, project, tmp_path):
+        counter = tmp_path / "runs"
+        _evaluate(TestPassValidator, project, counter)
+        (project / "debug.log").write_text("noise")
+        (project / "build" / "out.bin").write_text("1")
+        (project / "src" / "__pycache__").mkdir()
+        (project / "src" / "__pycache__" / "app.pyc").write_bytes(b"\0")
+        (project / "features.db").write_bytes(b"\0")
+        assert _evaluate(TestPassValidator, project, counter).details.get("cache_hit")
+        assert _runs(counter) == 1
+
+    def test_shared_through_cache_file(self, project, tmp_path):
+        counter = tmp_path / "runs"
+        _evaluate(TestPassValidator, project, counter)
+        assert (project / CACHE_FILE).exists()
+        # A new process starts with empty in-memory caches
+        clear_validator_caches()
+        assert _evaluate(TestPassValidator, project, counter).details.get("cache_hit")
+        assert _runs(counter) == 1
+
+
+class TestMisses:
+    """Anything the command could depend on invalidates the entry."""
+
+    @pytest.mark.parametrize("change", ["edit", "add", "delete", "touch"])
+    def test_tree_changes(self, project, tmp_path, change):
+        counter = tmp_path / "runs"
+        _evaluate(TestPassValidator, project, counter)
+        app = project / "src" / "app.py"
+        if change == "edit":
+            app.write_text("x = 22\n")
+        elif change == "add":
+            (project / "src" / "new.py").write_text("")
+        elif change == "delete":
+            app.unlink()
+        else:
+            os.utime(app)
+        assert "cache_hit" not in _evaluate(TestPassValidator, project, counter).details
+        assert _runs(counter) == 2
+
+    def test_environment_and_config(self, project, tmp_path, monkeypatch):
+        counter = tmp_path / "runs"
+        _evaluate(TestPassValidator, project, counter)
+        monkeypatch.setenv("VALIDATOR_CACHE_TEST", "1")
+        _evaluate(TestPassValidator, project, counter)
+        _evaluate(TestPassValidator, project, counter, timeout_seconds=30)
+        _evaluate(LintCleanValidator, project, counter)
+        assert _runs(counter) == 4
+
+    def test_same_size_rewrite_in_same_tick(self, tmp_path):
+        project = tmp_path / "project"
+        project.mkdir()
+        path = project / "a.py"
+        path.write_text("x = 1\n")
+        st = path.stat()
+        before = tree_fingerprint(project)
+        path.write_text("x = 2\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert tree_fingerprint(project) != before
+
+    def test_gitignore_negation_is_not_trusted(self, tmp_path):
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".gitignore").write_text("*.log\n!keep.log\n")
+        before = tree_fingerprint(project)
+        (project / "other.log").write_text("x")
+        assert tree_fingerprint(project) != before
+
+
+class TestNotCached:
+    """Only passing, completed runs are stored."""
+
+    def test_failure_is_rerun(self, project, tmp_path):
+        counter = tmp_path / "runs"
+        config = {"command": _counting_command(counter, exit_code=3)}
+        for _ in range(2):
+            result = TestPassValidator().evaluate(config, {"project_dir": str(project)})
+            assert not result.passed and "cache_hit" not in result.details
+        assert _runs(counter) == 2
+
+    def test_timeout(self, project, tmp_path):
+        counter = tmp_path / "runs"
+        code = f"open({str(counter)!r}, 'a').write('x'); import time; time.sleep(5)"
+        config = {"command": f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}", "timeout_seconds": 1}
+        for _ in range(2):
+            result = TestPassValidator().evaluate(config, {"project_dir": str(project)})
+            assert result.details["actual_exit_code"] is None
+            assert "cache_hit" not in result.details
+        assert _runs(counter) == 2
+
+    def test_missing_working_directory(self, project, tmp_path):
+        config = {"command": "true", "working_directory": str(tmp_path / "missing")}
+        for _ in range(2):
+            result = TestPassValidator().evaluate(config, {"project_dir": str(project)})
+            assert not result.passed and "cache_hit" not in result.details
+
+    def test_opt_out_and_no_project(self, project, tmp_path):
+        counter = tmp_path / "runs"
+        for _ in range(2):
+            _evaluate(TestPassValidator, project, counter, cache=False)
+        config = {"command": _counting_command(counter), "working_directory": str(project)}
+        for _ in range(2):
+            TestPassValidator().evaluate(config, {})
+        assert _runs(counter) == 4
+        assert not (project / CACHE_FILE).exists()
+
+    def test_unreadable_cache_file_is_ignored(self, project, tmp_path):
+        (project / CACHE_FILE).parent.mkdir()
+        (project / CACHE_FILE).write_text("{not json")
+        counter = tmp_path / "runs"
+        assert _evaluate(TestPassValidator, project, counter).passed
+        assert _evaluate(TestPassValidator, project, counter).details.get("cache_hit")
+
+
+class TestCacheBounds:
+    """The cache file stays bounded."""
+
+    def test_oldest_entries_dropped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(validator_cache, "MAX_CACHE_ENTRIES", 3)
+        cache = ValidatorResultCache(tmp_path)
+        for i in range(5):
+            cache.put(f"k{i}", {"passed": True, "message": str(i)})
+        reloaded = ValidatorResultCache(tmp_path)
+        assert [reloaded.get(f"k{i}") is not None for i in range(5)] == [False, False, True, True, True]
+
+
+def _benchmark_project(root: Path) -> Path:
+    project = root / "project"
+    for i in range(BENCHMARK_FILES):
+        package = project / f"pkg_{i % 20}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"mod_{i}.py").write_text(f"x = {i}\n")
+    _age(project)
+    return project
+
+
+def _time_evaluations(project: Path) -> tuple[float, float]:
+    code = f"import time; time.sleep({COMMAND_SECONDS})"
+    config = {"command": f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"}
+    context = {"project_dir": str(project)}
+    start = time.perf_counter()
+    first = TestPassValidator().evaluate(config, context)
+    run_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    second = TestPassValidator().evaluate(config, context)
+    hit_seconds = time.perf_counter() - start
+    assert first.passed and second.details.get("cache_hit")
+    return run_seconds, hit_seconds
+
+
+class TestBenchmark:
+    """Re-validating an unchanged project skips the command."""
+
+    def test_hit_is_faster(self, tmp_path):
+        run_seconds, hit_seconds = _time_evaluations(_benchmark_project(tmp_path))
+        assert run_seconds / hit_seconds >= MIN_CACHE_SPEEDUP, (
+            f"hit {hit_seconds:.3f}s vs run {run_seconds:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project = _benchmark_project(Path(tmp))
+        run_seconds, hit_seconds = _time_evaluations(project)
+        print(f"{BENCHMARK_FILES:,} files, {COMMAND_SECONDS}s command")
+        print(f"  run: {run_seconds * 1000:.1f} ms")
+        print(f"  hit: {hit_seconds * 1000:.1f} ms")
@@ -0,0 +1,219 @@
+"""
+Tests for the acceptance validator execution engine (run_validators in
+api/validators.py).
+
+Verifies:
+1. Results come back in definition order while validators run cheapest
+   first
+2. Short-circuiting never changes the gate outcome: every combination of
+   results, required flags and gate modes gives the same (passed, any
+   passed) as evaluating everything
+3. Validators are skipped only once the outcome is decided, and skipped
+   commands are never started
+4. AcceptanceGate reports skipped validators in place
+5. Benchmark: independent command validators run concurrently
+
+Run the benchmark directly with: python tests/test_validator_engine.py
+"""
+import itertools
+import shlex
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from api.validators import (
+    COST_CHEAP,
+    COST_COMMAND,
+    COST_EVENTS,
+    VALIDATOR_REGISTRY,
+    AcceptanceGate,
+    Validator,
+    ValidatorResult,
+    evaluate_acceptance_spec,
+    run_validators,
+)
+
+# Seconds each benchmark command sleeps (long enough that interpreter
+# start-up under load does not decide the result)
+COMMAND_SECONDS = 1.0
+
+BENCHMARK_COMMANDS = 4
+
+
+class _Recorded(Validator):
+    """Returns config["passed"] and records the evaluation order."""
+
+    calls: list[str] = []
+
+    def evaluate(self, config, context, run=None):
+        self.calls.append(config["name"])
+        return ValidatorResult(
+            passed=config["passed"], message=config["name"], validator_type=self.validator_type,
+        )
+
+
+class _Cheap(_Recorded):
+    validator_type = "fake_cheap"
+    cost = COST_CHEAP
+
+
+class _Events(_Recorded):
+    validator_type = "fake_events"
+    cost = COST_EVENTS
+
+
+class _Command(_Recorded):
+    validator_type = "fake_command"
+    cost = COST_COMMAND
+    concurrent_safe = True
+
+
+@pytest.fixture
+def fakes(monkeypatch):
+    for cls in (_Cheap, _Events, _Command):
+        monkeypatch.setitem(VALIDATOR_REGISTRY, cls.validator_type, cls)
+    _Recorded.calls = []
+    yield _Recorded.calls
+
+
+def _def(kind: str, name: str, passed: bool, required: bool = False) -> dict:
+    return {"type": f"fake_{kind}", "config": {"name": name, "passed": passed}, "required": required}
+
+
+def _outcome(validators, results, gate_mode):
+    required_ok = all(r.passed for v, r in zip(validators, results) if v.get("required"))
+    if not required_ok:
+        overall = False
+    elif gate_mode == "any_pass":
+        overall = any(r.passed for r in results)
+    else:
+        overall = all(r.passed for r in results)
+    return overall, any(r.passed for r in results)
+
+
+def _command(seconds: float, marker: Path | None = None) -> str:
+    code = f"import time; time.sleep({seconds})"
+    if marker is not None:
+        code += f"; open({str(marker)!r}, 'w').close()"
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
+
+
+class TestOrdering:
+    """Cost order for execution, definition order for results."""
+
+    def test_cheapest_first_results_in_order(self, fakes):
+        validators = [
+            _def("command", "c1", True),
+            _def("events", "e1", True),
+            _def("cheap", "f1", True),
+            _def("command", "c2", True),
+            _def("cheap", "f2", True),
+        ]
+        results = run_validators(validators, {})
+        assert [r.message for r in results] == ["c1", "e1", "f1", "c2", "f2"]
+        assert fakes[:3] == ["f1", "f2", "e1"]
+        assert sorted(fakes[3:]) == ["c1", "c2"]
+
+    def test_unknown_types_still_reported(self, fakes):
+        results = run_validators([{"type": "nope"}, {"config": {}}, _def("cheap", "f", True)], {})
+        assert [r.passed for r in results] == [False, False, True]
+        assert "Unknown validator type" in results[0].message
+
+
+class TestShortCircuit:
+    """Skipping never changes the outcome."""
+
+    @pytest.mark.parametrize("gate_mode", ["all_pass", "any_pass", "weighted"])
+    def test_exhaustive_outcomes(self, fakes, gate_mode):
+        kinds = ["cheap", "events", "command"]
+        for n in (1, 2, 3):
+            for outcomes in itertools.product([True, False], repeat=n):
+                for required in itertools.product([True, False], repeat=n):
+                    for kind in itertools.product(kinds, repeat=n):
+                        validators = [
+                            _def(k, f"v{i}", p, r)
+                            for i, (k, p, r) in enumerate(zip(kind, outcomes, required))
+                        ]
+                        full = run_validators(validators, {}, gate_mode=gate_mode, short_circuit=False)
+                        fast = run_validators(validators, {}, gate_mode=gate_mode)
+                        assert _outcome(validators, fast, gate_mode) == _outcome(validators, full, gate_mode)
+                        for f, s in zip(full, fast):
+                            assert s.details.get("skipped") or s.to_dict() == f.to_dict()
+
+    def test_skipped_commands_never_start(self, fakes, tmp_path):
+        marker = tmp_path / "ran"
+        validators = [
+            {"type": "test_pass", "config": {"command": _command(0, marker)}},
+            {"type": "test_pass", "config": {"command": _command(0, marker)}},
+            _def("cheap", "required", False, required=True),
+            _def("cheap", "other", True),
+        ]
+        passed, results = evaluate_acceptance_spec(validators, {"project_dir": str(tmp_path)})
+        assert not passed
+        assert [r.details.get("skipped", False) for r in results] == [True, True, False, False]
+        assert not marker.exists()
+
+    def test_any_pass_waits_for_required(self, fakes):
+        validators = [_def("cheap", "ok", True), _def("command", "req", True, required=True)]
+        results = run_validators(validators, {}, gate_mode="any_pass")
+        assert [r.passed for r in results] == [True, True]
+
+        validators = [_def("cheap", "ok", True), _def("command", "other", False)]
+        results = run_validators(validators, {}, gate_mode="any_pass")
+        assert results[1].details == {"skipped": True}
+
+
+class TestGateReporting:
+    """AcceptanceGate keeps its per-validator layout."""
+
+    def test_skipped_in_place(self, fakes):
+        spec = {
+            "gate_mode": "all_pass",
+            "validators": [
+                _def("command", "c", True),
+                _def("cheap", "bad", False),
+                _def("cheap", "good", True),
+            ],
+        }
+        result = AcceptanceGate().evaluate(None, spec, {})
+        assert result.verdict == "error"
+        assert [r["index"] for r in result.acceptance_results] == [0, 1, 2]
+        assert result.acceptance_results[0]["details"] == {"skipped": True}
+        assert "1 skipped" in result.summary
+        assert "c" not in fakes
+
+
+def _time_commands(tmp_path: Path, concurrent: bool) -> float:
+    validators = [
+        {"type": "test_pass", "config": {"command": _command(COMMAND_SECONDS), "cache": False}}
+        for _ in range(BENCHMARK_COMMANDS)
+    ]
+    start = time.perf_counter()
+    results = run_validators(validators, {"project_dir": str(tmp_path)}, max_workers=4 if concurrent else 1)
+    elapsed = time.perf_counter() - start
+    assert all(r.passed for r in results)
+    return elapsed
+
+
+class TestBenchmark:
+    """Command validators overlap."""
+
+    def test_commands_run_concurrently(self, tmp_path):
+        elapsed = _time_commands(tmp_path, concurrent=True)
+        serial_floor = COMMAND_SECONDS * BENCHMARK_COMMANDS
+        assert elapsed < serial_floor * 0.6, f"{BENCHMARK_COMMANDS} commands took {elapsed:.2f}s"
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for concurrent in (False, True):
+            label = "concurrent" if concurrent else "serial"
+            elapsed = _time_commands(Path(tmp), concurrent)
+            print(f"{label:>10}: {BENCHMARK_COMMANDS} x {COMMAND_SECONDS}s commands in {elapsed:.2f}s")
@@ -0,0 +1,179 @@
+"""
+Tests for the shared per-project output stream in server/websocket.py.
+
+Verifies:
+1. parse_output_line() classifies lines like the former per-pattern checks
+2. classify_thought() keeps THOUGHT_PATTERNS priority order
+3. Output is coalesced into batch frames sent to every subscriber
+4. A slow client gets log lines dropped (and summarized) without losing
+   agent_update messages or holding up other clients
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import server.websocket as ws_module
+from server.websocket import (
+    ProjectOutputStream,
+    classify_thought,
+    parse_output_line,
+)
+
+
+class TestParseOutputLine:
+    """One classification per line for both trackers."""
+
+    @pytest.mark.parametrize("line,event,feature_id,result", [
+        ("Started coding agent for feature #12: Login", "coding_start", 12, None),
+        ("Started testing agent for feature #3 (PID 42)", "testing_start", 3, None),
+        ("Feature #3 testing completed", "testing_complete", 3, "completed"),
+        ("Feature #3 testing failed", "testing_complete", 3, "failed"),
+        ("Feature #4 completed", "coding_complete", 4, "completed"),
+        ("Feature #4 failed", "coding_complete", 4, "failed"),
+        ("[Feature #7] Reading file", "feature_output", 7, None),
+        ("Plain output", None, None, None),
+    ])
+    def test_agent_events(self, line, event, feature_id, result):
+        parsed = parse_output_line(line)
+        assert parsed.agent_event == event
+        assert parsed.feature_id == feature_id
+        assert parsed.result == result
+
+    def test_feature_output_content(self):
+        parsed = parse_output_line("[Feature #7]   [Tool: Bash] npm test")
+        assert parsed.content == "[Tool: Bash] npm test"
+
+    @pytest.mark.parametrize("line,event,groups", [
+        ("[DEBUG] Spawning loop: 3 ready, 2 slots", "capacity_check", ("3", "2")),
+        ("Starting feature 1/5: #9 - Login form", "feature_start", ("9", "Login form")),
+        ("Started coding agent for feature #12", "coding_spawn", ("12",)),
+        ("Feature #3 testing completed", "testing_complete", ("3", "completed")),
+        ("2 blocked by dependencies", "blocked_features", ("2",)),
+        ("All features complete", "all_complete", ()),
+        ("Plain output", None, None),
+    ])
+    def test_orchestrator_events(self, line, event, groups):
+        parsed = parse_output_line(line)
+        assert parsed.orchestrator_event == event
+        if groups is not None:
+            assert parsed.orchestrator_match.groups() == groups
+
+
+class TestClassifyThought:
+    """The combined thought matcher honors list order, not match position."""
+
+    def test_tool_pattern_wins_over_earlier_text(self):
+        assert classify_thought("Reading docs [Tool: Bash]") == ("testing", "Reading docs [Tool: Bash]")
+
+    def test_captured_thought(self):
+        assert classify_thought("Reading the file foo") == ("thinking", "the file foo")
+        assert classify_thought("[Tool: Custom]") == ("working", "Custom")
+
+    def test_no_match(self):
+        assert classify_thought("nothing to see") == ("working", None)
+
+
+def _stream():
+    agent_manager = MagicMock()
+    agent_manager.structured_events = False
+    stream = ProjectOutputStream(agent_manager)
+    stream.start()
+    return stream
+
+
+class TestProjectOutputStream:
+    """Frames are built once and fanned out to all subscribers."""
+
+    @pytest.mark.asyncio
+    async def test_lines_coalesced_into_one_frame(self):
+        stream = _stream()
+        clients = [AsyncMock(), AsyncMock()]
+        for client in clients:
+            stream.subscribe(client)
+
+        await stream.on_output("Started coding agent for feature #1: Login")
+        await stream.on_output("[Feature #1] Reading file")
+        await asyncio.sleep(ws_module.FRAME_INTERVAL * 3)
+
+        for client in clients:
+            assert client.send_json.await_count == 1
+            frame = client.send_json.await_args.args[0]
+            assert frame["type"] == "batch"
+            types = [m["type"] for m in frame["messages"]]
+            assert types == ["log", "agent_update", "orchestrator_update", "log", "agent_update"]
+            assert frame["messages"][3]["agentIndex"] == 0
+        await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_status_change_resets_trackers(self):
+        stream = _stream()
+        client = AsyncMock()
+        stream.subscribe(client)
+
+        await stream.on_output("Started coding agent for feature #1")
+        await stream.on_status_change("stopped")
+        await asyncio.sleep(ws_module.FRAME_INTERVAL * 3)
+
+        assert stream.agent_tracker.active_agents == {}
+        messages = client.send_json.await_args.args[0]["messages"]
+        assert messages[-1] == {"type": "agent_status", "status": "stopped"}
+        await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_log_lines_only(self, monkeypatch):
+        monkeypatch.setattr(ws_module, "MAX_PENDING_FRAMES", 2)
+        stream = _stream()
+        fast = AsyncMock()
+        slow = AsyncMock()
+        release = asyncio.Event()
+        received = []
+
+        async def slow_send(frame):
+            await release.wait()
+            received.append(frame)
+
+        slow.send_json = slow_send
+        stream.subscribe(fast)
+        stream.subscribe(slow)
+
+        await stream.on_output("Started coding agent for feature #1")
+        stream.flush()
+        for i in range(6):
+            await stream.on_output(f"[Feature #1] line {i}")
+            stream.flush()
+            await asyncio.sleep(0)
+        await stream.on_output("Feature #1 completed")
+        stream.flush()
+        await asyncio.sleep(0)
+
+        # The fast client got every frame
+        assert fast.send_json.await_count == 8
+
+        release.set()
+        await asyncio.sleep(0.05)
+        messages = [m for frame in received for m in frame["messages"]]
+        skipped = [m for m in messages if "log lines skipped" in m.get("line", "")]
+        assert len(skipped) == 1
+        # Every agent_update survived, including the completion
+        states = [m["state"] for m in messages if m["type"] == "agent_update"]
+        assert states[0] == "thinking"
+        assert states[-1] == "success"
+        await stream.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_unregisters_callbacks(self):
+        stream = _stream()
+        stream.subscribe(AsyncMock())
+        await stream.stop()
+
+        stream.agent_manager.remove_output_callback.assert_called_once_with(stream.on_output)
+        stream.agent_manager.remove_status_callback.assert_called_once_with(stream.on_status_change)
+        stream.agent_manager.remove_event_callback.assert_called_once_with(stream.on_event)
+        assert stream.subscriber_count == 0
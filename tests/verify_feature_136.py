@@ -28,7 +28,7 @@ def _utc_now():
 
 def test_step1_source_code_verification():
     """Step 1: Verify placeholder removed and HarnessKernel import present."""
-    source_path = Path(__file__).parent.parent / "server" / "routers" / "agent_specs.py"
+    source_path = Path(__file__).parent.parent / "server" / "services" / "run_executor.py"
     content = source_path.read_text()
 
     # Placeholder should be removed
@@ -383,17 +383,17 @@ def test_step6_endpoint_triggers_real_kernel_execution():
 
 
 def test_source_code_background_function():
-    """Verify the _execute_spec_background function has correct structure."""
-    source_path = Path(__file__).parent.parent / "server" / "routers" / "agent_specs.py"
+    """Verify the execute_queued_run function has correct structure."""
+    source_path = Path(__file__).parent.parent / "server" / "services" / "run_executor.py"
     content = source_path.read_text()
 
     # Verify Phase 1: WebSocket broadcasting is preserved
     assert "broadcast_run_started" in content, "WebSocket broadcasting should be preserved"
 
     # Verify Phase 2: Kernel execution
-    assert "kernel_spec = kernel_db.query(AgentSpecModel)" in content, \
+    assert "kernel_spec = kernel_db.query(AgentSpec)" in content, \
         "Should query spec in kernel session"
-    assert "joinedload(AgentSpecModel.acceptance_spec)" in content, \
+    assert "joinedload(AgentSpec.acceptance_spec)" in content, \
         "Should eagerly load acceptance_spec"
     assert "kernel.execute(" in content, "Should call kernel.execute()"
 
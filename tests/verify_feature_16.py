@@ -96,7 +96,7 @@ def test_step_4_to_8_with_mock():
     from unittest.mock import MagicMock, patch, AsyncMock
 
     # Import the function we're testing
-    from server.routers.agent_specs import execute_agent_spec, _execution_tasks, _utc_now, _generate_uuid
+    from server.routers.agent_specs import execute_agent_spec, _utc_now, _generate_uuid
 
     # Mock spec ID and project
     spec_id = str(uuid.uuid4())
@@ -177,25 +177,20 @@ def test_background_task_exists():
     """Verify background task function exists and has correct signature"""
     print("Verify background execution task...")
 
-    from server.routers.agent_specs import _execute_spec_background, _execution_tasks
+    from server.services.run_executor import SpecRunExecutor, execute_queued_run
 
-    # Check function exists and is async
-    assert asyncio.iscoroutinefunction(_execute_spec_background), "Background task should be async"
-
-    # Check task store exists
-    assert isinstance(_execution_tasks, dict), "Task store should be a dict"
+    # Runs execute on the executor's worker threads, not the event loop
+    assert not asyncio.iscoroutinefunction(execute_queued_run), "Runner should be synchronous"
+    assert callable(getattr(SpecRunExecutor, "submit", None)), "Executor should accept submissions"
 
     # Check function signature
     import inspect
-    sig = inspect.signature(_execute_spec_background)
+    sig = inspect.signature(execute_queued_run)
     params = list(sig.parameters.keys())
-    assert "project_dir" in params, "Should have project_dir parameter"
-    assert "spec_id" in params, "Should have spec_id parameter"
-    assert "run_id" in params, "Should have run_id parameter"
+    assert "job" in params, "Should take the queued run"
 
-    print("  - _execute_spec_background is async ✓")
-    print("  - _execution_tasks dict exists ✓")
-    print("  - Function has correct parameters (project_dir, spec_id, run_id) ✓")
+    print("  - execute_queued_run runs on a worker thread ✓")
+    print("  - SpecRunExecutor.submit exists ✓")
     print("  PASS\n")
 
 
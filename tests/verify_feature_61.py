@@ -27,13 +27,13 @@ def verify_step_1():
     Step 1: When AgentRun status changes to running, publish message.
 
     Verify that the broadcast function is called when a run transitions to running.
-    This is implemented in server/routers/agent_specs.py::_execute_spec_background().
+    This is implemented in server/services/run_executor.py::execute_queued_run().
     """
     print("\n=== Step 1: When AgentRun status changes to running, publish message ===")
 
-    # Check the agent_specs router integration
-    agent_specs_path = root / "server" / "routers" / "agent_specs.py"
-    assert agent_specs_path.exists(), "agent_specs.py router not found"
+    # Check the spec run executor integration
+    agent_specs_path = root / "server" / "services" / "run_executor.py"
+    assert agent_specs_path.exists(), "run_executor.py service not found"
 
     content = agent_specs_path.read_text()
 
@@ -46,11 +46,11 @@ def verify_step_1():
         "Run status transition to running not found"
 
     # Verify broadcast_run_started is called
-    assert "await broadcast_run_started(" in content, \
+    assert "broadcast_run_started(" in content, \
         "broadcast_run_started not called in agent_specs router"
 
     # Verify it's called with project_name parameter
-    assert "project_name=project_name" in content, \
+    assert "project_name=job.project_name" in content, \
         "broadcast_run_started not called with project_name parameter"
 
     print("✓ broadcast_run_started is imported in agent_specs.py")
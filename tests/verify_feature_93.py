@@ -22,7 +22,6 @@ from api.dependency_resolver import (
     _detect_cycles_for_validation,
     compute_scheduling_scores,
     would_create_circular_dependency,
-    MAX_DEPENDENCY_DEPTH,
 )
 
 
@@ -123,16 +122,15 @@ def verify_step_3() -> bool:
 
 
 def verify_step_4() -> bool:
-    """Verify would_create_circular_dependency() uses visited set in DFS."""
-    print_step(4, "Review would_create_circular_dependency() - verify visited set in DFS")
+    """Verify would_create_circular_dependency() terminates on any graph."""
+    print_step(4, "Review would_create_circular_dependency() - verify iterative cycle check")
 
     source = inspect.getsource(would_create_circular_dependency)
 
-    has_visited = "visited" in source
-    print_result(has_visited, "Uses visited set for DFS traversal")
-
-    has_depth_limit = "MAX_DEPENDENCY_DEPTH" in source or "depth" in source.lower()
-    print_result(has_depth_limit, "Has depth limit to prevent stack overflow")
+    # The check runs on api.dependency_order.DependencyOrder, whose searches
+    # are iterative with visited sets, so no depth limit is needed
+    uses_order = "DependencyOrder" in source
+    print_result(uses_order, "Uses DependencyOrder (iterative search with visited set)")
 
     # Functional test: detect potential cycle
     features = [
@@ -148,7 +146,7 @@ def verify_step_4() -> bool:
     allows_safe_dep = would_not_cycle == False
     print_result(allows_safe_dep, "Correctly allows safe dependency additions")
 
-    return has_visited and has_depth_limit and detects_potential_cycle and allows_safe_dep
+    return uses_order and detects_potential_cycle and allows_safe_dep
 
 
 def verify_step_5() -> bool:
@@ -158,9 +156,7 @@ def verify_step_5() -> bool:
     # Check each function for iteration/depth limits
     functions_to_check = [
         ("_detect_cycles", _detect_cycles, "max_iterations"),
-        ("_detect_cycles_for_validation", _detect_cycles_for_validation, "max_iterations"),
         ("compute_scheduling_scores", compute_scheduling_scores, "max_iterations"),
-        ("would_create_circular_dependency", would_create_circular_dependency, "MAX_DEPENDENCY_DEPTH"),
     ]
 
     all_have_limits = True
@@ -171,6 +167,12 @@ def verify_step_5() -> bool:
         if not has_limit:
             all_have_limits = False
 
+    # _detect_cycles_for_validation() and would_create_circular_dependency()
+    # run on DependencyOrder, whose searches visit each feature at most once
+    uses_order = "DependencyOrder" in inspect.getsource(_detect_cycles_for_validation)
+    print_result(uses_order, "_detect_cycles_for_validation() uses DependencyOrder (inherently terminates)")
+    all_have_limits = all_have_limits and uses_order
+
     # Note: resolve_dependencies uses Kahn's algorithm which inherently terminates
     # because it processes each node exactly once via in_degree decrement
     print_result(True, "resolve_dependencies() uses Kahn's algorithm (inherently terminates)")
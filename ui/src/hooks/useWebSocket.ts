@@ -133,135 +133,124 @@ export function useProjectWebSocket(projectName: string | null) {
 
       ws.onmessage = (event) => {
         try {
-          const message: WSMessage = JSON.parse(event.data)
-
-          switch (message.type) {
-            case 'progress':
-              setState(prev => ({
-                ...prev,
-                progress: {
-                  passing: message.passing,
-                  in_progress: message.in_progress,
-                  total: message.total,
-                  percentage: message.percentage,
-                },
-              }))
-              break
-
-            case 'agent_status':
-              setState(prev => ({
-                ...prev,
-                agentStatus: message.status,
-                // Clear active agents and orchestrator status when process stops OR crashes to prevent stale UI
-                ...((message.status === 'stopped' || message.status === 'crashed') && {
-                  activeAgents: [],
-                  recentActivity: [],
-                  orchestratorStatus: null,
-                }),
-              }))
-              break
-
-            case 'log':
-              setState(prev => {
-                // Update global logs
-                const newLogs = [
-                  ...prev.logs.slice(-MAX_LOGS + 1),
-                  {
-                    line: message.line,
-                    timestamp: message.timestamp,
-                    featureId: message.featureId,
-                    agentIndex: message.agentIndex,
+          const frame: WSMessage = JSON.parse(event.data)
+          // Agent output, agent_update and orchestrator_update messages arrive
+          // in batch frames; handle each message in order
+          const messages = frame.type === 'batch' ? frame.messages : [frame]
+
+          for (const message of messages) {
+            switch (message.type) {
+              case 'progress':
+                setState(prev => ({
+                  ...prev,
+                  progress: {
+                    passing: message.passing,
+                    in_progress: message.in_progress,
+                    total: message.total,
+                    percentage: message.percentage,
                   },
-                ]
+                }))
+                break
+
+              case 'agent_status':
+                setState(prev => ({
+                  ...prev,
+                  agentStatus: message.status,
+                  // Clear active agents and orchestrator status when process stops OR crashes to prevent stale UI
+                  ...((message.status === 'stopped' || message.status === 'crashed') && {
+                    activeAgents: [],
+                    recentActivity: [],
+                    orchestratorStatus: null,
+                  }),
+                }))
+                break
+
+              case 'log':
+                setState(prev => {
+                  // Update global logs
+                  const newLogs = [
+                    ...prev.logs.slice(-MAX_LOGS + 1),
+                    {
+                      line: message.line,
+                      timestamp: message.timestamp,
+                      featureId: message.featureId,
+                      agentIndex: message.agentIndex,
+                    },
+                  ]
+
+                  // Also store in per-agent logs if we have an agentIndex
+                  let newAgentLogs = prev.agentLogs
+                  if (message.agentIndex !== undefined) {
+                    newAgentLogs = new Map(prev.agentLogs)
+                    const existingLogs = newAgentLogs.get(message.agentIndex) || []
+                    const logEntry: AgentLogEntry = {
+                      line: message.line,
+                      timestamp: message.timestamp,
+                      type: 'output',
+                    }
+                    newAgentLogs.set(
+                      message.agentIndex,
+                      [...existingLogs.slice(-MAX_AGENT_LOGS + 1), logEntry]
+                    )
+                  }
+
+                  return { ...prev, logs: newLogs, agentLogs: newAgentLogs }
+                })
+                break
+
+              case 'feature_update':
+                // Feature #173: Debounce invalidation to handle WebSocket bursts gracefully.
+                // When 20+ feature_update messages arrive in rapid succession, we coalesce
+                // them into a single invalidateQueries call after the burst settles (150ms window).
+                // This prevents redundant API fetches and eliminates UI jank in the virtualized list.
+                if (projectName) {
+                  scheduleFeatureInvalidation(message.feature_id || undefined)
+                }
+                break
 
-                // Also store in per-agent logs if we have an agentIndex
-                let newAgentLogs = prev.agentLogs
-                if (message.agentIndex !== undefined) {
-                  newAgentLogs = new Map(prev.agentLogs)
+              case 'agent_update':
+                setState(prev => {
+                  // Log state change to per-agent logs
+                  const newAgentLogs = new Map(prev.agentLogs)
                   const existingLogs = newAgentLogs.get(message.agentIndex) || []
-                  const logEntry: AgentLogEntry = {
-                    line: message.line,
+                  const stateLogEntry: AgentLogEntry = {
+                    line: `[STATE] ${message.state}${message.thought ? `: ${message.thought}` : ''}`,
                     timestamp: message.timestamp,
-                    type: 'output',
+                    type: message.state === 'error' ? 'error' : 'state_change',
                   }
                   newAgentLogs.set(
                     message.agentIndex,
-                    [...existingLogs.slice(-MAX_AGENT_LOGS + 1), logEntry]
+                    [...existingLogs.slice(-MAX_AGENT_LOGS + 1), stateLogEntry]
                   )
-                }
 
-                return { ...prev, logs: newLogs, agentLogs: newAgentLogs }
-              })
-              break
-
-            case 'feature_update':
-              // Feature #173: Debounce invalidation to handle WebSocket bursts gracefully.
-              // When 20+ feature_update messages arrive in rapid succession, we coalesce
-              // them into a single invalidateQueries call after the burst settles (150ms window).
-              // This prevents redundant API fetches and eliminates UI jank in the virtualized list.
-              if (projectName) {
-                scheduleFeatureInvalidation(message.feature_id || undefined)
-              }
-              break
-
-            case 'agent_update':
-              setState(prev => {
-                // Log state change to per-agent logs
-                const newAgentLogs = new Map(prev.agentLogs)
-                const existingLogs = newAgentLogs.get(message.agentIndex) || []
-                const stateLogEntry: AgentLogEntry = {
-                  line: `[STATE] ${message.state}${message.thought ? `: ${message.thought}` : ''}`,
-                  timestamp: message.timestamp,
-                  type: message.state === 'error' ? 'error' : 'state_change',
-                }
-                newAgentLogs.set(
-                  message.agentIndex,
-                  [...existingLogs.slice(-MAX_AGENT_LOGS + 1), stateLogEntry]
-                )
-
-                // Get current logs for this agent to attach to ActiveAgent
-                const agentLogsArray = newAgentLogs.get(message.agentIndex) || []
-
-                // Update or add the agent in activeAgents
-                const existingAgentIdx = prev.activeAgents.findIndex(
-                  a => a.agentIndex === message.agentIndex
-                )
-
-                let newAgents: ActiveAgent[]
-                if (message.state === 'success' || message.state === 'error') {
-                  // Remove agent from active list on completion (success or failure)
-                  // But keep the logs in agentLogs map for debugging
-                  if (message.agentIndex === -1) {
-                    // Synthetic completion: remove by featureId
-                    // This handles agents that weren't tracked but still completed
-                    newAgents = prev.activeAgents.filter(
-                      a => a.featureId !== message.featureId
-                    )
-                  } else {
-                    // Normal completion: remove by agentIndex
-                    newAgents = prev.activeAgents.filter(
-                      a => a.agentIndex !== message.agentIndex
-                    )
-                  }
-                } else if (existingAgentIdx >= 0) {
-                  // Update existing agent
-                  newAgents = [...prev.activeAgents]
-                  newAgents[existingAgentIdx] = {
-                    agentIndex: message.agentIndex,
-                    agentName: message.agentName,
-                    agentType: message.agentType || 'coding',  // Default to coding for backwards compat
-                    featureId: message.featureId,
-                    featureName: message.featureName,
-                    state: message.state,
-                    thought: message.thought,
-                    timestamp: message.timestamp,
-                    logs: agentLogsArray,
-                  }
-                } else {
-                  // Add new agent
-                  newAgents = [
-                    ...prev.activeAgents,
-                    {
+                  // Get current logs for this agent to attach to ActiveAgent
+                  const agentLogsArray = newAgentLogs.get(message.agentIndex) || []
+
+                  // Update or add the agent in activeAgents
+                  const existingAgentIdx = prev.activeAgents.findIndex(
+                    a => a.agentIndex === message.agentIndex
+                  )
+
+                  let newAgents: ActiveAgent[]
+                  if (message.state === 'success' || message.state === 'error') {
+                    // Remove agent from active list on completion (success or failure)
+                    // But keep the logs in agentLogs map for debugging
+                    if (message.agentIndex === -1) {
+                      // Synthetic completion: remove by featureId
+                      // This handles agents that weren't tracked but still completed
+                      newAgents = prev.activeAgents.filter(
+                        a => a.featureId !== message.featureId
+                      )
+                    } else {
+                      // Normal completion: remove by agentIndex
+                      newAgents = prev.activeAgents.filter(
+                        a => a.agentIndex !== message.agentIndex
+                      )
+                    }
+                  } else if (existingAgentIdx >= 0) {
+                    // Update existing agent
+                    newAgents = [...prev.activeAgents]
+                    newAgents[existingAgentIdx] = {
                       agentIndex: message.agentIndex,
                       agentName: message.agentName,
                       agentType: message.agentType || 'coding',  // Default to coding for backwards compat
@@ -271,122 +260,138 @@ export function useProjectWebSocket(projectName: string | null) {
                       thought: message.thought,
                       timestamp: message.timestamp,
                       logs: agentLogsArray,
-                    },
-                  ]
-                }
+                    }
+                  } else {
+                    // Add new agent
+                    newAgents = [
+                      ...prev.activeAgents,
+                      {
+                        agentIndex: message.agentIndex,
+                        agentName: message.agentName,
+                        agentType: message.agentType || 'coding',  // Default to coding for backwards compat
+                        featureId: message.featureId,
+                        featureName: message.featureName,
+                        state: message.state,
+                        thought: message.thought,
+                        timestamp: message.timestamp,
+                        logs: agentLogsArray,
+                      },
+                    ]
+                  }
 
-                // Add to activity feed if there's a thought
-                let newActivity = prev.recentActivity
-                if (message.thought) {
-                  newActivity = [
-                    {
+                  // Add to activity feed if there's a thought
+                  let newActivity = prev.recentActivity
+                  if (message.thought) {
+                    newActivity = [
+                      {
+                        agentName: message.agentName,
+                        thought: message.thought,
+                        timestamp: message.timestamp,
+                        featureId: message.featureId,
+                      },
+                      ...prev.recentActivity.slice(0, MAX_ACTIVITY - 1),
+                    ]
+                  }
+
+                  // Handle celebration queue on success
+                  let newCelebrationQueue = prev.celebrationQueue
+                  let newCelebration = prev.celebration
+
+                  if (message.state === 'success') {
+                    const newCelebrationItem: CelebrationTrigger = {
                       agentName: message.agentName,
-                      thought: message.thought,
-                      timestamp: message.timestamp,
+                      featureName: message.featureName,
                       featureId: message.featureId,
-                    },
-                    ...prev.recentActivity.slice(0, MAX_ACTIVITY - 1),
-                  ]
-                }
+                    }
+
+                    // If no celebration is showing, show this one immediately
+                    // Otherwise, add to queue
+                    if (!prev.celebration) {
+                      newCelebration = newCelebrationItem
+                    } else {
+                      newCelebrationQueue = [...prev.celebrationQueue, newCelebrationItem]
+                    }
+                  }
 
-                // Handle celebration queue on success
-                let newCelebrationQueue = prev.celebrationQueue
-                let newCelebration = prev.celebration
+                  return {
+                    ...prev,
+                    activeAgents: newAgents,
+                    agentLogs: newAgentLogs,
+                    recentActivity: newActivity,
+                    celebrationQueue: newCelebrationQueue,
+                    celebration: newCelebration,
+                  }
+                })
+                break
 
-                if (message.state === 'success') {
-                  const newCelebrationItem: CelebrationTrigger = {
-                    agentName: message.agentName,
-                    featureName: message.featureName,
+              case 'orchestrator_update':
+                setState(prev => {
+                  const newEvent: OrchestratorEvent = {
+                    eventType: message.eventType,
+                    message: message.message,
+                    timestamp: message.timestamp,
                     featureId: message.featureId,
+                    featureName: message.featureName,
                   }
 
-                  // If no celebration is showing, show this one immediately
-                  // Otherwise, add to queue
-                  if (!prev.celebration) {
-                    newCelebration = newCelebrationItem
-                  } else {
-                    newCelebrationQueue = [...prev.celebrationQueue, newCelebrationItem]
+                  return {
+                    ...prev,
+                    orchestratorStatus: {
+                      state: message.state,
+                      message: message.message,
+                      codingAgents: message.codingAgents ?? prev.orchestratorStatus?.codingAgents ?? 0,
+                      testingAgents: message.testingAgents ?? prev.orchestratorStatus?.testingAgents ?? 0,
+                      maxConcurrency: message.maxConcurrency ?? prev.orchestratorStatus?.maxConcurrency ?? 3,
+                      readyCount: message.readyCount ?? prev.orchestratorStatus?.readyCount ?? 0,
+                      blockedCount: message.blockedCount ?? prev.orchestratorStatus?.blockedCount ?? 0,
+                      timestamp: message.timestamp,
+                      recentEvents: [newEvent, ...(prev.orchestratorStatus?.recentEvents ?? []).slice(0, 4)],
+                    },
                   }
-                }
+                })
+                break
 
-                return {
+              case 'dev_log':
+                setState(prev => ({
                   ...prev,
-                  activeAgents: newAgents,
-                  agentLogs: newAgentLogs,
-                  recentActivity: newActivity,
-                  celebrationQueue: newCelebrationQueue,
-                  celebration: newCelebration,
-                }
-              })
-              break
-
-            case 'orchestrator_update':
-              setState(prev => {
-                const newEvent: OrchestratorEvent = {
-                  eventType: message.eventType,
-                  message: message.message,
-                  timestamp: message.timestamp,
-                  featureId: message.featureId,
-                  featureName: message.featureName,
-                }
-
-                return {
+                  devLogs: [
+                    ...prev.devLogs.slice(-MAX_LOGS + 1),
+                    { line: message.line, timestamp: message.timestamp },
+                  ],
+                }))
+                break
+
+              case 'dev_server_status':
+                setState(prev => ({
                   ...prev,
-                  orchestratorStatus: {
-                    state: message.state,
-                    message: message.message,
-                    codingAgents: message.codingAgents ?? prev.orchestratorStatus?.codingAgents ?? 0,
-                    testingAgents: message.testingAgents ?? prev.orchestratorStatus?.testingAgents ?? 0,
-                    maxConcurrency: message.maxConcurrency ?? prev.orchestratorStatus?.maxConcurrency ?? 3,
-                    readyCount: message.readyCount ?? prev.orchestratorStatus?.readyCount ?? 0,
-                    blockedCount: message.blockedCount ?? prev.orchestratorStatus?.blockedCount ?? 0,
-                    timestamp: message.timestamp,
-                    recentEvents: [newEvent, ...(prev.orchestratorStatus?.recentEvents ?? []).slice(0, 4)],
-                  },
-                }
-              })
-              break
-
-            case 'dev_log':
-              setState(prev => ({
-                ...prev,
-                devLogs: [
-                  ...prev.devLogs.slice(-MAX_LOGS + 1),
-                  { line: message.line, timestamp: message.timestamp },
-                ],
-              }))
-              break
-
-            case 'dev_server_status':
-              setState(prev => ({
-                ...prev,
-                devServerStatus: message.status,
-                devServerUrl: message.url,
-              }))
-              break
-
-            case 'pong':
-              // Heartbeat response
-              break
-
-            // Phase 3 AgentSpec WebSocket events
-            // Feature #146: Handle agent_spec_created in frontend UI
-            case 'agent_spec_created':
-              // When a new AgentSpec is created, log for debugging.
-              // Components that display agent specs can listen for this event
-              // to refresh their data (e.g., invalidate React Query caches).
-              console.debug('[WebSocket] agent_spec_created:', message.spec_id, message.display_name)
-              break
-
-            // Phase 3 AgentRun WebSocket events - handled by useAgentRunUpdates hook
-            // These are forwarded to components that subscribe via the specialized hook
-            case 'agent_run_started':
-            case 'agent_event_logged':
-            case 'agent_acceptance_update':
-              // These messages are processed by the useAgentRunUpdates hook
-              // which creates its own WebSocket connection for run-specific updates.
-              // We log them here for debugging purposes.
-              break
+                  devServerStatus: message.status,
+                  devServerUrl: message.url,
+                }))
+                break
+
+              case 'pong':
+                // Heartbeat response
+                break
+
+              // Phase 3 AgentSpec WebSocket events
+              // Feature #146: Handle agent_spec_created in frontend UI
+              case 'agent_spec_created':
+                // When a new AgentSpec is created, log for debugging.
+                // Components that display agent specs can listen for this event
+                // to refresh their data (e.g., invalidate React Query caches).
+                console.debug('[WebSocket] agent_spec_created:', message.spec_id, message.display_name)
+                break
+
+              // Phase 3 AgentRun WebSocket events - handled by useAgentRunUpdates hook
+              // These are forwarded to components that subscribe via the specialized hook
+              case 'agent_run_started':
+              case 'agent_event_logged':
+              case 'agent_acceptance_update':
+                // These messages are processed by the useAgentRunUpdates hook
+                // which creates its own WebSocket connection for run-specific updates.
+                // We log them here for debugging purposes.
+                break
+            }
           }
         } catch {
           console.error('Failed to parse WebSocket message')
@@ -300,7 +300,7 @@ export interface OrchestratorStatus {
 }
 
 // WebSocket message types
-export type WSMessageType = 'progress' | 'feature_update' | 'log' | 'agent_status' | 'pong' | 'dev_log' | 'dev_server_status' | 'agent_update' | 'orchestrator_update' | 'agent_run_started' | 'agent_event_logged' | 'agent_acceptance_update' | 'agent_spec_created'
+export type WSMessageType = 'progress' | 'feature_update' | 'log' | 'agent_status' | 'pong' | 'dev_log' | 'dev_server_status' | 'agent_update' | 'orchestrator_update' | 'agent_run_started' | 'agent_event_logged' | 'agent_acceptance_update' | 'agent_spec_created' | 'batch'
 
 export interface WSProgressMessage {
   type: 'progress'
@@ -347,6 +347,13 @@ export interface WSPongMessage {
   type: 'pong'
 }
 
+// Frame of messages coalesced by the server (agent output, agent_update,
+// orchestrator_update, agent_status)
+export interface WSBatchMessage {
+  type: 'batch'
+  messages: WSMessage[]
+}
+
 export interface WSDevLogMessage {
   type: 'dev_log'
   line: string
@@ -473,6 +480,7 @@ export type WSMessage =
   | WSAgentRunStartedMessage
   | WSAgentEventLoggedMessage
   | WSAgentAcceptanceUpdateMessage
+  | WSBatchMessage
 
 // ============================================================================
 // Spec Chat Types